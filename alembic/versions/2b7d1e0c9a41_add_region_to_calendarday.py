@@ -0,0 +1,38 @@
+"""Add region to CalendarDay
+
+Revision ID: 2b7d1e0c9a41
+Revises: 6884d1fcf1c6
+Create Date: 2026-10-19 10:12:40.518233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7d1e0c9a41'
+down_revision: Union[str, Sequence[str], None] = '6884d1fcf1c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('calendarday') as batch_op:
+        batch_op.add_column(
+            sa.Column('region', sa.String(length=8), nullable=False, server_default='ru')
+        )
+        batch_op.drop_index('ix_calendarday_date')
+        batch_op.create_index('ix_calendarday_date', ['date'], unique=False)
+        batch_op.create_unique_constraint('uq_calendarday_region_date', ['region', 'date'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('calendarday') as batch_op:
+        batch_op.drop_constraint('uq_calendarday_region_date', type_='unique')
+        batch_op.drop_index('ix_calendarday_date')
+        batch_op.create_index('ix_calendarday_date', ['date'], unique=True)
+        batch_op.drop_column('region')
@@ -0,0 +1,49 @@
+"""Add Overlay and OverlayInterval
+
+Revision ID: 3a9d7f2e5b18
+Revises: 8e4b2c6f1a93
+Create Date: 2026-10-19 14:05:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a9d7f2e5b18'
+down_revision: Union[str, Sequence[str], None] = '8e4b2c6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('overlay',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('region', sa.String(length=8), nullable=False),
+    sa.Column('parent_id', sa.Integer(), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['parent_id'], ['overlay.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('overlayinterval',
+    sa.Column('overlay_id', sa.Integer(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=False),
+    sa.Column('is_working', sa.Boolean(), nullable=False),
+    sa.Column('note', sa.String(length=200), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['overlay_id'], ['overlay.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_overlayinterval_overlay_id'), 'overlayinterval', ['overlay_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_overlayinterval_overlay_id'), table_name='overlayinterval')
+    op.drop_table('overlayinterval')
+    op.drop_table('overlay')
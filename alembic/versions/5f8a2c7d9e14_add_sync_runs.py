@@ -0,0 +1,43 @@
+"""Add SyncRun
+
+Revision ID: 5f8a2c7d9e14
+Revises: 9b3e6d1c4a87
+Create Date: 2026-10-19 19:02:51.663208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f8a2c7d9e14'
+down_revision: Union[str, Sequence[str], None] = '9b3e6d1c4a87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('syncrun',
+    sa.Column('run_id', sa.String(length=32), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('region', sa.String(length=8), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('source', sa.String(length=50), nullable=True),
+    sa.Column('fetch_seconds', sa.Float(), nullable=False),
+    sa.Column('parse_seconds', sa.Float(), nullable=False),
+    sa.Column('write_seconds', sa.Float(), nullable=False),
+    sa.Column('changed', sa.Integer(), nullable=False),
+    sa.Column('error', sa.String(length=500), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_syncrun_run_id'), 'syncrun', ['run_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_syncrun_run_id'), table_name='syncrun')
+    op.drop_table('syncrun')
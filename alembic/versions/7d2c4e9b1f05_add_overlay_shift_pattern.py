@@ -0,0 +1,32 @@
+"""Add shift pattern to Overlay
+
+Revision ID: 7d2c4e9b1f05
+Revises: 3a9d7f2e5b18
+Create Date: 2026-10-19 15:11:37.652904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2c4e9b1f05'
+down_revision: Union[str, Sequence[str], None] = '3a9d7f2e5b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('overlay') as batch_op:
+        batch_op.add_column(sa.Column('shift_pattern', sa.String(length=50), nullable=True))
+        batch_op.add_column(sa.Column('shift_anchor', sa.Date(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('overlay') as batch_op:
+        batch_op.drop_column('shift_anchor')
+        batch_op.drop_column('shift_pattern')
@@ -0,0 +1,32 @@
+"""Add working hours to CalendarDay and CalendarChange
+
+Revision ID: 8e4b2c6f1a93
+Revises: 5c3f8a2d7e10
+Create Date: 2026-10-19 13:20:41.204519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b2c6f1a93'
+down_revision: Union[str, Sequence[str], None] = '5c3f8a2d7e10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('calendarday', 'calendarchange'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column('working_hours', sa.SmallInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('calendarday', 'calendarchange'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('working_hours')
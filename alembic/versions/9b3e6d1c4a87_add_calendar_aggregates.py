@@ -0,0 +1,40 @@
+"""Add CalendarAggregate
+
+Revision ID: 9b3e6d1c4a87
+Revises: e5a17c3b9f42
+Create Date: 2026-10-19 18:11:37.204651
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3e6d1c4a87'
+down_revision: Union[str, Sequence[str], None] = 'e5a17c3b9f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('calendaraggregate',
+    sa.Column('region', sa.String(length=8), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('period', sa.String(length=8), nullable=False),
+    sa.Column('number', sa.SmallInteger(), nullable=False),
+    sa.Column('working_days', sa.SmallInteger(), nullable=False),
+    sa.Column('non_working_days', sa.SmallInteger(), nullable=False),
+    sa.Column('working_hours', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('region', 'year', 'period', 'number', name='uq_calendaraggregate_period')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('calendaraggregate')
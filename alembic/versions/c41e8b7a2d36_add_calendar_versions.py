@@ -0,0 +1,49 @@
+"""Add CalendarVersion and CalendarRelease
+
+Revision ID: c41e8b7a2d36
+Revises: 7d2c4e9b1f05
+Create Date: 2026-10-19 16:02:48.117530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e8b7a2d36'
+down_revision: Union[str, Sequence[str], None] = '7d2c4e9b1f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('calendarversion',
+    sa.Column('region', sa.String(length=8), nullable=False),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('note', sa.String(length=200), nullable=True),
+    sa.Column('snapshot', sa.Text(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True
+    )
+    op.create_index(op.f('ix_calendarversion_region'), 'calendarversion', ['region'], unique=False)
+    op.create_table('calendarrelease',
+    sa.Column('region', sa.String(length=8), nullable=False),
+    sa.Column('version_id', sa.Integer(), nullable=False),
+    sa.Column('released_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['version_id'], ['calendarversion.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('region')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('calendarrelease')
+    op.drop_index(op.f('ix_calendarversion_region'), table_name='calendarversion')
+    op.drop_table('calendarversion')
@@ -0,0 +1,36 @@
+"""Add CalendarArchive
+
+Revision ID: d83f1a6c2e57
+Revises: 5f8a2c7d9e14
+Create Date: 2026-10-19 21:14:07.318540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd83f1a6c2e57'
+down_revision: Union[str, Sequence[str], None] = '5f8a2c7d9e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('calendararchive',
+    sa.Column('region', sa.String(length=8), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('region', 'year', name='uq_calendararchive_region_year')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('calendararchive')
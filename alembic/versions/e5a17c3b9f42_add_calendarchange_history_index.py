@@ -0,0 +1,30 @@
+"""Add history index to CalendarChange
+
+Revision ID: e5a17c3b9f42
+Revises: c41e8b7a2d36
+Create Date: 2026-10-19 17:24:09.530816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a17c3b9f42'
+down_revision: Union[str, Sequence[str], None] = 'c41e8b7a2d36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_calendarchange_region_date_changed_at', 'calendarchange',
+        ['region', 'date', 'changed_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_calendarchange_region_date_changed_at', table_name='calendarchange')
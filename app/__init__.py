@@ -31,9 +31,21 @@ WorkCalendarClient — сервис для получения информаци
 
 Пример запуска:
     uvicorn app:app --host 0.0.0.0 --port 8000
-"""
 
-from app.core import Base
-from .main import app
+Примечание:
+- `app` и `Base` импортируются лениво (при первом обращении), поэтому
+  `import app.engine` не создаёт подключений к БД и не читает настройки —
+  ядро используется клиентской библиотекой workcalendar_client.
+"""
 
 __all__ = ['app', 'Base']
+
+
+def __getattr__(name):
+    if name == 'app':
+        from .main import app
+        return app
+    if name == 'Base':
+        from app.core import Base
+        return Base
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -12,11 +12,21 @@
 Экспортируемые объекты:
 - Base — декларативная база SQLAlchemy из app.core.db.
   Используется для создания моделей БД.
-- engine — объект подключения SQLAlchemy к БД.
+- engine — объект подключения SQLAlchemy к БД (запись и миграции).
+- read_engine, get_read_engine — подключение для запросов только на чтение.
+- read_router — маршрутизация чтения по репликам БД.
+- get_session — зависимость FastAPI с сессией чтения на время запроса.
+- get_write_session — зависимость FastAPI с сессией записи (primary).
+- dispose_engines — закрытие соединений движков перед fork.
+- LoadShedder — middleware ограничения нагрузки и сроков ответа
+  из app.core.shedding.
 - run_migrations — функция из app.core.alembic_runner.
   Применяет миграции Alembic при старте приложения.
+- migrations_applied, MIGRATIONS_APPLIED_ENV — признак того, что миграции
+  уже применил мастер процессов (воркеры их пропускают).
 - settings — экземпляр настроек из app.core.settings.
   Содержит параметры конфигурации из .env‑файлов.
+- reload_settings — горячая перезагрузка изменяемых параметров settings.
 
 Пример использования:
     from app.core import Base, settings
@@ -28,9 +38,18 @@
 - при расширении пакета дополняйте список импортов и __all__.
 """
 
-from .alembic_runner import run_migrations
-from .db import Base, engine
+from .alembic_runner import MIGRATIONS_APPLIED_ENV, migrations_applied, run_migrations
+from .db import (
+    Base, dispose_engines, engine, get_read_engine, get_session,
+    get_write_session, read_engine, read_router
+)
 from .logger import main_logger
-from .settings import settings
+from .settings import reload_settings, settings
+from .shedding import LoadShedder
 
-__all__ = ['Base', 'engine', 'main_logger', 'run_migrations','settings']
+__all__ = [
+    'Base', 'LoadShedder', 'MIGRATIONS_APPLIED_ENV', 'dispose_engines', 'engine',
+    'get_read_engine', 'get_session', 'get_write_session', 'main_logger',
+    'migrations_applied', 'read_engine',
+    'read_router', 'reload_settings', 'run_migrations', 'settings'
+]
@@ -17,12 +17,17 @@
 
 Функция:
 - run_migrations() — загружает конфигурацию, настраивает URL БД и запускает
-  миграции до версии "head" (последней).
+  миграции до версии "head" (последней);
+- migrations_applied() — применил ли миграции родительский процесс
+  (мастер `python -m app.server` выставляет MIGRATIONS_APPLIED_ENV,
+  и его воркеры не запускают миграции повторно).
 
 Порядок работы:
 1. Создаётся объект Config на основе файла alembic.ini.
 2. В конфигурацию подставляется актуальный URL БД из engine.
-3. Выполняется команда upgrade до ревизии "head".
+3. Соединение engine передаётся в alembic/env.py через config.attributes,
+   поэтому миграции применяются именно к переданной БД.
+4. Выполняется команда upgrade до ревизии "head".
 
 Пример использования:
     from app.core.alembic_runner import run_migrations
@@ -39,16 +44,31 @@
 - для отладки можно добавить логирование до/после вызова функции.
 """
 
+import os
+
 from alembic.config import Config
 from alembic import command
 
+MIGRATIONS_APPLIED_ENV = 'WORKCALENDAR_MIGRATIONS_APPLIED'
+"""Переменная окружения: миграции уже применены мастером процессов."""
+
 
 def run_migrations(engine):
     """
     Применяет все ожидающие миграции Alembic к базе данных.
 
-    Использует конфигурацию из alembic.ini и URL из SQLAlchemy engine.
+    Использует конфигурацию из alembic.ini и соединение переданного
+    SQLAlchemy engine.
     """
     alembic_cfg = Config("alembic.ini")
     alembic_cfg.set_main_option("sqlalchemy.url", str(engine.url))
-    command.upgrade(alembic_cfg, "head")
+    with engine.begin() as connection:
+        alembic_cfg.attributes['connection'] = connection
+        command.upgrade(alembic_cfg, "head")
+
+
+def migrations_applied() -> bool:
+    """
+    Проверяет, применены ли миграции до запуска процесса (MIGRATIONS_APPLIED_ENV).
+    """
+    return os.environ.get(MIGRATIONS_APPLIED_ENV) == '1'
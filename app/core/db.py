@@ -16,6 +16,24 @@
   - `__tablename__` генерируется как строчное имя класса;
   - поле `id` (Integer, primary_key=True) добавляется ко всем моделям.
 - `Base` — декларативная база с наследованием от `PreBase`.
+- `engine` — движок SQLAlchemy для записи (и миграций), основная БД (primary).
+- `read_engine` — движок для чтения файловой SQLite (для других БД совпадает с `engine`).
+- `read_router` — выбор движка для чтения: реплики DATABASE_REPLICA_URLS
+  (и пул чтения SQLite) по кругу с проверкой доступности, иначе primary;
+  `get_read_engine()` возвращает очередной движок.
+- `get_session` — зависимость FastAPI, выдающая сессию чтения на время запроса.
+- `get_write_session` — зависимость FastAPI, выдающая сессию записи (primary).
+- `dispose_engines` — закрытие соединений всех движков перед fork
+  (многопроцессный запуск `python -m app.server`).
+
+Профиль производительности SQLite (для файловой БД, SQLITE_TUNING=True):
+- при каждом подключении выставляются PRAGMA: journal_mode=WAL,
+  synchronous (NORMAL), mmap_size, cache_size, busy_timeout;
+- запись идёт через единственное соединение пула `engine`,
+  поэтому писатели не конкурируют за блокировку БД;
+- чтение идёт через отдельный пул `read_engine` (PRAGMA query_only):
+  в режиме WAL читатели не блокируются писателем, и фоновая
+  синхронизация не вызывает ошибок «database is locked» у запросов.
 
 Преимущества подхода:
 - единообразие структуры таблиц (везде есть `id`);
@@ -38,9 +56,11 @@
 - корректная настройка подключения к БД в другом модуле (например, через `create_engine`).
 """
 
-from sqlalchemy import Column, Integer, create_engine
-from sqlalchemy.orm import declared_attr, declarative_base
+from sqlalchemy import Column, Integer, create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, declared_attr, declarative_base
 
+from .replicas import ReadRouter
 from .settings import settings
 
 
@@ -69,9 +89,128 @@ Base = declarative_base(cls=PreBase)
 и поле `id`. Используется как родительский класс для всех моделей БД.
 """
 
-engine = create_engine(settings.DATABASE_URL)
+def is_sqlite_file(url: str) -> bool:
+    """
+    Проверяет, указывает ли URL на файловую (не in‑memory) БД SQLite.
+    """
+    parsed = make_url(url)
+    database = parsed.database or ''
+    return (
+        parsed.get_backend_name() == 'sqlite'
+        and database not in ('', ':memory:')
+        and not database.startswith('file::memory:')
+        and parsed.query.get('mode') != 'memory'
+    )
+
+
+def configure_sqlite(engine: Engine, query_only: bool = False) -> None:
+    """
+    Подключает к engine установку PRAGMA профиля SQLite при каждом соединении.
+
+    Args:
+        engine (Engine): движок файловой БД SQLite;
+        query_only (bool): запретить запись через соединения этого движка.
+    """
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute(f'PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}')
+        cursor.execute(f'PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}')
+        cursor.execute(f'PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}')
+        cursor.execute(f'PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT)}')
+        if query_only:
+            cursor.execute('PRAGMA query_only=ON')
+        cursor.close()
+
+
+def create_engines(url: str) -> tuple[Engine, Engine]:
+    """
+    Создаёт движки записи и чтения для URL подключения.
+
+    Для файловой SQLite с включённым SQLITE_TUNING запись идёт через
+    единственное соединение, а чтение — через отдельный пул из
+    DB_READ_POOL_SIZE соединений только для чтения. Для остальных БД
+    (и SQLite в памяти) оба движка совпадают.
+
+    Returns:
+        tuple[Engine, Engine]: движок записи и движок чтения.
+    """
+    if not (settings.SQLITE_TUNING and is_sqlite_file(url)):
+        writer = create_engine(url)
+        return writer, writer
+    writer = create_engine(url, pool_size=1, max_overflow=0)
+    reader = create_engine(url, pool_size=settings.DB_READ_POOL_SIZE, max_overflow=0)
+    configure_sqlite(writer)
+    configure_sqlite(reader, query_only=True)
+    return writer, reader
+
+
+def create_replica_engines(urls: list[str]) -> list[Engine]:
+    """
+    Создаёт движки реплик для чтения.
+
+    Соединения проверяются перед выдачей из пула (pool_pre_ping),
+    чтобы не отдавать запросу разорванное соединение с репликой.
+    """
+    return [create_engine(url, pool_pre_ping=True) for url in urls]
+
+
+engine, read_engine = create_engines(settings.DATABASE_URL)
 """
-Объект движка SQLAlchemy для подключения к БД.
+Объекты движков SQLAlchemy для подключения к БД.
 
-Инициализирован на основе строки подключения из настроек приложения.
+Инициализированы на основе строки подключения из настроек приложения:
+`engine` — для записи и миграций, `read_engine` — для чтения.
 """
+
+read_router = ReadRouter(
+    engine,
+    ([read_engine] if read_engine is not engine else [])
+    + create_replica_engines(settings.DATABASE_REPLICA_URLS)
+)
+"""Маршрутизация чтения по репликам (round‑robin, с проверкой доступности)."""
+
+
+def get_read_engine() -> Engine:
+    """
+    Возвращает движок для запросов только на чтение.
+
+    Реплики выбираются по кругу; если доступных реплик нет — primary.
+    """
+    return read_router.get()
+
+
+def get_session():
+    """
+    Зависимость FastAPI: открывает сессию чтения на время запроса.
+
+    Yields:
+        Session: сессия, закрываемая после обработки запроса.
+    """
+    with Session(get_read_engine()) as session:
+        yield session
+
+
+def get_write_session():
+    """
+    Зависимость FastAPI: открывает сессию записи (primary) на время запроса.
+
+    Yields:
+        Session: сессия, закрываемая после обработки запроса.
+    """
+    with Session(engine) as session:
+        yield session
+
+
+def dispose_engines() -> None:
+    """
+    Закрывает соединения всех движков (записи, чтения, реплик).
+
+    Вызывается в родительском процессе перед fork: соединения с БД
+    нельзя делить между процессами, а пулы воркеров откроют свои
+    соединения при первом запросе.
+    """
+    for pooled in {engine, read_engine, *read_router.replicas}:
+        pooled.dispose()
@@ -0,0 +1,107 @@
+"""
+Модуль app.core.replicas — маршрутизация запросов чтения по репликам БД.
+
+Запросы к календарю почти всегда только читают данные, поэтому их можно
+распределять по репликам, а основную БД (primary) оставить для записи
+синхронизации.
+
+Структура:
+- ReadRouter — выбор движка для чтения:
+  - реплики перебираются по кругу (round‑robin);
+  - недоступная реплика исключается до следующей успешной проверки:
+    пассивно (ошибка соединения во время запроса) и активно
+    (периодическая проверка `SELECT 1`);
+  - если доступных реплик нет, чтение идёт в primary.
+
+Пример использования:
+    router = ReadRouter(primary, [replica_1, replica_2])
+    with Session(router.get()) as session:
+        ...
+"""
+
+import asyncio
+import itertools
+import threading
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+
+class ReadRouter:
+    """
+    Выбор движка для запросов только на чтение.
+
+    Attributes:
+        primary (Engine): основная БД (резерв для чтения);
+        replicas (list[Engine]): реплики для чтения.
+    """
+
+    def __init__(self, primary: Engine, replicas: list[Engine]) -> None:
+        self.primary = primary
+        self.replicas = list(replicas)
+        self._healthy = set(range(len(self.replicas)))
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        for position, replica in enumerate(self.replicas):
+            self._watch_errors(position, replica)
+
+    def _watch_errors(self, position: int, replica: Engine) -> None:
+        """
+        Исключает реплику при ошибке соединения во время запроса.
+        """
+
+        @event.listens_for(replica, 'handle_error')
+        def mark_replica_down(context):
+            if context.is_disconnect or context.connection is None:
+                self.mark_down(position)
+
+    @property
+    def healthy(self) -> list[Engine]:
+        """
+        Реплики, которые сейчас считаются доступными.
+        """
+        return [self.replicas[position] for position in sorted(self._healthy)]
+
+    def mark_down(self, position: int) -> None:
+        """
+        Исключает реплику из ротации до следующей успешной проверки.
+        """
+        with self._lock:
+            self._healthy.discard(position)
+
+    def get(self) -> Engine:
+        """
+        Возвращает следующую доступную реплику или primary, если их нет.
+        """
+        healthy = self.healthy
+        if not healthy:
+            return self.primary
+        return healthy[next(self._counter) % len(healthy)]
+
+    def check(self) -> list[bool]:
+        """
+        Проверяет все реплики запросом `SELECT 1` и обновляет их состояние.
+
+        Returns:
+            list[bool]: доступность каждой реплики.
+        """
+        states = []
+        for position, replica in enumerate(self.replicas):
+            try:
+                with replica.connect() as connection:
+                    connection.execute(text('SELECT 1'))
+            except Exception:
+                states.append(False)
+            else:
+                states.append(True)
+        with self._lock:
+            self._healthy = {position for position, ok in enumerate(states) if ok}
+        return states
+
+    async def monitor(self, interval: float) -> None:
+        """
+        Периодически проверяет реплики (запускается фоновой задачей).
+        """
+        while True:
+            await asyncio.to_thread(self.check)
+            await asyncio.sleep(interval)
@@ -22,15 +22,69 @@
   Определяет, какой .env‑файл будет загружен.
 
 - DATABASE_URL — строка подключения к БД (обязательный параметр).
+  Это основная БД (primary): в неё идут запись и миграции.
+
+- DATABASE_REPLICA_URLS, DB_REPLICA_CHECK_INTERVAL — реплики для чтения
+  и интервал проверки их доступности.
+
+- SQLITE_TUNING, SQLITE_SYNCHRONOUS, SQLITE_MMAP_SIZE, SQLITE_CACHE_SIZE,
+  SQLITE_BUSY_TIMEOUT, DB_READ_POOL_SIZE — профиль производительности
+  файловой SQLite (WAL, PRAGMA, отдельный пул чтения).
+
+- CALENDAR_REGIONS, CALENDAR_SOURCES — регионы (коды стран) и порядок
+  опроса внешних источников календаря.
+
+- HTTP_CACHE_ENABLED, HTTP_CACHE_DIR — файловый кэш ответов источников
+  с перепроверкой через ETag.
+
+- SOURCE_RATE_LIMIT, SOURCE_BURST, SOURCE_RATE_LIMITS — ограничение
+  частоты запросов к каждому источнику.
+
+- SYNC_ENABLED, SYNC_INTERVAL, SYNC_JITTER, SYNC_LOCK_FILE,
+  SYNC_POLL_INTERVAL, SYNC_CONCURRENCY — параметры фонового обновления
+  данных из источников.
+
+- PARSE_WORKERS — число процессов для разбора HTML‑страниц источников.
+
+- NOTIFY_QUEUE_SIZE — размер очереди событий на подписчика WebSocket/SSE.
+
+- WARMUP_YEARS — прогреваемые при старте годы: текущий ± WARMUP_YEARS.
+
+- ARCHIVE_AFTER_YEARS, ARCHIVE_CACHE_SIZE — горизонт переноса давних лет
+  в компактный архив (0 — не архивировать) и число разобранных архивных
+  лет в памяти воркера (см. app.services.archive).
+
+- SHED_ENABLED, SHED_MAX_CONCURRENCY, SHED_EXPENSIVE_CONCURRENCY,
+  REQUEST_DEADLINE, CHEAP_REQUEST_DEADLINE — защита времени ответа
+  при перегрузке (см. app.core.shedding).
+
+- SETTINGS_WATCH_INTERVAL — период проверки .env‑файла для горячей
+  перезагрузки настроек (0 — только по сигналу SIGHUP).
+
+- SERVER_HOST, SERVER_PORT, SERVER_WORKERS — адрес и число воркеров
+  многопроцессного запуска `python -m app.server`.
+
+- WORKDAY_SCHEDULE — распорядок рабочего дня для расчёта рабочих часов
+  (сокращённый день заканчивается раньше на недостающие часы).
 
 Логика выбора файла настроек:
 - значение ENVIRONMENT берётся из окружения либо по умолчанию 'development';
 - подгружается файл .env.{режим} (например, .env.development);
 - переменные окружения переопределяют значения из .env‑файла.
 
+Горячая перезагрузка:
+- RELOADABLE_SETTINGS — параметры, которые читаются при каждом
+  использовании и меняются без перезапуска (источники, лимиты,
+  интервалы обновления, ограничение нагрузки);
+- остальные (подключение к БД, пулы, логи, распорядок дня) применяются
+  только при перезапуске;
+- reload_settings() перечитывает окружение и .env‑файл и подменяет
+  изменившиеся параметры в settings одной операцией.
+
 Экспортируемые объекты:
 - settings — экземпляр Settings с загруженными параметрами.
   Готов к использованию в любом модуле приложения.
+- reload_settings, RELOADABLE_SETTINGS — горячая перезагрузка.
 
 Требования:
 - наличие соответствующего .env‑файла для выбранного окружения;
@@ -46,6 +100,9 @@
 
 import os
 from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import Field, PositiveFloat
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -65,6 +122,15 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = ENV_MODE
     
     DATABASE_URL: str = f"sqlite:///{DATA_DIR / 'db.sqlite3'}"
+    DATABASE_REPLICA_URLS: list[str] = []  # реплики только для чтения
+    DB_REPLICA_CHECK_INTERVAL: int = 10  # проверка доступности реплик, секунды
+
+    SQLITE_TUNING: bool = True  # профиль производительности файловой SQLite
+    SQLITE_SYNCHRONOUS: str = 'NORMAL'
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # байт
+    SQLITE_CACHE_SIZE: int = -64 * 1024  # отрицательное значение — КиБ
+    SQLITE_BUSY_TIMEOUT: int = 5000  # миллисекунд
+    DB_READ_POOL_SIZE: int = 4  # соединений только для чтения
 
     ENCODING: str = 'utf-8'
     
@@ -72,6 +138,41 @@ class Settings(BaseSettings):
     LOG_MAX_BYTES: int = 1000000
     LOG_BACKUP_COUNT: int = 0
 
+    CALENDAR_REGIONS: list[str] = ['ru']
+    CALENDAR_SOURCES: list[str] = ['xmlcalendar', 'isdayoff']
+    HTTP_TIMEOUT: float = 10.0
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_DIR: str = f"{DATA_DIR / 'http_cache'}"
+
+    SOURCE_RATE_LIMIT: float = Field(1.0, gt=0)  # запросов в секунду к одному источнику
+    SOURCE_BURST: int = Field(2, ge=1)  # запросов подряд без ожидания
+    SOURCE_RATE_LIMITS: dict[str, PositiveFloat] = {}  # лимиты по именам источников
+
+    SYNC_ENABLED: bool = True
+    SYNC_INTERVAL: int = 6 * 60 * 60  # секунды между обновлениями
+    SYNC_JITTER: int = 10 * 60  # случайная добавка к интервалу, секунды
+    SYNC_LOCK_FILE: str = f"{DATA_DIR / 'sync.lock'}"
+    SYNC_POLL_INTERVAL: int = 30  # проверка новых изменений в БД, секунды
+    SYNC_CONCURRENCY: int = 8  # одновременных загрузок (регион, год)
+    PARSE_WORKERS: int = 0  # процессов разбора HTML; 0 — по числу ядер
+
+    NOTIFY_QUEUE_SIZE: int = 100  # очередь событий на одного подписчика
+    WARMUP_YEARS: int = 2  # прогрев при старте: текущий год ± N лет
+    ARCHIVE_AFTER_YEARS: int = 10  # годы старше «текущий − N» — в архив; 0 — выкл.
+    ARCHIVE_CACHE_SIZE: int = 64  # разобранных архивных лет в памяти воркера
+    WORKDAY_SCHEDULE: str = '09:00-13:00,14:00-18:00'  # интервалы рабочего дня
+
+    SHED_ENABLED: bool = True  # 503 вместо очереди при перегрузке воркера
+    SHED_MAX_CONCURRENCY: int = 64  # одновременных запросов на воркер
+    SHED_EXPENSIVE_CONCURRENCY: int = 48  # из них дорогих (периоды, пакеты)
+    REQUEST_DEADLINE: float = 10.0  # срок ответа дорогого запроса, секунды
+    CHEAP_REQUEST_DEADLINE: float = 2.0  # срок ответа точечного запроса, секунды
+
+    SETTINGS_WATCH_INTERVAL: float = 5.0  # проверка .env для перезагрузки; 0 — выкл.
+    SERVER_HOST: str = '0.0.0.0'
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 1  # процессов `python -m app.server`
+
     model_config = SettingsConfigDict(
         env_file=BASE_DIR / f".env.{ENV_MODE}",
         env_file_encoding="utf-8",
@@ -79,3 +180,49 @@ class Settings(BaseSettings):
     )
 
 settings = Settings()
+
+RELOADABLE_SETTINGS = frozenset({
+    'CALENDAR_REGIONS', 'CALENDAR_SOURCES', 'HTTP_TIMEOUT',
+    'HTTP_CACHE_ENABLED', 'HTTP_CACHE_DIR',
+    'SOURCE_RATE_LIMIT', 'SOURCE_BURST', 'SOURCE_RATE_LIMITS',
+    'SYNC_INTERVAL', 'SYNC_JITTER', 'SYNC_POLL_INTERVAL', 'SYNC_CONCURRENCY',
+    'NOTIFY_QUEUE_SIZE', 'WARMUP_YEARS', 'ARCHIVE_AFTER_YEARS', 'ARCHIVE_CACHE_SIZE',
+    'SHED_MAX_CONCURRENCY', 'SHED_EXPENSIVE_CONCURRENCY',
+    'REQUEST_DEADLINE', 'CHEAP_REQUEST_DEADLINE', 'SETTINGS_WATCH_INTERVAL',
+})
+"""Параметры, которые применяются без перезапуска."""
+
+
+def reload_settings(
+    target: Optional[Settings] = None,
+    env_file: Optional[Path] = None
+) -> tuple[dict[str, Any], list[str]]:
+    """
+    Перечитывает настройки и подменяет изменившиеся перезагружаемые параметры.
+
+    Новые значения сначала целиком проходят валидацию и только потом
+    подставляются в target одной операцией (обновлением словаря
+    атрибутов), поэтому читатель видит либо старые, либо новые значения.
+
+    Args:
+        target (Settings | None): обновляемые настройки (по умолчанию settings);
+        env_file (Path | None): .env‑файл, из которого читаются значения
+            (по умолчанию — файл текущей среды).
+
+    Returns:
+        tuple[dict[str, Any], list[str]]: применённые изменения и имена
+        изменившихся параметров, которые требуют перезапуска.
+
+    Raises:
+        pydantic.ValidationError: если новые значения некорректны
+        (настройки не меняются).
+    """
+    target = settings if target is None else target
+    fresh = Settings() if env_file is None else Settings(_env_file=env_file)
+    changed = [
+        name for name in Settings.model_fields
+        if getattr(fresh, name) != getattr(target, name)
+    ]
+    changes = {name: getattr(fresh, name) for name in changed if name in RELOADABLE_SETTINGS}
+    target.__dict__.update(changes)
+    return changes, [name for name in changed if name not in RELOADABLE_SETTINGS]
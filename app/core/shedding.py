@@ -0,0 +1,254 @@
+"""
+Модуль app.core.shedding — защита времени ответа воркера при перегрузке.
+
+Без ограничений uvicorn принимает все запросы, они копятся в очереди
+воркера, и при перегрузке медленно отвечают все — клиенты (CRM) ловят
+таймауты и повторяют запросы, усиливая нагрузку. Middleware LoadShedder
+вместо этого деградирует предсказуемо:
+
+- ограничивает число одновременно обрабатываемых запросов воркера
+  (SHED_MAX_CONCURRENCY); лишние запросы сразу получают 503 с Retry-After,
+  а не ждут в очереди;
+- отдаёт приоритет дешёвым запросам: дорогие (периоды, пакетные расчёты,
+  составные запросы, рабочие часы) занимают не больше
+  SHED_EXPENSIVE_CONCURRENCY мест, остальные места остаются точечным
+  запросам по снимку в памяти;
+- ограничивает время ответа чтения и расчётов (REQUEST_DEADLINE для
+  дорогих запросов, CHEAP_REQUEST_DEADLINE — для дешёвых): если ответ
+  не начат к сроку, клиент получает 503 с Retry-After, а обработчик
+  отменяется (синхронный обработчик дорабатывает в пуле потоков и до
+  конца держит своё место, поэтому лишние запросы не занимают новых
+  потоков); запросы записи (публикация и откат версий, наложения) срока
+  не имеют: отменить запись нельзя, и 503 привёл бы к её повтору;
+- пул потоков anyio для синхронных обработчиков (по умолчанию 40 потоков)
+  расширяется до лимита одновременных запросов, чтобы допущенные
+  запросы не ждали свободного потока в очереди;
+- Retry-After адаптивный: скользящее среднее времени обработки запросов.
+
+Лимиты и сроки, не заданные явно, читаются из settings при каждом
+запросе, поэтому меняются горячей перезагрузкой настроек.
+
+Проверки состояния (`/health`, `/ready`), поток событий `/changes/stream`
+и WebSocket не ограничиваются.
+
+Структура:
+- EXPENSIVE_PREFIXES, EXEMPT_PATHS — классификация запросов;
+- READ_ONLY_POST_PREFIXES — расчётные POST‑запросы (без записи);
+- is_expensive() — дорогой ли запрос;
+- has_deadline() — ограничивается ли время ответа (записи — нет:
+  они допускаются или отклоняются сразу и всегда получают свой результат);
+- LoadShedder — ASGI middleware.
+
+Пример использования:
+    app.add_middleware(LoadShedder)  # лимиты из settings
+    app.add_middleware(LoadShedder, limit=64, expensive_limit=48)
+"""
+
+import asyncio
+import json
+import math
+import time
+from contextlib import suppress
+from typing import Optional
+
+from anyio.to_thread import current_default_thread_limiter
+
+from .settings import settings
+
+EXPENSIVE_PREFIXES = (
+    '/calendar', '/days', '/bulk', '/query', '/working-hours', '/overlays', '/versions',
+    '/snapshot', '/changes', '/aggregates',
+)
+"""Пути дорогих запросов: периоды, пакетные и составные расчёты, снимки, журнал, записи."""
+
+READ_ONLY_POST_PREFIXES = ('/bulk', '/days', '/query')
+"""Пути POST‑запросов, которые только считают (без записи в БД)."""
+
+EXEMPT_PATHS = frozenset({'/health', '/ready', '/changes/stream'})
+"""Пути, которые не ограничиваются (проверки состояния, долгие потоки)."""
+
+LATENCY_SMOOTHING = 0.2
+"""Вес нового замера в скользящем среднем времени обработки."""
+
+MAX_RETRY_AFTER = 30
+"""Верхняя граница Retry-After, секунды."""
+
+
+def _matches(path: str, prefixes: tuple[str, ...]) -> bool:
+    return any(path == prefix or path.startswith(prefix + '/') for prefix in prefixes)
+
+
+def is_expensive(path: str) -> bool:
+    """
+    Проверяет, относится ли путь к дорогим запросам.
+    """
+    return _matches(path, EXPENSIVE_PREFIXES)
+
+
+def has_deadline(method: str, path: str) -> bool:
+    """
+    Проверяет, ограничивается ли время ответа запроса.
+
+    Срок действует только для чтения (GET/HEAD) и расчётных POST‑запросов:
+    брошенный по сроку синхронный обработчик дорабатывает в пуле потоков,
+    и запись успела бы зафиксироваться, а клиент по 503 повторил бы её.
+    """
+    return method in ('GET', 'HEAD') or (
+        method == 'POST' and _matches(path, READ_ONLY_POST_PREFIXES)
+    )
+
+
+class LoadShedder:
+    """
+    ASGI middleware: ограничение одновременных запросов и сроков ответа.
+
+    Счётчики меняются только в цикле событий воркера, поэтому
+    блокировки не нужны.
+
+    Attributes:
+        limit (int): всего одновременных запросов (SHED_MAX_CONCURRENCY);
+        expensive_limit (int): из них дорогих (SHED_EXPENSIVE_CONCURRENCY);
+        deadline (float): срок ответа дорогого запроса, секунды (REQUEST_DEADLINE);
+        cheap_deadline (float): срок ответа дешёвого запроса, секунды
+            (CHEAP_REQUEST_DEADLINE);
+        in_flight (int): обрабатываемых запросов;
+        expensive_in_flight (int): из них дорогих;
+        shed (int): отклонено запросов из‑за перегрузки;
+        timed_out (int): отклонено запросов по сроку ответа;
+        latency (float): скользящее среднее времени обработки, секунды.
+    """
+
+    def __init__(
+        self,
+        app,
+        limit: Optional[int] = None,
+        expensive_limit: Optional[int] = None,
+        deadline: Optional[float] = None,
+        cheap_deadline: Optional[float] = None
+    ) -> None:
+        self.app = app
+        self._limit = limit
+        self._expensive_limit = expensive_limit
+        self._deadline = deadline
+        self._cheap_deadline = cheap_deadline
+        self.in_flight = 0
+        self.expensive_in_flight = 0
+        self.shed = 0
+        self.timed_out = 0
+        self.latency = 0.0
+
+    @property
+    def limit(self) -> int:
+        return settings.SHED_MAX_CONCURRENCY if self._limit is None else self._limit
+
+    @property
+    def expensive_limit(self) -> int:
+        limit = (
+            settings.SHED_EXPENSIVE_CONCURRENCY
+            if self._expensive_limit is None else self._expensive_limit
+        )
+        return min(limit, self.limit)
+
+    @property
+    def deadline(self) -> float:
+        return settings.REQUEST_DEADLINE if self._deadline is None else self._deadline
+
+    @property
+    def cheap_deadline(self) -> float:
+        return settings.CHEAP_REQUEST_DEADLINE if self._cheap_deadline is None else self._cheap_deadline
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope['type'] != 'http' or scope['path'] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+        self._reserve_threads()
+        expensive = is_expensive(scope['path'])
+        if self.in_flight >= self.limit or (
+            expensive and self.expensive_in_flight >= self.expensive_limit
+        ):
+            self.shed += 1
+            await self._reject(send, 'Сервис перегружен, повторите запрос позже')
+            return
+        self.in_flight += 1
+        self.expensive_in_flight += expensive
+        started = time.perf_counter()
+        try:
+            if has_deadline(scope['method'], scope['path']):
+                await self._call_with_deadline(
+                    scope, receive, send, self.deadline if expensive else self.cheap_deadline
+                )
+            else:
+                await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            self.expensive_in_flight -= expensive
+            elapsed = time.perf_counter() - started
+            self.latency += LATENCY_SMOOTHING * (elapsed - self.latency)
+
+    def _reserve_threads(self) -> None:
+        """
+        Расширяет пул потоков anyio до лимита одновременных запросов.
+
+        Каждый допущенный синхронный обработчик (в том числе брошенный
+        по сроку) занимает и место, и поток, поэтому потоков нужно
+        не меньше, чем мест.
+        """
+        limiter = current_default_thread_limiter()
+        if limiter.total_tokens < self.limit:
+            limiter.total_tokens = self.limit
+
+    async def _call_with_deadline(self, scope, receive, send, deadline: float) -> None:
+        """
+        Вызывает приложение; если ответ не начат к сроку — отвечает 503.
+
+        После отказа обработчик отменяется, а всё, что он успеет
+        отправить, отбрасывается.
+        """
+        response_started = False
+        abandoned = False
+
+        async def guarded_send(message) -> None:
+            nonlocal response_started
+            if abandoned:
+                return
+            if message['type'] == 'http.response.start':
+                response_started = True
+            await send(message)
+
+        task = asyncio.ensure_future(self.app(scope, receive, guarded_send))
+        try:
+            done, _ = await asyncio.wait({task}, timeout=deadline)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if task in done or response_started:
+            await task
+            return
+        abandoned = True
+        task.cancel()
+        self.timed_out += 1
+        await self._reject(send, 'Превышено время ответа, повторите запрос позже')
+        with suppress(asyncio.CancelledError):
+            await task
+
+    def retry_after(self) -> int:
+        """
+        Рекомендуемая пауза перед повтором: среднее время обработки, секунды.
+        """
+        return min(max(math.ceil(self.latency), 1), MAX_RETRY_AFTER)
+
+    async def _reject(self, send, detail: str) -> None:
+        """
+        Отправляет 503 с Retry-After и JSON {"detail": ...}.
+        """
+        body = json.dumps({'detail': detail}, ensure_ascii=False).encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': 503,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode()),
+                (b'retry-after', str(self.retry_after()).encode()),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
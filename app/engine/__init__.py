@@ -0,0 +1,55 @@
+"""
+Модуль app.engine.__init__.py — вычислительное ядро календаря WorkCalendarClient.
+
+Содержит чистые (без БД, настроек и веб‑фреймворка) структуры данных
+и алгоритмы работы с производственным календарём.
+
+Экспортируемые объекты:
+- DayRecord — нормализованная запись о дне;
+- YearCalendar — календарь региона за год;
+- CalendarIndex — неизменяемый снимок календаря;
+- IndexHolder — держатель снимка с атомарной заменой;
+- default_is_working — правило пятидневки для незагруженных дат;
+- day_hours, special_hours, STANDARD_DAY_HOURS, SHORT_DAY_HOURS —
+  продолжительность рабочего дня;
+- WorkSchedule, working_hours_between, add_working_hours, MAX_WORKING_HOURS —
+  арифметика рабочих часов (сроки SLA);
+- IntervalMap, IntervalLayer, LayeredCalendar — календари сотрудников
+  и команд: разреженные интервалы поверх базового календаря;
+- ShiftPattern, ShiftLayer — сменные графики (2/2, 5/2, 1/3) с ленивым
+  вычислением блоками по месяцам;
+- dump_snapshot, load_snapshot, load_years — переносимый формат снимка
+  (общий для сервера и клиентской библиотеки workcalendar_client);
+- ArchiveStore, ArchiveCache, encode_year, decode_year — компактный архив
+  давних лет (сжатые битовые карты, ленивый разбор, LRU).
+
+Векторные вычисления на NumPy (app.engine.vectorized.VectorCalendar)
+не реэкспортируются, чтобы ядро импортировалось без NumPy; календарь
+региона в виде массивов можно получить через `CalendarIndex.vector()`.
+
+Пример использования:
+    from app.engine import CalendarIndex, DayRecord
+
+Рекомендации:
+- не импортируйте сюда модули app.core и app.services —
+  ядро должно оставаться лёгким и независимым.
+"""
+
+from .archive import ArchiveCache, ArchiveStore, decode_year, encode_year
+from .hours import MAX_WORKING_HOURS, WorkSchedule, add_working_hours, working_hours_between
+from .index import (
+    SHORT_DAY_HOURS, STANDARD_DAY_HOURS, CalendarIndex, DayRecord, IndexHolder,
+    YearCalendar, day_hours, default_is_working, special_hours
+)
+from .overlay import IntervalLayer, IntervalMap, LayeredCalendar
+from .shifts import ShiftLayer, ShiftPattern
+from .snapshot import dump_snapshot, load_snapshot, load_years
+
+__all__ = [
+    'ArchiveCache', 'ArchiveStore', 'CalendarIndex', 'DayRecord', 'IndexHolder',
+    'IntervalLayer', 'IntervalMap', 'LayeredCalendar', 'MAX_WORKING_HOURS', 'SHORT_DAY_HOURS', 'ShiftLayer',
+    'ShiftPattern', 'STANDARD_DAY_HOURS', 'WorkSchedule', 'YearCalendar',
+    'add_working_hours', 'day_hours', 'decode_year', 'default_is_working',
+    'dump_snapshot', 'encode_year', 'load_snapshot', 'load_years', 'special_hours',
+    'working_hours_between'
+]
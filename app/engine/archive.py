@@ -0,0 +1,177 @@
+"""
+Модуль app.engine.archive — компактный архив давних лет календаря.
+
+Давние годы запрашиваются редко, но должны оставаться доступными.
+Вместо 365 строк на год архив хранит один сжатый блоб на регион и год,
+а снимок календаря разбирает блоб только при первом обращении к году.
+
+Формат блоба (zlib):
+    байт версии формата (ARCHIVE_FORMAT)
+    + битовая карта рабочих дней (бит i — день года i, младший бит первым)
+    + JSON {"holidays": {"<день года>": "название"}, "hours": {"<день года>": 7}}
+
+Обычный год занимает около сотни байт.
+
+Структура:
+- encode_year() — календарь года в блоб;
+- decode_year() — блоб в календарь года;
+- ArchiveCache — общий LRU‑кэш разобранных лет (по содержимому блоба);
+- ArchiveStore — неизменяемый набор блобов снимка с ленивым разбором.
+
+Пример использования:
+    store = ArchiveStore({('ru', 2001): encode_year(calendar)}, ArchiveCache(64))
+    index = CalendarIndex.from_years(recent_years, archive=store)
+    index.is_working('ru', date(2001, 5, 1))  # разбор 2001 года при первом обращении
+"""
+
+import json
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Mapping, Optional
+
+from .index import YearCalendar, year_dates
+
+ARCHIVE_FORMAT = 1
+"""Версия формата блоба."""
+
+ARCHIVE_CACHE_SIZE = 64
+"""Сколько разобранных лет хранит кэш по умолчанию."""
+
+
+def encode_year(calendar: YearCalendar) -> bytes:
+    """
+    Упаковывает календарь года в сжатый блоб.
+    """
+    first = date(calendar.year, 1, 1)
+    bits = sum(1 << offset for offset, flag in enumerate(calendar.flags) if flag)
+    extras = {
+        'holidays': {(day - first).days: name for day, name in sorted(calendar.holidays.items())},
+        'hours': {(day - first).days: hours for day, hours in sorted(calendar.hours.items())},
+    }
+    payload = (
+        bytes([ARCHIVE_FORMAT])
+        + bits.to_bytes((len(calendar.flags) + 7) // 8, 'little')
+        + json.dumps(extras, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    )
+    return zlib.compress(payload, 9)
+
+
+def decode_year(region: str, year: int, blob: bytes) -> YearCalendar:
+    """
+    Восстанавливает календарь года из блоба.
+
+    Raises:
+        ValueError: если блоб повреждён или записан в неизвестном формате.
+    """
+    try:
+        payload = zlib.decompress(blob)
+    except zlib.error as error:
+        raise ValueError(f'Архив {region}/{year} повреждён: {error}') from error
+    if not payload or payload[0] != ARCHIVE_FORMAT:
+        raise ValueError(f'Архив {region}/{year}: неизвестный формат')
+    count = len(year_dates(year))
+    size = (count + 7) // 8
+    bits = int.from_bytes(payload[1:size + 1], 'little')
+    extras = json.loads(payload[size + 1:])
+    first = date(year, 1, 1)
+    return YearCalendar.from_flags(
+        region,
+        year,
+        (bits >> offset & 1 for offset in range(count)),
+        {first + timedelta(days=int(offset)): name for offset, name in extras['holidays'].items()},
+        {first + timedelta(days=int(offset)): int(hours) for offset, hours in extras['hours'].items()},
+    )
+
+
+class ArchiveCache:
+    """
+    LRU‑кэш разобранных лет архива, общий для снимков процесса.
+
+    Ключ — регион, год и сам блоб: блоб неизменяем, поэтому запись кэша
+    никогда не устаревает, а новый снимок с тем же блобом не разбирает
+    год заново. Обращения идут из пула потоков, поэтому кэш защищён
+    блокировкой.
+
+    Attributes:
+        size (int): сколько разобранных лет хранить.
+    """
+
+    def __init__(self, size: int = ARCHIVE_CACHE_SIZE) -> None:
+        self.size = size
+        self._years: OrderedDict[tuple[str, int, bytes], YearCalendar] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, region: str, year: int, blob: bytes) -> YearCalendar:
+        """
+        Разобранный год из кэша или, при промахе, из блоба.
+        """
+        key = (region, year, blob)
+        with self._lock:
+            calendar = self._years.get(key)
+            if calendar is not None:
+                self._years.move_to_end(key)
+                return calendar
+        calendar = decode_year(region, year, blob)
+        with self._lock:
+            self._years[key] = calendar
+            while len(self._years) > self.size:
+                self._years.popitem(last=False)
+        return calendar
+
+    def clear(self) -> None:
+        """
+        Очищает кэш.
+        """
+        with self._lock:
+            self._years.clear()
+
+    def __len__(self) -> int:
+        return len(self._years)
+
+
+class ArchiveStore:
+    """
+    Архивные годы снимка: блобы по (регион, год) с ленивым разбором.
+
+    Набор блобов не меняется после построения (как и CalendarIndex);
+    разобранные годы хранятся в общем кэше ArchiveCache.
+    """
+
+    def __init__(
+        self,
+        blobs: Optional[Mapping[tuple[str, int], bytes]] = None,
+        cache: Optional[ArchiveCache] = None
+    ) -> None:
+        self._blobs = dict(blobs or {})
+        self.cache = cache if cache is not None else ArchiveCache()
+
+    @property
+    def regions(self) -> set[str]:
+        """
+        Регионы, у которых есть архивные годы.
+        """
+        return {region for region, _ in self._blobs}
+
+    def years(self, region: str) -> list[int]:
+        """
+        Отсортированные архивные годы региона.
+        """
+        return sorted(year for key_region, year in self._blobs if key_region == region)
+
+    def get(self, region: str, year: int) -> Optional[YearCalendar]:
+        """
+        Календарь архивного года (разбирается при первом обращении)
+        или None, если года в архиве нет.
+        """
+        blob = self._blobs.get((region, year))
+        if blob is None:
+            return None
+        return self.cache.get(region, year, blob)
+
+    def __contains__(self, key: tuple[str, int]) -> bool:
+        return key in self._blobs
+
+    def __len__(self) -> int:
+        return len(self._blobs)
@@ -0,0 +1,227 @@
+"""
+Модуль app.engine.hours — арифметика рабочих часов (сроки SLA).
+
+Сроки SLA считаются в рабочих часах: «ответить за 16 рабочих часов»
+не считает ночи, выходные и праздники, а сокращённый предпраздничный
+день даёт на час меньше.
+
+Модель:
+- у каждого дня календаря есть число рабочих часов (YearCalendar.working_hours:
+  8 — обычный день, 7 — сокращённый, 0 — нерабочий);
+- распорядок дня (WorkSchedule) задаёт интервалы работы, например
+  09:00–13:00 и 14:00–18:00; день из N часов — это первые N часов распорядка
+  (сокращённый день заканчивается на час раньше);
+- для каждого года хранятся префиксные суммы рабочих часов по дням
+  (YearCalendar.cumulative_hours), поэтому «сколько рабочего времени прошло
+  с начала года до момента» вычисляется за O(1), а поиск дня по накопленному
+  времени — двоичным поиском по году.
+
+Структура:
+- WorkSchedule — распорядок рабочего дня;
+- working_hours_between() — рабочие часы между двумя моментами;
+- add_working_hours() — момент через N рабочих часов.
+
+Моменты — «наивные» datetime в местном времени региона; моменты
+с часовым поясом отклоняются (ValueError), как и срок длиннее
+MAX_WORKING_HOURS или бесконечный.
+
+Пример использования:
+    schedule = WorkSchedule.parse('09:00-13:00,14:00-18:00')
+    add_working_hours(index, 'ru', datetime(2025, 4, 30, 16, 0), 2, schedule)
+    # 30.04 — сокращённый день (до 17:00): 1 час 30.04 + 1 час следующего
+    # рабочего дня → 10:00 следующего рабочего дня
+"""
+
+import math
+from bisect import bisect_left
+from datetime import date, datetime, time
+from typing import Optional
+
+from .index import CalendarIndex
+
+SECONDS_PER_HOUR = 3600
+
+MAX_WORKING_HOURS = 100_000
+"""Наибольший срок в рабочих часах (около полувека рабочего времени)."""
+
+
+def _seconds(moment: time) -> int:
+    return moment.hour * 3600 + moment.minute * 60 + moment.second
+
+
+def _time(seconds: int) -> time:
+    if seconds >= 24 * 3600:
+        return time.max.replace(microsecond=0)
+    return time(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+
+
+class WorkSchedule:
+    """
+    Распорядок рабочего дня: интервалы работы внутри суток.
+
+    Attributes:
+        spans (tuple[tuple[int, int], ...]): интервалы [начало, конец)
+            в секундах от полуночи, по возрастанию.
+    """
+
+    def __init__(self, spans) -> None:
+        spans = tuple(sorted((int(start), int(end)) for start, end in spans))
+        if not spans or any(start >= end for start, end in spans) or any(
+            previous[1] > current[0] for previous, current in zip(spans, spans[1:])
+        ):
+            raise ValueError('Интервалы распорядка должны быть непустыми и не пересекаться')
+        self.spans = spans
+
+    @classmethod
+    def parse(cls, text: str) -> 'WorkSchedule':
+        """
+        Разбирает распорядок вида '09:00-13:00,14:00-18:00'.
+
+        Raises:
+            ValueError: если строка некорректна.
+        """
+        spans = []
+        for part in text.split(','):
+            start, end = (
+                _seconds(time.fromisoformat(value.strip())) for value in part.split('-')
+            )
+            spans.append((start, end))
+        return cls(spans)
+
+    def day_spans(self, hours: int) -> list[tuple[int, int]]:
+        """
+        Интервалы работы дня из `hours` часов: первые часы распорядка.
+
+        Если день длиннее распорядка, продлевается последний интервал.
+        """
+        remaining = hours * SECONDS_PER_HOUR
+        spans = []
+        for start, end in self.spans:
+            if remaining <= 0:
+                break
+            spans.append((start, min(end, start + remaining)))
+            remaining -= spans[-1][1] - start
+        if remaining > 0 and spans:
+            spans[-1] = (spans[-1][0], spans[-1][1] + remaining)
+        return spans
+
+    def worked(self, moment: time, hours: int) -> int:
+        """
+        Сколько секунд рабочего времени прошло в дне к моменту `moment`.
+        """
+        seconds = _seconds(moment)
+        return sum(
+            max(0, min(seconds, end) - start) for start, end in self.day_spans(hours)
+        )
+
+    def moment(self, worked: int, hours: int) -> time:
+        """
+        Момент дня, к которому отработано `worked` секунд (0 < worked ≤ длины дня).
+
+        Если момент приходится на конец интервала, возвращается конец
+        интервала (а не начало следующего).
+        """
+        for start, end in self.day_spans(hours):
+            if worked <= end - start:
+                return _time(start + worked)
+            worked -= end - start
+        raise ValueError('Отработанное время больше продолжительности дня')
+
+
+DEFAULT_SCHEDULE = WorkSchedule([(9 * 3600, 13 * 3600), (14 * 3600, 18 * 3600)])
+"""Распорядок по умолчанию: 09:00–13:00 и 14:00–18:00 (8 часов)."""
+
+
+def _check_naive(*moments: datetime) -> None:
+    """
+    Проверяет, что моменты заданы в местном времени без часового пояса.
+
+    Raises:
+        ValueError: если у момента есть часовой пояс.
+    """
+    if any(moment.tzinfo is not None for moment in moments):
+        raise ValueError('Моменты передаются в местном времени региона без часового пояса')
+
+
+def _worked_in_year(index: CalendarIndex, region: str, moment: datetime, schedule: WorkSchedule) -> int:
+    """
+    Рабочие секунды с начала года момента до самого момента.
+    """
+    calendar = index.calendar(region, moment.year)
+    day = moment.date()
+    return (
+        calendar.hours_before(day) * SECONDS_PER_HOUR
+        + schedule.worked(moment.time(), calendar.working_hours(day))
+    )
+
+
+def working_hours_between(
+    index: CalendarIndex,
+    region: str,
+    start: datetime,
+    end: datetime,
+    schedule: Optional[WorkSchedule] = None
+) -> float:
+    """
+    Рабочие часы между моментами start и end.
+
+    При end < start результат отрицательный. Время — O(числа лет в периоде).
+
+    Raises:
+        ValueError: если у момента есть часовой пояс.
+    """
+    _check_naive(start, end)
+    schedule = schedule or DEFAULT_SCHEDULE
+    if end < start:
+        return -working_hours_between(index, region, end, start, schedule)
+    total = 0
+    for year in range(start.year, end.year + 1):
+        first = _worked_in_year(index, region, start, schedule) if year == start.year else 0
+        if year == end.year:
+            last = _worked_in_year(index, region, end, schedule)
+        else:
+            last = index.calendar(region, year).cumulative_hours[-1] * SECONDS_PER_HOUR
+        total += last - first
+    return total / SECONDS_PER_HOUR
+
+
+def add_working_hours(
+    index: CalendarIndex,
+    region: str,
+    moment: datetime,
+    hours: float,
+    schedule: Optional[WorkSchedule] = None
+) -> datetime:
+    """
+    Возвращает момент, когда с `moment` пройдёт `hours` рабочих часов.
+
+    Результат всегда приходится на рабочее время; если срок истекает ровно
+    в конце рабочего интервала, возвращается конец интервала (например,
+    18:00, а не 09:00 следующего рабочего дня). Отрицательное `hours`
+    отсчитывает назад.
+
+    Raises:
+        ValueError: если у момента есть часовой пояс, |hours| больше
+            MAX_WORKING_HOURS или не конечно, либо срок выходит за 9999 год.
+    """
+    _check_naive(moment)
+    if not math.isfinite(hours) or abs(hours) > MAX_WORKING_HOURS:
+        raise ValueError(f'Срок должен быть конечным и не больше {MAX_WORKING_HOURS} часов')
+    schedule = schedule or DEFAULT_SCHEDULE
+    year = moment.year
+    calendar = index.calendar(region, year)
+    target = _worked_in_year(index, region, moment, schedule) + round(hours * SECONDS_PER_HOUR)
+    while target > calendar.cumulative_hours[-1] * SECONDS_PER_HOUR:
+        target -= calendar.cumulative_hours[-1] * SECONDS_PER_HOUR
+        year += 1
+        calendar = index.calendar(region, year)
+    while target <= 0:
+        year -= 1
+        calendar = index.calendar(region, year)
+        target += calendar.cumulative_hours[-1] * SECONDS_PER_HOUR
+    # день, в котором накопленное время впервые достигает target
+    offset = bisect_left(calendar.cumulative_hours, -(-target // SECONDS_PER_HOUR)) - 1
+    day = date.fromordinal(date(year, 1, 1).toordinal() + offset)
+    worked = target - calendar.cumulative_hours[offset] * SECONDS_PER_HOUR
+    return datetime.combine(day, schedule.moment(worked, calendar.working_hours(day)))
+
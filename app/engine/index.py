@@ -0,0 +1,532 @@
+"""
+Модуль app.engine.index — in‑memory индекс производственного календаря.
+
+Хранит нормализованные дни календаря в памяти процесса и отвечает на
+вопросы «рабочий ли день» без обращения к БД.
+
+Назначение:
+- быстрые ответы на запросы к календарю на горячем пути;
+- неизменяемые снимки данных, которые можно атомарно подменять.
+
+Структура:
+- DayRecord — нормализованная запись о дне (регион, дата, статус, праздник,
+  рабочие часы);
+- YearCalendar — данные одного региона за один год;
+- CalendarIndex — неизменяемый снимок всех загруженных регионов и лет
+  (давние годы могут лежать в архиве снимка и разбираться лениво,
+  см. app.engine.archive);
+- IndexHolder — держатель текущего снимка с атомарной заменой (swap).
+
+Правило по умолчанию:
+- для дат, которых нет в снимке, действует обычная пятидневка
+  (суббота и воскресенье — выходные);
+- рабочий день длится STANDARD_DAY_HOURS часов, если источник не указал
+  иное (например, сокращённый предпраздничный день — SHORT_DAY_HOURS).
+
+Особенности:
+- модуль не зависит от БД, настроек и веб‑фреймворка,
+  поэтому его можно использовать вне сервера;
+- снимок не изменяется после построения: читатель, получивший
+  `holder.current`, работает с согласованными данными даже во время
+  фоновой замены индекса.
+
+Пример использования:
+    holder = IndexHolder()
+    holder.swap(CalendarIndex(records))
+    holder.current.is_working('ru', date(2025, 1, 1))  # False
+"""
+
+from calendar import isleap
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterable, Optional
+
+
+STANDARD_DAY_HOURS = 8
+"""Продолжительность обычного рабочего дня, часов."""
+
+SHORT_DAY_HOURS = 7
+"""Продолжительность сокращённого предпраздничного дня, часов."""
+
+DEFAULT_YEARS_CACHE_SIZE = 128
+"""Сколько календарей лет по правилу по умолчанию хранит общий кэш процесса."""
+
+
+@dataclass(frozen=True)
+class DayRecord:
+    """
+    Нормализованная запись о дне календаря.
+
+    Attributes:
+        region (str): код региона (например, 'ru');
+        date (date): дата;
+        is_working (bool): True — рабочий день, False — выходной/праздник;
+        holiday_name (str | None): название праздника, если известно;
+        working_hours (int | None): рабочих часов в дне; None — по статусу
+            (STANDARD_DAY_HOURS для рабочего дня, 0 для нерабочего).
+            Записи из снимка календаря всегда содержат число часов.
+    """
+
+    region: str
+    date: date
+    is_working: bool
+    holiday_name: Optional[str] = None
+    working_hours: Optional[int] = None
+
+
+def day_hours(is_working: bool, working_hours: Optional[int] = None) -> int:
+    """
+    Рабочих часов в дне с учётом значения по умолчанию.
+    """
+    if not is_working:
+        return 0
+    return STANDARD_DAY_HOURS if working_hours is None else working_hours
+
+
+def special_hours(is_working: bool, working_hours: Optional[int]) -> Optional[int]:
+    """
+    Часы дня для хранения: None, если они совпадают со значением по умолчанию.
+    """
+    hours = day_hours(is_working, working_hours)
+    return None if hours == day_hours(is_working) else hours
+
+
+def default_is_working(day: date) -> bool:
+    """
+    Правило по умолчанию: понедельник–пятница рабочие, выходные — нет.
+    """
+    return day.weekday() < 5
+
+
+def year_dates(year: int) -> list[date]:
+    """
+    Возвращает список всех дат указанного года по порядку.
+    """
+    first = date(year, 1, 1)
+    count = 366 if isleap(year) else 365
+    return [first + timedelta(days=offset) for offset in range(count)]
+
+
+class YearCalendar:
+    """
+    Календарь одного региона за один год.
+
+    Хранит признак рабочего дня для каждой даты года в виде
+    последовательности флагов, словарь названий праздников и словарь
+    нестандартной продолжительности дней (сокращённые дни).
+
+    Attributes:
+        region (str): код региона;
+        year (int): год;
+        flags (tuple[bool, ...]): признак рабочего дня по порядку дат года;
+        holidays (dict[date, str]): названия праздников по датам;
+        hours (dict[date, int]): рабочие часы дней, отличающиеся от стандартных.
+    """
+
+    __slots__ = (
+        'region', 'year', 'flags', 'holidays', 'hours', '_first_ordinal',
+        '_records', '_cumulative', '_working', '_cumulative_hours'
+    )
+
+    def __init__(self, region: str, year: int, records: Iterable[DayRecord]) -> None:
+        """
+        Строит календарь года из записей.
+
+        Даты, для которых записей нет, заполняются правилом по умолчанию.
+
+        Args:
+            region (str): код региона;
+            year (int): год;
+            records (Iterable[DayRecord]): записи этого региона и года.
+        """
+        self.region = region
+        self.year = year
+        self._first_ordinal = date(year, 1, 1).toordinal()
+        flags = [default_is_working(day) for day in year_dates(year)]
+        holidays = {}
+        hours = {}
+        for record in records:
+            flags[record.date.toordinal() - self._first_ordinal] = record.is_working
+            if record.holiday_name:
+                holidays[record.date] = record.holiday_name
+            special = special_hours(record.is_working, record.working_hours)
+            if special is not None:
+                hours[record.date] = special
+        self.flags = tuple(flags)
+        self.holidays = holidays
+        self.hours = hours
+        self._records = None
+        self._cumulative = None
+        self._working = None
+        self._cumulative_hours = None
+
+    @classmethod
+    def from_flags(
+        cls,
+        region: str,
+        year: int,
+        flags: Iterable[bool],
+        holidays: Optional[dict[date, str]] = None,
+        hours: Optional[dict[date, int]] = None
+    ) -> 'YearCalendar':
+        """
+        Строит календарь года из готовых флагов (например, из снимка клиента).
+
+        Raises:
+            ValueError: если число флагов не равно числу дней года.
+        """
+        calendar = cls(region, year, ())
+        flags = tuple(bool(flag) for flag in flags)
+        if len(flags) != len(calendar.flags):
+            raise ValueError(f'Ожидалось {len(calendar.flags)} флагов для {year} года')
+        calendar.flags = flags
+        calendar.holidays = dict(holidays or {})
+        calendar.hours = dict(hours or {})
+        return calendar
+
+    def is_working(self, day: date) -> bool:
+        """
+        Возвращает признак рабочего дня для даты этого года.
+        """
+        return self.flags[day.toordinal() - self._first_ordinal]
+
+    def working_hours(self, day: date) -> int:
+        """
+        Возвращает число рабочих часов даты этого года.
+        """
+        return day_hours(self.is_working(day), self.hours.get(day))
+
+    def get_day(self, day: date) -> DayRecord:
+        """
+        Возвращает запись о дне этого года.
+        """
+        is_working = self.is_working(day)
+        return DayRecord(
+            self.region, day, is_working, self.holidays.get(day),
+            day_hours(is_working, self.hours.get(day))
+        )
+
+    def records(self) -> tuple[DayRecord, ...]:
+        """
+        Возвращает записи обо всех днях года по порядку.
+
+        Записи строятся при первом обращении и переиспользуются
+        (календарь года неизменяем).
+        """
+        if self._records is None:
+            self._records = tuple(self.get_day(day) for day in year_dates(self.year))
+        return self._records
+
+    @property
+    def cumulative(self) -> tuple[int, ...]:
+        """
+        Число рабочих дней года до каждой даты (длина — дней в году + 1).
+        """
+        if self._cumulative is None:
+            self._cumulative = (0, *accumulate(self.flags))
+        return self._cumulative
+
+    @property
+    def cumulative_hours(self) -> tuple[int, ...]:
+        """
+        Число рабочих часов года до каждой даты (длина — дней в году + 1).
+        """
+        if self._cumulative_hours is None:
+            self._cumulative_hours = (0, *accumulate(
+                day_hours(flag, self.hours.get(date.fromordinal(self._first_ordinal + offset)))
+                for offset, flag in enumerate(self.flags)
+            ))
+        return self._cumulative_hours
+
+    def hours_before(self, day: date) -> int:
+        """
+        Число рабочих часов этого года строго до даты.
+        """
+        return self.cumulative_hours[day.toordinal() - self._first_ordinal]
+
+    def count_before(self, day: date) -> int:
+        """
+        Число рабочих дней этого года строго до даты.
+        """
+        return self.cumulative[day.toordinal() - self._first_ordinal]
+
+    def nth_working(self, position: int) -> date:
+        """
+        Возвращает рабочий день года с порядковым номером position (с нуля).
+        """
+        if self._working is None:
+            self._working = tuple(offset for offset, flag in enumerate(self.flags) if flag)
+        return date.fromordinal(self._first_ordinal + self._working[position])
+
+    def slice(self, start: date, end: date) -> tuple[DayRecord, ...]:
+        """
+        Возвращает записи о днях этого года в диапазоне [start, end].
+        """
+        return self.records()[
+            start.toordinal() - self._first_ordinal:
+            end.toordinal() - self._first_ordinal + 1
+        ]
+
+
+@lru_cache(maxsize=DEFAULT_YEARS_CACHE_SIZE)
+def default_year(region: str, year: int) -> YearCalendar:
+    """
+    Календарь года по правилу по умолчанию (кэш — DEFAULT_YEARS_CACHE_SIZE лет).
+    """
+    return YearCalendar(region, year, ())
+
+
+class CalendarIndex:
+    """
+    Неизменяемый снимок календаря по всем загруженным регионам и годам.
+
+    Годы, которых нет среди готовых календарей, ищутся в архиве снимка
+    (ArchiveStore) — для снимка они неотличимы от загруженных.
+
+    Attributes:
+        version (int): номер снимка (растёт при каждой перезагрузке);
+        archive (ArchiveStore | None): архивные годы снимка.
+    """
+
+    def __init__(self, records: Iterable[DayRecord] = (), version: int = 0) -> None:
+        """
+        Строит снимок из записей.
+
+        Args:
+            records (Iterable[DayRecord]): записи о днях любых регионов и лет;
+            version (int): номер снимка.
+        """
+        grouped: dict[tuple[str, int], list[DayRecord]] = {}
+        for record in records:
+            grouped.setdefault((record.region, record.date.year), []).append(record)
+        self._years = {
+            key: YearCalendar(key[0], key[1], year_records)
+            for key, year_records in grouped.items()
+        }
+        self._vectors = {}
+        self.version = version
+        self.archive = None
+
+    @classmethod
+    def from_years(
+        cls,
+        years: Iterable[YearCalendar],
+        version: int = 0,
+        archive=None
+    ) -> 'CalendarIndex':
+        """
+        Строит снимок из готовых календарей лет.
+
+        Args:
+            years (Iterable[YearCalendar]): календари лет;
+            version (int): номер снимка;
+            archive (ArchiveStore | None): архивные годы, которых нет в `years`.
+        """
+        index = cls(version=version)
+        index._years = {(calendar.region, calendar.year): calendar for calendar in years}
+        index.archive = archive
+        return index
+
+    @property
+    def regions(self) -> set[str]:
+        """
+        Регионы, для которых в снимке есть данные.
+        """
+        regions = {region for region, _ in self._years}
+        if self.archive is not None:
+            regions |= self.archive.regions
+        return regions
+
+    def years(self, region: str) -> list[int]:
+        """
+        Возвращает отсортированный список загруженных лет региона
+        (включая архивные).
+        """
+        years = {year for key_region, year in self._years if key_region == region}
+        if self.archive is not None:
+            years.update(self.archive.years(region))
+        return sorted(years)
+
+    def year(self, region: str, year: int) -> Optional[YearCalendar]:
+        """
+        Возвращает календарь года или None, если год не загружен.
+
+        Архивный год разбирается при первом обращении.
+        """
+        calendar = self._years.get((region, year))
+        if calendar is None and self.archive is not None:
+            return self.archive.get(region, year)
+        return calendar
+
+    def calendar(self, region: str, year: int) -> YearCalendar:
+        """
+        Возвращает календарь года; для незагруженного года — по правилу
+        по умолчанию (общий LRU‑кэш процесса на DEFAULT_YEARS_CACHE_SIZE лет:
+        такие календари не зависят от снимка, а регион и год приходят
+        из запроса, поэтому кэш ограничен).
+        """
+        calendar = self.year(region, year)
+        if calendar is None:
+            calendar = default_year(region, year)
+        return calendar
+
+    def is_working(self, region: str, day: date) -> bool:
+        """
+        Проверяет, является ли дата рабочим днём в регионе.
+        """
+        calendar = self.year(region, day.year)
+        if calendar is None:
+            return default_is_working(day)
+        return calendar.is_working(day)
+
+    def get_day(self, region: str, day: date) -> DayRecord:
+        """
+        Возвращает запись о дне; для незагруженных лет — по правилу по умолчанию.
+        """
+        calendar = self.year(region, day.year)
+        if calendar is None:
+            is_working = default_is_working(day)
+            return DayRecord(region, day, is_working, None, day_hours(is_working))
+        return calendar.get_day(day)
+
+    def days(self, region: str, start: date, end: date) -> list[DayRecord]:
+        """
+        Возвращает записи о днях в диапазоне [start, end] включительно.
+
+        Загруженные годы отдаются срезами готовых записей года.
+        """
+        result = []
+        for year in range(start.year, end.year + 1):
+            first = max(start, date(year, 1, 1))
+            last = min(end, date(year, 12, 31))
+            calendar = self.year(region, year)
+            if calendar is not None:
+                result.extend(calendar.slice(first, last))
+            else:
+                result.extend(
+                    DayRecord(region, day, default_is_working(day), None,
+                              day_hours(default_is_working(day)))
+                    for day in (
+                        first + timedelta(days=offset)
+                        for offset in range((last - first).days + 1)
+                    )
+                )
+        return result
+
+    def count_working(self, region: str, start: date, end: date) -> int:
+        """
+        Число рабочих дней в полуинтервале [start, end).
+
+        При end < start результат — число рабочих дней в [end, start)
+        со знаком минус. Время — O(числа лет в периоде).
+        """
+        if end < start:
+            return -self.count_working(region, end, start)
+        total = 0
+        for year in range(start.year, end.year + 1):
+            calendar = self.calendar(region, year)
+            first = calendar.count_before(start) if year == start.year else 0
+            last = calendar.count_before(end) if year == end.year else calendar.cumulative[-1]
+            total += last - first
+        return total
+
+    def add_working_days(self, region: str, day: date, days: int) -> date:
+        """
+        Сдвигает дату на `days` рабочих дней (в обе стороны).
+
+        Нерабочая дата сначала переносится на следующий рабочий день
+        (как roll='forward' в numpy.busday_offset), поэтому
+        `add_working_days(region, day, 0)` — ближайший рабочий день
+        не раньше `day`.
+        """
+        year = day.year
+        calendar = self.calendar(region, year)
+        position = calendar.count_before(day) + days
+        while position >= calendar.cumulative[-1]:
+            position -= calendar.cumulative[-1]
+            year += 1
+            calendar = self.calendar(region, year)
+        while position < 0:
+            year -= 1
+            calendar = self.calendar(region, year)
+            position += calendar.cumulative[-1]
+        return calendar.nth_working(position)
+
+    def warm(self, region: str, years: Iterable[int]) -> list[int]:
+        """
+        Заранее строит записи указанных лет региона.
+
+        Returns:
+            list[int]: годы, которых нет в снимке (для них действует
+            правило по умолчанию).
+        """
+        missing = []
+        for year in years:
+            calendar = self.year(region, year)
+            if calendar is None:
+                missing.append(year)
+            else:
+                calendar.records()
+        return missing
+
+    def vector(self, region: str):
+        """
+        Возвращает календарь региона в виде массивов NumPy (VectorCalendar).
+
+        Для регионов снимка строится при первом обращении и живёт вместе
+        со снимком; для прочих регионов (пятидневка) строится на каждый
+        вызов и не кэшируется — регион приходит из запроса.
+        Требует NumPy (импортируется только здесь).
+        """
+        calendar = self._vectors.get(region)
+        if calendar is None:
+            from .vectorized import VectorCalendar
+            calendar = VectorCalendar.from_index(self, region)
+            if region in self.regions:
+                self._vectors[region] = calendar
+        return calendar
+
+    def records(self) -> list[DayRecord]:
+        """
+        Возвращает все записи снимка (архивные годы разбираются).
+        """
+        return [
+            record
+            for region in sorted(self.regions)
+            for year in self.years(region)
+            for record in self.year(region, year).records()
+        ]
+
+
+class IndexHolder:
+    """
+    Держатель текущего снимка календаря.
+
+    Замена снимка — это присваивание одной ссылки, поэтому читатели
+    всегда видят либо старый, либо новый снимок целиком.
+    """
+
+    def __init__(self, index: Optional[CalendarIndex] = None) -> None:
+        self._index = index if index is not None else CalendarIndex()
+
+    @property
+    def current(self) -> CalendarIndex:
+        """
+        Текущий снимок календаря.
+        """
+        return self._index
+
+    def swap(self, index: CalendarIndex) -> CalendarIndex:
+        """
+        Атомарно подменяет текущий снимок.
+
+        Args:
+            index (CalendarIndex): новый снимок.
+
+        Returns:
+            CalendarIndex: предыдущий снимок.
+        """
+        previous, self._index = self._index, index
+        return previous
@@ -0,0 +1,215 @@
+"""
+Модуль app.engine.overlay — календари сотрудников и команд поверх базового.
+
+Личные выходные (отпуск, отгул) и особые графики команд хранятся не копией
+базового календаря на каждого человека, а разреженными наборами интервалов
+дат. Ответ собирается «слоями»: базовый календарь региона → слои по порядку
+(например, команда → сотрудник); каждый следующий слой может переопределить
+статус дня, а где у слоя нет интервала — действует предыдущий.
+
+Память на сотрудника пропорциональна числу его интервалов, а не числу дней.
+
+Структура:
+- IntervalMap — непересекающиеся интервалы дат со значениями
+  (поиск двоичным поиском, O(log k));
+- Layer — протокол слоя: state(day) → (рабочий, пометка) или None;
+- IntervalLayer — слой из интервалов (отпуска, отгулы, рабочие дни);
+- LayeredCalendar — композиция базового снимка и слоёв.
+
+Пример использования:
+    team = IntervalLayer('team-ops', [(date(2025, 6, 2), date(2025, 6, 6), False, 'Выездная неделя')])
+    person = IntervalLayer('ivanov', [(date(2025, 7, 1), date(2025, 7, 14), False, 'Отпуск')])
+    calendar = LayeredCalendar(index, 'ru', [team, person])
+    calendar.is_working(date(2025, 7, 2))  # False
+"""
+
+from bisect import bisect_right
+from datetime import date, timedelta
+from typing import Any, Iterable, Optional, Protocol
+
+from .index import STANDARD_DAY_HOURS, CalendarIndex, DayRecord
+
+
+class IntervalMap:
+    """
+    Набор непересекающихся интервалов дат [start, end] со значениями.
+
+    Интервалы, добавленные позже, перекрывают ранее добавленные
+    (пересечение «закрашивается» новым значением).
+    """
+
+    __slots__ = ('_starts', '_ends', '_values')
+
+    def __init__(self, intervals: Iterable[tuple[date, date, Any]] = ()) -> None:
+        self._starts: list[date] = []
+        self._ends: list[date] = []
+        self._values: list[Any] = []
+        for start, end, value in intervals:
+            self.paint(start, end, value)
+
+    def paint(self, start: date, end: date, value: Any) -> None:
+        """
+        Задаёт значение на интервале [start, end], перекрывая прежние.
+
+        Raises:
+            ValueError: если end раньше start.
+        """
+        if end < start:
+            raise ValueError('Конец интервала раньше начала')
+        pieces = []
+        for old_start, old_end, old_value in zip(self._starts, self._ends, self._values):
+            if old_end < start or old_start > end:
+                pieces.append((old_start, old_end, old_value))
+                continue
+            if old_start < start:
+                pieces.append((old_start, start - timedelta(days=1), old_value))
+            if old_end > end:
+                pieces.append((end + timedelta(days=1), old_end, old_value))
+        pieces.append((start, end, value))
+        pieces.sort(key=lambda piece: piece[0])
+        self._starts = [piece[0] for piece in pieces]
+        self._ends = [piece[1] for piece in pieces]
+        self._values = [piece[2] for piece in pieces]
+
+    def get(self, day: date) -> Optional[Any]:
+        """
+        Возвращает значение интервала, содержащего дату, или None.
+        """
+        position = bisect_right(self._starts, day) - 1
+        if position >= 0 and day <= self._ends[position]:
+            return self._values[position]
+        return None
+
+    def overlapping(self, start: date, end: date) -> list[tuple[date, date, Any]]:
+        """
+        Интервалы, пересекающиеся с [start, end], обрезанные по его границам.
+        """
+        position = max(bisect_right(self._starts, start) - 1, 0)
+        result = []
+        while position < len(self._starts) and self._starts[position] <= end:
+            if self._ends[position] >= start:
+                result.append((
+                    max(self._starts[position], start),
+                    min(self._ends[position], end),
+                    self._values[position],
+                ))
+            position += 1
+        return result
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+
+class Layer(Protocol):
+    """
+    Слой календаря: переопределяет статус части дней.
+    """
+
+    name: str
+
+    def state(self, day: date) -> Optional[tuple[bool, Optional[str]]]:
+        """
+        (рабочий ли день, пометка) или None, если слой не переопределяет день.
+        """
+
+    def overrides(self, start: date, end: date) -> Iterable[tuple[date, date, tuple[bool, Optional[str]]]]:
+        """
+        Переопределённые интервалы внутри [start, end].
+        """
+
+
+class IntervalLayer:
+    """
+    Слой из интервалов дат: (начало, конец, рабочий ли, пометка).
+
+    Attributes:
+        name (str): имя слоя (например, код сотрудника или команды);
+        intervals (IntervalMap): интервалы слоя.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        intervals: Iterable[tuple[date, date, bool, Optional[str]]] = ()
+    ) -> None:
+        self.name = name
+        self.intervals = IntervalMap(
+            (start, end, (is_working, note)) for start, end, is_working, note in intervals
+        )
+
+    def state(self, day: date) -> Optional[tuple[bool, Optional[str]]]:
+        return self.intervals.get(day)
+
+    def overrides(self, start: date, end: date):
+        return self.intervals.overlapping(start, end)
+
+
+class LayeredCalendar:
+    """
+    Календарь базового региона с наложенными слоями.
+
+    Слои применяются по порядку: последний слой имеет наивысший приоритет.
+    День, переведённый слоем в рабочий, длится STANDARD_DAY_HOURS часов;
+    в нерабочий — 0 часов.
+
+    Attributes:
+        base (CalendarIndex): базовый снимок календаря;
+        region (str): регион базового календаря;
+        layers (list[Layer]): слои по возрастанию приоритета.
+    """
+
+    def __init__(self, base: CalendarIndex, region: str, layers: Iterable[Layer] = ()) -> None:
+        self.base = base
+        self.region = region
+        self.layers = list(layers)
+
+    @staticmethod
+    def _apply(record: DayRecord, state: tuple[bool, Optional[str]]) -> DayRecord:
+        is_working, note = state
+        if is_working == record.is_working and not note:
+            return record
+        hours = record.working_hours if is_working == record.is_working else (
+            STANDARD_DAY_HOURS if is_working else 0
+        )
+        return DayRecord(record.region, record.date, is_working, note or record.holiday_name, hours)
+
+    def get_day(self, day: date) -> DayRecord:
+        """
+        Возвращает запись о дне с учётом всех слоёв.
+        """
+        record = self.base.get_day(self.region, day)
+        for layer in self.layers:
+            state = layer.state(day)
+            if state is not None:
+                record = self._apply(record, state)
+        return record
+
+    def is_working(self, day: date) -> bool:
+        """
+        Проверяет, рабочий ли день с учётом всех слоёв.
+        """
+        return self.get_day(day).is_working
+
+    def days(self, start: date, end: date) -> list[DayRecord]:
+        """
+        Возвращает записи о днях [start, end] включительно.
+
+        Берётся срез базового календаря, и поверх него применяются только
+        интервалы слоёв, пересекающиеся с периодом.
+        """
+        records = self.base.days(self.region, start, end)
+        for layer in self.layers:
+            for first, last, state in layer.overrides(start, end):
+                for offset in range((first - start).days, (last - start).days + 1):
+                    records[offset] = self._apply(records[offset], state)
+        return records
+
+    def count_working(self, start: date, end: date) -> int:
+        """
+        Число рабочих дней в полуинтервале [start, end).
+        """
+        if end < start:
+            return -self.count_working(end, start)
+        if end == start:
+            return 0
+        return sum(record.is_working for record in self.days(start, end - timedelta(days=1)))
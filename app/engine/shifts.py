@@ -0,0 +1,182 @@
+"""
+Модуль app.engine.shifts — сменные графики (2/2, 5/2, 1/3 и т. п.).
+
+Сменный график — цикл рабочих и нерабочих дней, привязанный к дате начала
+(якорю): «2/2» — два дня работы, два дня отдыха; «1/3» — сутки через трое;
+«5/2/5/3» — чередование нескольких отрезков. Праздники базового календаря
+(нерабочие дни с названием) по умолчанию дают выходной и сменщику.
+
+График никогда не разворачивается на всё время:
+- статусы вычисляются блоками по месяцу и только для запрошенных дат;
+- блок месяца зависит лишь от цикла и фазы цикла на 1-е число, поэтому
+  кэш блоков (LRU) общий для всех сотрудников с одинаковым графиком —
+  у цикла длины N на месяц не больше N разных блоков;
+- праздники накладываются из снимка базового календаря (его записи
+  по годам уже закэшированы в YearCalendar).
+
+Структура:
+- ShiftPattern — цикл графика: parse(), is_working(), month();
+- ShiftLayer — слой LayeredCalendar со сменным графиком.
+
+Пример использования:
+    pattern = ShiftPattern.parse('2/2')
+    layer = ShiftLayer('ivanov-shift', pattern, date(2025, 1, 1), index, 'ru')
+    calendar = LayeredCalendar(index, 'ru', [layer, vacations])
+    calendar.days(date(2027, 1, 1), date(2027, 1, 31))
+"""
+
+from calendar import monthrange
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from .index import CalendarIndex
+
+MAX_CACHED_MONTHS = 4096
+"""Число блоков месяцев в общем кэше сменных графиков."""
+
+MAX_CYCLE_DAYS = 366
+"""Наибольшая длина цикла графика, дней."""
+
+
+@lru_cache(maxsize=MAX_CACHED_MONTHS)
+def _month_block(cycle: tuple[bool, ...], phase: int, days: int) -> tuple[bool, ...]:
+    """
+    Статусы дней месяца длиной `days`, если 1-е число приходится на `phase` цикла.
+    """
+    return tuple(cycle[(phase + offset) % len(cycle)] for offset in range(days))
+
+
+class ShiftPattern:
+    """
+    Цикл сменного графика.
+
+    Attributes:
+        cycle (tuple[bool, ...]): статусы дней цикла (True — рабочий).
+    """
+
+    __slots__ = ('cycle',)
+
+    def __init__(self, cycle: Iterable[bool]) -> None:
+        self.cycle = tuple(bool(flag) for flag in cycle)
+        if not self.cycle:
+            raise ValueError('Цикл графика пуст')
+
+    @classmethod
+    def parse(cls, text: str) -> 'ShiftPattern':
+        """
+        Разбирает график вида '2/2', '5/2', '1/3' или '5/2/5/3'.
+
+        Числа — длины чередующихся отрезков, начиная с рабочих дней;
+        цикл — не длиннее MAX_CYCLE_DAYS дней.
+
+        Raises:
+            ValueError: если строка некорректна или цикл слишком длинный.
+        """
+        lengths = [int(part) for part in text.split('/')]
+        if len(lengths) % 2 or any(length < 0 for length in lengths) or not any(lengths):
+            raise ValueError(f'Некорректный сменный график: {text}')
+        if sum(lengths) > MAX_CYCLE_DAYS:
+            raise ValueError(f'Цикл графика длиннее {MAX_CYCLE_DAYS} дней: {text}')
+        cycle = []
+        for position, length in enumerate(lengths):
+            cycle.extend([position % 2 == 0] * length)
+        return cls(cycle)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ShiftPattern) and self.cycle == other.cycle
+
+    def __hash__(self) -> int:
+        return hash(self.cycle)
+
+    def _phase(self, anchor: date, day: date) -> int:
+        return (day - anchor).days % len(self.cycle)
+
+    def is_working(self, anchor: date, day: date) -> bool:
+        """
+        Рабочий ли день по графику, начатому в `anchor`.
+        """
+        return self.cycle[self._phase(anchor, day)]
+
+    def month(self, anchor: date, year: int, month: int) -> tuple[bool, ...]:
+        """
+        Статусы дней месяца по графику (блок берётся из общего кэша).
+        """
+        first = date(year, month, 1)
+        return _month_block(self.cycle, self._phase(anchor, first), monthrange(year, month)[1])
+
+
+class ShiftLayer:
+    """
+    Слой сменного графика для LayeredCalendar.
+
+    Задаёт статус каждого дня начиная с `anchor` (раньше — не
+    переопределяет); праздник базового календаря (нерабочий день
+    с названием) при `holidays_off=True` даёт выходной с его названием.
+
+    Attributes:
+        name (str): имя слоя;
+        pattern (ShiftPattern): цикл графика;
+        anchor (date): дата, с которой начинается цикл;
+        base (CalendarIndex): снимок базового календаря (праздники);
+        region (str): регион базового календаря;
+        holidays_off (bool): праздники — выходные и по графику.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        pattern: ShiftPattern,
+        anchor: date,
+        base: CalendarIndex,
+        region: str,
+        holidays_off: bool = True
+    ) -> None:
+        self.name = name
+        self.pattern = pattern
+        self.anchor = anchor
+        self.base = base
+        self.region = region
+        self.holidays_off = holidays_off
+
+    def _holiday(self, day: date) -> Optional[str]:
+        """
+        Название праздника базового календаря, если день нерабочий по графику.
+        """
+        if not self.holidays_off:
+            return None
+        calendar = self.base.year(self.region, day.year)
+        if calendar is None or calendar.is_working(day):
+            return None
+        return calendar.holidays.get(day)
+
+    def _state(self, day: date, block: tuple[bool, ...]) -> tuple[bool, Optional[str]]:
+        holiday = self._holiday(day)
+        if holiday is not None:
+            return False, holiday
+        return block[day.day - 1], None
+
+    def state(self, day: date) -> Optional[tuple[bool, Optional[str]]]:
+        if day < self.anchor:
+            return None
+        return self._state(day, self.pattern.month(self.anchor, day.year, day.month))
+
+    def overrides(self, start: date, end: date):
+        """
+        Интервалы [начало, конец] с одинаковым статусом внутри [start, end].
+
+        Вычисляются только месяцы, пересекающиеся с периодом.
+        """
+        result = []
+        day = max(start, self.anchor)
+        while day <= end:
+            block = self.pattern.month(self.anchor, day.year, day.month)
+            last = min(end, date(day.year, day.month, len(block)))
+            while day <= last:
+                state = self._state(day, block)
+                if result and result[-1][2] == state and result[-1][1] == day - timedelta(days=1):
+                    result[-1] = (result[-1][0], day, state)
+                else:
+                    result.append((day, day, state))
+                day += timedelta(days=1)
+        return result
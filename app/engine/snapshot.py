@@ -0,0 +1,79 @@
+"""
+Модуль app.engine.snapshot — переносимый формат снимка календаря региона.
+
+Сервер отдаёт снимок региона целиком (GET /snapshot/{region}), а клиентская
+библиотека (workcalendar_client) восстанавливает из него тот же
+CalendarIndex и отвечает на вопросы локально тем же кодом ядра.
+
+Формат (JSON):
+    {
+      "region": "ru",
+      "version": 42,
+      "years": {
+        "2025": {"flags": "0011100...", "holidays": {"2025-01-01": "Новый год"},
+                 "hours": {"2025-04-30": 7}}
+      }
+    }
+
+`flags` — строка из '1' (рабочий день) и '0' по дням года;
+`hours` — рабочие часы дней, отличающиеся от стандартных.
+
+Структура:
+- dump_snapshot() — снимок региона в словарь для JSON;
+- load_years() — календари лет из словаря;
+- load_snapshot() — CalendarIndex из словарей снимков одного или
+  нескольких регионов.
+"""
+
+from datetime import date
+from typing import Iterable
+
+from .index import CalendarIndex, YearCalendar
+
+
+def dump_snapshot(index: CalendarIndex, region: str) -> dict:
+    """
+    Сериализует загруженные годы региона.
+    """
+    years = {}
+    for year in index.years(region):
+        calendar = index.year(region, year)
+        years[str(year)] = {
+            'flags': ''.join('1' if flag else '0' for flag in calendar.flags),
+            'holidays': {day.isoformat(): name for day, name in sorted(calendar.holidays.items())},
+            'hours': {day.isoformat(): hours for day, hours in sorted(calendar.hours.items())},
+        }
+    return {'region': region, 'version': index.version, 'years': years}
+
+
+def load_years(snapshot: dict) -> list[YearCalendar]:
+    """
+    Восстанавливает календари лет из снимка региона.
+
+    Raises:
+        ValueError: если снимок повреждён (неверное число флагов, даты).
+    """
+    region = snapshot['region']
+    return [
+        YearCalendar.from_flags(
+            region,
+            int(year),
+            (flag == '1' for flag in data['flags']),
+            {date.fromisoformat(day): name for day, name in data['holidays'].items()},
+            {date.fromisoformat(day): int(hours) for day, hours in data.get('hours', {}).items()},
+        )
+        for year, data in snapshot['years'].items()
+    ]
+
+
+def load_snapshot(snapshots: Iterable[dict]) -> CalendarIndex:
+    """
+    Строит CalendarIndex из снимков регионов.
+
+    Версия индекса — наибольшая версия среди снимков.
+    """
+    snapshots = list(snapshots)
+    return CalendarIndex.from_years(
+        (calendar for snapshot in snapshots for calendar in load_years(snapshot)),
+        version=max((snapshot['version'] for snapshot in snapshots), default=0),
+    )
@@ -0,0 +1,104 @@
+"""
+Модуль app.loader — командная строка загрузки календаря из файлов.
+
+Загружает календарь из локальных файлов (CSV, JSON, JSON Lines, XML
+производственного календаря) в БД без обращения к внешним источникам:
+для заполнения нового окружения и восстановления данных в закрытом контуре.
+Перед загрузкой применяются миграции (как при старте приложения),
+после загрузки каждого файла изменившиеся регионы публикуются новой
+версией календаря (см. app.services.versions; `--no-publish` — только
+записать дни в `calendarday`).
+
+Использование:
+    python -m app.loader data/ru-2025.xml data/ru-2026.xml --region ru
+    python -m app.loader history.csv --chunk-size 20000 --strict
+    python -m app.loader days.json --format json --quiet
+
+Код возврата: 0 — успех, 1 — ошибка загрузки, 2 — неверные аргументы.
+"""
+
+import argparse
+import sys
+import time
+from typing import Optional, Sequence
+
+from app.core import engine, run_migrations
+from app.services.bulk_load import DEFAULT_CHUNK_SIZE, FORMATS, LoadError, LoadStats, load_file
+from app.services.versions import publish_version
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Описание аргументов командной строки.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m app.loader',
+        description='Загрузка производственного календаря из локальных файлов в БД.',
+    )
+    parser.add_argument('files', nargs='+', help='файлы CSV, JSON, JSON Lines или XML')
+    parser.add_argument('--region', default='ru', help='регион строк без поля region (по умолчанию ru)')
+    parser.add_argument('--format', choices=FORMATS, help='формат файлов (по умолчанию — по расширению)')
+    parser.add_argument(
+        '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f'строк в порции проверки и записи (по умолчанию {DEFAULT_CHUNK_SIZE})'
+    )
+    parser.add_argument('--strict', action='store_true', help='остановиться на первой неверной строке')
+    parser.add_argument('--no-publish', action='store_true', help='не публиковать новую версию календаря')
+    parser.add_argument('--quiet', action='store_true', help='не выводить прогресс')
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None, bind=None) -> int:
+    """
+    Точка входа командной строки.
+
+    Args:
+        argv: аргументы (по умолчанию — sys.argv[1:]);
+        bind: движок записи (по умолчанию `engine`).
+
+    Returns:
+        int: код возврата.
+    """
+    args = build_parser().parse_args(argv)
+    if args.chunk_size < 1:
+        print('--chunk-size должен быть положительным', file=sys.stderr)
+        return 2
+    bind = bind or engine
+    run_migrations(bind)
+    for path in args.files:
+        started = time.monotonic()
+
+        def report(stats: LoadStats) -> None:
+            if not args.quiet:
+                rate = stats.read / max(time.monotonic() - started, 1e-9)
+                print(
+                    f'\r{path}: прочитано {stats.read}, записано {stats.written}, '
+                    f'изменено {stats.changed}, отброшено {stats.invalid} ({rate:,.0f} строк/с)',
+                    end='', file=sys.stderr, flush=True
+                )
+
+        try:
+            stats = load_file(
+                path, region=args.region, fmt=args.format, chunk_size=args.chunk_size,
+                bind=bind, strict=args.strict, progress=report
+            )
+        except LoadError as error:
+            print(f'\nОшибка загрузки: {error}', file=sys.stderr)
+            return 1
+        if not args.quiet:
+            print(file=sys.stderr)
+        for message in stats.errors:
+            print(f'  {message}', file=sys.stderr)
+        if stats.changed and not args.no_publish:
+            for region in sorted(stats.regions):
+                version_id = publish_version(region, f'загрузка {path}'[:200], bind)
+                print(f'{region}: активная версия {version_id}')
+        print(
+            f'{path}: прочитано {stats.read}, изменено {stats.changed}, '
+            f'отброшено {stats.invalid} за {time.monotonic() - started:.2f} с'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,6 +8,11 @@
 - создание экземпляра приложения FastAPI;
 - подключение объединённого роутера с API‑маршрутами;
 - запуск миграций БД при старте;
+- загрузка in‑memory снимка календаря и запуск фонового обновления;
+- горячая перезагрузка настроек по SIGHUP и при изменении .env‑файла
+  (без потери прогретого снимка);
+- ограничение нагрузки: 503 с Retry-After вместо очереди при перегрузке
+  и сроки ответа запросов (LoadShedder, если SHED_ENABLED);
 - подготовка приложения к запуску через ASGI‑сервер.
 
 Используемые компоненты:
@@ -15,6 +20,7 @@
 - lifespan — контекстный менеджер для действий при старте/завершении;
 - run_migrations — функция применения миграций Alembic;
 - engine — объект подключения SQLAlchemy к БД;
+- SyncScheduler — фоновое обновление календаря из внешних источников;
 - router — объединённый роутер со всеми API‑маршрутами.
 
 Инициализируемые объекты:
@@ -38,11 +44,20 @@
 - убедитесь, что alembic.ini доступен в корне проекта.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
-from app.core import run_migrations, engine, main_logger
+from app.core import (
+    LoadShedder, migrations_applied, run_migrations, engine, main_logger,
+    read_router, settings
+)
 from app.routes import router
+from app.services import (
+    SyncScheduler, broadcaster, index_holder, readiness, settings_reloader,
+    warmup, warmup_years
+)
+from app.sources.pool import shutdown_parse_pool
 
 
 @asynccontextmanager
@@ -52,14 +67,64 @@ async def lifespan(app: FastAPI):
 
     Выполняет:
     - импорт моделей для регистрации в SQLAlchemy;
-    - запуск миграций Alembic при старте;
+    - запуск миграций Alembic при старте (кроме воркеров `python -m app.server`:
+      миграции до fork применяет мастер);
+    - прогрев в фоне (снимок календаря, пулы БД, записи прогреваемых лет),
+      после которого `/ready` отвечает 200;
+    - периодическую проверку доступности реплик для чтения;
+    - запуск фонового обновления после прогрева (если SYNC_ENABLED)
+      и его остановку;
+    - горячую перезагрузку настроек: по SIGHUP и при изменении .env‑файла
+      (раз в SETTINGS_WATCH_INTERVAL секунд);
+    - снятие готовности при завершении, чтобы балансировщик вывел воркер;
+    - закрытие подписок WebSocket/SSE и пула процессов разбора при завершении.
     """
     import app.models.calendar
-    main_logger.info("Запуск миграций Alembic...")
-    run_migrations(engine)
-    main_logger.info("Миграции применены.")
+    if migrations_applied():
+        main_logger.info("Миграции применены мастером процессов, пропуск.")
+    else:
+        main_logger.info("Запуск миграций Alembic...")
+        run_migrations(engine)
+        main_logger.info("Миграции применены.")
+    readiness.reset()
+    replica_monitor = None
+    if read_router.replicas:
+        replica_monitor = asyncio.create_task(
+            read_router.monitor(settings.DB_REPLICA_CHECK_INTERVAL)
+        )
+    scheduler = None
+    if settings.SYNC_ENABLED:
+        scheduler = SyncScheduler(
+            settings.CALENDAR_REGIONS, index_holder, broadcaster=broadcaster
+        )
+        settings_reloader.subscribe(scheduler.apply_settings)
+    settings_reloader.install_signal_handler()
+    settings_watch = asyncio.create_task(settings_reloader.watch())
+
+    async def start():
+        try:
+            await warmup(index_holder, settings.CALENDAR_REGIONS, warmup_years())
+        except Exception as error:
+            main_logger.error(f'Ошибка прогрева, воркер не готов: {error!r}')
+            return
+        if scheduler is not None:
+            scheduler.start()
+
+    startup = asyncio.create_task(start())
     yield
+    readiness.reset()
+    startup.cancel()
+    settings_watch.cancel()
+    if scheduler is not None:
+        settings_reloader.unsubscribe(scheduler.apply_settings)
+        await scheduler.stop()
+    if replica_monitor is not None:
+        replica_monitor.cancel()
+    broadcaster.close()
+    shutdown_parse_pool()
     main_logger.info("Приложение завершает работу.")
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(router)
+if settings.SHED_ENABLED:
+    app.add_middleware(LoadShedder)
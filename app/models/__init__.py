@@ -12,6 +12,18 @@
 Экспортируемые объекты:
 - CalendarDay — модель из app.models.calendar.
   Описывает статус дня (рабочий/нерабочий) и название праздника.
+- CalendarChange — модель из app.models.change.
+  Журнал изменений дней с монотонным номером (seq).
+- CalendarVersion, CalendarRelease — модели из app.models.version.
+  Неизменяемые версии календаря региона и указатель на активную.
+- CalendarAggregate — модель из app.models.aggregate.
+  Нормы рабочих дней и часов по месяцам, кварталам и году.
+- CalendarArchive — модель из app.models.archive.
+  Давние годы календаря в виде сжатых блобов (один на регион и год).
+- SyncRun — модель из app.models.sync_run.
+  История синхронизаций с длительностями этапов.
+- Overlay, OverlayInterval — модели из app.models.overlay.
+  Календари сотрудников и команд: интервалы поверх базового календаря.
 
 Пример использования:
     from app.models import CalendarDay
@@ -23,6 +35,15 @@
 - при добавлении новых моделей дополняйте список импортов и __all__.
 """
 
+from .aggregate import CalendarAggregate
+from .archive import CalendarArchive
 from .calendar import CalendarDay
+from .change import CalendarChange
+from .overlay import Overlay, OverlayInterval
+from .sync_run import SyncRun
+from .version import CalendarRelease, CalendarVersion
 
-__all__ = ['CalendarDay']
+__all__ = [
+    'CalendarAggregate', 'CalendarArchive', 'CalendarChange', 'CalendarDay',
+    'CalendarRelease', 'CalendarVersion', 'Overlay', 'OverlayInterval', 'SyncRun'
+]
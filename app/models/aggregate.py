@@ -0,0 +1,53 @@
+"""
+Модуль app.models.aggregate — нормы рабочего времени по периодам.
+
+Отчёты постоянно спрашивают «сколько рабочих дней и часов в месяце M
+года Y» (нормы производственного календаря). Таблица `calendaraggregate`
+хранит готовые ответы по месяцам, кварталам и году для каждого региона:
+ответ — чтение одной строки по уникальному индексу вместо подсчёта
+по 365 дням.
+
+Строки пересчитываются в той же транзакции, что и изменение дней
+(см. app.services.aggregates), и отражают календарь в том виде, как
+его видят воркеры (активная версия региона или `calendarday`).
+
+Поля модели CalendarAggregate:
+- region — регион;
+- year — год;
+- period — вид периода: 'month', 'quarter' или 'year';
+- number — номер месяца (1–12), квартала (1–4) или 1 для года;
+- working_days, non_working_days — число рабочих и нерабочих дней;
+- working_hours — норма рабочих часов (с учётом сокращённых дней);
+- updated_at — время пересчёта (UTC).
+
+Пример использования:
+    from app.models import CalendarAggregate
+    select(CalendarAggregate).where(
+        CalendarAggregate.region == 'ru', CalendarAggregate.year == 2025,
+        CalendarAggregate.period == 'month', CalendarAggregate.number == 5,
+    )
+"""
+
+from sqlalchemy import Column, DateTime, Integer, SmallInteger, String, UniqueConstraint
+
+from app.core import Base
+from .change import utc_now
+
+
+class CalendarAggregate(Base):
+    """
+    Число рабочих дней, нерабочих дней и рабочих часов за период.
+    """
+
+    __table_args__ = (
+        UniqueConstraint('region', 'year', 'period', 'number', name='uq_calendaraggregate_period'),
+    )
+
+    region = Column(String(8), nullable=False)
+    year = Column(Integer, nullable=False)
+    period = Column(String(8), nullable=False)
+    number = Column(SmallInteger, nullable=False)
+    working_days = Column(SmallInteger, nullable=False)
+    non_working_days = Column(SmallInteger, nullable=False)
+    working_hours = Column(Integer, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
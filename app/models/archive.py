@@ -0,0 +1,41 @@
+"""
+Модуль app.models.archive — архив давних лет календаря.
+
+Годы старше горизонта ARCHIVE_AFTER_YEARS переносятся из строк
+`calendarday` (365 строк на год) в одну строку `calendararchive`
+со сжатой битовой картой рабочих дней, праздниками и сокращёнными
+днями (формат — app.engine.archive). Воркеры разбирают блоб только
+при первом обращении к году.
+
+Поля модели CalendarArchive:
+- region — регион;
+- year — год;
+- data — сжатый блоб года;
+- archived_at — время записи в архив (UTC).
+
+Пример использования:
+    from app.models import CalendarArchive
+    select(CalendarArchive.data).where(
+        CalendarArchive.region == 'ru', CalendarArchive.year == 2001
+    )
+"""
+
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, UniqueConstraint
+
+from app.core import Base
+from .change import utc_now
+
+
+class CalendarArchive(Base):
+    """
+    Год региона в компактном архиве.
+    """
+
+    __table_args__ = (
+        UniqueConstraint('region', 'year', name='uq_calendararchive_region_year'),
+    )
+
+    region = Column(String(8), nullable=False)
+    year = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    archived_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
@@ -2,27 +2,31 @@
 Модуль app.models.calendar — модель данных для хранения информации о днях календаря.
 
 Определяет структуру таблицы `calendarday` в базе данных:
+- регион (код страны);
 - дата;
 - признак рабочего/нерабочего дня;
-- название праздника (если есть).
+- название праздника (если есть);
+- рабочие часы, если они отличаются от стандартных (сокращённый день).
 
 Используемые компоненты:
 - SQLAlchemy ORM — для описания модели и маппинга на таблицу БД;
 - Base из app.core — базовая конфигурация моделей (автоимя таблицы, поле id).
 
 Поля модели CalendarDay:
-- date — дата (уникальная, индексированная, обязательная);
+- region — код региона (например, 'ru'), обязательный;
+- date — дата (индексированная, обязательная, уникальная в пределах региона);
 - is_working — флаг: True = рабочий день, False = выходной/праздник;
 - holiday_name — опциональное название праздника (макс. 200 символов).
 
 Преимущества:
-- уникальность дат исключает дублирование записей;
+- уникальность пары (region, date) исключает дублирование записей;
 - индекс по полю date ускоряет запросы по конкретной дате;
 - поле holiday_name позволяет хранить контекст для нерабочих дней.
 
 Пример использования:
     from app.models.calendar import CalendarDay
     day = CalendarDay(
+        region="ru",
         date=datetime.date(2025, 1, 1),
         is_working=False,
         holiday_name="Новый год"
@@ -33,7 +37,7 @@
 - инициализированная БД с миграциями (например, через Alembic).
 """
 
-from sqlalchemy import Column, Date, Boolean, String
+from sqlalchemy import Column, Date, Boolean, SmallInteger, String, UniqueConstraint
 from app.core import Base
 
 
@@ -45,11 +49,16 @@ class CalendarDay(Base):
     а также содержит название праздника для нерабочих дней.
     """
 
+    __table_args__ = (
+        UniqueConstraint('region', 'date', name='uq_calendarday_region_date'),
+    )
+
+    region = Column(String(8), nullable=False, default='ru')
     date = Column(
         Date,
-        unique=True,
         nullable=False,
         index=True
     )
     is_working = Column(Boolean, nullable=False)
     holiday_name = Column(String(200), nullable=True)
+    working_hours = Column(SmallInteger, nullable=True)
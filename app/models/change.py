@@ -0,0 +1,55 @@
+"""
+Модуль app.models.change — журнал изменений календаря.
+
+Определяет структуру таблицы `calendarchange`: каждая строка — одно
+изменение дня календаря, записанное при синхронизации с источником.
+
+Поля модели CalendarChange:
+- id — номер изменения (монотонно растущая последовательность, seq);
+- region, date — изменённый день;
+- is_working, holiday_name, working_hours — новые значения дня;
+- changed_at — время записи изменения (UTC).
+
+Назначение:
+- инкрементальное обновление клиентов и кэшей через `GET /changes?since=<seq>`;
+- история календаря: состояние дня на момент T — последнее изменение
+  с changed_at ≤ T (индекс по region, date, changed_at; см. app.services.history);
+- определение воркерами, что данные в БД обновились (по последнему seq).
+
+Пример использования:
+    from app.models import CalendarChange
+    session.scalars(select(CalendarChange).where(CalendarChange.id > since))
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Boolean, Column, Date, DateTime, Index, SmallInteger, String
+
+from app.core import Base
+
+
+def utc_now() -> datetime:
+    """
+    Текущее время в UTC.
+    """
+    return datetime.now(timezone.utc)
+
+
+class CalendarChange(Base):
+    """
+    Запись журнала изменений дня календаря.
+
+    AUTOINCREMENT в SQLite гарантирует, что номера не переиспользуются.
+    """
+
+    __table_args__ = (
+        Index('ix_calendarchange_region_date_changed_at', 'region', 'date', 'changed_at'),
+        {'sqlite_autoincrement': True},
+    )
+
+    region = Column(String(8), nullable=False)
+    date = Column(Date, nullable=False)
+    is_working = Column(Boolean, nullable=False)
+    holiday_name = Column(String(200), nullable=True)
+    working_hours = Column(SmallInteger, nullable=True)
+    changed_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
@@ -0,0 +1,60 @@
+"""
+Модуль app.models.overlay — календари сотрудников и команд (наложения).
+
+Наложение хранит только отличия от базового календаря региона в виде
+интервалов дат (отпуск, отгул, выездная неделя, рабочие выходные),
+а не копию календаря на каждого сотрудника.
+
+Поля модели Overlay:
+- id — первичный ключ;
+- name — уникальное имя наложения (код сотрудника или команды);
+- region — регион базового календаря;
+- parent_id — родительское наложение (например, команда сотрудника):
+  его интервалы применяются раньше, интервалы потомка перекрывают их;
+- shift_pattern, shift_anchor — сменный график (например, '2/2')
+  и дата его начала; интервалы наложения перекрывают график.
+
+Поля модели OverlayInterval:
+- overlay_id — наложение, которому принадлежит интервал;
+- start_date, end_date — границы интервала (включительно);
+- is_working — статус дней интервала;
+- note — пометка (например, «Отпуск»).
+
+Пример использования:
+    from app.models import Overlay, OverlayInterval
+    team = Overlay(name='team-ops', region='ru')
+    person = Overlay(name='ivanov', region='ru', parent_id=team.id)
+"""
+
+from sqlalchemy import Boolean, Column, Date, ForeignKey, Integer, String
+
+from app.core import Base
+
+
+class Overlay(Base):
+    """
+    Календарь сотрудника или команды поверх базового календаря региона.
+    """
+
+    name = Column(String(100), nullable=False, unique=True)
+    region = Column(String(8), nullable=False, default='ru')
+    parent_id = Column(Integer, ForeignKey('overlay.id'), nullable=True)
+    shift_pattern = Column(String(50), nullable=True)
+    shift_anchor = Column(Date, nullable=True)
+
+
+class OverlayInterval(Base):
+    """
+    Интервал дат наложения с переопределённым статусом дней.
+    """
+
+    overlay_id = Column(
+        Integer,
+        ForeignKey('overlay.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    is_working = Column(Boolean, nullable=False)
+    note = Column(String(200), nullable=True)
@@ -0,0 +1,47 @@
+"""
+Модуль app.models.sync_run — история синхронизаций с источниками.
+
+Каждая загрузка года региона при синхронизации (refresh) записывается
+отдельной строкой с длительностями этапов: по ним видно, что именно
+замедлилось — сеть источника, разбор ответа или запись в БД.
+
+Поля модели SyncRun:
+- run_id — идентификатор запуска синхронизации (общий для всех
+  регионов и лет одного запуска);
+- started_at — время начала загрузки года (UTC);
+- region, year — регион и год;
+- source — источник, который вернул данные (NULL — ни один не ответил);
+- fetch_seconds — загрузка по сети (включая неудачные попытки
+  других источников);
+- parse_seconds — разбор ответа;
+- write_seconds — запись в БД;
+- changed — число изменившихся дней;
+- error — ошибки источников (в том числе тех, после которых данные
+  вернул резервный источник).
+
+Пример использования:
+    from app.models import SyncRun
+    select(SyncRun).where(SyncRun.region == 'ru').order_by(SyncRun.id.desc())
+"""
+
+from sqlalchemy import Column, DateTime, Float, Integer, String
+
+from app.core import Base
+from .change import utc_now
+
+
+class SyncRun(Base):
+    """
+    Загрузка года региона в одном запуске синхронизации.
+    """
+
+    run_id = Column(String(32), nullable=False, index=True)
+    started_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
+    region = Column(String(8), nullable=False)
+    year = Column(Integer, nullable=False)
+    source = Column(String(50), nullable=True)
+    fetch_seconds = Column(Float, nullable=False, default=0.0)
+    parse_seconds = Column(Float, nullable=False, default=0.0)
+    write_seconds = Column(Float, nullable=False, default=0.0)
+    changed = Column(Integer, nullable=False, default=0)
+    error = Column(String(500), nullable=True)
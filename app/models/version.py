@@ -0,0 +1,54 @@
+"""
+Модуль app.models.version — версии календаря региона и указатель на активную.
+
+Версия — неизменяемый снимок календаря региона (формат
+app.engine.snapshot), сохранённый при публикации. Активная версия
+региона задаётся указателем `calendarrelease`: публикация и откат —
+изменение одной строки указателя, без перезаписи `calendarday`.
+
+Поля модели CalendarVersion:
+- id — номер версии (монотонно растёт, не переиспользуется);
+- region — регион;
+- seq — номер последнего изменения журнала на момент публикации;
+- created_at — время публикации (UTC);
+- note — комментарий (например, «откат ошибки источника»);
+- snapshot — снимок региона в JSON.
+
+Поля модели CalendarRelease:
+- region — регион (уникален);
+- version_id — активная версия региона;
+- released_at — время переключения (UTC).
+
+Пример использования:
+    from app.models import CalendarRelease, CalendarVersion
+    session.get(CalendarVersion, release.version_id)
+"""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+
+from app.core import Base
+from .change import utc_now
+
+
+class CalendarVersion(Base):
+    """
+    Неизменяемый снимок календаря региона.
+    """
+
+    __table_args__ = {'sqlite_autoincrement': True}
+
+    region = Column(String(8), nullable=False, index=True)
+    seq = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
+    note = Column(String(200), nullable=True)
+    snapshot = Column(Text, nullable=False)
+
+
+class CalendarRelease(Base):
+    """
+    Указатель на активную версию календаря региона.
+    """
+
+    region = Column(String(8), nullable=False, unique=True)
+    version_id = Column(Integer, ForeignKey('calendarversion.id'), nullable=False)
+    released_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
@@ -7,7 +7,7 @@
 
 
 Функциональность:
-- Импорт роутеров из подмодулей (например, interfaces).
+- Импорт роутеров из подмодулей (interfaces, health, calendar, hours, aggregates, bulk, snapshot, changes, notifications, overlays, query, versions, sync).
 - Объединение маршрутов в единый роутер.
 - Упрощение подключения всех API‑маршрутов к основному приложению.
 
@@ -34,9 +34,33 @@
 from fastapi import APIRouter
 
 
+from .aggregates import router as aggregates_router
+from .bulk import router as bulk_router
+from .calendar import router as calendar_router
+from .changes import router as changes_router
+from .health import router as health_router
+from .hours import router as hours_router
 from .interfaces import router as interface_router
+from .notifications import router as notifications_router
+from .overlays import router as overlays_router
+from .query import router as query_router
+from .snapshot import router as snapshot_router
+from .sync import router as sync_router
+from .versions import router as versions_router
 
 router = APIRouter()
 router.include_router(interface_router)
+router.include_router(health_router)
+router.include_router(calendar_router)
+router.include_router(hours_router)
+router.include_router(aggregates_router)
+router.include_router(query_router)
+router.include_router(overlays_router)
+router.include_router(bulk_router)
+router.include_router(snapshot_router)
+router.include_router(changes_router)
+router.include_router(versions_router)
+router.include_router(sync_router)
+router.include_router(notifications_router)
 
 __all__ = ['router']
@@ -0,0 +1,84 @@
+"""
+Модуль app.routes.aggregates — нормы рабочего времени (производственный календарь).
+
+Определённые маршруты:
+- GET `/aggregates/{region}/{year}` — нормы за все месяцы, кварталы
+  и год (`?period=month` — только месяцы);
+- GET `/aggregates/{region}/{year}/{period}/{number}` — норма одного
+  периода, например `/aggregates/ru/2025/month/5` или `/aggregates/ru/2025/quarter/2`.
+
+Ответ — готовые строки таблицы `calendaraggregate` (чтение по уникальному
+индексу). Для лет, по которым в БД нет данных, нормы считаются по
+снимку календаря воркера (правило по умолчанию). Год — от 1 до 9999.
+
+Пример ответа:
+    {"region": "ru", "year": 2025, "period": "month", "number": 5,
+     "working_days": 18, "non_working_days": 13, "working_hours": 144}
+"""
+
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Path
+from sqlalchemy.orm import Session
+
+from app.core import get_session
+from app.schemas import AggregateSchema
+from app.services import index_holder, read_aggregates
+from app.services.aggregates import period_totals
+
+PERIOD_COUNTS = {'month': 12, 'quarter': 4, 'year': 1}
+"""Число периодов каждого вида в году."""
+
+router = APIRouter(prefix='/aggregates')
+
+
+def _aggregates(
+    session: Session,
+    region: str,
+    year: int,
+    period: Optional[str] = None,
+    number: Optional[int] = None
+) -> list:
+    """
+    Нормы из таблицы или, если года в ней нет, по снимку воркера.
+    """
+    rows = read_aggregates(session, region, year, period, number)
+    if rows:
+        return rows
+    return [
+        totals for totals in period_totals(index_holder.current.calendar(region, year))
+        if (period is None or totals['period'] == period)
+        and (number is None or totals['number'] == number)
+    ]
+
+
+@router.get('/{region}/{year}', response_model=list[AggregateSchema])
+def get_year_aggregates(
+    region: str,
+    year: int = Path(ge=1, le=9999),
+    period: Optional[Literal['month', 'quarter', 'year']] = None,
+    session: Session = Depends(get_session)
+):
+    """
+    Нормы года по месяцам, кварталам и за год.
+    """
+    return _aggregates(session, region, year, period)
+
+
+@router.get('/{region}/{year}/{period}/{number}', response_model=AggregateSchema)
+def get_period_aggregate(
+    region: str,
+    period: Literal['month', 'quarter', 'year'],
+    number: int,
+    year: int = Path(ge=1, le=9999),
+    session: Session = Depends(get_session)
+):
+    """
+    Норма одного периода.
+
+    Raises:
+        HTTPException: 404, если номер периода вне диапазона.
+    """
+    if not 1 <= number <= PERIOD_COUNTS[period]:
+        raise HTTPException(status_code=404, detail='Нет такого периода')
+    return _aggregates(session, region, year, period, number)[0]
@@ -0,0 +1,71 @@
+"""
+Модуль app.routes.bulk — пакетные запросы к календарю для аналитики.
+
+Ответы на массив дат вычисляются одним векторным проходом по календарю
+региона в виде массивов NumPy (`index_holder.current.vector(region)`),
+аналогично numpy.is_busday / busday_count / busday_offset, но с учётом
+праздников и переносов.
+
+Определённые маршруты:
+- POST `/bulk/is-working` — признак рабочего дня для каждой даты;
+- POST `/bulk/count` — число рабочих дней в [start, end) для каждой пары;
+- POST `/bulk/offset` — сдвиг каждой даты на N рабочих дней.
+
+Пример запроса:
+    POST /bulk/count
+    {"region": "ru", "start_dates": ["2025-01-01"], "end_dates": ["2025-02-01"]}
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from app.engine.vectorized import as_dates
+from app.schemas import (
+    BulkCountResultSchema, BulkCountSchema, BulkDatesSchema,
+    BulkOffsetResultSchema, BulkOffsetSchema, BulkWorkingSchema
+)
+from app.services import index_holder
+
+router = APIRouter(prefix='/bulk')
+
+
+@router.post('/is-working', response_model=BulkWorkingSchema)
+def bulk_is_working(request: BulkDatesSchema):
+    """
+    Возвращает признаки рабочего дня для массива дат.
+    """
+    calendar = index_holder.current.vector(request.region)
+    return {'is_working': calendar.is_working(as_dates(request.dates)).tolist()}
+
+
+@router.post('/count', response_model=BulkCountResultSchema)
+def bulk_count(request: BulkCountSchema):
+    """
+    Возвращает число рабочих дней для каждой пары дат.
+
+    Raises:
+        HTTPException: 400, если длины массивов начал и концов не совпадают.
+    """
+    if len(request.start_dates) != len(request.end_dates):
+        raise HTTPException(status_code=400, detail='start_dates и end_dates разной длины')
+    calendar = index_holder.current.vector(request.region)
+    counts = calendar.count(as_dates(request.start_dates), as_dates(request.end_dates))
+    return {'counts': counts.tolist()}
+
+
+@router.post('/offset', response_model=BulkOffsetResultSchema)
+def bulk_offset(request: BulkOffsetSchema):
+    """
+    Возвращает даты, сдвинутые на заданное число рабочих дней.
+
+    Raises:
+        HTTPException: 400, если длина `days` не совпадает с числом дат
+            или результат выходит за пределы загруженных лет.
+    """
+    if isinstance(request.days, list) and len(request.days) != len(request.dates):
+        raise HTTPException(status_code=400, detail='days и dates разной длины')
+    calendar = index_holder.current.vector(request.region)
+    try:
+        shifted = calendar.offset(as_dates(request.dates), request.days, request.roll)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+    return {'dates': shifted.tolist()}
@@ -0,0 +1,83 @@
+"""
+Модуль app.routes.calendar — маршруты API для запросов к календарю.
+
+Все ответы строятся из in‑memory снимка календаря (`index_holder.current`)
+без обращения к БД; снимок обновляется в фоне планировщиком.
+
+Определённые маршруты:
+- GET `/calendar?start_date=...&end_date=...&region=ru` — статусы дней
+  за период (включительно);
+- GET `/is-working-day/{day}?region=ru` — статус одного дня;
+- параметр `as_of` (момент, по умолчанию UTC) у `/calendar` и
+  `/is-working-day/{day}` — ответ в том виде, каким календарь был на этот
+  момент (из истории журнала изменений, а не из снимка);
+- POST `/days` — статусы произвольного набора дат одним запросом
+  (в него асинхронный клиент объединяет одиночные запросы).
+
+Пример запроса:
+    GET /calendar?start_date=2025-01-01&end_date=2025-01-31
+"""
+
+from datetime import date, datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core import get_session
+
+from app.schemas import BulkDatesSchema, DaySchema
+from app.services import days_as_of, index_holder
+
+MAX_RANGE_DAYS = 3660
+"""Максимальная длина запрашиваемого периода, дней."""
+
+router = APIRouter()
+
+
+@router.get('/calendar', response_model=list[DaySchema])
+def get_calendar(
+    start_date: date,
+    end_date: date,
+    region: str = 'ru',
+    as_of: Optional[datetime] = None,
+    session: Session = Depends(get_session)
+):
+    """
+    Возвращает статусы дней за период [start_date, end_date]
+    (с as_of — на указанный момент).
+
+    Raises:
+        HTTPException: 400, если период задан неверно или слишком длинный.
+    """
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail='end_date раньше start_date')
+    if (end_date - start_date).days >= MAX_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail='Слишком длинный период')
+    if as_of is not None:
+        return days_as_of(session, region, start_date, end_date, as_of)
+    return index_holder.current.days(region, start_date, end_date)
+
+
+@router.get('/is-working-day/{day}', response_model=DaySchema)
+def is_working_day(
+    day: date,
+    region: str = 'ru',
+    as_of: Optional[datetime] = None,
+    session: Session = Depends(get_session)
+):
+    """
+    Возвращает статус одного дня (с as_of — на указанный момент).
+    """
+    if as_of is not None:
+        return days_as_of(session, region, day, day, as_of)[0]
+    return index_holder.current.get_day(region, day)
+
+
+@router.post('/days', response_model=list[DaySchema])
+def get_days(request: BulkDatesSchema):
+    """
+    Возвращает статусы дней в порядке входных дат.
+    """
+    index = index_holder.current
+    return [index.get_day(request.region, day) for day in request.dates]
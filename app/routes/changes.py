@@ -0,0 +1,51 @@
+"""
+Модуль app.routes.changes — лента изменений календаря.
+
+Определённые маршруты:
+- GET `/changes?since=<seq>&limit=1000` — изменения дней с номером больше
+  `since` в порядке возрастания.
+
+Сценарий клиента:
+1. первый запрос с `since=0` (или после полной загрузки календаря);
+2. сохранить `seq` из ответа;
+3. периодически запрашивать `/changes?since=<seq>` и применять изменения.
+
+Пример ответа:
+    {"seq": 42, "changes": [{"seq": 42, "region": "ru", "date": "2025-11-03",
+     "is_working": false, "holiday_name": null, "working_hours": 0,
+     "changed_at": "..."}]}
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core import get_session
+from app.engine import day_hours
+from app.schemas import ChangeFeedSchema, ChangeSchema
+from app.services import changes_since
+
+router = APIRouter()
+
+
+@router.get('/changes', response_model=ChangeFeedSchema)
+def get_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=10000),
+    session: Session = Depends(get_session)
+):
+    """
+    Возвращает порцию журнала изменений после `since`.
+    """
+    changes = [
+        ChangeSchema(
+            seq=change.id,
+            region=change.region,
+            date=change.date,
+            is_working=change.is_working,
+            holiday_name=change.holiday_name,
+            working_hours=day_hours(change.is_working, change.working_hours),
+            changed_at=change.changed_at,
+        )
+        for change in changes_since(session, since, limit)
+    ]
+    return ChangeFeedSchema(seq=changes[-1].seq if changes else since, changes=changes)
@@ -0,0 +1,43 @@
+"""
+Модуль app.routes.health — проверки состояния воркера для балансировщика.
+
+Определённые маршруты:
+- GET `/health` — проверка «жив ли процесс» (liveness): всегда 200,
+  ничего не проверяет и ничего не загружает;
+- GET `/ready` — проверка готовности (readiness): 503, пока идёт прогрев
+  (или воркер останавливается), 200 — после прогрева.
+
+Балансировщик должен направлять трафик только на воркеры, у которых
+`/ready` отвечает 200: так после деплоя запросы не попадают на холодные воркеры.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.services import index_holder, readiness
+
+router = APIRouter()
+
+
+@router.get('/health')
+def health():
+    """
+    Проверка, что процесс отвечает.
+    """
+    return {'status': 'ok'}
+
+
+@router.get('/ready')
+def ready():
+    """
+    Проверка готовности воркера принимать трафик.
+
+    Returns:
+        200 с версией снимка календаря после прогрева,
+        503 с Retry-After — до его завершения.
+    """
+    if not readiness.ready:
+        return JSONResponse(
+            {'status': 'warming_up'}, status_code=503, headers={'Retry-After': '1'}
+        )
+    return {'status': 'ready', 'version': index_holder.current.version}
@@ -0,0 +1,64 @@
+"""
+Модуль app.routes.hours — сроки в рабочих часах (SLA).
+
+Ответы считаются по in‑memory снимку календаря с учётом сокращённых дней
+и распорядка рабочего дня (WORKDAY_SCHEDULE) через префиксные суммы
+рабочих часов — без перебора дней.
+
+Определённые маршруты:
+- GET `/working-hours?start=...&end=...&region=ru` — рабочие часы
+  между двумя моментами;
+- GET `/working-hours/add?start=...&hours=16&region=ru` — момент,
+  когда истекут `hours` рабочих часов.
+
+Моменты передаются в местном времени региона без часового пояса,
+например `2025-04-30T16:00:00`. `hours` — конечное число
+в (0, MAX_WORKING_HOURS], иначе 422; момент с часовым поясом
+и выход за 9999 год — 400.
+"""
+
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.engine import MAX_WORKING_HOURS, add_working_hours, working_hours_between
+from app.schemas import DeadlineSchema, WorkingHoursSchema
+from app.services import index_holder, work_schedule
+
+router = APIRouter(prefix='/working-hours')
+
+
+@router.get('', response_model=WorkingHoursSchema)
+def get_working_hours(start: datetime, end: datetime, region: str = 'ru'):
+    """
+    Возвращает рабочие часы между start и end.
+
+    Raises:
+        HTTPException: 400, если у момента есть часовой пояс или период
+            выходит за пределы дат.
+    """
+    try:
+        hours = working_hours_between(index_holder.current, region, start, end, work_schedule)
+    except (ValueError, OverflowError) as error:
+        raise HTTPException(status_code=400, detail=str(error))
+    return WorkingHoursSchema(start=start, end=end, hours=hours)
+
+
+@router.get('/add', response_model=DeadlineSchema)
+def get_deadline(
+    start: datetime,
+    hours: float = Query(gt=0, le=MAX_WORKING_HOURS, allow_inf_nan=False),
+    region: str = 'ru'
+):
+    """
+    Возвращает момент, когда с start пройдёт hours рабочих часов.
+
+    Raises:
+        HTTPException: 400, если у момента есть часовой пояс или срок
+            выходит за пределы дат.
+    """
+    try:
+        deadline = add_working_hours(index_holder.current, region, start, hours, work_schedule)
+    except (ValueError, OverflowError) as error:
+        raise HTTPException(status_code=400, detail=str(error))
+    return DeadlineSchema(start=start, hours=hours, deadline=deadline)
@@ -0,0 +1,170 @@
+"""
+Модуль app.routes.notifications — push‑уведомления об изменениях календаря.
+
+Клиенты подписываются на события вместо периодического опроса API.
+События публикует фоновое обновление каждого воркера (см. SyncScheduler),
+когда в журнале изменений появляются новые записи.
+
+Определённые маршруты:
+- WebSocket `/ws/changes?regions=ru,by` — события в виде JSON‑сообщений;
+- GET `/changes/stream?regions=ru&since=<seq>` — Server‑Sent Events.
+  Вместо `since` можно передать заголовок `Last-Event-ID` (браузерный
+  EventSource делает это сам при переподключении): пропущенные события
+  будут догружены из БД перед живыми.
+
+Формат события:
+    {"seq": 42, "region": "ru", "changes": [
+        {"seq": 42, "date": "2025-11-03", "is_working": false, "holiday_name": null}]}
+
+Если клиент не успевает читать события и его очередь переполняется,
+соединение закрывается (WebSocket — кодом 1013); клиент переподключается
+и догружает пропущенное через `GET /changes?since=<seq>`.
+"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from fastapi import APIRouter, Depends, Header, WebSocket
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core import get_session
+from app.services import broadcaster, change_events, changes_since
+from app.services.broadcaster import Broadcaster
+
+SSE_KEEPALIVE = 15
+"""Интервал комментария‑пинга в потоке SSE, секунды."""
+
+REPLAY_LIMIT = 10000
+"""Максимум изменений, догружаемых из БД при подключении к SSE."""
+
+router = APIRouter()
+
+
+def parse_regions(regions: Optional[str]) -> Optional[set[str]]:
+    """
+    Разбирает список регионов вида 'ru,by'; пустое значение — все регионы.
+    """
+    if not regions:
+        return None
+    return {region.strip() for region in regions.split(',') if region.strip()}
+
+
+def format_sse(event: dict) -> str:
+    """
+    Форматирует событие как сообщение Server‑Sent Events.
+    """
+    data = json.dumps(event, ensure_ascii=False)
+    return f"id: {event['seq']}\nevent: change\ndata: {data}\n\n"
+
+
+def skip_seen(event: dict, last_seq: int) -> Optional[dict]:
+    """
+    Убирает из события изменения, уже отправленные клиенту.
+
+    Returns:
+        dict | None: событие только с новыми изменениями или None.
+    """
+    changes = [change for change in event['changes'] if change['seq'] > last_seq]
+    if not changes:
+        return None
+    return {**event, 'changes': changes}
+
+
+async def sse_stream(
+    regions: Optional[set[str]],
+    replay: Callable[[], Awaitable[list[dict]]],
+    keepalive: float = SSE_KEEPALIVE,
+    hub: Broadcaster = broadcaster
+) -> AsyncIterator[str]:
+    """
+    Поток SSE: сначала догруженные из БД события, затем живые.
+
+    Подписка оформляется в самом потоке (до догрузки `replay()`, чтобы
+    не потерять события между ними) и снимается при его завершении,
+    в том числе при отключении клиента. Если ответ так и не начал
+    отправляться, подписки не возникает вовсе.
+    """
+    subscription = hub.subscribe(regions)
+    last_seq = 0
+    try:
+        for event in await replay():
+            last_seq = event['seq']
+            yield format_sse(event)
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield ': keepalive\n\n'
+                continue
+            if event is None:
+                break
+            event = skip_seen(event, last_seq)
+            if event is not None:
+                last_seq = event['seq']
+                yield format_sse(event)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@router.get('/changes/stream')
+async def changes_stream(
+    regions: Optional[str] = None,
+    since: Optional[int] = None,
+    last_event_id: Optional[int] = Header(None),
+    session: Session = Depends(get_session)
+):
+    """
+    Поток событий об изменениях календаря (Server‑Sent Events).
+    """
+    wanted = parse_regions(regions)
+    start = since if since is not None else last_event_id
+
+    async def replay() -> list[dict]:
+        if start is None:
+            return []
+        changes = await run_in_threadpool(changes_since, session, start, REPLAY_LIMIT)
+        return [
+            event for event in change_events(changes)
+            if wanted is None or event['region'] in wanted
+        ]
+
+    return StreamingResponse(
+        sse_stream(wanted, replay),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@router.websocket('/ws/changes')
+async def changes_websocket(websocket: WebSocket, regions: Optional[str] = None):
+    """
+    WebSocket с событиями об изменениях календаря.
+
+    Сообщения от клиента не ожидаются; чтение нужно только для того,
+    чтобы сразу заметить отключение и снять подписку.
+    """
+    await websocket.accept()
+    subscription = broadcaster.subscribe(parse_regions(regions))
+    disconnected = asyncio.Event()
+
+    async def watch_disconnect() -> None:
+        while (await websocket.receive())['type'] != 'websocket.disconnect':
+            pass
+        disconnected.set()
+        subscription.offer(None)
+
+    watcher = asyncio.create_task(watch_disconnect())
+    try:
+        while (event := await subscription.get()) is not None:
+            await websocket.send_json(event)
+        if not disconnected.is_set():
+            if subscription.overflowed:
+                await websocket.close(code=1013, reason='Очередь переполнена, используйте /changes')
+            else:
+                await websocket.close(code=1001)
+    finally:
+        watcher.cancel()
+        broadcaster.unsubscribe(subscription)
@@ -0,0 +1,185 @@
+"""
+Модуль app.routes.overlays — календари сотрудников и команд (наложения).
+
+Наложение хранит только интервалы дат, отличающиеся от базового календаря
+(отпуск, отгул, выездная неделя); ответы собираются слоями поверх
+in‑memory снимка: базовый календарь → команда → сотрудник.
+
+Определённые маршруты:
+- PUT `/overlays/{name}` — создать или изменить наложение
+  (`{"region": "ru", "parent": "team-ops"}`; сменный график —
+  `{"shift_pattern": "2/2", "shift_anchor": "2025-01-01"}`);
+- GET `/overlays/{name}/intervals` — интервалы наложения;
+- POST `/overlays/{name}/intervals` — добавить интервал
+  (`{"start_date": "2025-07-01", "end_date": "2025-07-14", "note": "Отпуск"}`);
+- DELETE `/overlays/{name}/intervals/{interval_id}` — удалить интервал;
+- GET `/overlays/{name}/calendar?start_date=...&end_date=...` — статусы дней
+  с учётом наложения и его предков;
+- GET `/overlays/{name}/is-working-day/{day}` — статус одного дня.
+"""
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core import get_session, get_write_session
+from app.engine import ShiftPattern
+from app.models import Overlay, OverlayInterval
+from app.schemas import (
+    DaySchema, IntervalCreateSchema, IntervalSchema, OverlayCreateSchema, OverlaySchema
+)
+from app.services import index_holder, overlay_calendar, overlay_chain
+from .calendar import MAX_RANGE_DAYS
+
+router = APIRouter(prefix='/overlays')
+
+
+def _get_overlay(session: Session, name: str) -> Overlay:
+    """
+    Возвращает наложение по имени.
+
+    Raises:
+        HTTPException: 404, если наложения нет.
+    """
+    overlay = session.scalars(select(Overlay).where(Overlay.name == name)).first()
+    if overlay is None:
+        raise HTTPException(status_code=404, detail=f'Наложение {name} не найдено')
+    return overlay
+
+
+@router.put('/{name}', response_model=OverlaySchema)
+def put_overlay(
+    name: str,
+    request: OverlayCreateSchema,
+    session: Session = Depends(get_write_session)
+):
+    """
+    Создаёт или изменяет наложение.
+
+    Raises:
+        HTTPException: 400, если родитель не найден или образует цикл;
+            422, если сменный график задан неверно или его цикл длиннее
+            MAX_CYCLE_DAYS.
+    """
+    if (request.shift_pattern is None) != (request.shift_anchor is None):
+        raise HTTPException(status_code=400, detail='shift_pattern задаётся вместе с shift_anchor')
+    if request.shift_pattern is not None:
+        try:
+            ShiftPattern.parse(request.shift_pattern)
+        except ValueError as error:
+            raise HTTPException(status_code=422, detail=str(error))
+    parent_id = None
+    if request.parent is not None:
+        parent = session.scalars(select(Overlay).where(Overlay.name == request.parent)).first()
+        if parent is None:
+            raise HTTPException(status_code=400, detail=f'Наложение {request.parent} не найдено')
+        if name in {overlay.name for overlay in overlay_chain(session, parent.name)}:
+            raise HTTPException(status_code=400, detail='Родитель образует цикл')
+        parent_id = parent.id
+    overlay = session.scalars(select(Overlay).where(Overlay.name == name)).first()
+    if overlay is None:
+        overlay = Overlay(name=name)
+        session.add(overlay)
+    overlay.region = request.region
+    overlay.parent_id = parent_id
+    overlay.shift_pattern = request.shift_pattern
+    overlay.shift_anchor = request.shift_anchor
+    session.commit()
+    return OverlaySchema(name=name, **request.model_dump())
+
+
+@router.get('/{name}/intervals', response_model=list[IntervalSchema])
+def get_intervals(name: str, session: Session = Depends(get_session)):
+    """
+    Возвращает интервалы наложения в порядке добавления.
+    """
+    overlay = _get_overlay(session, name)
+    return session.scalars(
+        select(OverlayInterval)
+        .where(OverlayInterval.overlay_id == overlay.id)
+        .order_by(OverlayInterval.id)
+    ).all()
+
+
+@router.post('/{name}/intervals', response_model=IntervalSchema, status_code=201)
+def add_interval(
+    name: str,
+    request: IntervalCreateSchema,
+    session: Session = Depends(get_write_session)
+):
+    """
+    Добавляет интервал; он перекрывает ранее добавленные интервалы наложения.
+
+    Raises:
+        HTTPException: 400, если конец интервала раньше начала.
+    """
+    if request.end_date < request.start_date:
+        raise HTTPException(status_code=400, detail='end_date раньше start_date')
+    overlay = _get_overlay(session, name)
+    interval = OverlayInterval(overlay_id=overlay.id, **request.model_dump())
+    session.add(interval)
+    session.commit()
+    return interval
+
+
+@router.delete('/{name}/intervals/{interval_id}', status_code=204)
+def delete_interval(
+    name: str,
+    interval_id: int,
+    session: Session = Depends(get_write_session)
+):
+    """
+    Удаляет интервал наложения.
+
+    Raises:
+        HTTPException: 404, если интервала у наложения нет.
+    """
+    overlay = _get_overlay(session, name)
+    interval = session.get(OverlayInterval, interval_id)
+    if interval is None or interval.overlay_id != overlay.id:
+        raise HTTPException(status_code=404, detail='Интервал не найден')
+    session.delete(interval)
+    session.commit()
+    return Response(status_code=204)
+
+
+@router.get('/{name}/calendar', response_model=list[DaySchema])
+def get_overlay_calendar(
+    name: str,
+    start_date: date,
+    end_date: date,
+    session: Session = Depends(get_session)
+):
+    """
+    Возвращает статусы дней за период [start_date, end_date] с учётом наложения.
+
+    Raises:
+        HTTPException: 400, если период задан неверно или слишком длинный;
+            404, если наложения нет.
+    """
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail='end_date раньше start_date')
+    if (end_date - start_date).days >= MAX_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail='Слишком длинный период')
+    try:
+        calendar = overlay_calendar(session, name, index_holder.current)
+    except LookupError as error:
+        raise HTTPException(status_code=404, detail=str(error))
+    return calendar.days(start_date, end_date)
+
+
+@router.get('/{name}/is-working-day/{day}', response_model=DaySchema)
+def get_overlay_day(name: str, day: date, session: Session = Depends(get_session)):
+    """
+    Возвращает статус одного дня с учётом наложения.
+
+    Raises:
+        HTTPException: 404, если наложения нет.
+    """
+    try:
+        calendar = overlay_calendar(session, name, index_holder.current)
+    except LookupError as error:
+        raise HTTPException(status_code=404, detail=str(error))
+    return calendar.get_day(day)
@@ -0,0 +1,40 @@
+"""
+Модуль app.routes.query — составной запрос к календарю.
+
+Странице с несколькими виджетами (месяц, счётчики, ближайший рабочий
+день, список праздников) достаточно одного запроса вместо 10–20:
+все операции вычисляются по одному снимку календаря, поэтому ответы
+согласованы между собой (одна версия данных).
+
+Определённые маршруты:
+- POST `/query` — операции по порядку, результаты в том же порядке.
+
+Пример запроса:
+    POST /query
+    {"region": "ru", "operations": [
+      {"id": "month", "op": "calendar", "start_date": "2025-05-01", "end_date": "2025-05-31"},
+      {"op": "count_working", "start_date": "2025-05-01", "end_date": "2025-06-01"},
+      {"op": "next_working", "day": "2025-04-30"},
+      {"op": "deadline", "start": "2025-04-30T16:00:00", "hours": 16}
+    ]}
+
+Ошибка в одной операции (например, неверный период) возвращается в поле
+`error` её результата и не мешает остальным.
+"""
+
+from fastapi import APIRouter
+
+from app.schemas import QueryResponseSchema, QuerySchema
+from app.services import QueryContext, index_holder, work_schedule
+
+router = APIRouter()
+
+
+@router.post('/query', response_model=QueryResponseSchema)
+def run_query(request: QuerySchema):
+    """
+    Вычисляет операции составного запроса по текущему снимку.
+    """
+    index = index_holder.current
+    context = QueryContext(index, request.region, work_schedule)
+    return QueryResponseSchema(version=index.version, results=context.run(request.operations))
@@ -0,0 +1,54 @@
+"""
+Модуль app.routes.snapshot — выгрузка снимка календаря региона целиком.
+
+Используется клиентской библиотекой workcalendar_client: она загружает
+снимок один раз, отвечает на вопросы локально и периодически
+перепроверяет его через ETag (If-None-Match → 304 без тела).
+
+Определённые маршруты:
+- GET `/snapshot/{region}` — все загруженные годы региона в формате
+  app.engine.snapshot; ETag зависит от версии снимка.
+
+Тело ответа сериализуется один раз на версию снимка и регион
+(только для регионов снимка: для прочих регионов тело — пустой снимок,
+и оно не кэшируется, чтобы произвольные регионы из запросов не копились
+в памяти).
+"""
+
+import json
+
+from fastapi import APIRouter, Request, Response
+
+from app.engine import dump_snapshot
+from app.services import index_holder
+
+router = APIRouter()
+
+_rendered: dict[str, tuple[int, bytes]] = {}
+"""Готовые тела ответов: регион → (версия снимка, JSON)."""
+
+
+def snapshot_etag(region: str, version: int) -> str:
+    """
+    ETag снимка региона.
+    """
+    return f'"{region}-{version}"'
+
+
+@router.get('/snapshot/{region}')
+def get_snapshot(region: str, request: Request):
+    """
+    Возвращает снимок региона или 304, если у клиента он актуален.
+    """
+    index = index_holder.current
+    etag = snapshot_etag(region, index.version)
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status_code=304, headers=headers)
+    rendered = _rendered.get(region)
+    if rendered is None or rendered[0] != index.version:
+        body = json.dumps(dump_snapshot(index, region), ensure_ascii=False).encode('utf-8')
+        rendered = (index.version, body)
+        if region in index.regions:
+            _rendered[region] = rendered
+    return Response(rendered[1], media_type='application/json', headers=headers)
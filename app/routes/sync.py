@@ -0,0 +1,38 @@
+"""
+Модуль app.routes.sync — история синхронизаций с источниками.
+
+Определённые маршруты:
+- GET `/sync/runs` — последние загрузки лет (новые первыми)
+  с длительностями загрузки, разбора и записи; фильтры `?region=`,
+  `?run_id=` и `?limit=` (по умолчанию 100).
+
+Пример ответа:
+    [{"run_id": "3f2a…", "started_at": "2025-05-01T03:00:00Z",
+      "region": "ru", "year": 2025, "source": "xmlcalendar",
+      "fetch_seconds": 0.412, "parse_seconds": 0.008, "write_seconds": 0.031,
+      "changed": 3, "error": null}]
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core import get_session
+from app.schemas import SyncRunSchema
+from app.services import list_sync_runs
+
+router = APIRouter(prefix='/sync')
+
+
+@router.get('/runs', response_model=list[SyncRunSchema])
+def get_sync_runs(
+    region: Optional[str] = None,
+    run_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    session: Session = Depends(get_session)
+):
+    """
+    Последние загрузки лет из истории синхронизаций.
+    """
+    return list_sync_runs(session, region, run_id, limit)
@@ -0,0 +1,84 @@
+"""
+Модуль app.routes.versions — версии календаря региона и мгновенный откат.
+
+Определённые маршруты:
+- GET `/versions/{region}` — версии региона (новые первыми) и активная;
+- POST `/versions/{region}/publish` — опубликовать текущее состояние
+  `calendarday` новой версией (`{"note": "..."}`);
+- POST `/versions/{region}/rollback` — переключить регион на версию
+  (`{"version_id": 41}`): откат ошибочных данных источника или возврат вперёд.
+
+Переключение — изменение одной строки указателя; этот воркер сразу
+подменяет свой снимок и рассылает события об изменившихся днях,
+остальные воркеры подхватывают откат по seq в течение SYNC_POLL_INTERVAL.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core import get_session, get_write_session
+from app.schemas import ActivationSchema, PublishSchema, RollbackSchema, VersionSchema
+from app.services import (
+    activate_version, broadcaster, change_events, changes_since, index_holder,
+    list_versions, load_index, publish_version
+)
+from app.services.scheduler import MAX_EVENT_CHANGES
+
+router = APIRouter(prefix='/versions')
+
+
+def _apply(session: Session) -> None:
+    """
+    Подменяет снимок этого воркера и рассылает события о новых изменениях.
+    """
+    previous = index_holder.current.version
+    index_holder.swap(load_index(session.get_bind()))
+    if broadcaster.subscribers:
+        for event in change_events(changes_since(session, previous, MAX_EVENT_CHANGES)):
+            broadcaster.publish(event)
+
+
+def _schema(version, active: bool) -> VersionSchema:
+    return VersionSchema(
+        id=version.id, region=version.region, seq=version.seq,
+        created_at=version.created_at, note=version.note, active=active,
+    )
+
+
+@router.get('/{region}', response_model=list[VersionSchema])
+def get_versions(region: str, session: Session = Depends(get_session)):
+    """
+    Возвращает версии региона, новые первыми.
+    """
+    return [_schema(version, active) for version, active in list_versions(session, region)]
+
+
+@router.post('/{region}/publish', response_model=VersionSchema)
+def publish(region: str, request: PublishSchema, session: Session = Depends(get_write_session)):
+    """
+    Публикует текущее состояние региона новой версией.
+
+    Если активная версия уже совпадает с данными, возвращается она.
+    """
+    version_id = publish_version(region, request.note, session.get_bind())
+    _apply(session)
+    return next(
+        _schema(version, active)
+        for version, active in list_versions(session, region) if version.id == version_id
+    )
+
+
+@router.post('/{region}/rollback', response_model=ActivationSchema)
+def rollback(region: str, request: RollbackSchema, session: Session = Depends(get_write_session)):
+    """
+    Переключает регион на версию `version_id`.
+
+    Raises:
+        HTTPException: 404, если у региона нет такой версии.
+    """
+    try:
+        changed = activate_version(region, request.version_id, session.get_bind())
+    except LookupError as error:
+        raise HTTPException(status_code=404, detail=str(error))
+    _apply(session)
+    return ActivationSchema(region=region, version_id=request.version_id, changed=changed)
@@ -0,0 +1,42 @@
+"""
+Модуль app.schemas.__init__.py — схемы запросов и ответов API WorkCalendarClient.
+
+Экспортируемые объекты:
+- AggregateSchema — нормы рабочих дней и часов за месяц, квартал, год;
+- DaySchema — статус одного дня календаря;
+- ChangeSchema, ChangeFeedSchema — журнал изменений календаря;
+- Bulk*Schema — пакетные запросы (массивы дат) и ответы на них;
+- WorkingHoursSchema, DeadlineSchema — сроки в рабочих часах;
+- Overlay*Schema, Interval*Schema — календари сотрудников и команд;
+- QuerySchema, QueryResultSchema, QueryResponseSchema — составной запрос
+  (операции — в app.schemas.query);
+- SyncRunSchema — история синхронизаций с длительностями этапов;
+- VersionSchema, PublishSchema, RollbackSchema, ActivationSchema — версии
+  календаря и откат.
+
+Пример использования:
+    from app.schemas import DaySchema
+"""
+
+from .aggregate import AggregateSchema
+from .bulk import (
+    BulkCountResultSchema, BulkCountSchema, BulkDatesSchema,
+    BulkOffsetResultSchema, BulkOffsetSchema, BulkWorkingSchema
+)
+from .calendar import ChangeFeedSchema, ChangeSchema, DaySchema
+from .hours import DeadlineSchema, WorkingHoursSchema
+from .overlay import (
+    IntervalCreateSchema, IntervalSchema, OverlayCreateSchema, OverlaySchema
+)
+from .query import QueryResponseSchema, QueryResultSchema, QuerySchema
+from .sync import SyncRunSchema
+from .version import ActivationSchema, PublishSchema, RollbackSchema, VersionSchema
+
+__all__ = [
+    'ActivationSchema', 'AggregateSchema', 'BulkCountResultSchema', 'BulkCountSchema', 'BulkDatesSchema',
+    'BulkOffsetResultSchema', 'BulkOffsetSchema', 'BulkWorkingSchema',
+    'ChangeFeedSchema', 'ChangeSchema', 'DaySchema', 'DeadlineSchema',
+    'IntervalCreateSchema', 'IntervalSchema', 'OverlayCreateSchema',
+    'OverlaySchema', 'PublishSchema', 'QueryResponseSchema', 'QueryResultSchema',
+    'QuerySchema', 'RollbackSchema', 'SyncRunSchema', 'VersionSchema', 'WorkingHoursSchema'
+]
@@ -0,0 +1,28 @@
+"""
+Модуль app.schemas.aggregate — схема норм рабочего времени за период.
+
+Структура:
+- AggregateSchema — число рабочих и нерабочих дней и рабочих часов
+  за месяц, квартал или год.
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AggregateSchema(BaseModel):
+    """
+    Нормы периода: `period` — 'month', 'quarter' или 'year',
+    `number` — номер месяца (1–12), квартала (1–4) или 1 для года.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    region: str
+    year: int
+    period: Literal['month', 'quarter', 'year']
+    number: int
+    working_days: int
+    non_working_days: int
+    working_hours: int
@@ -0,0 +1,80 @@
+"""
+Модуль app.schemas.bulk — схемы пакетных запросов к календарю.
+
+Пакетные маршруты принимают массивы дат и считают ответы одним векторным
+проходом (NumPy) вместо вызова на каждую дату.
+
+Структура:
+- BulkDatesSchema, BulkWorkingSchema — признак рабочего дня для массива дат;
+- BulkCountSchema, BulkCountResultSchema — число рабочих дней в парах дат;
+- BulkOffsetSchema, BulkOffsetResultSchema — сдвиг дат на N рабочих дней.
+"""
+
+from datetime import date
+from typing import Annotated, Literal, Union
+
+from pydantic import BaseModel, Field
+
+MAX_BULK_SIZE = 100_000
+"""Максимальное число дат в одном пакетном запросе."""
+
+MAX_OFFSET_DAYS = 10 ** 6
+"""Наибольший сдвиг |days| в рабочих днях."""
+
+OffsetDays = Annotated[int, Field(ge=-MAX_OFFSET_DAYS, le=MAX_OFFSET_DAYS)]
+"""Сдвиг в рабочих днях в пределах ±MAX_OFFSET_DAYS."""
+
+
+class BulkDatesSchema(BaseModel):
+    """
+    Массив дат региона.
+    """
+
+    region: str = 'ru'
+    dates: list[date] = Field(max_length=MAX_BULK_SIZE)
+
+
+class BulkWorkingSchema(BaseModel):
+    """
+    Признаки рабочего дня в порядке входных дат.
+    """
+
+    is_working: list[bool]
+
+
+class BulkCountSchema(BaseModel):
+    """
+    Пары дат: рабочие дни считаются в [start_dates[i], end_dates[i]).
+    """
+
+    region: str = 'ru'
+    start_dates: list[date] = Field(max_length=MAX_BULK_SIZE)
+    end_dates: list[date] = Field(max_length=MAX_BULK_SIZE)
+
+
+class BulkCountResultSchema(BaseModel):
+    """
+    Число рабочих дней для каждой пары (отрицательное, если конец раньше начала).
+    """
+
+    counts: list[int]
+
+
+class BulkOffsetSchema(BulkDatesSchema):
+    """
+    Сдвиг дат на `days` рабочих дней (одно число или по числу на дату).
+
+    Нерабочая дата сначала переносится на ближайший рабочий день
+    по правилу `roll`; |days| не больше MAX_OFFSET_DAYS.
+    """
+
+    days: Union[OffsetDays, list[OffsetDays]]
+    roll: Literal['forward', 'backward'] = 'forward'
+
+
+class BulkOffsetResultSchema(BaseModel):
+    """
+    Сдвинутые даты в порядке входных дат.
+    """
+
+    dates: list[date]
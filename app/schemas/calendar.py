@@ -0,0 +1,49 @@
+"""
+Модуль app.schemas.calendar — схемы ответов API календаря.
+
+Определяет Pydantic‑модели, в которых маршруты возвращают данные о днях.
+
+Структура:
+- DaySchema — статус одного дня (регион, дата, рабочий ли, праздник,
+  рабочие часы);
+- ChangeSchema — запись журнала изменений (день и его seq);
+- ChangeFeedSchema — порция журнала изменений и seq для следующего запроса.
+"""
+
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class DaySchema(BaseModel):
+    """
+    Статус дня календаря в ответе API.
+    """
+
+    region: str
+    date: date
+    is_working: bool
+    holiday_name: Optional[str] = None
+    working_hours: Optional[int] = None
+
+
+class ChangeSchema(DaySchema):
+    """
+    Изменение дня календаря с номером в журнале.
+    """
+
+    seq: int
+    changed_at: datetime
+
+
+class ChangeFeedSchema(BaseModel):
+    """
+    Порция журнала изменений.
+
+    Поле `seq` — номер последнего изменения в порции (или исходный `since`,
+    если изменений нет); его передают в следующий запрос.
+    """
+
+    seq: int
+    changes: list[ChangeSchema]
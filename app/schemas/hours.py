@@ -0,0 +1,31 @@
+"""
+Модуль app.schemas.hours — схемы ответов арифметики рабочих часов.
+
+Структура:
+- WorkingHoursSchema — рабочие часы между двумя моментами;
+- DeadlineSchema — момент, когда истечёт заданное число рабочих часов.
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class WorkingHoursSchema(BaseModel):
+    """
+    Рабочие часы между start и end (отрицательные, если end раньше start).
+    """
+
+    start: datetime
+    end: datetime
+    hours: float
+
+
+class DeadlineSchema(BaseModel):
+    """
+    Срок: момент, когда с start пройдёт hours рабочих часов.
+    """
+
+    start: datetime
+    hours: float
+    deadline: datetime
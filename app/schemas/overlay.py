@@ -0,0 +1,58 @@
+"""
+Модуль app.schemas.overlay — схемы календарей сотрудников и команд.
+
+Ограничения длины строк совпадают с колонками таблиц `overlay`
+и `overlayinterval`.
+
+Структура:
+- OverlayCreateSchema — создание или изменение наложения;
+- OverlaySchema — наложение в ответе API;
+- IntervalCreateSchema — новый интервал наложения;
+- IntervalSchema — интервал наложения в ответе API.
+"""
+
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class OverlayCreateSchema(BaseModel):
+    """
+    Параметры наложения: регион базового календаря, родитель (команда)
+    и сменный график (например, '2/2' с даты shift_anchor).
+    """
+
+    region: str = Field('ru', max_length=8)
+    parent: Optional[str] = Field(None, max_length=100)
+    shift_pattern: Optional[str] = Field(None, max_length=50)
+    shift_anchor: Optional[date] = None
+
+
+class OverlaySchema(OverlayCreateSchema):
+    """
+    Наложение в ответе API.
+    """
+
+    name: str
+
+
+class IntervalCreateSchema(BaseModel):
+    """
+    Интервал дат [start_date, end_date] с переопределённым статусом.
+
+    По умолчанию дни интервала нерабочие (отпуск, отгул).
+    """
+
+    start_date: date
+    end_date: date
+    is_working: bool = False
+    note: Optional[str] = Field(None, max_length=200)
+
+
+class IntervalSchema(IntervalCreateSchema):
+    """
+    Интервал наложения в ответе API.
+    """
+
+    id: int
@@ -0,0 +1,124 @@
+"""
+Модуль app.schemas.query — схемы составного запроса к календарю.
+
+Составной запрос (`POST /query`) содержит список разнородных операций;
+все они вычисляются по одному снимку календаря и возвращаются вместе.
+
+Структура:
+- *Operation — операции (поле `op` выбирает вид операции);
+- QuerySchema — составной запрос;
+- QueryResultSchema — результат одной операции;
+- QueryResponseSchema — ответ: версия снимка и результаты по порядку.
+"""
+
+from datetime import date, datetime
+from typing import Annotated, Any, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.engine import MAX_WORKING_HOURS
+
+MAX_QUERY_OPERATIONS = 100
+"""Максимальное число операций в одном составном запросе."""
+
+
+class Operation(BaseModel):
+    """
+    Общие поля операции: `id` — метка для сопоставления ответа (необязательна).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: Optional[str] = None
+
+
+class DayOperation(Operation):
+    """
+    Статус дня (`day`) или только признак рабочего дня (`is_working`).
+    """
+
+    op: Literal['day', 'is_working']
+    day: date
+
+
+class RangeOperation(Operation):
+    """
+    Операции над периодом:
+    - `calendar` — статусы дней [start_date, end_date];
+    - `holidays` — праздники (нерабочие дни с названием) в [start_date, end_date];
+    - `count_working` — число рабочих дней в [start_date, end_date).
+    """
+
+    op: Literal['calendar', 'holidays', 'count_working']
+    start_date: date
+    end_date: date
+
+
+class ShiftOperation(Operation):
+    """
+    Сдвиг по рабочим дням:
+    - `add_working_days` — `day` плюс `days` рабочих дней;
+    - `next_working` — первый рабочий день после `day`;
+    - `previous_working` — последний рабочий день до `day`.
+    """
+
+    op: Literal['add_working_days', 'next_working', 'previous_working']
+    day: date
+    days: int = 0
+
+
+class HoursOperation(Operation):
+    """
+    Рабочие часы между start и end (`working_hours`).
+    """
+
+    op: Literal['working_hours']
+    start: datetime
+    end: datetime
+
+
+class DeadlineOperation(Operation):
+    """
+    Момент, когда с start пройдёт hours рабочих часов (`deadline`).
+    """
+
+    op: Literal['deadline']
+    start: datetime
+    hours: float = Field(ge=-MAX_WORKING_HOURS, le=MAX_WORKING_HOURS, allow_inf_nan=False)
+
+
+QueryOperation = Annotated[
+    Union[DayOperation, RangeOperation, ShiftOperation, HoursOperation, DeadlineOperation],
+    Field(discriminator='op')
+]
+"""Операция составного запроса (вид выбирается полем `op`)."""
+
+
+class QuerySchema(BaseModel):
+    """
+    Составной запрос: операции над календарём региона.
+    """
+
+    region: str = 'ru'
+    operations: list[QueryOperation] = Field(max_length=MAX_QUERY_OPERATIONS)
+
+
+class QueryResultSchema(BaseModel):
+    """
+    Результат операции: `result` или текст ошибки `error`.
+    """
+
+    id: Optional[str] = None
+    op: str
+    result: Any = None
+    error: Optional[str] = None
+
+
+class QueryResponseSchema(BaseModel):
+    """
+    Ответ составного запроса: версия снимка, по которому вычислены
+    все результаты, и результаты в порядке операций.
+    """
+
+    version: int
+    results: list[QueryResultSchema]
@@ -0,0 +1,33 @@
+"""
+Модуль app.schemas.sync — схема истории синхронизаций.
+
+Структура:
+- SyncRunSchema — загрузка года региона: источник и длительности этапов.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SyncRunSchema(BaseModel):
+    """
+    Загрузка года региона в запуске синхронизации `run_id`.
+
+    `source` пуст, если ни один источник не ответил; `error` — ошибки
+    источников через «; ». Длительности — в секундах.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    run_id: str
+    started_at: datetime
+    region: str
+    year: int
+    source: Optional[str]
+    fetch_seconds: float
+    parse_seconds: float
+    write_seconds: float
+    changed: int
+    error: Optional[str]
@@ -0,0 +1,53 @@
+"""
+Модуль app.schemas.version — схемы версий календаря региона.
+
+Структура:
+- VersionSchema — версия в ответе API;
+- PublishSchema — запрос публикации текущего состояния;
+- RollbackSchema — запрос переключения на версию;
+- ActivationSchema — результат переключения.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class VersionSchema(BaseModel):
+    """
+    Версия календаря региона; `active` — версия, которую видят воркеры.
+    """
+
+    id: int
+    region: str
+    seq: int
+    created_at: datetime
+    note: Optional[str] = None
+    active: bool
+
+
+class PublishSchema(BaseModel):
+    """
+    Публикация текущего состояния `calendarday` с комментарием.
+    """
+
+    note: Optional[str] = Field(None, max_length=200)
+
+
+class RollbackSchema(BaseModel):
+    """
+    Переключение региона на версию `version_id`.
+    """
+
+    version_id: int
+
+
+class ActivationSchema(BaseModel):
+    """
+    Результат переключения: активная версия и число изменившихся дней.
+    """
+
+    region: str
+    version_id: int
+    changed: int
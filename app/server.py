@@ -0,0 +1,226 @@
+"""
+Модуль app.server — многопроцессный запуск сервиса с общим снимком календаря.
+
+`uvicorn --workers N` запускает воркеры как отдельные процессы с нуля:
+каждый сам применяет миграции, читает календарь из БД и строит свой
+снимок в памяти — N копий одних и тех же данных и N прогревов.
+
+Здесь мастер‑процесс делает эту работу один раз и только потом
+порождает воркеры через fork:
+1. применяет миграции и загружает снимок календаря (с прогретыми годами
+   «текущий ± WARMUP_YEARS» для CALENDAR_REGIONS); переменная окружения
+   MIGRATIONS_APPLIED_ENV сообщает воркерам, что миграции запускать не нужно;
+2. закрывает соединения с БД (их нельзя делить между процессами)
+   и замораживает сборщик мусора (gc.freeze), чтобы он не переписывал
+   страницы общих объектов;
+3. открывает слушающий сокет и порождает SERVER_WORKERS воркеров:
+   они наследуют снимок как общую память copy-on-write, а прогрев
+   в lifespan видит, что снимок актуален, и не перечитывает его;
+4. следит за воркерами: упавший воркер перезапускается, SIGTERM/SIGINT
+   плавно останавливает все воркеры, SIGHUP перезагружает настройки
+   у мастера и передаётся воркерам (см. app.services.reload); воркер
+   игнорирует SIGHUP, пока lifespan не установит свой обработчик,
+   чтобы ранний сигнал не завершил его.
+
+Снимок остаётся общим, пока не изменится календарь: после
+синхронизации каждый воркер строит новый снимок у себя.
+
+На платформах без fork (Windows) и при одном воркере сервис
+запускается в текущем процессе.
+
+Использование:
+    python -m app.server --workers 4
+    python -m app.server --host 127.0.0.1 --port 8080
+
+Код возврата: 0 — штатная остановка, 2 — неверные аргументы.
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Optional, Sequence
+
+import uvicorn
+
+from app.core import (
+    MIGRATIONS_APPLIED_ENV, dispose_engines, engine, main_logger, run_migrations, settings
+)
+from app.engine import CalendarIndex
+from app.services import index_holder, load_index, settings_reloader, warmup_years
+
+RESPAWN_DELAY = 1.0
+"""Пауза перед перезапуском упавшего воркера, секунды."""
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Описание аргументов командной строки (по умолчанию — из настроек).
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m app.server',
+        description='Запуск WorkCalendarClient с воркерами, разделяющими снимок календаря.',
+    )
+    parser.add_argument('--host', default=settings.SERVER_HOST, help='адрес (SERVER_HOST)')
+    parser.add_argument('--port', type=int, default=settings.SERVER_PORT, help='порт (SERVER_PORT)')
+    parser.add_argument(
+        '--workers', type=int, default=settings.SERVER_WORKERS,
+        help='число воркеров (SERVER_WORKERS)'
+    )
+    return parser
+
+
+def preload(bind=None) -> CalendarIndex:
+    """
+    Применяет миграции и загружает прогретый снимок календаря в index_holder.
+
+    Returns:
+        CalendarIndex: загруженный снимок.
+    """
+    run_migrations(bind or engine)
+    index = load_index(bind)
+    for region in settings.CALENDAR_REGIONS:
+        index.warm(region, warmup_years())
+    index_holder.swap(index)
+    return index
+
+
+def reset_worker_signals() -> None:
+    """
+    Сигналы в только что порождённом воркере: SIGTERM/SIGINT — по умолчанию
+    (обработчики uvicorn), SIGHUP — игнорируется до установки обработчика
+    перезагрузки настроек в lifespan.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """
+    Открывает слушающий сокет, общий для всех воркеров.
+    """
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve(sock: socket.socket) -> None:
+    """
+    Обслуживает запросы приложения на уже открытом сокете.
+    """
+    from app.main import app
+    uvicorn.Server(uvicorn.Config(app)).run(sockets=[sock])
+
+
+class Supervisor:
+    """
+    Мастер‑процесс: порождает воркеры через fork и следит за ними.
+
+    Attributes:
+        sock (socket.socket): слушающий сокет;
+        workers (int): число воркеров;
+        children (set[int]): pid работающих воркеров;
+        stopping (bool): идёт остановка (упавшие воркеры не перезапускаются).
+    """
+
+    def __init__(self, sock: socket.socket, workers: int) -> None:
+        self.sock = sock
+        self.workers = workers
+        self.children: set[int] = set()
+        self.stopping = False
+
+    def spawn(self) -> int:
+        """
+        Порождает воркер; в дочернем процессе обслуживает запросы до остановки.
+        """
+        pid = os.fork()
+        if pid == 0:
+            reset_worker_signals()
+            code = 0
+            try:
+                serve(self.sock)
+            except BaseException as error:
+                main_logger.error(f'Воркер {os.getpid()} завершился с ошибкой: {error!r}')
+                code = 1
+            finally:
+                os._exit(code)
+        self.children.add(pid)
+        return pid
+
+    def _signal(self, signum: int) -> None:
+        for pid in self.children:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def _stop(self, signum, frame) -> None:
+        self.stopping = True
+        self._signal(signal.SIGTERM)
+
+    def _reload(self, signum, frame) -> None:
+        settings_reloader.reload()
+        self._signal(signal.SIGHUP)
+
+    def run(self) -> None:
+        """
+        Запускает воркеры и ждёт их завершения, перезапуская упавшие.
+        """
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        signal.signal(signal.SIGHUP, self._reload)
+        for _ in range(self.workers):
+            self.spawn()
+        main_logger.info(f'Запущено воркеров: {self.workers} (мастер {os.getpid()}).')
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            self.children.discard(pid)
+            if self.stopping:
+                continue
+            main_logger.error(
+                f'Воркер {pid} завершился (код {os.waitstatus_to_exitcode(status)}), перезапуск.'
+            )
+            time.sleep(RESPAWN_DELAY)
+            if not self.stopping:
+                self.spawn()
+        main_logger.info('Все воркеры остановлены.')
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Точка входа командной строки.
+
+    Returns:
+        int: код возврата.
+    """
+    args = build_parser().parse_args(argv)
+    if args.workers < 1:
+        print('--workers должен быть положительным', file=sys.stderr)
+        return 2
+    index = preload()
+    os.environ[MIGRATIONS_APPLIED_ENV] = '1'
+    main_logger.info(f'Снимок календаря загружен мастером (версия {index.version}).')
+    sock = bind_socket(args.host, args.port)
+    if args.workers == 1 or not hasattr(os, 'fork'):
+        serve(sock)
+        return 0
+    dispose_engines()
+    gc.collect()
+    gc.freeze()
+    Supervisor(sock, args.workers).run()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
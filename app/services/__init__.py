@@ -0,0 +1,66 @@
+"""
+Модуль app.services.__init__.py — прикладные сервисы WorkCalendarClient.
+
+Объединяет логику, которая связывает источники данных, БД и
+in‑memory снимок календаря.
+
+Экспортируемые объекты:
+- index_holder — держатель текущего снимка календаря воркера;
+- broadcaster, Broadcaster — рассылка событий об изменениях подписчикам;
+- work_schedule — распорядок рабочего дня для арифметики рабочих часов;
+- SyncScheduler — фоновое обновление календаря из источников;
+- LeaderLock — межпроцессная блокировка лидера;
+- load_index — построение снимка календаря из БД;
+- latest_seq — номер последнего изменения календаря;
+- refresh — загрузка и сохранение изменившихся дней из источников;
+- backfill — загрузка истории за диапазон лет;
+- bulk_save_days — пакетная запись изменившихся дней (импорт файлов,
+  см. app.services.bulk_load и `python -m app.loader`);
+- readiness, warmup, warmup_years — прогрев воркера при старте и признак
+  готовности для `/ready`;
+- overlay_chain, overlay_layers, overlay_calendar — календари сотрудников
+  и команд (наложения) поверх снимка;
+- QueryContext — вычисление составного запроса по одному снимку;
+- publish_version, activate_version, list_versions, version_cache —
+  версии календаря региона и мгновенный откат;
+- SettingsReloader, settings_reloader — горячая перезагрузка настроек
+  (SIGHUP или изменение .env) без потери прогретого снимка;
+- read_aggregates, ensure_aggregates — нормы рабочего времени по месяцам,
+  кварталам и году (таблица `calendaraggregate`);
+- list_sync_runs — история синхронизаций с длительностями этапов
+  (таблица `syncrun`);
+- archive_years, archive_cache — перенос давних лет в компактный архив
+  (`calendararchive`) и кэш разобранных архивных лет;
+- days_as_of — календарь на момент времени (история из журнала изменений);
+- changes_since, change_events — чтение журнала изменений после заданного seq
+  и группировка его в события.
+
+Пример использования:
+    from app.services import index_holder
+    index_holder.current.is_working('ru', day)
+"""
+
+from .aggregates import ensure_aggregates, read_aggregates
+from .archive import archive_cache, archive_years
+from .broadcaster import Broadcaster
+from .changes import change_events, changes_since
+from .history import days_as_of
+from .overlays import overlay_calendar, overlay_chain, overlay_layers
+from .query import QueryContext
+from .reload import SettingsReloader, settings_reloader
+from .scheduler import LeaderLock, SyncScheduler
+from .state import broadcaster, index_holder, work_schedule
+from .sync import backfill, bulk_save_days, latest_seq, load_index, refresh
+from .sync_history import list_sync_runs
+from .versions import activate_version, list_versions, publish_version, version_cache
+from .warmup import Readiness, readiness, warmup, warmup_years
+
+__all__ = [
+    'Broadcaster', 'LeaderLock', 'QueryContext', 'Readiness', 'SettingsReloader',
+    'SyncScheduler', 'activate_version', 'archive_cache', 'archive_years', 'backfill',
+    'broadcaster', 'bulk_save_days', 'change_events', 'changes_since', 'days_as_of',
+    'ensure_aggregates', 'index_holder', 'latest_seq', 'list_sync_runs', 'list_versions',
+    'load_index', 'overlay_calendar', 'overlay_chain', 'overlay_layers', 'publish_version',
+    'read_aggregates', 'readiness', 'refresh', 'settings_reloader', 'version_cache', 'warmup',
+    'warmup_years', 'work_schedule'
+]
@@ -0,0 +1,192 @@
+"""
+Модуль app.services.aggregates — нормы рабочего времени по периодам.
+
+Поддерживает таблицу `calendaraggregate` (месяцы, кварталы, год) в
+актуальном состоянии инкрементально: при каждом изменении календаря
+пересчитываются только затронутые годы региона, в той же транзакции,
+что и само изменение:
+- save_days()/bulk_save_days() — годы изменившихся дней, но только
+  у регионов без опубликованной версии; дни года берутся из `calendarday`
+  с учётом архива. Регионы с версией пропускаются: воркеры видят их
+  активную версию, а запись в `calendarday` её не меняет;
+- publish_version() — годы, которые отличаются от прежней активной версии;
+- activate_version() — годы, в которых откат изменил дни.
+
+Пересчёт года — один проход по 365 флагам YearCalendar; чтение нормы —
+одна строка по уникальному индексу (region, year, period, number).
+
+Структура:
+- PERIODS — виды периодов;
+- period_totals() — нормы года по месяцам, кварталам и году;
+- store_aggregates() — замена строк норм для календарей лет;
+- refresh_day_aggregates() — пересчёт лет из `calendarday` (и архива);
+- ensure_aggregates() — заполнение недостающих лет по снимку (при старте);
+- read_aggregates() — нормы года из таблицы.
+
+Пример использования:
+    with Session(engine) as session:
+        refresh_day_aggregates(session, {('ru', 2025)})
+        session.commit()
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, insert, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core import engine, main_logger
+from app.engine import CalendarIndex, YearCalendar, day_hours
+from app.models import CalendarAggregate, CalendarRelease
+from app.models.change import utc_now
+from .archive import stored_years
+
+PERIODS = ('month', 'quarter', 'year')
+"""Виды периодов норм."""
+
+
+def period_totals(calendar: YearCalendar) -> list[dict]:
+    """
+    Нормы года: 12 месяцев, 4 квартала и год целиком.
+
+    Returns:
+        list[dict]: значения полей CalendarAggregate (без updated_at).
+    """
+    months = [[0, 0, 0] for _ in range(12)]
+    for record in calendar.records():
+        totals = months[record.date.month - 1]
+        if record.is_working:
+            totals[0] += 1
+            totals[2] += day_hours(True, record.working_hours)
+        else:
+            totals[1] += 1
+    groups = [('month', number + 1, [totals]) for number, totals in enumerate(months)]
+    groups += [('quarter', number + 1, months[number * 3:number * 3 + 3]) for number in range(4)]
+    groups.append(('year', 1, months))
+    return [
+        {
+            'region': calendar.region,
+            'year': calendar.year,
+            'period': period,
+            'number': number,
+            'working_days': sum(totals[0] for totals in members),
+            'non_working_days': sum(totals[1] for totals in members),
+            'working_hours': sum(totals[2] for totals in members),
+        }
+        for period, number, members in groups
+    ]
+
+
+def store_aggregates(session: Session, calendars: Iterable[YearCalendar]) -> int:
+    """
+    Заменяет строки норм для переданных календарей лет (в транзакции session).
+
+    Returns:
+        int: число пересчитанных лет.
+    """
+    calendars = list(calendars)
+    if not calendars:
+        return 0
+    connection = session.connection()
+    connection.execute(
+        delete(CalendarAggregate).where(
+            tuple_(CalendarAggregate.region, CalendarAggregate.year).in_(
+                [(calendar.region, calendar.year) for calendar in calendars]
+            )
+        )
+    )
+    updated_at = utc_now()
+    connection.execute(
+        insert(CalendarAggregate.__table__),
+        [
+            {**totals, 'updated_at': updated_at}
+            for calendar in calendars
+            for totals in period_totals(calendar)
+        ],
+    )
+    return len(calendars)
+
+
+def refresh_day_aggregates(session: Session, keys: Iterable[tuple[str, int]]) -> int:
+    """
+    Пересчитывает нормы лет (region, year) из строк `calendarday`
+    (поверх архивных лет).
+
+    Регионы с опубликованной версией пропускаются: их нормы
+    пересчитываются при публикации и откате.
+
+    Returns:
+        int: число пересчитанных лет.
+    """
+    keys = set(keys)
+    if not keys:
+        return 0
+    released = set(session.scalars(
+        select(CalendarRelease.region).where(
+            CalendarRelease.region.in_({region for region, _ in keys})
+        )
+    ))
+    years: dict[str, set[int]] = {}
+    for region, year in keys:
+        if region not in released:
+            years.setdefault(region, set()).add(year)
+    calendars = []
+    for region, region_years in sorted(years.items()):
+        stored = {calendar.year: calendar for calendar in stored_years(session, region, region_years)}
+        calendars.extend(
+            stored.get(year) or YearCalendar(region, year, ()) for year in sorted(region_years)
+        )
+    return store_aggregates(session, calendars)
+
+
+def ensure_aggregates(index: CalendarIndex, bind=None) -> int:
+    """
+    Заполняет нормы лет снимка, для которых строк ещё нет
+    (данные, загруженные до появления таблицы норм).
+
+    Одновременный запуск несколькими воркерами безопасен: проигравший
+    гонку воркер откатывает свою транзакцию.
+
+    Returns:
+        int: число заполненных лет.
+    """
+    with Session(bind or engine) as session:
+        stored = set(session.execute(
+            select(CalendarAggregate.region, CalendarAggregate.year).distinct()
+        ).tuples())
+        calendars = [
+            index.year(region, year)
+            for region in sorted(index.regions)
+            for year in index.years(region)
+            if (region, year) not in stored
+        ]
+        try:
+            count = store_aggregates(session, calendars)
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            return 0
+    if count:
+        main_logger.info(f'Нормы рабочего времени заполнены за {count} лет.')
+    return count
+
+
+def read_aggregates(
+    session: Session,
+    region: str,
+    year: int,
+    period: Optional[str] = None,
+    number: Optional[int] = None
+) -> list[CalendarAggregate]:
+    """
+    Строки норм года (в порядке: месяцы, кварталы, год).
+    """
+    query = select(CalendarAggregate).where(
+        CalendarAggregate.region == region, CalendarAggregate.year == year
+    )
+    if period is not None:
+        query = query.where(CalendarAggregate.period == period)
+    if number is not None:
+        query = query.where(CalendarAggregate.number == number)
+    rows = session.scalars(query).all()
+    return sorted(rows, key=lambda row: (PERIODS.index(row.period), row.number))
@@ -0,0 +1,241 @@
+"""
+Модуль app.services.archive — перенос давних лет в компактный архив.
+
+Давние годы запрашиваются редко, но должны оставаться доступными.
+В виде строк `calendarday` они раздувают таблицу и её индексы
+и замедляют загрузку снимка при старте воркера — хотя прогреваются
+только свежие годы.
+
+Модель хранения:
+- годы старше горизонта (текущий год − ARCHIVE_AFTER_YEARS) переносятся
+  из `calendarday` в `calendararchive` — один сжатый блоб на регион и год
+  (формат — app.engine.archive); в архив попадает год в том виде, как
+  его видят воркеры (для регионов с опубликованной версией — из активной
+  версии), поэтому перенос не меняет ответов и не пишет журнал изменений;
+- снимок воркера получает архив как ArchiveStore: блобы читаются
+  при загрузке снимка, а разбираются при первом обращении к году
+  и хранятся в общем LRU‑кэше процесса (archive_cache,
+  ARCHIVE_CACHE_SIZE лет);
+- строки `calendarday`, записанные в архивный год позже (например,
+  backfill), действуют поверх архива: запись сравнивает дни с архивом
+  и сохраняет только отличия, а следующий перенос сворачивает их в блоб;
+- откат версии (activate_version) перезаписывает блобы архивных лет,
+  которые он изменил.
+
+Структура:
+- archive_cache — кэш разобранных архивных лет этого процесса;
+- archive_horizon() — первый год, который остаётся строками;
+- merge_year() — архивный год с наложенными строками;
+- load_archive() — ArchiveStore со всеми блобами (для снимка);
+- stored_years() — годы региона из `calendarday` с учётом архива;
+- archived_days() — дни архивных лет в диапазоне (для сравнения при записи);
+- store_archive() — замена блобов для календарей лет;
+- archive_years() — перенос лет старше горизонта в архив.
+
+Пример использования:
+    archive_years()  # горизонт из ARCHIVE_AFTER_YEARS
+"""
+
+import json
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, extract, insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core import engine, main_logger, settings
+from app.engine import (
+    ArchiveCache, ArchiveStore, DayRecord, YearCalendar, encode_year, load_years, special_hours
+)
+from app.models import CalendarArchive, CalendarDay, CalendarRelease, CalendarVersion
+from app.models.change import utc_now
+
+archive_cache = ArchiveCache(settings.ARCHIVE_CACHE_SIZE)
+"""Разобранные архивные годы этого процесса (общие для всех снимков)."""
+
+DAY_COLUMNS = (
+    CalendarDay.region, CalendarDay.date, CalendarDay.is_working,
+    CalendarDay.holiday_name, CalendarDay.working_hours,
+)
+"""Колонки `calendarday` в порядке полей DayRecord."""
+
+
+def archive_horizon(today: Optional[date] = None, years: Optional[int] = None) -> Optional[int]:
+    """
+    Первый год, который остаётся строками `calendarday`: текущий − years
+    (по умолчанию ARCHIVE_AFTER_YEARS). None — архив выключен.
+    """
+    years = settings.ARCHIVE_AFTER_YEARS if years is None else years
+    if years <= 0:
+        return None
+    return (today or date.today()).year - years
+
+
+def merge_year(
+    archived: Optional[YearCalendar],
+    region: str,
+    year: int,
+    records: Iterable[DayRecord]
+) -> YearCalendar:
+    """
+    Календарь года: архивные дни, поверх которых наложены записи строк.
+    """
+    if archived is None:
+        return YearCalendar(region, year, records)
+    records = list(records)
+    if not records:
+        return archived
+    days = {record.date: record for record in archived.records()}
+    days.update((record.date, record) for record in records)
+    return YearCalendar(region, year, days.values())
+
+
+def load_archive(session: Session, cache: ArchiveCache = archive_cache) -> ArchiveStore:
+    """
+    Архив для снимка: все блобы (разбираются при первом обращении).
+    """
+    rows = session.execute(select(CalendarArchive.region, CalendarArchive.year, CalendarArchive.data))
+    return ArchiveStore({(region, year): data for region, year, data in rows}, cache)
+
+
+def stored_years(
+    session: Session,
+    region: str,
+    years: Optional[Iterable[int]] = None
+) -> list[YearCalendar]:
+    """
+    Годы региона из `calendarday` с учётом архива (все или только `years`).
+    """
+    query = select(*DAY_COLUMNS).where(CalendarDay.region == region)
+    blobs = select(CalendarArchive.year, CalendarArchive.data).where(CalendarArchive.region == region)
+    if years is not None:
+        years = set(years)
+        if not years:
+            return []
+        query = query.where(CalendarDay.date.between(date(min(years), 1, 1), date(max(years), 12, 31)))
+        blobs = blobs.where(CalendarArchive.year.in_(years))
+    grouped: dict[int, list[DayRecord]] = {}
+    for row in session.execute(query):
+        record = DayRecord(*row)
+        if years is None or record.date.year in years:
+            grouped.setdefault(record.date.year, []).append(record)
+    archived = {year: data for year, data in session.execute(blobs)}
+    return [
+        merge_year(
+            archive_cache.get(region, year, archived[year]) if year in archived else None,
+            region, year, grouped.get(year, ()),
+        )
+        for year in sorted(grouped.keys() | archived.keys())
+    ]
+
+
+def archived_days(
+    session: Session,
+    regions: Iterable[str],
+    start: date,
+    end: date
+) -> dict[tuple[str, date], tuple[bool, Optional[str], Optional[int]]]:
+    """
+    Дни архивных лет в диапазоне [start, end] в виде хранимых значений
+    (is_working, holiday_name, working_hours) — для сравнения при записи.
+    """
+    rows = session.execute(
+        select(CalendarArchive.region, CalendarArchive.year, CalendarArchive.data).where(
+            CalendarArchive.region.in_(set(regions)),
+            CalendarArchive.year.between(start.year, end.year),
+        )
+    )
+    days = {}
+    for region, year, data in rows:
+        calendar = archive_cache.get(region, year, data)
+        for record in calendar.slice(max(start, date(year, 1, 1)), min(end, date(year, 12, 31))):
+            days[(region, record.date)] = (
+                record.is_working, record.holiday_name,
+                special_hours(record.is_working, record.working_hours),
+            )
+    return days
+
+
+def store_archive(session: Session, calendars: Iterable[YearCalendar]) -> int:
+    """
+    Заменяет блобы архива для календарей лет (в транзакции session).
+
+    Returns:
+        int: число записанных лет.
+    """
+    calendars = list(calendars)
+    if not calendars:
+        return 0
+    connection = session.connection()
+    connection.execute(
+        delete(CalendarArchive).where(
+            tuple_(CalendarArchive.region, CalendarArchive.year).in_(
+                [(calendar.region, calendar.year) for calendar in calendars]
+            )
+        )
+    )
+    archived_at = utc_now()
+    connection.execute(
+        insert(CalendarArchive.__table__),
+        [
+            {
+                'region': calendar.region,
+                'year': calendar.year,
+                'data': encode_year(calendar),
+                'archived_at': archived_at,
+            }
+            for calendar in calendars
+        ],
+    )
+    return len(calendars)
+
+
+def _released_calendars(session: Session, region: str) -> dict[int, YearCalendar]:
+    """
+    Годы активной версии региона (пусто, если версия не публиковалась).
+    """
+    snapshot = session.scalar(
+        select(CalendarVersion.snapshot)
+        .join(CalendarRelease, CalendarRelease.version_id == CalendarVersion.id)
+        .where(CalendarRelease.region == region)
+    )
+    if snapshot is None:
+        return {}
+    return {calendar.year: calendar for calendar in load_years(json.loads(snapshot))}
+
+
+def archive_years(horizon: Optional[int] = None, bind=None) -> int:
+    """
+    Переносит годы раньше `horizon` (по умолчанию archive_horizon())
+    из `calendarday` в архив одной транзакцией.
+
+    Returns:
+        int: число перенесённых лет.
+    """
+    horizon = archive_horizon() if horizon is None else horizon
+    if horizon is None:
+        return 0
+    cutoff = date(horizon, 1, 1)
+    with Session(bind or engine) as session:
+        keys = session.execute(
+            select(CalendarDay.region, extract('year', CalendarDay.date))
+            .where(CalendarDay.date < cutoff)
+            .distinct()
+        ).tuples()
+        years: dict[str, set[int]] = {}
+        for region, year in keys:
+            years.setdefault(region, set()).add(int(year))
+        if not years:
+            return 0
+        calendars = []
+        for region, region_years in sorted(years.items()):
+            released = _released_calendars(session, region)
+            calendars.extend(
+                released.get(calendar.year, calendar)
+                for calendar in stored_years(session, region, region_years)
+            )
+        count = store_archive(session, calendars)
+        session.execute(delete(CalendarDay).where(CalendarDay.date < cutoff))
+        session.commit()
+    main_logger.info(f'Архив: перенесено лет {count} (раньше {horizon} года).')
+    return count
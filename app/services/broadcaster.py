@@ -0,0 +1,147 @@
+"""
+Модуль app.services.broadcaster — рассылка событий об изменениях календаря.
+
+Fan‑out: одно опубликованное событие попадает в очереди всех подписчиков,
+которым оно подходит по региону. Очередь каждого подписчика ограничена:
+медленный подписчик не задерживает остальных и не накапливает память.
+
+Переполнение очереди:
+- очередь подписчика очищается, подписка помечается как `overflowed`
+  и закрывается;
+- клиент переподключается и догружает пропущенное через
+  `GET /changes?since=<seq>` (seq есть в каждом событии).
+
+Структура:
+- Subscription — подписка с ограниченной очередью и фильтром регионов;
+- Broadcaster — реестр подписок и публикация событий.
+
+Публиковать события можно из любого потока: доставка в очередь
+выполняется в цикле событий подписчика.
+"""
+
+import asyncio
+from typing import Iterable, Optional
+
+
+class Subscription:
+    """
+    Подписка на события об изменениях календаря.
+
+    Attributes:
+        regions (frozenset[str] | None): регионы подписки (None — все);
+        queue (asyncio.Queue): ограниченная очередь событий;
+            значение None означает закрытие подписки;
+        overflowed (bool): подписка закрыта из‑за переполнения очереди.
+    """
+
+    def __init__(self, regions: Optional[Iterable[str]], queue_size: int) -> None:
+        self.regions = frozenset(regions) if regions else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+        self.closed = False
+        self.loop = asyncio.get_running_loop()
+
+    def accepts(self, event: dict) -> bool:
+        """
+        Подходит ли событие под фильтр регионов подписки.
+        """
+        return not self.closed and (self.regions is None or event['region'] in self.regions)
+
+    def offer(self, event: Optional[dict]) -> None:
+        """
+        Кладёт событие в очередь без ожидания.
+
+        При переполнении очередь очищается и подписка закрывается.
+        Вызывается только в цикле событий подписчика.
+        """
+        if self.closed:
+            return
+        if event is None:
+            self._close()
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self._close()
+
+    def _close(self) -> None:
+        """
+        Очищает очередь и кладёт в неё маркер закрытия.
+        """
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def get(self) -> Optional[dict]:
+        """
+        Ожидает следующее событие; None — подписка закрыта.
+        """
+        return await self.queue.get()
+
+
+class Broadcaster:
+    """
+    Рассылка событий всем подходящим подписчикам.
+
+    Attributes:
+        queue_size (int): размер очереди каждого подписчика.
+    """
+
+    def __init__(self, queue_size: int = 100) -> None:
+        self.queue_size = queue_size
+        self._subscriptions: set[Subscription] = set()
+
+    @property
+    def subscribers(self) -> int:
+        """
+        Количество активных подписок.
+        """
+        return len(self._subscriptions)
+
+    def subscribe(self, regions: Optional[Iterable[str]] = None) -> Subscription:
+        """
+        Создаёт подписку в текущем цикле событий.
+        """
+        subscription = Subscription(regions, self.queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Удаляет подписку.
+        """
+        self._subscriptions.discard(subscription)
+
+    def publish(self, event: dict) -> int:
+        """
+        Рассылает событие подписчикам его региона.
+
+        Returns:
+            int: количество подписок, которым отправлено событие.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        delivered = 0
+        for subscription in list(self._subscriptions):
+            if not subscription.accepts(event):
+                continue
+            if subscription.loop is running:
+                subscription.offer(event)
+            else:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            delivered += 1
+        return delivered
+
+    def close(self) -> None:
+        """
+        Закрывает все подписки (при остановке приложения).
+        """
+        for subscription in list(self._subscriptions):
+            if subscription.loop.is_closed():
+                continue
+            subscription.loop.call_soon_threadsafe(subscription.offer, None)
+        self._subscriptions.clear()
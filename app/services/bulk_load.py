@@ -0,0 +1,312 @@
+"""
+Модуль app.services.bulk_load — загрузка календаря из локальных файлов.
+
+Нужна для заполнения новых окружений и восстановления данных в закрытых
+контурах без обращения к внешним источникам.
+
+Поддерживаемые форматы:
+- CSV (`.csv`) — заголовок `date,is_working[,holiday_name][,working_hours][,region]`;
+- JSON (`.json`) — массив объектов с теми же полями;
+- JSON Lines (`.jsonl`, `.ndjson`) — по объекту на строку;
+- XML производственного календаря (`.xml`, формат xmlcalendar.ru) —
+  файл за год, дни вне файла достраиваются пятидневкой.
+
+Порядок загрузки:
+1. файл читается потоково (CSV и JSON Lines — построчно, JSON‑массив —
+   по объекту из буфера фиксированного размера), в памяти не бывает
+   больше одной порции строк;
+2. строки собираются в порции по `chunk_size` и проверяются порцией:
+   неверные строки отбрасываются (или прерывают загрузку при strict),
+   повторы даты внутри порции схлопываются (действует последняя строка);
+3. порция пишется через пакетную запись bulk_save_days() (только
+   изменившиеся дни и журнал изменений — работающие воркеры подхватят
+   изменения по seq);
+4. после каждой порции вызывается `progress(stats)`.
+
+Структура:
+- LoadError — ошибка загрузки (формат, файл, строка при strict);
+- LoadStats — счётчики загрузки;
+- FORMATS, detect_format() — форматы файлов;
+- read_rows() — потоковое чтение строк файла;
+- parse_row() — строка файла → DayRecord с проверкой;
+- load_file() — загрузка файла порциями.
+
+Пример использования:
+    stats = load_file('data/ru-2025.csv', region='ru', progress=print)
+    stats.changed
+"""
+
+import csv
+import json
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+from xml.etree import ElementTree
+
+from app.engine import DayRecord
+from app.sources.base import SourceError
+from app.sources.xmlcalendar import parse_calendar_xml
+from .sync import bulk_save_days
+
+FORMATS = ('csv', 'json', 'jsonl', 'xml')
+"""Поддерживаемые форматы файлов."""
+
+EXTENSIONS = {'.csv': 'csv', '.json': 'json', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.xml': 'xml'}
+"""Формат по расширению файла."""
+
+DEFAULT_CHUNK_SIZE = 5000
+"""Строк в одной порции проверки и записи."""
+
+MAX_REPORTED_ERRORS = 20
+"""Сколько ошибок строк сохраняется в LoadStats.errors."""
+
+READ_BUFFER_SIZE = 1 << 16
+"""Размер буфера потокового чтения JSON‑массива, символов."""
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 't', 'да'}
+FALSE_VALUES = {'0', 'false', 'no', 'n', 'f', 'нет'}
+
+
+class LoadError(Exception):
+    """
+    Ошибка загрузки файла календаря.
+    """
+
+
+@dataclass
+class LoadStats:
+    """
+    Счётчики загрузки.
+
+    Attributes:
+        read (int): прочитано строк;
+        invalid (int): отброшено неверных строк;
+        written (int): проверено и передано на запись дней;
+        changed (int): изменилось дней в БД;
+        regions (set[str]): регионы записанных дней;
+        errors (list[str]): первые MAX_REPORTED_ERRORS ошибок строк.
+    """
+
+    read: int = 0
+    invalid: int = 0
+    written: int = 0
+    changed: int = 0
+    regions: set[str] = field(default_factory=set)
+    errors: list[str] = field(default_factory=list)
+
+
+def detect_format(path: Union[str, Path]) -> str:
+    """
+    Определяет формат файла по расширению.
+
+    Raises:
+        LoadError: если расширение не поддерживается.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in EXTENSIONS:
+        raise LoadError(f'Неизвестный формат файла {path}: ожидается одно из {sorted(EXTENSIONS)}')
+    return EXTENSIONS[suffix]
+
+
+def _iter_json_array(stream) -> Iterator[tuple[int, object]]:
+    """
+    Потоково разбирает JSON‑массив объектов из текстового потока.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, number, started = '', 0, 0, False
+    eof = False
+    while True:
+        while position < len(buffer) and buffer[position] in ' \t\r\n,' + ('' if started else '['):
+            if buffer[position] == '[':
+                started = True
+            position += 1
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as error:
+            if eof:
+                if position >= len(buffer) and started:
+                    raise LoadError('JSON‑массив не закрыт') from error
+                raise LoadError(f'Некорректный JSON: {error}') from error
+            chunk = stream.read(READ_BUFFER_SIZE)
+            buffer, position = buffer[position:] + chunk, 0
+            eof = not chunk
+            continue
+        if not started:
+            raise LoadError('Ожидается JSON‑массив объектов')
+        number += 1
+        yield number, value
+        position = end
+
+
+def _xml_year(path: Path) -> int:
+    """
+    Год из атрибута `year` корневого элемента XML календаря.
+    """
+    try:
+        for _, element in ElementTree.iterparse(path, events=('start',)):
+            return int(element.get('year'))
+    except (ElementTree.ParseError, TypeError, ValueError) as error:
+        raise SourceError(f'Некорректный XML календаря {path}: {error}') from error
+    raise SourceError(f'Пустой XML календаря {path}')
+
+
+def read_rows(path: Union[str, Path], fmt: str, region: str) -> Iterator[tuple[int, object]]:
+    """
+    Потоково читает строки файла.
+
+    Yields:
+        tuple[int, object]: номер строки (записи) и строка — словарь полей
+            или готовая DayRecord (для XML).
+
+    Raises:
+        LoadError: если файл нельзя прочитать или формат нарушен целиком.
+    """
+    path = Path(path)
+    if fmt == 'xml':
+        try:
+            root_year = _xml_year(path)
+            records = parse_calendar_xml(path.read_bytes(), region, root_year)
+        except (OSError, SourceError) as error:
+            raise LoadError(str(error)) from error
+        yield from enumerate(records, start=1)
+        return
+    try:
+        with path.open(encoding='utf-8-sig', newline='') as stream:
+            if fmt == 'csv':
+                for number, row in enumerate(csv.DictReader(stream), start=2):
+                    yield number, row
+            elif fmt == 'jsonl':
+                for number, line in enumerate(stream, start=1):
+                    if line.strip():
+                        try:
+                            yield number, json.loads(line)
+                        except json.JSONDecodeError as error:
+                            yield number, error
+            else:
+                yield from _iter_json_array(stream)
+    except OSError as error:
+        raise LoadError(str(error)) from error
+
+
+def _flag(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f'is_working: ожидается логическое значение, получено {value!r}')
+
+
+def _text(row: dict, field: str) -> Optional[str]:
+    """
+    Строковое поле строки без пробелов по краям (None — пусто или нет поля).
+
+    Raises:
+        ValueError: если значение поля не строка.
+    """
+    value = row.get(field)
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValueError(f'{field}: ожидается строка, получено {value!r}')
+    return value.strip() or None
+
+
+def parse_row(row, region: str) -> DayRecord:
+    """
+    Преобразует строку файла в DayRecord с проверкой полей.
+
+    Raises:
+        ValueError: если строка неверна.
+    """
+    if isinstance(row, DayRecord):
+        return row
+    if isinstance(row, Exception):
+        raise ValueError(str(row))
+    if not isinstance(row, dict):
+        raise ValueError('ожидается объект с полями дня')
+    try:
+        day = row['date'] if isinstance(row['date'], date) else date.fromisoformat(str(row['date']).strip())
+        is_working = _flag(row['is_working'])
+    except KeyError as error:
+        raise ValueError(f'нет поля {error.args[0]}') from None
+    holiday_name = _text(row, 'holiday_name')
+    if holiday_name is not None and len(holiday_name) > 200:
+        raise ValueError('holiday_name длиннее 200 символов')
+    hours = row.get('working_hours')
+    hours = None if hours in (None, '') else int(hours)
+    if hours is not None and not 0 <= hours <= 24:
+        raise ValueError('working_hours вне диапазона 0–24')
+    if hours and not is_working:
+        raise ValueError('у нерабочего дня не может быть рабочих часов')
+    row_region = _text(row, 'region') or region.strip()
+    if not row_region or len(row_region) > 8:
+        raise ValueError('region должен содержать от 1 до 8 символов')
+    return DayRecord(row_region, day, is_working, holiday_name, hours)
+
+
+def load_file(
+    path: Union[str, Path],
+    region: str = 'ru',
+    fmt: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    bind=None,
+    strict: bool = False,
+    progress: Optional[Callable[[LoadStats], None]] = None
+) -> LoadStats:
+    """
+    Загружает файл календаря в `calendarday` порциями.
+
+    Args:
+        path: путь к файлу;
+        region (str): регион строк без поля `region` (и XML);
+        fmt (str | None): формат из FORMATS (по умолчанию — по расширению);
+        chunk_size (int): строк в порции;
+        bind: движок записи (по умолчанию `engine`);
+        strict (bool): прерывать загрузку на первой неверной строке;
+        progress: вызывается со счётчиками после каждой порции.
+
+    Raises:
+        LoadError: неизвестный формат, ошибка чтения или неверная
+            строка при strict (уже записанные порции остаются в БД).
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise LoadError(f'Неизвестный формат {fmt}: ожидается одно из {FORMATS}')
+    stats = LoadStats()
+    chunk = []
+
+    def flush():
+        records = {}
+        for number, row in chunk:
+            try:
+                record = parse_row(row, region)
+            except (ValueError, TypeError) as error:
+                message = f'{path}:{number}: {error}'
+                if strict:
+                    raise LoadError(message) from error
+                stats.invalid += 1
+                if len(stats.errors) < MAX_REPORTED_ERRORS:
+                    stats.errors.append(message)
+                continue
+            records[record.region, record.date] = record
+        chunk.clear()
+        stats.written += len(records)
+        stats.regions.update(region for region, _ in records)
+        stats.changed += bulk_save_days(records.values(), bind)
+        if progress is not None:
+            progress(stats)
+
+    for number, row in read_rows(path, fmt, region):
+        stats.read += 1
+        chunk.append((number, row))
+        if len(chunk) >= chunk_size:
+            flush()
+    if chunk:
+        flush()
+    return stats
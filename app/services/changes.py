@@ -0,0 +1,55 @@
+"""
+Модуль app.services.changes — чтение журнала изменений календаря.
+
+Функции:
+- changes_since() — изменения с номером больше заданного (по возрастанию seq);
+- change_events() — группировка изменений в события по регионам для рассылки.
+
+Клиенты хранят последний полученный seq и запрашивают только новые
+изменения, вместо того чтобы заново скачивать годы целиком.
+"""
+
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.engine import day_hours
+from app.models import CalendarChange
+
+
+def changes_since(session: Session, since: int, limit: int) -> list[CalendarChange]:
+    """
+    Возвращает изменения с seq > since, не более limit штук.
+    """
+    return list(session.scalars(
+        select(CalendarChange)
+        .where(CalendarChange.id > since)
+        .order_by(CalendarChange.id)
+        .limit(limit)
+    ))
+
+
+def change_events(changes: Iterable[CalendarChange]) -> list[dict]:
+    """
+    Группирует изменения в события по регионам.
+
+    Формат события (готов к сериализации в JSON):
+        {"seq": 42, "region": "ru", "changes": [
+            {"seq": 42, "date": "2025-11-03", "is_working": false,
+             "holiday_name": null, "working_hours": 0}]}
+
+    Поле `seq` события — номер последнего изменения в нём.
+    """
+    events: dict[str, dict] = {}
+    for change in changes:
+        event = events.setdefault(change.region, {'seq': 0, 'region': change.region, 'changes': []})
+        event['seq'] = change.id
+        event['changes'].append({
+            'seq': change.id,
+            'date': change.date.isoformat(),
+            'is_working': change.is_working,
+            'holiday_name': change.holiday_name,
+            'working_hours': day_hours(change.is_working, change.working_hours),
+        })
+    return sorted(events.values(), key=lambda event: event['seq'])
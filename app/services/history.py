@@ -0,0 +1,80 @@
+"""
+Модуль app.services.history — календарь «на дату» (as of).
+
+Перерасчёт зарплаты требует знать, что говорил календарь в момент
+начисления, — до того как более поздний перенос выходных его изменил.
+
+История берётся из журнала изменений `calendarchange`: каждое изменение
+дня (синхронизация, загрузка файла, откат версии) хранит новые значения
+и время changed_at. Состояние дня на момент T — последнее изменение
+этого дня с changed_at ≤ T. Запрос идёт по индексу
+(region, date, changed_at) и читает по одной строке на день периода,
+без воспроизведения всего журнала.
+
+Дни, для которых до момента T изменений не было, отвечаются правилом
+по умолчанию (пятидневка) — так же, как тогда ответил бы сервис.
+
+Структура:
+- as_utc() — момент в UTC (момент без часового пояса считается UTC);
+- days_as_of() — записи о днях периода на момент T.
+
+Пример использования:
+    days_as_of(session, 'ru', date(2025, 1, 1), date(2025, 1, 31),
+               datetime(2024, 12, 1, tzinfo=timezone.utc))
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.engine import DayRecord, day_hours
+from app.engine.index import default_is_working
+from app.models import CalendarChange
+
+
+def as_utc(moment: datetime) -> datetime:
+    """
+    Приводит момент к UTC; момент без часового пояса считается UTC.
+    """
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def days_as_of(
+    session: Session,
+    region: str,
+    start: date,
+    end: date,
+    as_of: datetime
+) -> list[DayRecord]:
+    """
+    Записи о днях [start, end] в том виде, как их знал календарь на момент as_of.
+    """
+    latest = (
+        select(func.max(CalendarChange.id))
+        .where(
+            CalendarChange.region == region,
+            CalendarChange.date.between(start, end),
+            CalendarChange.changed_at <= as_utc(as_of),
+        )
+        .group_by(CalendarChange.date)
+    )
+    known = {
+        day: DayRecord(region, day, is_working, holiday_name, day_hours(is_working, hours))
+        for day, is_working, holiday_name, hours in session.execute(
+            select(
+                CalendarChange.date, CalendarChange.is_working,
+                CalendarChange.holiday_name, CalendarChange.working_hours,
+            ).where(CalendarChange.id.in_(latest))
+        )
+    }
+    records = []
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        if day not in known:
+            is_working = default_is_working(day)
+            known[day] = DayRecord(region, day, is_working, None, day_hours(is_working))
+        records.append(known[day])
+    return records
@@ -0,0 +1,89 @@
+"""
+Модуль app.services.overlays — календари сотрудников и команд из БД.
+
+Наложения (Overlay) хранят только интервалы дат (OverlayInterval)
+и, при необходимости, сменный график. Календарь сотрудника собирается
+на лету: цепочка наложений от корня (команда) к листу (сотрудник)
+превращается в слои (ShiftLayer графика, затем IntervalLayer интервалов)
+поверх in‑memory снимка базового календаря. Базовый календарь при этом не
+копируется — на запрос читаются только интервалы цепочки.
+
+Структура:
+- overlay_chain() — наложение и его предки (от корня к листу);
+- overlay_layers() — слои графиков и интервалов для цепочки наложений;
+- overlay_calendar() — календарь наложения поверх снимка.
+
+Пример использования:
+    with Session(get_read_engine()) as session:
+        calendar = overlay_calendar(session, 'ivanov', index_holder.current)
+        calendar.is_working(date(2025, 7, 2))
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.engine import CalendarIndex, IntervalLayer, LayeredCalendar, ShiftLayer, ShiftPattern
+from app.models import Overlay, OverlayInterval
+
+
+def overlay_chain(session: Session, name: str) -> list[Overlay]:
+    """
+    Возвращает наложение и всех его предков, начиная с корня.
+
+    Raises:
+        LookupError: если наложения с таким именем нет.
+    """
+    overlay = session.scalars(select(Overlay).where(Overlay.name == name)).first()
+    if overlay is None:
+        raise LookupError(f'Наложение {name} не найдено')
+    chain = [overlay]
+    seen = {overlay.id}
+    while chain[-1].parent_id is not None and chain[-1].parent_id not in seen:
+        parent = session.get(Overlay, chain[-1].parent_id)
+        if parent is None:
+            break
+        chain.append(parent)
+        seen.add(parent.id)
+    return chain[::-1]
+
+
+def overlay_layers(session: Session, chain: list[Overlay], index: CalendarIndex) -> list:
+    """
+    Строит слои для цепочки наложений (интервалы — одним запросом).
+
+    У каждого наложения сменный график (если задан) идёт перед интервалами;
+    внутри наложения интервалы, добавленные позже, перекрывают ранние.
+    """
+    intervals = {overlay.id: [] for overlay in chain}
+    rows = session.execute(
+        select(
+            OverlayInterval.overlay_id, OverlayInterval.start_date,
+            OverlayInterval.end_date, OverlayInterval.is_working, OverlayInterval.note
+        )
+        .where(OverlayInterval.overlay_id.in_(list(intervals)))
+        .order_by(OverlayInterval.id)
+    )
+    for overlay_id, start, end, is_working, note in rows:
+        intervals[overlay_id].append((start, end, is_working, note))
+    layers = []
+    for overlay in chain:
+        if overlay.shift_pattern and overlay.shift_anchor:
+            layers.append(ShiftLayer(
+                overlay.name, ShiftPattern.parse(overlay.shift_pattern),
+                overlay.shift_anchor, index, overlay.region
+            ))
+        layers.append(IntervalLayer(overlay.name, intervals[overlay.id]))
+    return layers
+
+
+def overlay_calendar(session: Session, name: str, index: CalendarIndex) -> LayeredCalendar:
+    """
+    Возвращает календарь наложения поверх снимка базового календаря.
+
+    Регион берётся у самого наложения.
+
+    Raises:
+        LookupError: если наложения с таким именем нет.
+    """
+    chain = overlay_chain(session, name)
+    return LayeredCalendar(index, chain[-1].region, overlay_layers(session, chain, index))
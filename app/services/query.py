@@ -0,0 +1,122 @@
+"""
+Модуль app.services.query — вычисление составного запроса к календарю.
+
+Все операции составного запроса вычисляются в одном контексте:
+по одному снимку календаря (одна версия данных для всех виджетов
+страницы), с общими кэшами лет снимка и без повторного вычисления
+одинаковых операций.
+
+Структура:
+- QueryContext — контекст вычисления: снимок, регион, распорядок дня;
+  run() возвращает результаты операций по порядку.
+
+Пример использования:
+    context = QueryContext(index_holder.current, 'ru', work_schedule)
+    context.run(operations)
+"""
+
+from datetime import timedelta
+from typing import Optional
+
+from app.engine import CalendarIndex, WorkSchedule, add_working_hours, working_hours_between
+from app.schemas import DaySchema
+from app.schemas.query import (
+    DayOperation, DeadlineOperation, HoursOperation, Operation,
+    QueryResultSchema, RangeOperation, ShiftOperation
+)
+
+MAX_QUERY_RANGE_DAYS = 3660
+"""Максимальная длина периода в операциях `calendar`, `holidays` и `count_working`, дней."""
+
+OPERATION_ERRORS = (ValueError, OverflowError, TypeError)
+"""Ошибки вычисления, которые возвращаются в результате операции, а не прерывают запрос
+(некорректные параметры, выход за пределы допустимых дат, смешение моментов
+с часовым поясом и без)."""
+
+
+class QueryContext:
+    """
+    Контекст вычисления составного запроса.
+
+    Attributes:
+        index (CalendarIndex): снимок, по которому вычисляются все операции;
+        region (str): регион календаря;
+        schedule (WorkSchedule): распорядок дня для операций с часами.
+    """
+
+    def __init__(
+        self,
+        index: CalendarIndex,
+        region: str,
+        schedule: Optional[WorkSchedule] = None
+    ) -> None:
+        self.index = index
+        self.region = region
+        self.schedule = schedule
+        self._results: dict[Operation, object] = {}
+
+    def _period(self, operation: RangeOperation, signed: bool = False) -> None:
+        """
+        Проверяет период операции; `signed` — допускается end_date < start_date.
+        """
+        if operation.end_date < operation.start_date and not signed:
+            raise ValueError('end_date раньше start_date')
+        if abs((operation.end_date - operation.start_date).days) >= MAX_QUERY_RANGE_DAYS:
+            raise ValueError('Слишком длинный период')
+
+    def evaluate(self, operation: Operation):
+        """
+        Вычисляет одну операцию.
+
+        Raises:
+            ValueError: если параметры операции некорректны;
+            OverflowError: если результат выходит за пределы допустимых дат.
+        """
+        index, region = self.index, self.region
+        if isinstance(operation, DayOperation):
+            if operation.op == 'is_working':
+                return index.is_working(region, operation.day)
+            return DaySchema.model_validate(index.get_day(region, operation.day), from_attributes=True)
+        if isinstance(operation, RangeOperation):
+            if operation.op == 'count_working':
+                self._period(operation, signed=True)
+                return index.count_working(region, operation.start_date, operation.end_date)
+            self._period(operation)
+            days = index.days(region, operation.start_date, operation.end_date)
+            if operation.op == 'holidays':
+                days = [day for day in days if day.holiday_name and not day.is_working]
+            return [DaySchema.model_validate(day, from_attributes=True) for day in days]
+        if isinstance(operation, ShiftOperation):
+            if operation.op == 'next_working':
+                return index.add_working_days(region, operation.day + timedelta(days=1), 0)
+            if operation.op == 'previous_working':
+                return index.add_working_days(region, operation.day, -1)
+            return index.add_working_days(region, operation.day, operation.days)
+        if isinstance(operation, HoursOperation):
+            return working_hours_between(
+                index, region, operation.start, operation.end, self.schedule
+            )
+        if isinstance(operation, DeadlineOperation):
+            return add_working_hours(
+                index, region, operation.start, operation.hours, self.schedule
+            )
+        raise ValueError(f'Неизвестная операция {operation.op}')
+
+    def run(self, operations: list[Operation]) -> list[QueryResultSchema]:
+        """
+        Вычисляет операции по порядку; одинаковые операции — один раз.
+
+        Ошибка одной операции не прерывает остальные: она возвращается
+        в поле `error` её результата.
+        """
+        results = []
+        for operation in operations:
+            key = operation.model_copy(update={'id': None})
+            try:
+                if key not in self._results:
+                    self._results[key] = self.evaluate(operation)
+                result = QueryResultSchema(id=operation.id, op=operation.op, result=self._results[key])
+            except OPERATION_ERRORS as error:
+                result = QueryResultSchema(id=operation.id, op=operation.op, error=str(error))
+            results.append(result)
+        return results
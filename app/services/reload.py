@@ -0,0 +1,166 @@
+"""
+Модуль app.services.reload — горячая перезагрузка настроек воркера.
+
+Изменение источников, лимитов или интервалов обновления не должно
+требовать перезапуска: перезапуск сбрасывает прогретый снимок календаря,
+кэш версий и соединения. Перезагрузка перечитывает окружение и
+.env‑файл, проверяет новые значения целиком и подменяет изменившиеся
+параметры из RELOADABLE_SETTINGS в общем объекте settings одной операцией;
+снимок календаря, кэши и соединения не трогаются.
+
+Параметры, которые применяются только при перезапуске (подключение
+к БД, пулы, логи, распорядок дня), не подменяются — их изменение
+записывается в лог предупреждением.
+
+Поводы для перезагрузки:
+- сигнал SIGHUP (`kill -HUP <pid>`; мастер `python -m app.server`
+  передаёт его всем воркерам);
+- изменение .env‑файла (проверка раз в SETTINGS_WATCH_INTERVAL секунд).
+
+Объекты, которые копируют настройки при создании, подписываются на
+изменения: ограничители запросов к источникам сбрасываются, очередь
+новых подписчиков уведомлений берёт новый размер, кэш архивных лет —
+новую ёмкость, планировщик обновления
+подписывается из lifespan (SyncScheduler.apply_settings).
+
+Структура:
+- SettingsReloader — перезагрузка, подписчики, сигнал и наблюдение за файлом;
+- settings_reloader — перезагрузчик этого процесса.
+
+Пример использования:
+    settings_reloader.subscribe(scheduler.apply_settings)
+    settings_reloader.install_signal_handler()
+    watcher = asyncio.create_task(settings_reloader.watch())
+"""
+
+import asyncio
+import signal
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from pydantic import ValidationError
+
+from app.core import main_logger, reload_settings, settings
+from app.core.settings import Settings
+from app.sources.http import reset_limiters
+from .archive import archive_cache
+from .state import broadcaster
+
+SOURCE_LIMIT_SETTINGS = frozenset({'SOURCE_RATE_LIMIT', 'SOURCE_BURST', 'SOURCE_RATE_LIMITS'})
+"""Параметры, после изменения которых пересоздаются ограничители запросов."""
+
+
+class SettingsReloader:
+    """
+    Перезагрузка настроек с уведомлением подписчиков.
+
+    Attributes:
+        target (Settings): обновляемые настройки;
+        path (Path): .env‑файл, изменения которого отслеживаются;
+        listeners (list[Callable]): подписчики, получающие словарь изменений.
+    """
+
+    def __init__(self, target: Settings = settings, path: Optional[Path] = None) -> None:
+        self.target = target
+        self.path = Path(path or Settings.model_config['env_file'])
+        self.listeners: list[Callable[[dict[str, Any]], None]] = []
+
+    def subscribe(self, listener: Callable[[dict[str, Any]], None]) -> None:
+        """
+        Подписывает на применённые изменения настроек.
+        """
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[dict[str, Any]], None]) -> None:
+        """
+        Отменяет подписку (если она есть).
+        """
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def reload(self) -> dict[str, Any]:
+        """
+        Перечитывает настройки из отслеживаемого .env‑файла (переменные
+        окружения по‑прежнему важнее файла) и уведомляет подписчиков
+        об изменениях.
+
+        Некорректные значения в файле не применяются: действуют прежние
+        настройки, ошибка пишется в лог.
+
+        Returns:
+            dict[str, Any]: применённые изменения.
+        """
+        try:
+            changes, restart = reload_settings(self.target, self.path)
+        except ValidationError as error:
+            main_logger.error(f'Настройки не перезагружены, ошибка значений: {error}')
+            return {}
+        if restart:
+            main_logger.warning(
+                f'Изменения настроек {", ".join(restart)} применятся после перезапуска.'
+            )
+        if not changes:
+            return changes
+        main_logger.info(f'Настройки перезагружены: {", ".join(sorted(changes))}.')
+        for listener in list(self.listeners):
+            try:
+                listener(changes)
+            except Exception as error:
+                main_logger.error(f'Ошибка применения настроек: {error!r}')
+        return changes
+
+    def install_signal_handler(self) -> bool:
+        """
+        Перезагружает настройки по сигналу SIGHUP (в текущем цикле событий).
+
+        Returns:
+            bool: False, если платформа не поддерживает SIGHUP.
+        """
+        if not hasattr(signal, 'SIGHUP'):
+            return False
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self.reload)
+        except (NotImplementedError, RuntimeError, ValueError):
+            return False
+        return True
+
+    def _mtime(self) -> Optional[float]:
+        try:
+            return self.path.stat().st_mtime
+        except OSError:
+            return None
+
+    async def watch(self, interval: Optional[float] = None) -> None:
+        """
+        Проверяет .env‑файл раз в interval секунд (по умолчанию
+        SETTINGS_WATCH_INTERVAL) и перезагружает настройки при изменении.
+        Интервал 0 останавливает наблюдение.
+        """
+        seen = self._mtime()
+        while True:
+            delay = interval or self.target.SETTINGS_WATCH_INTERVAL
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+            current = self._mtime()
+            if current != seen:
+                seen = current
+                self.reload()
+
+
+def apply_service_settings(changes: dict[str, Any]) -> None:
+    """
+    Применяет изменения к объектам процесса, копирующим настройки при создании.
+    """
+    if SOURCE_LIMIT_SETTINGS & changes.keys():
+        reset_limiters()
+    if 'NOTIFY_QUEUE_SIZE' in changes:
+        broadcaster.queue_size = changes['NOTIFY_QUEUE_SIZE']
+    if 'ARCHIVE_CACHE_SIZE' in changes:
+        archive_cache.size = changes['ARCHIVE_CACHE_SIZE']
+
+
+settings_reloader = SettingsReloader()
+"""Перезагрузчик настроек этого процесса."""
+
+settings_reloader.subscribe(apply_service_settings)
@@ -0,0 +1,244 @@
+"""
+Модуль app.services.scheduler — фоновое обновление календаря.
+
+Запускается из `lifespan` приложения и каждые SYNC_POLL_INTERVAL секунд:
+1. пытается стать лидером среди воркеров (файловая блокировка);
+2. если воркер — лидер и подошёл срок (SYNC_INTERVAL плюс случайный jitter),
+   загружает из источников текущий и следующий год и сохраняет в БД
+   только изменившиеся дни, а затем переносит в архив годы старше
+   горизонта ARCHIVE_AFTER_YEARS (см. app.services.archive);
+3. каждый воркер сравнивает номер последнего изменения в БД (seq) с версией
+   своего снимка и, если данные обновились, перечитывает календарь,
+   атомарно подменяет in‑memory снимок и рассылает события об изменениях
+   своим подписчикам (WebSocket/SSE).
+
+Так только один из N воркеров ходит во внешние источники, а остальные
+получают свежие данные через общую БД.
+
+Структура:
+- LeaderLock — неблокирующая межпроцессная блокировка на файле;
+- SyncScheduler — цикл обновления с настраиваемым интервалом и jitter.
+
+Пример использования:
+    scheduler = SyncScheduler(settings.CALENDAR_REGIONS, index_holder)
+    scheduler.start()
+    ...
+    await scheduler.stop()
+"""
+
+import asyncio
+import os
+import random
+import time
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core import get_read_engine, main_logger, settings
+from app.engine import CalendarIndex, IndexHolder
+from app.sources import BaseSource
+from .archive import archive_years
+from .broadcaster import Broadcaster
+from .changes import change_events, changes_since
+from .sync import latest_seq, load_index, refresh, target_years
+
+MAX_EVENT_CHANGES = 10000
+"""Максимум изменений, рассылаемых за один цикл; остальное клиенты догружают через /changes."""
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LeaderLock:
+    """
+    Межпроцессная блокировка лидера на файле.
+
+    Блокировка удерживается, пока процесс жив; при падении лидера
+    операционная система снимает её, и лидером становится другой воркер.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        """
+        Удерживает ли текущий процесс блокировку.
+        """
+        return self._fd is not None
+
+    def acquire(self) -> bool:
+        """
+        Пытается захватить блокировку, не дожидаясь её освобождения.
+
+        Returns:
+            bool: True, если процесс является лидером.
+        """
+        if self._fd is not None:
+            return True
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """
+        Освобождает блокировку, если она удерживается.
+        """
+        if self._fd is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        os.close(self._fd)
+        self._fd = None
+
+
+class SyncScheduler:
+    """
+    Планировщик фонового обновления календаря.
+
+    Attributes:
+        regions (list[str]): обновляемые регионы;
+        holder (IndexHolder): держатель снимка, который подменяется после обновления;
+        interval (float): базовый интервал между обновлениями из источников, секунды;
+        jitter (float): максимальная случайная добавка к интервалу, секунды;
+        poll_interval (float): интервал проверки новых изменений в БД, секунды;
+        lock (LeaderLock): блокировка лидера;
+        broadcaster (Broadcaster | None): рассылка событий об изменениях.
+    """
+
+    def __init__(
+        self,
+        regions: list[str],
+        holder: IndexHolder,
+        interval: Optional[float] = None,
+        jitter: Optional[float] = None,
+        lock: Optional[LeaderLock] = None,
+        sources: Optional[list[BaseSource]] = None,
+        bind=None,
+        poll_interval: Optional[float] = None,
+        broadcaster: Optional[Broadcaster] = None
+    ) -> None:
+        self.regions = regions
+        self.holder = holder
+        self.interval = settings.SYNC_INTERVAL if interval is None else interval
+        self.jitter = settings.SYNC_JITTER if jitter is None else jitter
+        self.lock = lock or LeaderLock(settings.SYNC_LOCK_FILE)
+        self.sources = sources
+        self.bind = bind
+        self.poll_interval = (
+            settings.SYNC_POLL_INTERVAL if poll_interval is None else poll_interval
+        )
+        self.broadcaster = broadcaster
+        self._next_refresh = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def apply_settings(self, changes: dict) -> None:
+        """
+        Применяет перезагруженные настройки (регионы и интервалы обновления)
+        к работающему планировщику; следующий цикл идёт с новыми значениями.
+        """
+        if 'CALENDAR_REGIONS' in changes:
+            self.regions = changes['CALENDAR_REGIONS']
+        if 'SYNC_INTERVAL' in changes:
+            self.interval = changes['SYNC_INTERVAL']
+        if 'SYNC_JITTER' in changes:
+            self.jitter = changes['SYNC_JITTER']
+        if 'SYNC_POLL_INTERVAL' in changes:
+            self.poll_interval = changes['SYNC_POLL_INTERVAL']
+
+    def next_delay(self) -> float:
+        """
+        Задержка до следующего обновления: интервал плюс случайный jitter.
+
+        Jitter разводит воркеров и экземпляры сервиса во времени,
+        чтобы они не обращались к источникам одновременно.
+        """
+        return self.interval + random.uniform(0, self.jitter)
+
+    async def run_once(self) -> CalendarIndex:
+        """
+        Выполняет один цикл: обновление из источников (если воркер — лидер
+        и подошёл срок) и перезагрузку снимка.
+
+        Returns:
+            CalendarIndex: актуальный снимок в holder.
+        """
+        now = time.monotonic()
+        if now >= self._next_refresh and self.lock.acquire():
+            changed = await refresh(self.regions, target_years(), self.sources, self.bind)
+            main_logger.info(f'Обновление календаря: изменилось дней {changed}.')
+            await asyncio.to_thread(archive_years, None, self.bind)
+            self._next_refresh = now + self.next_delay()
+        return await self.reload()
+
+    async def reload(self) -> CalendarIndex:
+        """
+        Перечитывает снимок, если в журнале есть изменения новее его версии,
+        и рассылает события об этих изменениях.
+
+        Returns:
+            CalendarIndex: актуальный снимок в holder.
+        """
+        previous = self.holder.current.version
+        seq = await asyncio.to_thread(latest_seq, self.bind)
+        if seq == previous:
+            return self.holder.current
+        self.holder.swap(await asyncio.to_thread(load_index, self.bind))
+        if self.broadcaster is not None and self.broadcaster.subscribers:
+            for event in await asyncio.to_thread(self._read_events, previous):
+                self.broadcaster.publish(event)
+        return self.holder.current
+
+    def _read_events(self, since: int) -> list[dict]:
+        """
+        Читает изменения после since и группирует их в события.
+        """
+        with Session(self.bind or get_read_engine()) as session:
+            return change_events(changes_since(session, since, MAX_EVENT_CHANGES))
+
+    async def _run(self) -> None:
+        """
+        Бесконечный цикл обновления; ошибки логируются и не прерывают цикл.
+        """
+        while True:
+            try:
+                await self.run_once()
+            except Exception as error:
+                main_logger.error(f'Ошибка фонового обновления календаря: {error!r}')
+            await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        """
+        Запускает цикл обновления в фоновой задаче.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Останавливает цикл обновления и освобождает блокировку лидера.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.lock.release()
@@ -0,0 +1,27 @@
+"""
+Модуль app.services.state — состояние процесса WorkCalendarClient.
+
+Хранит объекты, общие для всех запросов одного воркера.
+
+Экспортируемые объекты:
+- index_holder — держатель текущего in‑memory снимка календаря.
+  Маршруты читают `index_holder.current`, фоновое обновление
+  подменяет снимок через `index_holder.swap()`;
+- broadcaster — рассылка событий об изменениях подписчикам
+  WebSocket/SSE этого воркера;
+- work_schedule — распорядок рабочего дня (WORKDAY_SCHEDULE) для
+  арифметики рабочих часов.
+"""
+
+from app.core import settings
+from app.engine import IndexHolder, WorkSchedule
+from .broadcaster import Broadcaster
+
+index_holder = IndexHolder()
+"""Текущий снимок календаря этого воркера."""
+
+broadcaster = Broadcaster(settings.NOTIFY_QUEUE_SIZE)
+"""Рассылка событий об изменениях календаря подписчикам этого воркера."""
+
+work_schedule = WorkSchedule.parse(settings.WORKDAY_SCHEDULE)
+"""Распорядок рабочего дня для расчёта рабочих часов."""
@@ -0,0 +1,387 @@
+"""
+Модуль app.services.sync — синхронизация календаря с внешними источниками.
+
+Назначение:
+- загрузка данных региона за год с перебором источников
+  (если один не отвечает — пробуем следующий);
+- сравнение нормализованных дней с таблицей `calendarday` и запись
+  только изменившихся дней;
+- ведение журнала изменений `calendarchange` с монотонным номером (seq);
+- история синхронизаций: длительности загрузки, разбора и записи каждого
+  года региона в логе и таблице `syncrun` (см. app.services.sync_history);
+- пересчёт норм рабочего времени затронутых лет (`calendaraggregate`,
+  см. app.services.aggregates) в той же транзакции;
+- учёт архива давних лет (`calendararchive`, см. app.services.archive):
+  дни архивных лет сравниваются с архивом, снимок получает архив
+  с ленивым разбором лет;
+- построение in‑memory снимка календаря из БД.
+
+Функции:
+- fetch_year() — асинхронная загрузка года из первого доступного источника;
+- save_days() — запись изменившихся дней и журнала изменений в одной транзакции;
+- bulk_save_days() — то же для больших пакетов (импорт файлов): пакетные
+  INSERT/UPDATE (executemany) без построения ORM‑объектов на каждую строку;
+- latest_seq() — номер последнего изменения;
+- load_index() — снимок календаря из БД (версия = последний seq): регионы
+  с опубликованной версией — из активной версии (app.services.versions),
+  остальные — из `calendarday`, архивные годы — из `calendararchive`;
+- refresh() — загрузка и сохранение набора регионов и лет
+  (загрузки идут параллельно с ограничением SYNC_CONCURRENCY,
+  запись в БД — последовательно) и публикация новых версий изменившихся
+  регионов;
+- backfill() — загрузка диапазона лет (например, истории за 30 лет).
+
+Работа с БД синхронная (SQLAlchemy ORM); из асинхронного кода её следует
+вызывать через `asyncio.to_thread`. Параметр `bind` по умолчанию выбирает
+движок записи (`engine`) для записи и движок чтения (`get_read_engine()`)
+для чтения.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import date
+from typing import Iterable, Optional
+
+import httpx
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core import engine, get_read_engine, main_logger, settings
+from app.engine import CalendarIndex, DayRecord, special_hours
+from app.models import CalendarChange, CalendarDay
+from app.models.change import utc_now
+from .aggregates import refresh_day_aggregates
+from .archive import archived_days, load_archive, merge_year
+from .sync_history import SyncRunStats, log_sync_run, save_sync_runs
+from .versions import publish_version, released_years
+from app.sources import BaseSource, SourceError, get_sources
+from app.sources.base import stage_timings
+
+
+async def fetch_year(
+    client: httpx.AsyncClient,
+    region: str,
+    year: int,
+    sources: Optional[list[BaseSource]] = None,
+    stats: Optional[SyncRunStats] = None
+) -> list[DayRecord]:
+    """
+    Загружает данные региона за год из первого ответившего источника.
+
+    Args:
+        client (httpx.AsyncClient): HTTP‑клиент;
+        region (str): код региона;
+        year (int): год;
+        sources (list[BaseSource] | None): источники в порядке опроса
+            (по умолчанию — из settings.CALENDAR_SOURCES);
+        stats (SyncRunStats | None): куда записать источник, длительности
+            загрузки и разбора и ошибки источников.
+
+    Returns:
+        list[DayRecord]: записи обо всех днях года.
+
+    Raises:
+        SourceError: если ни один источник не вернул корректные данные.
+    """
+    if sources is None:
+        sources = get_sources(settings.CALENDAR_SOURCES)
+    stats = stats or SyncRunStats(region, year)
+    for source in sources:
+        timings = {}
+        token = stage_timings.set(timings)
+        started = time.perf_counter()
+        try:
+            records = await source.fetch_year(client, region, year)
+        except (httpx.HTTPError, SourceError) as error:
+            main_logger.warning(f'Источник {source.name} недоступен для {region}/{year}: {error}')
+            stats.errors.append(f'{source.name}: {error}')
+            stats.fetch_seconds += time.perf_counter() - started
+            continue
+        finally:
+            stage_timings.reset(token)
+        stats.source = source.name
+        stats.fetch_seconds += timings.get('fetch', time.perf_counter() - started)
+        stats.parse_seconds += timings.get('parse', 0.0)
+        return records
+    raise SourceError(f'Нет доступных источников для {region}/{year}')
+
+
+def save_days(records: Iterable[DayRecord], bind=None) -> list[DayRecord]:
+    """
+    Сохраняет в таблицу `calendarday` только изменившиеся дни.
+
+    Записи сравниваются с хранимыми строками (по паре region, date):
+    новые дни добавляются, отличающиеся — обновляются, совпадающие
+    не трогаются. Дни архивных лет без строк сравниваются с архивом.
+    Рабочие часы хранятся только если они отличаются
+    от стандартных (иначе NULL). Каждое изменение попадает в журнал `calendarchange`
+    в той же транзакции.
+
+    Returns:
+        list[DayRecord]: изменившиеся дни.
+    """
+    records = list(records)
+    if not records:
+        return []
+    dates = [record.date for record in records]
+    regions = {record.region for record in records}
+    changed = []
+    with Session(bind or engine) as session:
+        existing = {
+            (row.region, row.date): row
+            for row in session.scalars(
+                select(CalendarDay).where(
+                    CalendarDay.region.in_(regions),
+                    CalendarDay.date.between(min(dates), max(dates)),
+                )
+            )
+        }
+        archived = archived_days(session, regions, min(dates), max(dates))
+        for record in records:
+            row = existing.get((record.region, record.date))
+            hours = special_hours(record.is_working, record.working_hours)
+            if row is None:
+                if archived.get((record.region, record.date)) == (
+                    record.is_working, record.holiday_name, hours
+                ):
+                    continue
+                session.add(CalendarDay(
+                    region=record.region,
+                    date=record.date,
+                    is_working=record.is_working,
+                    holiday_name=record.holiday_name,
+                    working_hours=hours,
+                ))
+            elif (row.is_working, row.holiday_name, row.working_hours) != (
+                record.is_working, record.holiday_name, hours
+            ):
+                row.is_working = record.is_working
+                row.holiday_name = record.holiday_name
+                row.working_hours = hours
+            else:
+                continue
+            session.add(CalendarChange(
+                region=record.region,
+                date=record.date,
+                is_working=record.is_working,
+                holiday_name=record.holiday_name,
+                working_hours=hours,
+            ))
+            changed.append(record)
+        session.flush()
+        refresh_day_aggregates(session, {(record.region, record.date.year) for record in changed})
+        session.commit()
+    return changed
+
+
+def bulk_save_days(records: Iterable[DayRecord], bind=None) -> int:
+    """
+    Пакетно сохраняет изменившиеся дни и журнал изменений.
+
+    Семантика та же, что у save_days() (сравнение с хранимыми строками,
+    запись только изменившихся дней, журнал в той же транзакции), но
+    новые и изменённые строки пишутся пакетными INSERT и UPDATE
+    (executemany) на уровне SQLAlchemy Core, а хранимые строки читаются
+    кортежами без ORM.
+    Используется загрузчиком файлов (app.services.bulk_load).
+
+    Returns:
+        int: число изменившихся дней.
+    """
+    records = list(records)
+    if not records:
+        return 0
+    dates = [record.date for record in records]
+    regions = {record.region for record in records}
+    with Session(bind or engine) as session:
+        existing = {
+            (region, day): (is_working, holiday_name, working_hours)
+            for region, day, is_working, holiday_name, working_hours in session.execute(
+                select(
+                    CalendarDay.region, CalendarDay.date, CalendarDay.is_working,
+                    CalendarDay.holiday_name, CalendarDay.working_hours
+                ).where(
+                    CalendarDay.region.in_(regions),
+                    CalendarDay.date.between(min(dates), max(dates)),
+                )
+            )
+        }
+        archived = archived_days(session, regions, min(dates), max(dates))
+        inserted, updated, changes = [], [], []
+        for record in records:
+            values = {
+                'region': record.region,
+                'date': record.date,
+                'is_working': record.is_working,
+                'holiday_name': record.holiday_name,
+                'working_hours': special_hours(record.is_working, record.working_hours),
+            }
+            stored = existing.get((record.region, record.date))
+            current = (values['is_working'], values['holiday_name'], values['working_hours'])
+            if stored is None:
+                if archived.get((record.region, record.date)) == current:
+                    continue
+                inserted.append(values)
+            elif stored != current:
+                updated.append({**values, 'key_region': record.region, 'key_date': record.date})
+            else:
+                continue
+            changes.append(values)
+        connection = session.connection()
+        if inserted:
+            connection.execute(insert(CalendarDay.__table__), inserted)
+        if updated:
+            connection.execute(
+                update(CalendarDay)
+                .where(
+                    CalendarDay.region == bindparam('key_region'),
+                    CalendarDay.date == bindparam('key_date'),
+                )
+                .values(
+                    is_working=bindparam('is_working'),
+                    holiday_name=bindparam('holiday_name'),
+                    working_hours=bindparam('working_hours'),
+                ),
+                updated,
+            )
+        if changes:
+            changed_at = utc_now()
+            connection.execute(
+                insert(CalendarChange.__table__),
+                [{**values, 'changed_at': changed_at} for values in changes]
+            )
+            refresh_day_aggregates(
+                session, {(values['region'], values['date'].year) for values in changes}
+            )
+        session.commit()
+    return len(changes)
+
+
+def latest_seq(bind=None) -> int:
+    """
+    Возвращает номер последнего изменения календаря (0, если изменений нет).
+    """
+    with Session(bind or get_read_engine()) as session:
+        return session.scalar(select(func.max(CalendarChange.id))) or 0
+
+
+def load_index(bind=None) -> CalendarIndex:
+    """
+    Строит снимок календаря из БД.
+
+    Регионы с активной версией берутся из неё (разобранные версии
+    кэшируются по номеру), остальные — из строк таблицы `calendarday`.
+    Архивные годы остаются в архиве снимка и разбираются при первом
+    обращении; строки, записанные в архивный год, накладываются на него.
+    Версия снимка — номер последнего изменения. Он читается до самих дней,
+    поэтому снимок никогда не бывает старше своей версии.
+    """
+    with Session(bind or get_read_engine()) as session:
+        version = session.scalar(select(func.max(CalendarChange.id))) or 0
+        released, years = released_years(session)
+        archive = load_archive(session)
+        rows = session.execute(
+            select(
+                CalendarDay.region,
+                CalendarDay.date,
+                CalendarDay.is_working,
+                CalendarDay.holiday_name,
+                CalendarDay.working_hours,
+            ).where(CalendarDay.region.not_in(released))
+        )
+        grouped: dict[tuple[str, int], list[DayRecord]] = {}
+        for row in rows:
+            record = DayRecord(*row)
+            grouped.setdefault((record.region, record.date.year), []).append(record)
+        return CalendarIndex.from_years(
+            [merge_year(archive.get(*key), *key, records) for key, records in grouped.items()]
+            + [calendar for calendar in years if (calendar.region, calendar.year) not in archive],
+            version=version,
+            archive=archive,
+        )
+
+
+async def refresh(
+    regions: Iterable[str],
+    years: Iterable[int],
+    sources: Optional[list[BaseSource]] = None,
+    bind=None,
+    concurrency: Optional[int] = None
+) -> int:
+    """
+    Загружает из источников и сохраняет в БД указанные регионы и годы.
+
+    Загрузка и разбор пар (регион, год) выполняются параллельно, но не
+    более `concurrency` одновременно; запись в БД сериализуется, чтобы
+    не конкурировать за блокировку записи. Ошибка по одному году не
+    прерывает обновление остальных. Для регионов, в которых изменились
+    дни, публикуется новая версия календаря.
+
+    Каждая загрузка года пишется в лог и в историю `syncrun`
+    с длительностями загрузки, разбора и записи (общий run_id запуска);
+    история сохраняется, даже если запуск прерван.
+
+    Returns:
+        int: количество изменившихся дней.
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.SYNC_CONCURRENCY)
+    write_lock = asyncio.Lock()
+    run_id = uuid.uuid4().hex
+    runs = []
+
+    async def load(client: httpx.AsyncClient, region: str, year: int) -> int:
+        stats = SyncRunStats(region, year)
+        runs.append(stats)
+        try:
+            async with semaphore:
+                records = await fetch_year(client, region, year, sources, stats)
+            async with write_lock:
+                started = time.perf_counter()
+                stats.changed = len(await asyncio.to_thread(save_days, records, bind))
+                stats.write_seconds = time.perf_counter() - started
+            return stats.changed
+        except SourceError as error:
+            main_logger.error(str(error))
+            return 0
+        except Exception as error:
+            stats.errors.append(f'{type(error).__name__}: {error}')
+            main_logger.error(f'Ошибка синхронизации {region}/{year}: {error!r}')
+            return 0
+        finally:
+            log_sync_run(run_id, stats)
+
+    years = list(years)
+    pairs = [(region, year) for region in regions for year in years]
+    try:
+        async with httpx.AsyncClient(timeout=settings.HTTP_TIMEOUT) as client:
+            results = await asyncio.gather(*(load(client, region, year) for region, year in pairs))
+    finally:
+        await asyncio.to_thread(save_sync_runs, run_id, runs, bind)
+    for region in sorted({region for (region, _), changed in zip(pairs, results) if changed}):
+        await asyncio.to_thread(publish_version, region, 'синхронизация с источниками', bind)
+    return sum(results)
+
+
+async def backfill(
+    regions: Iterable[str],
+    first_year: int,
+    last_year: int,
+    sources: Optional[list[BaseSource]] = None,
+    bind=None
+) -> int:
+    """
+    Загружает историю за годы [first_year, last_year] включительно.
+
+    Returns:
+        int: количество изменившихся дней.
+    """
+    return await refresh(regions, range(first_year, last_year + 1), sources, bind)
+
+
+def target_years(today: Optional[date] = None) -> list[int]:
+    """
+    Годы, которые обновляются регулярно: текущий и следующий.
+    """
+    year = (today or date.today()).year
+    return [year, year + 1]
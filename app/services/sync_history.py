@@ -0,0 +1,121 @@
+"""
+Модуль app.services.sync_history — история синхронизаций с источниками.
+
+Когда обновление замедляется или источник деградирует, нужно понять,
+на каком этапе теряется время: сеть источника, разбор ответа или запись
+в БД (например, из‑за конкуренции за блокировку записи). Для каждой
+загрузки года региона refresh() собирает длительности этапов в
+SyncRunStats, пишет их в лог строкой «ключ=значение» и сохраняет
+в таблицу `syncrun` (одна транзакция на запуск).
+
+Структура:
+- SyncRunStats — длительности этапов и результат загрузки года;
+- log_sync_run() — структурированная строка лога;
+- save_sync_runs() — сохранение запуска в `syncrun`;
+- list_sync_runs() — последние загрузки (новые первыми).
+
+Пример строки лога:
+    Синхронизация: run=3f2a… region=ru year=2025 source=xmlcalendar
+    fetch=0.412s parse=0.008s write=0.031s changed=3 errors=0
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.core import engine, main_logger
+from app.models import SyncRun
+from app.models.change import utc_now
+
+MAX_ERROR_LENGTH = 500
+"""Максимальная длина текста ошибок в `syncrun.error`."""
+
+
+@dataclass
+class SyncRunStats:
+    """
+    Загрузка года региона: источник, длительности этапов и результат.
+
+    Attributes:
+        region (str): регион;
+        year (int): год;
+        started_at (datetime): начало загрузки (UTC);
+        source (str | None): источник, вернувший данные;
+        fetch_seconds (float): загрузка по сети, включая неудачные источники;
+        parse_seconds (float): разбор ответа;
+        write_seconds (float): запись в БД;
+        changed (int): изменилось дней;
+        errors (list[str]): ошибки источников.
+    """
+
+    region: str
+    year: int
+    started_at: datetime = field(default_factory=utc_now)
+    source: Optional[str] = None
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    write_seconds: float = 0.0
+    changed: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+def log_sync_run(run_id: str, stats: SyncRunStats) -> None:
+    """
+    Пишет длительности этапов загрузки года в лог (WARNING — если были ошибки).
+    """
+    message = (
+        f'Синхронизация: run={run_id} region={stats.region} year={stats.year} '
+        f'source={stats.source or "-"} fetch={stats.fetch_seconds:.3f}s '
+        f'parse={stats.parse_seconds:.3f}s write={stats.write_seconds:.3f}s '
+        f'changed={stats.changed} errors={len(stats.errors)}'
+    )
+    if stats.errors:
+        main_logger.warning(f'{message} ({"; ".join(stats.errors)})')
+    else:
+        main_logger.info(message)
+
+
+def save_sync_runs(run_id: str, runs: Iterable[SyncRunStats], bind=None) -> None:
+    """
+    Сохраняет загрузки одного запуска синхронизации.
+    """
+    rows = [
+        {
+            'run_id': run_id,
+            'started_at': stats.started_at,
+            'region': stats.region,
+            'year': stats.year,
+            'source': stats.source,
+            'fetch_seconds': stats.fetch_seconds,
+            'parse_seconds': stats.parse_seconds,
+            'write_seconds': stats.write_seconds,
+            'changed': stats.changed,
+            'error': '; '.join(stats.errors)[:MAX_ERROR_LENGTH] or None,
+        }
+        for stats in runs
+    ]
+    if not rows:
+        return
+    with Session(bind or engine) as session:
+        session.connection().execute(insert(SyncRun.__table__), rows)
+        session.commit()
+
+
+def list_sync_runs(
+    session: Session,
+    region: Optional[str] = None,
+    run_id: Optional[str] = None,
+    limit: int = 100
+) -> list[SyncRun]:
+    """
+    Последние загрузки (новые первыми) с фильтром по региону и запуску.
+    """
+    query = select(SyncRun).order_by(SyncRun.id.desc()).limit(limit)
+    if region is not None:
+        query = query.where(SyncRun.region == region)
+    if run_id is not None:
+        query = query.where(SyncRun.run_id == run_id)
+    return list(session.scalars(query))
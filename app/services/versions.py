@@ -0,0 +1,328 @@
+"""
+Модуль app.services.versions — версии календаря и мгновенный откат.
+
+Если источник опубликовал ошибочные данные, календарь региона нужно
+вернуть к предыдущему состоянию сразу, не дожидаясь исправления источника.
+
+Модель:
+- публикация сохраняет неизменяемый снимок региона (`calendarversion`)
+  и переключает на него указатель региона (`calendarrelease`);
+- откат (и возврат вперёд) — переключение указателя на другую версию:
+  одна строка, без перезаписи `calendarday`; в ту же транзакцию
+  в журнал `calendarchange` записываются дни, которые отличаются между
+  версиями, — воркеры и клиенты ленты изменений видят откат как
+  обычное изменение (seq растёт);
+- публикация тоже сравнивает новый снимок с активной версией и пишет
+  в журнал дни, последняя запись журнала которых отличается от нового
+  значения: после отката `calendarday` по‑прежнему содержит откатанные
+  дни, и публикация (например, после синхронизации) возвращает их
+  в обслуживание — журнал, история и уведомления должны это видеть,
+  а дни, уже записанные в журнал при сохранении, не дублируются;
+- снимок воркера для региона с указателем строится из активной версии,
+  а разобранные версии хранятся в кэше по номеру версии (VersionCache):
+  возврат к уже загруженной версии не пересобирает годы календаря;
+- нормы рабочего времени (`calendaraggregate`) пересчитываются для лет,
+  изменившихся при публикации или откате, в той же транзакции;
+- снимок для публикации включает архивные годы (`calendararchive`),
+  а откат перезаписывает блобы архивных лет, которые он изменил,
+  поэтому архив всегда совпадает с активной версией;
+- снимок целиком подменяется атомарно (IndexHolder), поэтому чтение
+  никогда не видит наполовину обновлённый год.
+
+Регионы без указателя (ещё не публиковавшиеся) читаются из `calendarday`,
+как раньше.
+
+Структура:
+- VersionCache, version_cache — кэш разобранных версий (LRU);
+- region_snapshot() — снимок региона из `calendarday`;
+- released_years() — регионы с активными версиями и их годы;
+- publish_version() — публикация текущего состояния региона;
+- activate_version() — переключение на версию (откат);
+- list_versions() — версии региона.
+
+Пример использования:
+    version_id = publish_version('ru', note='после синхронизации')
+    activate_version('ru', version_id - 1)  # откат
+"""
+
+import json
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core import engine
+from app.engine import CalendarIndex, DayRecord, YearCalendar, dump_snapshot, load_years, special_hours
+from app.models import CalendarArchive, CalendarChange, CalendarRelease, CalendarVersion
+from app.models.change import utc_now
+from .aggregates import store_aggregates
+from .archive import store_archive, stored_years
+
+VERSION_CACHE_SIZE = 32
+"""Сколько разобранных версий хранит кэш воркера."""
+
+
+class VersionCache:
+    """
+    Кэш разобранных версий: номер версии → годы календаря (LRU).
+
+    Версии неизменяемы, поэтому запись кэша никогда не устаревает.
+    """
+
+    def __init__(self, size: int = VERSION_CACHE_SIZE) -> None:
+        self.size = size
+        self._years: OrderedDict[int, list[YearCalendar]] = OrderedDict()
+
+    def get(self, version_id: int, load: Callable[[], list[YearCalendar]]) -> list[YearCalendar]:
+        """
+        Годы версии из кэша или, при промахе, из `load()`.
+        """
+        if version_id in self._years:
+            self._years.move_to_end(version_id)
+            return self._years[version_id]
+        years = self._years[version_id] = load()
+        while len(self._years) > self.size:
+            self._years.popitem(last=False)
+        return years
+
+    def clear(self) -> None:
+        """
+        Очищает кэш (например, при переключении на другую БД).
+        """
+        self._years.clear()
+
+    def __contains__(self, version_id: int) -> bool:
+        return version_id in self._years
+
+
+version_cache = VersionCache()
+"""Кэш разобранных версий этого воркера."""
+
+
+def region_snapshot(session: Session, region: str) -> dict:
+    """
+    Снимок региона из текущих строк `calendarday` и архива.
+    """
+    return dump_snapshot(CalendarIndex.from_years(stored_years(session, region)), region)
+
+
+def _version_years(session: Session, version_id: int, cache: VersionCache) -> list[YearCalendar]:
+    return cache.get(
+        version_id,
+        lambda: load_years(json.loads(
+            session.scalar(select(CalendarVersion.snapshot).where(CalendarVersion.id == version_id))
+        )),
+    )
+
+
+def released_years(
+    session: Session,
+    cache: VersionCache = version_cache
+) -> tuple[set[str], list[YearCalendar]]:
+    """
+    Регионы с активной версией и годы этих версий.
+    """
+    regions, years = set(), []
+    for region, version_id in session.execute(
+        select(CalendarRelease.region, CalendarRelease.version_id)
+    ):
+        regions.add(region)
+        years.extend(_version_years(session, version_id, cache))
+    return regions, years
+
+
+def _active_years(session: Session, region: str, cache: VersionCache) -> list[YearCalendar]:
+    """
+    Годы региона в том виде, как их сейчас видят воркеры.
+    """
+    version_id = session.scalar(
+        select(CalendarRelease.version_id).where(CalendarRelease.region == region)
+    )
+    if version_id is None:
+        return load_years(region_snapshot(session, region))
+    return _version_years(session, version_id, cache)
+
+
+def _diff_days(
+    region: str,
+    current: CalendarIndex,
+    target: CalendarIndex
+) -> tuple[list[DayRecord], list[YearCalendar]]:
+    """
+    Дни региона, которые отличаются в `target` от `current`, и годы
+    `target`, в которых они есть.
+    """
+    changed, changed_years = [], []
+    for year in sorted(set(current.years(region)) | set(target.years(region))):
+        before = current.calendar(region, year).records()
+        after = target.calendar(region, year).records()
+        if before != after:
+            changed_years.append(target.calendar(region, year))
+            changed.extend(new for old, new in zip(before, after) if old != new)
+    return changed, changed_years
+
+
+def _unjournaled(session: Session, region: str, records: list[DayRecord]) -> list[DayRecord]:
+    """
+    Дни, последняя запись журнала которых отличается от записи (или отсутствует).
+    """
+    if not records:
+        return []
+    latest = (
+        select(func.max(CalendarChange.id))
+        .where(
+            CalendarChange.region == region,
+            CalendarChange.date.in_([record.date for record in records]),
+        )
+        .group_by(CalendarChange.date)
+    )
+    journaled = {
+        day: (is_working, holiday_name, working_hours)
+        for day, is_working, holiday_name, working_hours in session.execute(
+            select(
+                CalendarChange.date, CalendarChange.is_working,
+                CalendarChange.holiday_name, CalendarChange.working_hours,
+            ).where(CalendarChange.id.in_(latest))
+        )
+    }
+    return [
+        record for record in records
+        if journaled.get(record.date) != (
+            record.is_working, record.holiday_name,
+            special_hours(record.is_working, record.working_hours),
+        )
+    ]
+
+
+def _journal(session: Session, records: list[DayRecord]) -> None:
+    """
+    Записывает дни в журнал изменений (в транзакции session).
+    """
+    if not records:
+        return
+    changed_at = utc_now()
+    session.connection().execute(insert(CalendarChange.__table__), [
+        {
+            'region': record.region,
+            'date': record.date,
+            'is_working': record.is_working,
+            'holiday_name': record.holiday_name,
+            'working_hours': special_hours(record.is_working, record.working_hours),
+            'changed_at': changed_at,
+        }
+        for record in records
+    ])
+
+
+def _switch(session: Session, region: str, version_id: int) -> None:
+    """
+    Переключает указатель региона на версию.
+    """
+    release = session.scalars(
+        select(CalendarRelease).where(CalendarRelease.region == region)
+    ).first()
+    if release is None:
+        session.add(CalendarRelease(region=region, version_id=version_id))
+    else:
+        release.version_id = version_id
+        release.released_at = utc_now()
+
+
+def publish_version(
+    region: str,
+    note: Optional[str] = None,
+    bind=None
+) -> int:
+    """
+    Публикует текущее состояние региона из `calendarday` как новую версию.
+
+    Если активная версия уже совпадает с `calendarday`, новая версия
+    не создаётся. Дни, которые публикация меняет для воркеров и которых
+    ещё нет в журнале изменений с этим значением (например, откатанные
+    дни), записываются в журнал в той же транзакции.
+
+    Returns:
+        int: номер активной версии.
+    """
+    with Session(bind or engine) as session:
+        snapshot = region_snapshot(session, region)
+        release = session.scalars(
+            select(CalendarRelease).where(CalendarRelease.region == region)
+        ).first()
+        previous, current = {}, CalendarIndex()
+        if release is not None:
+            active = session.get(CalendarVersion, release.version_id)
+            previous = json.loads(active.snapshot)['years']
+            if previous == snapshot['years']:
+                return active.id
+            current = CalendarIndex.from_years(_version_years(session, active.id, version_cache))
+        changed, _ = _diff_days(region, current, CalendarIndex.from_years(load_years(snapshot)))
+        _journal(session, _unjournaled(session, region, changed))
+        version = CalendarVersion(
+            region=region,
+            seq=session.scalar(select(func.max(CalendarChange.id))) or 0,
+            note=note,
+            snapshot=json.dumps(snapshot, ensure_ascii=False),
+        )
+        session.add(version)
+        session.flush()
+        _switch(session, region, version.id)
+        store_aggregates(session, [
+            calendar for calendar in load_years(snapshot)
+            if previous.get(str(calendar.year)) != snapshot['years'][str(calendar.year)]
+        ])
+        session.commit()
+        return version.id
+
+
+def activate_version(
+    region: str,
+    version_id: int,
+    bind=None,
+    cache: VersionCache = version_cache
+) -> int:
+    """
+    Переключает регион на версию `version_id` (откат или возврат вперёд).
+
+    Дни, отличающиеся между текущей и новой версией, записываются
+    в журнал изменений в той же транзакции; изменившиеся архивные
+    годы перезаписываются в архиве.
+
+    Returns:
+        int: число изменившихся дней.
+
+    Raises:
+        LookupError: если у региона нет такой версии.
+    """
+    with Session(bind or engine) as session:
+        version = session.get(CalendarVersion, version_id)
+        if version is None or version.region != region:
+            raise LookupError(f'Версия {version_id} региона {region} не найдена')
+        current = CalendarIndex.from_years(_active_years(session, region, cache))
+        target = CalendarIndex.from_years(_version_years(session, version_id, cache))
+        changes, changed_years = _diff_days(region, current, target)
+        _journal(session, changes)
+        store_aggregates(session, changed_years)
+        archived = set(session.scalars(
+            select(CalendarArchive.year).where(CalendarArchive.region == region)
+        ))
+        store_archive(session, [calendar for calendar in changed_years if calendar.year in archived])
+        _switch(session, region, version_id)
+        session.commit()
+    return len(changes)
+
+
+def list_versions(session: Session, region: str) -> list[tuple[CalendarVersion, bool]]:
+    """
+    Версии региона (новые первыми) и признак активной версии.
+    """
+    active = session.scalar(
+        select(CalendarRelease.version_id).where(CalendarRelease.region == region)
+    )
+    versions = session.scalars(
+        select(CalendarVersion)
+        .where(CalendarVersion.region == region)
+        .order_by(CalendarVersion.id.desc())
+    ).all()
+    return [(version, version.id == active) for version in versions]
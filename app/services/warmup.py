@@ -0,0 +1,121 @@
+"""
+Модуль app.services.warmup — прогрев воркера при старте.
+
+Сразу после миграций воркер ещё «холодный»: снимок календаря не загружен,
+записи лет не построены, соединения с БД не открыты. Прогрев выполняет
+эту работу до того, как балансировщик начнёт направлять на воркер трафик.
+
+Порядок прогрева:
+1. загрузка снимка календаря из БД и атомарная подмена в держателе
+   (если снимок уже актуален — например, загружен мастером
+   `python -m app.server` до fork, — он не перечитывается и остаётся
+   общей с мастером памятью copy-on-write);
+2. заполнение норм рабочего времени для лет снимка, у которых их ещё нет
+   (данные, загруженные до появления таблицы норм);
+3. проверка реплик для чтения (открывает соединения в пулах);
+4. построение записей для регионов CALENDAR_REGIONS и лет
+   «текущий ± WARMUP_YEARS»;
+5. отметка готовности — после неё `/ready` отвечает 200.
+
+Структура:
+- Readiness — признак готовности воркера;
+- readiness — признак готовности этого воркера;
+- warmup_years() — годы, которые прогреваются;
+- warmup() — выполнение прогрева.
+
+Пример использования:
+    await warmup(index_holder, settings.CALENDAR_REGIONS, warmup_years())
+    readiness.ready  # True
+"""
+
+import asyncio
+import time
+from datetime import date
+from typing import Iterable, Optional
+
+from app.core import main_logger, read_router, settings
+from app.core.replicas import ReadRouter
+from app.engine import IndexHolder
+from .aggregates import ensure_aggregates
+from .sync import latest_seq, load_index
+
+
+class Readiness:
+    """
+    Признак готовности воркера принимать трафик.
+
+    Attributes:
+        ready (bool): True после завершения прогрева.
+    """
+
+    def __init__(self) -> None:
+        self.ready = False
+
+    def mark_ready(self) -> None:
+        """
+        Отмечает воркер готовым.
+        """
+        self.ready = True
+
+    def reset(self) -> None:
+        """
+        Снимает готовность (при старте и при остановке воркера).
+        """
+        self.ready = False
+
+
+readiness = Readiness()
+"""Готовность этого воркера (отдаётся эндпоинтом `/ready`)."""
+
+
+def warmup_years(today: Optional[date] = None, span: Optional[int] = None) -> list[int]:
+    """
+    Годы для прогрева: текущий ± span (по умолчанию WARMUP_YEARS).
+    """
+    year = (today or date.today()).year
+    span = settings.WARMUP_YEARS if span is None else span
+    return list(range(year - span, year + span + 1))
+
+
+async def warmup(
+    holder: IndexHolder,
+    regions: Iterable[str],
+    years: Iterable[int],
+    bind=None,
+    state: Readiness = readiness,
+    router: Optional[ReadRouter] = read_router
+) -> None:
+    """
+    Прогревает воркер и отмечает его готовым.
+
+    Args:
+        holder (IndexHolder): держатель снимка календаря;
+        regions (Iterable[str]): регионы для прогрева;
+        years (Iterable[int]): годы для прогрева;
+        bind: движок SQLAlchemy (по умолчанию — get_read_engine() для чтения
+            и engine для записи норм);
+        state (Readiness): признак готовности, который нужно выставить;
+        router (ReadRouter | None): маршрутизатор чтения, реплики которого
+            проверяются (None — без проверки, например для тестовой БД).
+    """
+    started = time.monotonic()
+    index = holder.current
+    if not index.regions or index.version != await asyncio.to_thread(latest_seq, bind):
+        index = await asyncio.to_thread(load_index, bind)
+        holder.swap(index)
+    await asyncio.to_thread(ensure_aggregates, index, bind)
+    if router is not None and router.replicas:
+        await asyncio.to_thread(router.check)
+    years = list(years)
+    for region in regions:
+        missing = index.warm(region, years)
+        if missing:
+            main_logger.warning(
+                f'Прогрев: нет данных региона {region} за годы {missing} '
+                '(действует правило по умолчанию).'
+            )
+    state.mark_ready()
+    main_logger.info(
+        f'Прогрев завершён за {time.monotonic() - started:.2f} с '
+        f'(версия снимка {index.version}).'
+    )
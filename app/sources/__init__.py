@@ -0,0 +1,48 @@
+"""
+Модуль app.sources.__init__.py — адаптеры внешних источников календаря.
+
+Каждый источник умеет загрузить данные региона за год и привести их
+к единому виду — списку DayRecord на каждый день года.
+
+Доступные источники: xmlcalendar (XML), isdayoff (API),
+consultant (HTML‑страницы, разбор в пуле процессов).
+
+Экспортируемые объекты:
+- BaseSource — базовый класс адаптера;
+- SourceError — ошибка источника;
+- SOURCES — реестр источников по имени;
+- get_sources() — создание адаптеров по списку имён из настроек.
+
+Пример использования:
+    from app.sources import get_sources
+    sources = get_sources(settings.CALENDAR_SOURCES)
+
+Рекомендации:
+- при добавлении источника реализуйте url() и parse()
+  и зарегистрируйте класс в SOURCES.
+"""
+
+from .base import BaseSource, SourceError
+from .consultant import ConsultantSource
+from .isdayoff import IsDayOffSource
+from .xmlcalendar import XmlCalendarSource
+
+SOURCES = {
+    XmlCalendarSource.name: XmlCalendarSource,
+    IsDayOffSource.name: IsDayOffSource,
+    ConsultantSource.name: ConsultantSource,
+}
+"""Реестр источников: имя → класс адаптера."""
+
+
+def get_sources(names: list[str]) -> list[BaseSource]:
+    """
+    Создаёт адаптеры источников в порядке опроса.
+
+    Raises:
+        KeyError: если имя источника не зарегистрировано.
+    """
+    return [SOURCES[name]() for name in names]
+
+
+__all__ = ['BaseSource', 'SourceError', 'SOURCES', 'get_sources']
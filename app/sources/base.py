@@ -0,0 +1,132 @@
+"""
+Модуль app.sources.base — базовый адаптер внешнего источника календаря.
+
+Определяет общий интерфейс источников и нормализацию данных к полному
+списку дней года.
+
+Структура:
+- SourceError — ошибка получения или разбора данных источника;
+- BaseSource — базовый класс адаптера:
+  - url() — адрес данных региона за год;
+  - fetch_raw() — асинхронная загрузка «сырых» данных (сеть) с ограничением
+    частоты запросов и файловым кэшем ответов (см. app.sources.http);
+  - parse() — разбор и нормализация (чистая функция, без сети);
+  - fetch_year() — загрузка и разбор вместе;
+- expand_year() — достраивает исключения источника до полного года;
+- stage_timings — длительности этапов последней загрузки fetch_year()
+  в текущей задаче (секунды загрузки и разбора; для истории синхронизаций).
+
+Разделение загрузки и разбора позволяет кэшировать ответы и выносить
+разбор в отдельные процессы: источники с `offload_parse = True`
+(например, разбор HTML) выполняют parse() в пуле процессов.
+"""
+
+import time
+from contextvars import ContextVar
+from datetime import date
+from typing import Optional
+
+import httpx
+
+from app.engine import DayRecord
+from app.engine.index import default_is_working, year_dates
+from .http import fetch, get_cache, get_limiter
+from .pool import parse_in_pool
+
+
+stage_timings: ContextVar[Optional[dict[str, float]]] = ContextVar('stage_timings', default=None)
+"""
+Словарь, в который BaseSource.fetch_year() записывает длительности этапов
+'fetch' (сеть) и 'parse' (разбор), если вызывающий код его установил.
+"""
+
+
+class SourceError(Exception):
+    """
+    Ошибка получения или разбора данных внешнего источника.
+    """
+
+
+def expand_year(
+    region: str,
+    year: int,
+    overrides: dict[date, tuple]
+) -> list[DayRecord]:
+    """
+    Формирует записи обо всех днях года.
+
+    Args:
+        region (str): код региона;
+        year (int): год;
+        overrides (dict): отличия от пятидневки — дата → (рабочий, праздник)
+            или (рабочий, праздник, рабочих часов) для сокращённых дней.
+
+    Returns:
+        list[DayRecord]: записи обо всех днях года по порядку.
+    """
+    records = []
+    for day in year_dates(year):
+        records.append(DayRecord(region, day, *overrides.get(day, (default_is_working(day), None))))
+    return records
+
+
+class BaseSource:
+    """
+    Базовый адаптер внешнего источника календаря.
+
+    Attributes:
+        name (str): имя источника в настройках CALENDAR_SOURCES;
+        offload_parse (bool): выполнять parse() в пуле процессов
+            (для тяжёлого разбора, например HTML‑страниц).
+    """
+
+    name = 'base'
+    offload_parse = False
+
+    def url(self, region: str, year: int) -> str:
+        """
+        Возвращает адрес данных региона за год.
+        """
+        raise NotImplementedError
+
+    async def fetch_raw(self, client: httpx.AsyncClient, region: str, year: int) -> bytes:
+        """
+        Загружает «сырые» данные источника.
+
+        Запросы проходят через ограничитель частоты этого источника,
+        а ответы перепроверяются по кэшу (ETag/If-None-Match).
+
+        Raises:
+            httpx.HTTPError: при сетевой ошибке или неуспешном статусе ответа.
+        """
+        return await fetch(
+            client, self.url(region, year), get_limiter(self.name), get_cache()
+        )
+
+    def parse(self, raw: bytes, region: str, year: int) -> list[DayRecord]:
+        """
+        Разбирает «сырые» данные и возвращает записи обо всех днях года.
+
+        Raises:
+            SourceError: если данные не удалось разобрать.
+        """
+        raise NotImplementedError
+
+    async def fetch_year(self, client: httpx.AsyncClient, region: str, year: int) -> list[DayRecord]:
+        """
+        Загружает и нормализует данные региона за год.
+
+        Длительности загрузки и разбора записываются в stage_timings.
+        """
+        started = time.perf_counter()
+        raw = await self.fetch_raw(client, region, year)
+        fetched = time.perf_counter()
+        if self.offload_parse:
+            records = await parse_in_pool(self.parse, raw, region, year)
+        else:
+            records = self.parse(raw, region, year)
+        timings = stage_timings.get()
+        if timings is not None:
+            timings['fetch'] = fetched - started
+            timings['parse'] = time.perf_counter() - fetched
+        return records
@@ -0,0 +1,95 @@
+"""
+Модуль app.sources.consultant — адаптер веб‑страниц производственного
+календаря consultant.ru (скрапинг HTML).
+
+Страница года содержит 12 таблиц‑месяцев:
+
+    <table class="cal">
+      <tr><th class="month">Январь</th></tr>
+      <tr>
+        <td class="inactively">30</td>
+        <td class="holiday weekend">1</td>
+        <td class="preholiday">30*</td>
+        <td>9</td>
+      </tr>
+    </table>
+
+Классы ячеек:
+- inactively — день соседнего месяца (пропускается);
+- weekend / holiday — нерабочий день;
+- preholiday — сокращённый рабочий день (SHORT_DAY_HOURS часов);
+- без классов — рабочий день.
+
+Особенности:
+- страница большая, поэтому разбор выполняется в пуле процессов
+  (`offload_parse = True`);
+- парсится только содержимое таблиц календаря (SoupStrainer),
+  используется lxml, если он установлен, иначе встроенный html.parser;
+- источник публикует только российский календарь.
+"""
+
+import re
+from datetime import date
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from app.engine import SHORT_DAY_HOURS, DayRecord
+from .base import BaseSource, SourceError, expand_year
+
+# Парсер BeautifulSoup: lxml (быстрее), если установлен, иначе встроенный.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+NON_WORKING_CLASSES = frozenset({'weekend', 'holiday'})
+"""Классы ячеек нерабочих дней."""
+
+
+def parse_consultant_html(raw: bytes, region: str, year: int) -> list[DayRecord]:
+    """
+    Разбирает HTML‑страницу года в записи обо всех днях года.
+
+    Функция уровня модуля, чтобы её можно было выполнить в пуле процессов.
+
+    Raises:
+        SourceError: если на странице нет 12 таблиц‑месяцев или даты неверны.
+    """
+    soup = BeautifulSoup(raw, HTML_PARSER, parse_only=SoupStrainer('table', class_='cal'))
+    tables = soup.find_all('table', class_='cal')[:12]
+    if len(tables) != 12:
+        raise SourceError(f'На странице {region}/{year} найдено месяцев: {len(tables)}')
+    overrides = {}
+    try:
+        for month, table in enumerate(tables, start=1):
+            for cell in table.find_all('td'):
+                classes = set(cell.get('class', ()))
+                digits = re.sub(r'\D', '', cell.get_text())
+                if 'inactively' in classes or not digits:
+                    continue
+                overrides[date(year, month, int(digits))] = (
+                    not classes & NON_WORKING_CLASSES, None,
+                    SHORT_DAY_HOURS if 'preholiday' in classes else None
+                )
+    except ValueError as error:
+        raise SourceError(f'Некорректная дата на странице {region}/{year}: {error}') from error
+    return expand_year(region, year, overrides)
+
+
+class ConsultantSource(BaseSource):
+    """
+    Адаптер HTML‑страниц consultant.ru (только регион 'ru').
+    """
+
+    name = 'consultant'
+    base_url = 'https://www.consultant.ru/law/ref/calendar/proizvodstvennye'
+    offload_parse = True
+
+    def url(self, region: str, year: int) -> str:
+        if region != 'ru':
+            raise SourceError(f'consultant.ru не публикует календарь региона {region}')
+        return f'{self.base_url}/{year}/'
+
+    def parse(self, raw: bytes, region: str, year: int) -> list[DayRecord]:
+        return parse_consultant_html(raw, region, year)
@@ -0,0 +1,226 @@
+"""
+Модуль app.sources.http — слой загрузки данных внешних источников.
+
+Назначение:
+- не превышать квоты провайдеров: у каждого источника свой ограничитель
+  запросов (token bucket);
+- не скачивать неизменившиеся данные повторно: ответы хранятся на диске
+  (в data/) и перепроверяются у провайдера через ETag/If-None-Match
+  (и Last-Modified/If-Modified-Since); неизменившийся год стоит ответа 304.
+
+Структура:
+- TokenBucket — асинхронный ограничитель частоты запросов;
+- ResponseCache — файловый кэш ответов с валидаторами;
+- get_limiter() — ограничитель источника (создаётся по настройкам);
+- reset_limiters() — сброс ограничителей после перезагрузки настроек;
+- fetch() — GET с ограничением частоты и условной перепроверкой кэша.
+
+Настройки:
+- SOURCE_RATE_LIMIT, SOURCE_BURST — запросов в секунду и размер «пачки»
+  по умолчанию; SOURCE_RATE_LIMITS — отдельные лимиты по именам источников;
+- HTTP_CACHE_ENABLED, HTTP_CACHE_DIR — файловый кэш ответов.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import httpx
+
+from app.core import settings
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты запросов «ведро с токенами».
+
+    Ведро вмещает `capacity` токенов и пополняется со скоростью `rate`
+    токенов в секунду; каждый запрос забирает один токен или ждёт его.
+
+    Attributes:
+        rate (float): скорость пополнения, токенов в секунду;
+        capacity (float): максимальное число токенов (допустимая «пачка»).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Raises:
+            ValueError: если rate не положительна или capacity меньше 1
+                (запрос ждал бы токена бесконечно).
+        """
+        if not rate > 0:
+            raise ValueError(f'Скорость пополнения должна быть положительной: {rate}')
+        if not capacity >= 1:
+            raise ValueError(f'Ёмкость ведра должна быть не меньше 1: {capacity}')
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """
+        Добавляет токены, накопившиеся с последнего обновления.
+        """
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """
+        Забирает токен, при необходимости дожидаясь пополнения.
+
+        Ожидающие обслуживаются по очереди (под блокировкой).
+        """
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """
+        Запрещает запросы на указанное время (например, по Retry-After).
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 0) - seconds * self.rate
+
+
+class ResponseCache:
+    """
+    Файловый кэш ответов внешних источников.
+
+    Для каждого URL хранятся тело ответа (`<ключ>.body`) и валидаторы
+    (`<ключ>.json`: ETag, Last-Modified). Файлы записываются атомарно
+    через временный файл и os.replace.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / f'{key}.body', self.directory / f'{key}.json'
+
+    def get(self, url: str) -> Optional[tuple[dict, bytes]]:
+        """
+        Возвращает (валидаторы, тело) для URL или None, если записи нет.
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            return meta, body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url: str, meta: dict, body: bytes) -> None:
+        """
+        Сохраняет тело ответа и его валидаторы.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        for path, data in ((body_path, body), (meta_path, json.dumps(meta).encode('utf-8'))):
+            tmp_path = path.with_suffix(f'{path.suffix}.{os.getpid()}.tmp')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+
+
+_limiters: dict[str, TokenBucket] = {}
+
+
+def get_limiter(source: str) -> TokenBucket:
+    """
+    Возвращает ограничитель запросов источника (один на процесс).
+
+    Лимит берётся из SOURCE_RATE_LIMITS[source] или SOURCE_RATE_LIMIT.
+    """
+    limiter = _limiters.get(source)
+    if limiter is None:
+        rate = settings.SOURCE_RATE_LIMITS.get(source, settings.SOURCE_RATE_LIMIT)
+        limiter = _limiters[source] = TokenBucket(rate, settings.SOURCE_BURST)
+    return limiter
+
+
+def reset_limiters() -> None:
+    """
+    Сбрасывает ограничители запросов: следующие запросы создадут их
+    с текущими SOURCE_RATE_LIMIT, SOURCE_BURST, SOURCE_RATE_LIMITS.
+    """
+    _limiters.clear()
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """
+    Возвращает файловый кэш ответов или None, если он отключён.
+    """
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+    return ResponseCache(settings.HTTP_CACHE_DIR)
+
+
+def retry_after(response: httpx.Response) -> float:
+    """
+    Длительность паузы из заголовка Retry-After (секунды; по умолчанию 60).
+    """
+    try:
+        return float(response.headers.get('Retry-After', 60))
+    except ValueError:
+        return 60.0
+
+
+async def fetch(
+    client: httpx.AsyncClient,
+    url: str,
+    limiter: Optional[TokenBucket] = None,
+    cache: Optional[ResponseCache] = None
+) -> bytes:
+    """
+    Загружает URL с ограничением частоты и перепроверкой кэша.
+
+    Порядок работы:
+    1. ждёт токен ограничителя источника;
+    2. если ответ есть в кэше — отправляет If-None-Match/If-Modified-Since;
+    3. на 304 возвращает тело из кэша, на 200 — сохраняет новое тело
+       (если у ответа есть валидаторы);
+    4. на 429 приостанавливает ограничитель на Retry-After.
+
+    Raises:
+        httpx.HTTPError: при сетевой ошибке или неуспешном статусе ответа.
+    """
+    cached = cache.get(url) if cache is not None else None
+    headers = {}
+    if cached is not None:
+        meta, _ = cached
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    if limiter is not None:
+        await limiter.acquire()
+    response = await client.get(url, headers=headers)
+
+    if response.status_code == 304 and cached is not None:
+        return cached[1]
+    if response.status_code == 429 and limiter is not None:
+        limiter.pause(retry_after(response))
+    response.raise_for_status()
+
+    meta = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    if cache is not None and (meta['etag'] or meta['last_modified']):
+        cache.put(url, meta, response.content)
+    return response.content
@@ -0,0 +1,46 @@
+"""
+Модуль app.sources.isdayoff — адаптер источника isdayoff.ru.
+
+Источник возвращает строку из цифр — по одной на каждый день года:
+- 0 — рабочий день;
+- 1 — нерабочий день;
+- 2 — сокращённый рабочий день (при параметре pre=1), SHORT_DAY_HOURS часов;
+- 4 — рабочий день (особые режимы).
+
+Названий праздников источник не передаёт.
+"""
+
+from app.engine import SHORT_DAY_HOURS, DayRecord
+from app.engine.index import year_dates
+from .base import BaseSource, SourceError
+
+WORKING_CODES = frozenset('024')
+"""Коды дней, которые считаются рабочими."""
+
+SHORT_CODE = '2'
+"""Код сокращённого предпраздничного дня."""
+
+
+class IsDayOffSource(BaseSource):
+    """
+    Адаптер isdayoff.ru (резервный источник без названий праздников).
+    """
+
+    name = 'isdayoff'
+    base_url = 'https://isdayoff.ru/api'
+
+    def url(self, region: str, year: int) -> str:
+        return f'{self.base_url}/getdata?year={year}&cc={region}&pre=1'
+
+    def parse(self, raw: bytes, region: str, year: int) -> list[DayRecord]:
+        codes = raw.decode('ascii', errors='replace').strip()
+        days = year_dates(year)
+        if len(codes) != len(days) or not set(codes) <= set('0124'):
+            raise SourceError(f'Некорректный ответ isdayoff для {region}/{year}: {codes[:20]!r}')
+        return [
+            DayRecord(
+                region, day, code in WORKING_CODES, None,
+                SHORT_DAY_HOURS if code == SHORT_CODE else None
+            )
+            for day, code in zip(days, codes)
+        ]
@@ -0,0 +1,64 @@
+"""
+Модуль app.sources.pool — пул процессов для разбора данных источников.
+
+Разбор больших HTML‑страниц — CPU‑задача: в потоке цикла событий он
+блокировал бы обработку запросов, а в пуле потоков упирался бы в GIL.
+Поэтому тяжёлый разбор выполняется в отдельных процессах.
+
+Функции:
+- get_parse_pool() — общий ProcessPoolExecutor (создаётся при первом вызове);
+- parse_in_pool() — асинхронный вызов функции разбора в пуле;
+- shutdown_parse_pool() — остановка пула при завершении приложения.
+
+Количество процессов задаётся PARSE_WORKERS (по умолчанию — число ядер).
+Процессы создаются через forkserver (или spawn), а не fork: форк процесса
+с работающими потоками может унаследовать захваченные блокировки.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from app.core import settings
+
+T = TypeVar('T')
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Возвращает общий пул процессов разбора, создавая его при первом вызове.
+    """
+    global _pool
+    if _pool is None:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.PARSE_WORKERS or os.cpu_count(),
+            mp_context=context
+        )
+    return _pool
+
+
+async def parse_in_pool(func: Callable[..., T], *args) -> T:
+    """
+    Выполняет функцию разбора в пуле процессов, не блокируя цикл событий.
+
+    Функция и аргументы должны сериализоваться через pickle
+    (функции уровня модуля, экземпляры простых классов, bytes).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_parse_pool(), func, *args)
+
+
+def shutdown_parse_pool() -> None:
+    """
+    Останавливает пул процессов, если он был создан.
+    """
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
@@ -0,0 +1,68 @@
+"""
+Модуль app.sources.xmlcalendar — адаптер источника xmlcalendar.ru.
+
+Источник публикует производственный календарь в XML‑формате:
+
+    <calendar year="2025" lang="ru" country="ru">
+      <holidays>
+        <holiday id="1" title="Новогодние каникулы"/>
+      </holidays>
+      <days>
+        <day d="01.01" t="1" h="1"/>
+        <day d="04.30" t="2"/>
+        <day d="11.01" t="3" f="01.05"/>
+      </days>
+    </calendar>
+
+Атрибуты дня:
+- d — дата в формате ММ.ДД;
+- t — тип: 1 — выходной/праздник, 2 — сокращённый рабочий (SHORT_DAY_HOURS часов),
+  3 — рабочий (перенос);
+- h — идентификатор праздника из секции holidays.
+"""
+
+from datetime import date
+from xml.etree import ElementTree
+
+from app.engine import SHORT_DAY_HOURS, DayRecord
+from .base import BaseSource, SourceError, expand_year
+
+
+def parse_calendar_xml(raw: bytes, region: str, year: int) -> list[DayRecord]:
+    """
+    Разбирает XML производственного календаря в записи обо всех днях года.
+
+    Raises:
+        SourceError: если XML некорректен или содержит неверные даты.
+    """
+    try:
+        root = ElementTree.fromstring(raw)
+        titles = {
+            holiday.get('id'): holiday.get('title', '').split(' (')[0][:200]
+            for holiday in root.iter('holiday')
+        }
+        overrides = {}
+        for day in root.iter('day'):
+            month, day_of_month = (int(part) for part in day.get('d').split('.'))
+            overrides[date(year, month, day_of_month)] = (
+                day.get('t') != '1', titles.get(day.get('h')) or None,
+                SHORT_DAY_HOURS if day.get('t') == '2' else None
+            )
+    except (ElementTree.ParseError, AttributeError, ValueError) as error:
+        raise SourceError(f'Некорректный XML календаря {region}/{year}: {error}') from error
+    return expand_year(region, year, overrides)
+
+
+class XmlCalendarSource(BaseSource):
+    """
+    Адаптер xmlcalendar.ru (XML‑формат с названиями праздников).
+    """
+
+    name = 'xmlcalendar'
+    base_url = 'https://xmlcalendar.ru/data'
+
+    def url(self, region: str, year: int) -> str:
+        return f'{self.base_url}/{region}/{year}/calendar.xml'
+
+    def parse(self, raw: bytes, region: str, year: int) -> list[DayRecord]:
+        return parse_calendar_xml(raw, region, year)
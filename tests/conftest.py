@@ -9,9 +9,11 @@
 
 Ключевые возможности:
 1. **HTTP‑тестирование**: фикстура `test_client` создаёт изолированный `TestClient`, имитирующий запросы к FastAPI‑приложению с тестовым `lifespan`.
-2. **Тестовая БД**: фикстура `test_db_engine` настраивает SQLite в памяти, применяет миграции и очищает соединения после сессии.
-3. **Жизненный цикл БД**: `test_lifespan` управляет инициализацией (импорт моделей, миграции) и логированием старта/остановки.
-4. **Глобальный клиент**: экспортируемый `client` позволяет простые тесты без сложной настройки (с оговоркой на отсутствие изоляции БД).
+2. **Шаблон БД**: миграции применяются один раз за сессию к шаблонной БД SQLite в памяти (`template_engine`); каждая тестовая БД — её копия через SQLite backup API (`clone_database`), что на порядки быстрее повторного прогона миграций.
+3. **Тестовая БД**: фикстура `test_db_engine` — общая для сессии копия шаблона (её же видят маршруты `test_client`); `migrated_engine` — отдельная копия на каждый тест.
+4. **Кэш версий**: автоматическая фикстура `clear_version_cache` очищает кэш разобранных версий календаря перед каждым тестом (номера версий в разных тестовых БД совпадают).
+5. **Синтетические данные**: `seeded_engine` — копия шаблона, заполненного набором `tests.datasets.SEEDED_YEARS` (заполняется один раз за сессию).
+6. **Глобальный клиент**: экспортируемый `client` — маршруты API без `lifespan` и без БД (для простых тестов интерфейса).
 
 Используемые технологии:
 - FastAPI + `TestClient` для HTTP‑тестов.
@@ -21,46 +23,136 @@
 - асинхронные контекстные менеджеры (`@asynccontextmanager`) для `lifespan`.
 
 Рекомендации по использованию:
-- Для тестов с БД используйте `test_db_engine` и `test_client`.
+- Для тестов, которые пишут в БД, используйте `migrated_engine` (пустая схема) или `seeded_engine` (синтетический календарь).
+- Для HTTP‑тестов используйте `test_client` (БД — `test_db_engine`).
 - Для простых HTTP‑тестов без БД можно использовать глобальный `client`.
 - Добавляйте новые фикстуры в этот модуль для повторного использования.
 
 Ограничения и примечания:
-- Глобальный `client` не изолирует БД — используйте осторожно.
+- Глобальный `client` не подключён к БД — маршруты, читающие БД, через него не проверяются.
 - Все фикстуры с `scope="session"` экономят время, но требуют корректной очистки.
-- Замените `print()` на `logger` для структурированного вывода.
 - SQLite в памяти обеспечивает скорость, но не поддерживает все функции реальных БД.
 """
 
 
+import sqlite3
+
 import pytest
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core import get_session, get_write_session, run_migrations
+from app.routes import router
+from app.services.sync import save_days
+from app.services.versions import version_cache
+from .datasets import seeded_records
+
+# Основной клиент: маршруты API без lifespan (миграции рабочей БД
+# и фоновое обновление не запускаются) и без тестовой БД.
+api_app = FastAPI()
+api_app.include_router(router)
+client = TestClient(api_app)
 
-from app import app, Base
-from app.core import run_migrations
+TEST_DATABASE_URL = "sqlite:///:memory:"
 
-# Основной клиент (без изоляции БД — использовать осторожно)
-client = TestClient(app)
 
-# Тестовая БД в памяти
-TEST_DATABASE_URL = "sqlite:///:memory:"
-test_engine = create_engine(TEST_DATABASE_URL)
+def create_test_engine() -> Engine:
+    """
+    Создаёт движок пустой БД SQLite в памяти.
 
-@asynccontextmanager
-async def test_lifespan(app):
+    Одно соединение на все потоки: lifespan и обработчики TestClient
+    выполняются в другом потоке и должны видеть ту же БД.
+    """
+    return create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+
+def clone_database(source: Engine, target: Engine) -> Engine:
+    """
+    Копирует БД source в target через SQLite backup API.
+
+    Копия постраничная и не выполняет SQL, поэтому занимает доли
+    миллисекунды для схемы и небольших наборов данных.
+
+    Returns:
+        Engine: target с копией данных source.
+    """
+    source_connection = source.raw_connection()
+    target_connection = target.raw_connection()
+    try:
+        source_driver = source_connection.driver_connection
+        target_driver = target_connection.driver_connection
+        assert isinstance(source_driver, sqlite3.Connection)
+        source_driver.backup(target_driver)
+    finally:
+        target_connection.close()
+        source_connection.close()
+    return target
+
+
+# Тестовая БД маршрутов test_client (копия шаблона на всю сессию).
+test_engine = create_test_engine()
+
+
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    """
+    Очищает кэш разобранных версий календаря перед каждым тестом.
+
+    Кэш воркера привязан к номерам версий одной БД, а каждая копия
+    шаблона нумерует версии заново.
+    """
+    version_cache.clear()
+    yield
+
+
+@pytest.fixture(scope="session")
+def template_engine():
+    """
+    Шаблонная БД: миграции Alembic применяются к ней один раз за сессию.
+
+    Тесты не пишут в шаблон напрямую — они получают его копии.
+
+    Yields:
+        Engine: движок шаблонной БД с актуальной схемой.
+    """
+    engine = create_test_engine()
+    run_migrations(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def seeded_template(template_engine):
+    """
+    Шаблон, заполненный синтетическим календарём (tests.datasets.SEEDED_YEARS).
+
+    Yields:
+        Engine: движок шаблона с данными.
     """
-    Обеспечивает корректную инициализацию и очистку ресурсов в тестовой среде.
+    engine = clone_database(template_engine, create_test_engine())
+    save_days(seeded_records(), engine)
+    yield engine
+    engine.dispose()
 
-    Выполняет следующие действия:
-    1. Импортирует SQLAlchemy‑модели (необходимо для корректной работы Alembic).
-    2. Запускает миграции Alembic через `run_migrations()` для подготовки схемы тестовой БД.
-    3. Передаёт управление приложению (`yield`) до его завершения.
 
-    Предназначен для использования как параметр `lifespan` в `FastAPI()` при тестировании.
+@asynccontextmanager
+async def test_lifespan(app):
+    """
+    Жизненный цикл тестового приложения.
 
+    Схема тестовой БД уже скопирована из шаблона фикстурой `test_db_engine`,
+    поэтому здесь только передаётся управление приложению (`yield`).
+    Рабочий lifespan (миграции файловой БД, прогрев, фоновое обновление)
+    в тестах не запускается.
 
     Args:
         app (FastAPI): приложение, для которого управляется жизненный цикл.
@@ -68,25 +160,48 @@ async def test_lifespan(app):
     Yields:
         None: управление приложением на время его активной работы.
     """
-    import app.models.calendar
-    print("Запуск миграций Alembic...") # заменить на logger
-    run_migrations(test_engine)
-    print("Миграции применены.") # заменить на logger
     yield
-    print("Приложение завершает работу.") # заменить на logger
+
+
+def get_test_session():
+    """
+    Замена зависимости `get_session`: сессия тестовой БД на время запроса.
+    """
+    with Session(test_engine) as session:
+        yield session
 
 
 @pytest.fixture(scope="session")
-def test_client():
+def test_db_engine(template_engine):
+    """
+    Общая для сессии тестовая БД — копия мигрированного шаблона.
+
+    Её же используют маршруты `test_client`. После завершения всех тестов
+    соединение закрывается (`dispose()`).
+
+    Yields:
+        Engine: экземпляр движка SQLAlchemy, указывающий на тестовую БД.
+    """
+    clone_database(template_engine, test_engine)
+    yield test_engine
+    test_engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def test_client(test_db_engine):
     """
     Предоставляет изолированный тестовый HTTP‑клиент на всю сессию pytest.
 
     Порядок инициализации:
     1. Создаёт новое FastAPI‑приложение (`test_app`) с тестовым обработчиком жизненного цикла (`test_lifespan`).
-    2. Подключает основной роутер приложения (`app.router`), обеспечивая доступность всех эндпоинтов.
-    3. Обертывает приложение в `TestClient` из `fastapi.testclient` для симуляции HTTP‑взаимодействия.
-    4. Предоставляет клиент в качестве ресурса для тестов через `yield`.
-    5. Автоматически закрывает клиент по выходу из контекста (`with`).
+    2. Подключает объединённый роутер `app.routes.router`, обеспечивая доступность всех эндпоинтов.
+       (`app.router` не используется: вместе с ним подключился бы рабочий `lifespan`
+       с миграциями файловой БД и фоновым обновлением из внешних источников.)
+    3. Подменяет зависимости `get_session` и `get_write_session`, чтобы маршруты работали с тестовой БД
+       (`test_db_engine` — копия мигрированного шаблона).
+    4. Обертывает приложение в `TestClient` из `fastapi.testclient` для симуляции HTTP‑взаимодействия.
+    5. Предоставляет клиент в качестве ресурса для тестов через `yield`.
+    6. Автоматически закрывает клиент по выходу из контекста (`with`).
 
     Использование: внедряется в тестовые функции как аргумент для выполнения HTTP‑запросов.
 
@@ -94,31 +209,40 @@ def test_client():
         TestClient: экземпляр тестового клиента FastAPI.
     """
     test_app = FastAPI(lifespan=test_lifespan)
-    test_app.include_router(app.router)
+    test_app.include_router(router)
+    test_app.dependency_overrides[get_session] = get_test_session
+    test_app.dependency_overrides[get_write_session] = get_test_session
 
     with TestClient(test_app) as client:
         yield client
 
 
-@pytest.fixture(scope="session")
-def test_db_engine():
+@pytest.fixture
+def migrated_engine(template_engine):
     """
-    Обеспечивает изолированную тестовую среду БД для всей сессии pytest.
-
-    Порядок действий:
-    1. Создаёт все необходимые таблицы в тестовой БД на основе метаданных SQLAlchemy (`Base.metadata`).
-    2. Применяет все pending-миграции через функцию `run_migrations()`.
-    3. Предоставляет готовый к использованию тестовый движок (`test_engine`) в качестве ресурса для тестов.
-    4. После завершения всех тестов в сессии корректно закрывает соединение (`dispose()`).
+    Предоставляет отдельную мигрированную БД SQLite в памяти для одного теста.
 
-    Использование: внедряется в тестовые функции как аргумент.
+    БД — копия шаблона (миграции не выполняются повторно). Используется
+    тестами, которые записывают данные календаря и не должны влиять
+    друг на друга.
 
     Yields:
-        Engine: экземпляр движка SQLAlchemy, указывающий на тестовую БД.
+        Engine: движок SQLAlchemy с применённой схемой.
     """
-    Base.metadata.create_all(test_engine)
-    run_migrations(test_engine)
-    yield test_engine
-    test_engine.dispose()
+    engine = clone_database(template_engine, create_test_engine())
+    yield engine
+    engine.dispose()
 
 
+@pytest.fixture
+def seeded_engine(seeded_template):
+    """
+    Отдельная БД для одного теста с синтетическим календарём
+    (tests.datasets.SEEDED_YEARS).
+
+    Yields:
+        Engine: движок SQLAlchemy с применённой схемой и данными.
+    """
+    engine = clone_database(seeded_template, create_test_engine())
+    yield engine
+    engine.dispose()
@@ -0,0 +1,83 @@
+"""
+Модуль tests.datasets — синтетические наборы данных календаря для тестов.
+
+Наборы детерминированы (генератор случайных чисел с фиксированным seed),
+поэтому тесты воспроизводимы, а данные похожи на настоящие:
+новогодние каникулы, праздники с названиями, переносы выходных
+(рабочая суббота и выходной понедельник) и сокращённые предпраздничные дни.
+
+Структура:
+- synthetic_overrides() — отличия года от пятидневки в формате expand_year();
+- synthetic_year() — записи обо всех днях года;
+- SEEDED_YEARS — регионы и годы набора, которым заполняется шаблон
+  тестовой БД `seeded_engine`;
+- seeded_records() — все записи этого набора.
+
+Пример использования:
+    records = synthetic_year('ru', 2025)
+    save_days(records, migrated_engine)
+"""
+
+import random
+from datetime import date, timedelta
+
+from app.engine import SHORT_DAY_HOURS, DayRecord
+from app.engine.index import default_is_working
+from app.sources.base import expand_year
+
+SEEDED_YEARS = {'ru': (2024, 2025, 2026), 'kz': (2025,)}
+"""Регионы и годы набора, которым заполнен шаблон `seeded_engine`."""
+
+
+def synthetic_overrides(region: str, year: int, seed: int = 0) -> dict[date, tuple]:
+    """
+    Отличия синтетического года от пятидневки.
+
+    Args:
+        region (str): код региона (влияет на выбор дат);
+        year (int): год;
+        seed (int): дополнительное зерно генератора.
+
+    Returns:
+        dict: дата → (рабочий, праздник) или (рабочий, праздник, часов).
+    """
+    rng = random.Random(f'{region}:{year}:{seed}')
+    overrides = {
+        date(year, 1, day): (False, 'Новогодние каникулы') for day in range(1, 9)
+    }
+    weekdays = [
+        day for day in (date(year, 2, 1) + timedelta(days=offset) for offset in range(300))
+        if default_is_working(day)
+    ]
+    for number, day in enumerate(sorted(rng.sample(weekdays, 6)), start=1):
+        overrides[day] = (False, f'Праздник {number}')
+        previous = day - timedelta(days=1)
+        if default_is_working(previous) and previous not in overrides:
+            overrides[previous] = (True, None, SHORT_DAY_HOURS)
+    saturdays = [
+        day for day in (date(year, 3, 1) + timedelta(days=offset) for offset in range(270))
+        if day.weekday() == 5 and day + timedelta(days=2) not in overrides
+    ]
+    for saturday in rng.sample(saturdays, 2):
+        overrides[saturday] = (True, None)
+        overrides[saturday + timedelta(days=2)] = (False, None)
+    return overrides
+
+
+def synthetic_year(region: str, year: int, seed: int = 0) -> list[DayRecord]:
+    """
+    Записи обо всех днях синтетического года.
+    """
+    return expand_year(region, year, synthetic_overrides(region, year, seed))
+
+
+def seeded_records() -> list[DayRecord]:
+    """
+    Все записи набора SEEDED_YEARS.
+    """
+    return [
+        record
+        for region, years in SEEDED_YEARS.items()
+        for year in years
+        for record in synthetic_year(region, year)
+    ]
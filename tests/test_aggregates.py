@@ -0,0 +1,141 @@
+"""
+Модуль tests.test_aggregates — тесты норм рабочего времени по периодам.
+
+Проверяет:
+- подсчёт норм месяцев, кварталов и года (с сокращёнными днями);
+- инкрементальный пересчёт при записи дней, публикации и откате версии;
+- заполнение недостающих лет по снимку;
+- маршруты `/aggregates/...`.
+"""
+
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.engine import DayRecord, YearCalendar
+from app.models import CalendarAggregate
+from app.services import (
+    activate_version, bulk_save_days, ensure_aggregates, load_index, publish_version,
+    read_aggregates
+)
+from app.services.aggregates import period_totals
+from app.services.sync import save_days
+from app.sources.base import expand_year
+
+JANUARY = {date(2025, 1, day): (False, 'Новогодние каникулы') for day in range(1, 9)}
+SHORT_DAY = {date(2025, 3, 7): (True, None, 7)}
+
+
+def norm(bind, region, year, period, number):
+    """
+    Строка нормы периода из таблицы.
+    """
+    with Session(bind) as session:
+        [row] = read_aggregates(session, region, year, period, number)
+        return row.working_days, row.non_working_days, row.working_hours
+
+
+class TestPeriodTotals:
+    """
+    Тесты подсчёта норм по календарю года.
+    """
+
+    def test_months_quarters_and_year(self):
+        """
+        Праздники и сокращённый день учитываются; кварталы и год — суммы месяцев.
+        """
+        calendar = YearCalendar('ru', 2025, expand_year('ru', 2025, {**JANUARY, **SHORT_DAY}))
+        totals = {(row['period'], row['number']): row for row in period_totals(calendar)}
+        assert len(totals) == 17
+        january = totals[('month', 1)]
+        assert (january['working_days'], january['non_working_days']) == (17, 14)
+        assert january['working_hours'] == 136
+        assert totals[('month', 3)]['working_hours'] == 21 * 8 - 1
+        quarter = totals[('quarter', 1)]
+        assert quarter['working_days'] == sum(totals[('month', month)]['working_days'] for month in (1, 2, 3))
+        year = totals[('year', 1)]
+        assert year['working_days'] + year['non_working_days'] == 365
+
+
+class TestAggregateMaintenance:
+    """
+    Тесты пересчёта норм при изменениях календаря.
+    """
+
+    def test_save_days_updates_touched_year(self, migrated_engine):
+        """
+        Запись дней пересчитывает нормы их года в той же транзакции.
+        """
+        save_days(expand_year('ru', 2025, JANUARY), migrated_engine)
+        assert norm(migrated_engine, 'ru', 2025, 'month', 1) == (17, 14, 136)
+        save_days([DayRecord('ru', date(2025, 1, 9), False, 'Перенос')], migrated_engine)
+        assert norm(migrated_engine, 'ru', 2025, 'month', 1) == (16, 15, 128)
+        assert norm(migrated_engine, 'ru', 2025, 'quarter', 1)[0] == 16 + 20 + 21
+        with Session(migrated_engine) as session:
+            assert session.scalar(select(func.count()).select_from(CalendarAggregate)) == 17
+
+    def test_bulk_save_days_updates_touched_years(self, migrated_engine):
+        """
+        Пакетная запись (загрузчик файлов) тоже пересчитывает нормы.
+        """
+        bulk_save_days(expand_year('kz', 2024, {}) + expand_year('kz', 2025, JANUARY), migrated_engine)
+        assert norm(migrated_engine, 'kz', 2025, 'month', 1)[0] == 17
+        assert norm(migrated_engine, 'kz', 2024, 'year', 1)[0] == 262
+
+    def test_versions_drive_released_region(self, migrated_engine):
+        """
+        У опубликованного региона нормы следуют активной версии, включая откат.
+        """
+        save_days(expand_year('ru', 2025, {}), migrated_engine)
+        first = publish_version('ru', bind=migrated_engine)
+        save_days([DayRecord('ru', date(2025, 5, 5), False, 'Ошибка')], migrated_engine)
+        assert norm(migrated_engine, 'ru', 2025, 'month', 5)[0] == 22
+        publish_version('ru', bind=migrated_engine)
+        assert norm(migrated_engine, 'ru', 2025, 'month', 5)[0] == 21
+        activate_version('ru', first, migrated_engine)
+        assert norm(migrated_engine, 'ru', 2025, 'month', 5)[0] == 22
+
+    def test_ensure_fills_missing_years(self, migrated_engine):
+        """
+        Годы снимка без норм заполняются; повторный вызов ничего не делает.
+        """
+        save_days(expand_year('ru', 2025, JANUARY), migrated_engine)
+        with Session(migrated_engine) as session:
+            session.query(CalendarAggregate).delete()
+            session.commit()
+        index = load_index(migrated_engine)
+        assert ensure_aggregates(index, migrated_engine) == 1
+        assert ensure_aggregates(index, migrated_engine) == 0
+        assert norm(migrated_engine, 'ru', 2025, 'month', 1) == (17, 14, 136)
+
+
+class TestAggregateRoutes:
+    """
+    Тесты маршрутов `/aggregates/...`.
+    """
+
+    def test_period_and_year(self, test_client):
+        """
+        Норма месяца, фильтр по виду периода и 404 для несуществующего номера.
+        """
+        response = test_client.get('/aggregates/zz/2025/month/5')
+        assert response.status_code == 200
+        body = response.json()
+        assert body['working_days'] + body['non_working_days'] == 31
+        assert body['working_hours'] == body['working_days'] * 8
+
+        quarters = test_client.get('/aggregates/zz/2025', params={'period': 'quarter'}).json()
+        assert [row['number'] for row in quarters] == [1, 2, 3, 4]
+        assert test_client.get('/aggregates/zz/2025/month/13').status_code == 404
+        assert test_client.get('/aggregates/zz/2025/week/1').status_code == 422
+
+    def test_last_supported_year(self, test_client):
+        """
+        Нормы 9999 года считаются; год за пределами дат — 422, а не 500.
+        """
+        response = test_client.get('/aggregates/zz/9999/month/12')
+        assert response.status_code == 200
+        assert response.json()['working_days'] + response.json()['non_working_days'] == 31
+        assert len(test_client.get('/aggregates/zz/9999').json()) == 17
+        assert test_client.get('/aggregates/zz/10000').status_code == 422
@@ -0,0 +1,164 @@
+"""
+Модуль tests.test_archive — тесты архива давних лет.
+
+Проверяет:
+- упаковку года в блоб и обратно (флаги, праздники, сокращённые дни);
+- ленивый разбор архивных лет снимком и LRU‑кэш;
+- перенос лет старше горизонта из `calendarday` без изменения ответов;
+- запись дней в архивный год: сравнение с архивом и наложение строк;
+- перезапись архива при откате версии.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.engine import (
+    ArchiveCache, ArchiveStore, CalendarIndex, DayRecord, YearCalendar, decode_year, encode_year
+)
+from app.models import CalendarArchive, CalendarDay
+from app.services import activate_version, archive_years, latest_seq, load_index, publish_version
+from app.services.archive import archive_horizon
+from app.services.sync import save_days
+from .datasets import synthetic_year
+
+OLD = 2005
+RECENT = 2025
+
+
+def calendar_of(records: list[DayRecord]) -> YearCalendar:
+    """
+    Календарь года из записей синтетического набора.
+    """
+    return YearCalendar(records[0].region, records[0].date.year, records)
+
+
+class TestArchiveFormat:
+    """
+    Тесты формата блоба и кэша.
+    """
+
+    def test_roundtrip(self):
+        """
+        Разобранный год совпадает с исходным, а блоб занимает сотни байт.
+        """
+        calendar = calendar_of(synthetic_year('ru', OLD))
+        calendar.hours[date(OLD, 12, 30)] = 7
+        blob = encode_year(calendar)
+        restored = decode_year('ru', OLD, blob)
+
+        assert restored.flags == calendar.flags
+        assert restored.holidays == calendar.holidays
+        assert restored.hours == calendar.hours
+        assert restored.records() == calendar.records()
+        assert len(blob) < 300
+
+    def test_corrupted_blob(self):
+        """
+        Повреждённый блоб и неизвестный формат — ValueError.
+        """
+        with pytest.raises(ValueError):
+            decode_year('ru', OLD, b'not zlib')
+        with pytest.raises(ValueError):
+            decode_year('ru', OLD, encode_year(calendar_of(synthetic_year('ru', OLD)))[:-4])
+
+    def test_lazy_decoding_and_lru(self):
+        """
+        Снимок разбирает архивный год при первом обращении; кэш ограничен.
+        """
+        cache = ArchiveCache(size=1)
+        store = ArchiveStore({
+            ('ru', year): encode_year(calendar_of(synthetic_year('ru', year)))
+            for year in (2004, OLD)
+        }, cache)
+        recent = calendar_of(synthetic_year('ru', RECENT))
+        index = CalendarIndex.from_years([recent], archive=store)
+
+        assert index.years('ru') == [2004, OLD, RECENT]
+        assert len(cache) == 0
+        expected = CalendarIndex(synthetic_year('ru', OLD))
+        for day in (date(OLD, 1, 1), date(OLD, 5, 9), date(OLD, 11, 4)):
+            assert index.get_day('ru', day) == expected.get_day('ru', day)
+        assert len(cache) == 1
+        assert index.year('ru', OLD) is index.year('ru', OLD)
+
+        index.is_working('ru', date(2004, 1, 1))
+        assert len(cache) == 1
+        assert index.count_working('ru', date(2004, 1, 1), date(RECENT, 1, 1)) > 0
+
+
+class TestArchiveStorage:
+    """
+    Тесты переноса лет в архив.
+    """
+
+    def test_archive_keeps_answers(self, migrated_engine):
+        """
+        Давний год уходит из calendarday в один блоб, ответы снимка не меняются.
+        """
+        save_days(synthetic_year('ru', OLD) + synthetic_year('ru', RECENT), migrated_engine)
+        before = load_index(migrated_engine)
+        seq = latest_seq(migrated_engine)
+
+        assert archive_years(RECENT - 10, migrated_engine) == 1
+        assert archive_years(RECENT - 10, migrated_engine) == 0
+        with Session(migrated_engine) as session:
+            assert session.scalar(select(func.count()).select_from(CalendarDay)) == 365
+            assert session.scalar(select(func.count()).select_from(CalendarArchive)) == 1
+
+        after = load_index(migrated_engine)
+        assert after.version == seq == latest_seq(migrated_engine)
+        assert after.years('ru') == [OLD, RECENT]
+        assert after.days('ru', date(OLD, 1, 1), date(OLD, 12, 31)) == \
+            before.days('ru', date(OLD, 1, 1), date(OLD, 12, 31))
+
+    def test_writes_into_archived_year(self, migrated_engine):
+        """
+        Совпадающие с архивом дни не пишутся, отличия накладываются
+        поверх архива и сворачиваются в него следующим переносом.
+        """
+        records = synthetic_year('ru', OLD)
+        save_days(records, migrated_engine)
+        archive_years(RECENT - 10, migrated_engine)
+
+        assert save_days(records, migrated_engine) == []
+        day = date(OLD, 3, 3)
+        changed = save_days([DayRecord('ru', day, False, 'Перенос')], migrated_engine)
+        assert [record.date for record in changed] == [day]
+        index = load_index(migrated_engine)
+        assert index.get_day('ru', day).holiday_name == 'Перенос'
+        assert index.get_day('ru', date(OLD, 1, 1)) == CalendarIndex(records).get_day('ru', date(OLD, 1, 1))
+
+        assert archive_years(RECENT - 10, migrated_engine) == 1
+        with Session(migrated_engine) as session:
+            assert session.scalar(select(func.count()).select_from(CalendarDay)) == 0
+        assert load_index(migrated_engine).get_day('ru', day).holiday_name == 'Перенос'
+
+    def test_rollback_rewrites_archive(self, migrated_engine):
+        """
+        Откат версии меняет и архивные годы; публикация после переноса
+        не создаёт новой версии.
+        """
+        save_days(synthetic_year('ru', OLD), migrated_engine)
+        first = publish_version('ru', bind=migrated_engine)
+        day = date(OLD, 3, 3)
+        save_days([DayRecord('ru', day, False, 'Ошибка')], migrated_engine)
+        second = publish_version('ru', bind=migrated_engine)
+
+        archive_years(RECENT - 10, migrated_engine)
+        assert publish_version('ru', bind=migrated_engine) == second
+        assert not load_index(migrated_engine).is_working('ru', day)
+
+        assert activate_version('ru', first, migrated_engine) == 1
+        index = load_index(migrated_engine)
+        assert index.is_working('ru', day)
+        assert index.year('ru', OLD) is index.archive.get('ru', OLD)
+
+    def test_horizon(self):
+        """
+        Горизонт — текущий год минус ARCHIVE_AFTER_YEARS; 0 выключает архив.
+        """
+        assert archive_horizon(date(2026, 6, 1), 10) == 2016
+        assert archive_horizon(date(2026, 6, 1), 0) is None
@@ -0,0 +1,155 @@
+"""
+Модуль tests.test_async_client — тесты асинхронного клиента и микропакетов.
+
+Проверяет на тестовом приложении (ASGI‑транспорт httpx):
+- объединение одновременных одиночных вопросов в один запрос POST /days;
+- разбиение на пакеты по max_size и передачу ошибки (в том числе
+  неполного ответа) всем участникам пакета.
+"""
+
+import asyncio
+from datetime import date, timedelta
+
+import httpx
+from fastapi import FastAPI
+
+from app.engine import CalendarIndex
+from app.routes import router
+from app.services import index_holder
+from app.sources.base import expand_year
+from workcalendar_client import AsyncCalendarClient, MicroBatcher
+
+
+def counting_http(requests):
+    """
+    Асинхронный HTTP‑клиент к тестовому приложению, записывающий пути запросов.
+    """
+    test_app = FastAPI()
+    test_app.include_router(router)
+
+    async def record(request):
+        requests.append(request.url.path)
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=test_app),
+        base_url='http://calendar',
+        event_hooks={'request': [record]},
+    )
+
+
+class TestAsyncCalendarClient:
+    """
+    Тесты AsyncCalendarClient.
+    """
+
+    def setup_method(self):
+        """
+        Подставляет снимок за 2025 год с праздником 1 января
+        и сокращённым днём 30 апреля.
+        """
+        self.previous = index_holder.swap(CalendarIndex(
+            expand_year('ru', 2025, {
+                date(2025, 1, 1): (False, 'Новый год'),
+                date(2025, 4, 30): (True, None, 7),
+            })
+        ))
+
+    def teardown_method(self):
+        """
+        Возвращает исходный снимок.
+        """
+        index_holder.swap(self.previous)
+
+    def test_concurrent_calls_are_batched(self):
+        """
+        50 одновременных вопросов (с повторами) уходят одним запросом.
+        """
+        requests = []
+        days = [date(2025, 1, 1) + timedelta(days=offset % 25) for offset in range(50)]
+
+        async def scenario():
+            async with AsyncCalendarClient(http=counting_http(requests)) as calendar:
+                return await asyncio.gather(*(calendar.is_working(day) for day in days))
+
+        flags = asyncio.run(scenario())
+        assert requests == ['/days']
+        assert flags[0] is False and flags[1] is True
+        assert len(flags) == 50
+
+    def test_holiday_name_and_range(self):
+        """
+        Одиночный вопрос возвращает DayRecord с часами сокращённого дня,
+        период запрашивается через /calendar.
+        """
+        async def scenario():
+            async with AsyncCalendarClient(http=counting_http([])) as calendar:
+                day, short = await asyncio.gather(
+                    calendar.get_day(date(2025, 1, 1)), calendar.get_day(date(2025, 4, 30))
+                )
+                period = await calendar.calendar(date(2025, 4, 28), date(2025, 5, 4))
+                return day, short, period
+
+        day, short, period = asyncio.run(scenario())
+        assert day.holiday_name == 'Новый год'
+        assert short.working_hours == 7
+        assert len(period) == 7
+        assert period[2].working_hours == 7
+
+
+class TestMicroBatcher:
+    """
+    Тесты MicroBatcher.
+    """
+
+    def test_max_size_splits_batches(self):
+        """
+        Пакет отправляется сразу по достижении max_size.
+        """
+        batches = []
+
+        async def send(key, items):
+            batches.append(items)
+            return [item * 2 for item in items]
+
+        async def scenario():
+            batcher = MicroBatcher(send, window=10, max_size=3)
+            results = asyncio.gather(*(batcher.submit('k', item) for item in range(5)))
+            await asyncio.sleep(0)
+            await batcher.flush()
+            return await results
+
+        assert asyncio.run(scenario()) == [0, 2, 4, 6, 8]
+        assert [len(batch) for batch in batches] == [3, 2]
+
+    def test_error_reaches_every_caller(self):
+        """
+        Ошибка отправки пакета получают все его участники.
+        """
+        async def send(key, items):
+            raise RuntimeError('сервер недоступен')
+
+        async def scenario():
+            batcher = MicroBatcher(send, window=0.001)
+            return await asyncio.gather(
+                *(batcher.submit('k', item) for item in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_short_answer_fails_batch(self):
+        """
+        Если результатов меньше, чем вопросов, ошибку получают все участники,
+        и ни один не ждёт ответа вечно.
+        """
+        async def send(key, items):
+            return items[:1]
+
+        async def scenario():
+            batcher = MicroBatcher(send, window=0.001)
+            return await asyncio.wait_for(asyncio.gather(
+                *(batcher.submit('k', item) for item in range(3)), return_exceptions=True
+            ), timeout=1)
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(result, ValueError) for result in results)
@@ -0,0 +1,60 @@
+"""
+Модуль tests.test_calendar_api — тесты маршрутов календаря.
+
+Проверяет ответы `/calendar` и `/is-working-day/{day}` из in‑memory снимка.
+"""
+
+from datetime import date
+
+from app.engine import CalendarIndex, DayRecord
+from app.services import index_holder
+
+
+class TestCalendarApi:
+    """
+    Тесты маршрутов чтения календаря.
+    """
+
+    def setup_method(self):
+        """
+        Подставляет снимок с праздником 1 января 2025 года.
+        """
+        self.previous = index_holder.swap(CalendarIndex([
+            DayRecord('ru', date(2025, 1, 1), False, 'Новый год'),
+        ]))
+
+    def teardown_method(self):
+        """
+        Возвращает исходный снимок.
+        """
+        index_holder.swap(self.previous)
+
+    def test_is_working_day(self, test_client):
+        """
+        Статус дня берётся из снимка.
+        """
+        response = test_client.get('/is-working-day/2025-01-01')
+        assert response.status_code == 200
+        assert response.json() == {
+            'region': 'ru', 'date': '2025-01-01',
+            'is_working': False, 'holiday_name': 'Новый год', 'working_hours': 0
+        }
+
+    def test_calendar_range(self, test_client):
+        """
+        Период возвращается по дню на запись, включая границы.
+        """
+        response = test_client.get(
+            '/calendar', params={'start_date': '2025-01-01', 'end_date': '2025-01-07'}
+        )
+        assert response.status_code == 200
+        assert len(response.json()) == 7
+
+    def test_calendar_reversed_range(self, test_client):
+        """
+        Период с концом раньше начала отклоняется.
+        """
+        response = test_client.get(
+            '/calendar', params={'start_date': '2025-01-07', 'end_date': '2025-01-01'}
+        )
+        assert response.status_code == 400
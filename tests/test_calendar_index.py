@@ -0,0 +1,99 @@
+"""
+Модуль tests.test_calendar_index — тесты in‑memory индекса календаря.
+
+Проверяет:
+- заполнение незагруженных дат правилом пятидневки;
+- применение праздников и переносов из записей;
+- ограниченный кэш календарей лет по правилу по умолчанию;
+- атомарную замену снимка в IndexHolder.
+"""
+
+from datetime import date
+
+from app.engine import CalendarIndex, DayRecord, IndexHolder
+from app.engine.index import DEFAULT_YEARS_CACHE_SIZE, default_year
+
+
+class TestCalendarIndex:
+    """
+    Тесты построения и чтения снимка календаря.
+    """
+
+    def setup_class(self):
+        """
+        Готовит снимок с праздником 1 января и рабочей субботой 1 ноября 2025 года.
+        """
+        self.index = CalendarIndex([
+            DayRecord('ru', date(2025, 1, 1), False, 'Новогодние каникулы'),
+            DayRecord('ru', date(2025, 11, 1), True),
+        ], version=3)
+
+    def test_holiday_from_records(self):
+        """
+        Праздник из записей — нерабочий день с названием.
+        """
+        day = self.index.get_day('ru', date(2025, 1, 1))
+        assert day.is_working is False
+        assert day.holiday_name == 'Новогодние каникулы'
+
+    def test_working_saturday(self):
+        """
+        Перенесённая рабочая суббота считается рабочим днём.
+        """
+        assert self.index.is_working('ru', date(2025, 11, 1)) is True
+
+    def test_default_rule_inside_loaded_year(self):
+        """
+        Даты загруженного года без записей заполняются пятидневкой.
+        """
+        assert self.index.is_working('ru', date(2025, 1, 13)) is True
+        assert self.index.is_working('ru', date(2025, 1, 12)) is False
+
+    def test_default_rule_for_unknown_year(self):
+        """
+        Для незагруженного года действует правило пятидневки.
+        """
+        assert self.index.year('ru', 2030) is None
+        assert self.index.is_working('ru', date(2030, 1, 5)) is False
+
+    def test_days_range_is_inclusive(self):
+        """
+        Диапазон дней включает обе границы.
+        """
+        days = self.index.days('ru', date(2025, 1, 1), date(2025, 1, 10))
+        assert len(days) == 10
+        assert days[-1].date == date(2025, 1, 10)
+
+    def test_days_across_years(self):
+        """
+        Диапазон через границу загруженного и незагруженного года собирается целиком.
+        """
+        days = self.index.days('ru', date(2024, 12, 30), date(2025, 1, 2))
+        assert [day.date.day for day in days] == [30, 31, 1, 2]
+        assert days[2].holiday_name == 'Новогодние каникулы'
+
+    def test_warm_reports_missing_years(self):
+        """
+        warm() строит записи загруженных лет и возвращает отсутствующие.
+        """
+        assert self.index.warm('ru', [2024, 2025]) == [2024]
+        assert self.index.year('ru', 2025).records() is self.index.year('ru', 2025).records()
+
+    def test_default_years_cache_is_bounded(self):
+        """
+        Календари лет по правилу по умолчанию общие для снимков и хранятся
+        в ограниченном кэше, сколько бы регионов и лет ни пришло в запросах.
+        """
+        default_year.cache_clear()
+        assert self.index.calendar('zz', 2030) is CalendarIndex().calendar('zz', 2030)
+        self.index.count_working('zz', date(1, 1, 1), date(1000, 1, 1))
+        assert default_year.cache_info().currsize == DEFAULT_YEARS_CACHE_SIZE
+
+    def test_holder_swap_returns_previous(self):
+        """
+        swap() подменяет снимок и возвращает предыдущий.
+        """
+        holder = IndexHolder()
+        previous = holder.swap(self.index)
+        assert holder.current is self.index
+        assert previous.version == 0
@@ -0,0 +1,77 @@
+"""
+Модуль tests.test_changes — тесты инкрементальной синхронизации и ленты изменений.
+
+Проверяет:
+- запись только изменившихся дней при повторной публикации года;
+- монотонный рост номера изменения (seq);
+- выдачу изменений через `GET /changes?since=<seq>`.
+"""
+
+from datetime import date
+
+from app.engine import DayRecord
+from app.services import latest_seq, load_index
+from app.services.sync import save_days
+from app.sources.base import expand_year
+
+from .conftest import test_engine
+
+
+class TestIncrementalSync:
+    """
+    Тесты сравнения с хранимыми днями и журнала изменений.
+    """
+
+    def test_republish_writes_only_changed_days(self, migrated_engine):
+        """
+        Повторная публикация года с одним переносом даёт одно изменение.
+        """
+        first = save_days(expand_year('ru', 2025, {}), migrated_engine)
+        seq = latest_seq(migrated_engine)
+        assert len(first) == 365
+        assert seq == 365
+
+        assert save_days(expand_year('ru', 2025, {}), migrated_engine) == []
+        assert latest_seq(migrated_engine) == seq
+
+        moved = {date(2025, 11, 3): (False, 'Перенос выходного')}
+        changed = save_days(expand_year('ru', 2025, moved), migrated_engine)
+        assert changed == [DayRecord('ru', date(2025, 11, 3), False, 'Перенос выходного')]
+        assert latest_seq(migrated_engine) == seq + 1
+
+    def test_index_version_is_latest_seq(self, migrated_engine):
+        """
+        Версия снимка совпадает с номером последнего изменения.
+        """
+        save_days(expand_year('ru', 2026, {}), migrated_engine)
+        assert load_index(migrated_engine).version == latest_seq(migrated_engine)
+
+
+class TestChangesApi:
+    """
+    Тесты маршрута `/changes`.
+    """
+
+    def test_changes_since(self, test_client):
+        """
+        Лента возвращает только изменения после since и seq для следующего запроса.
+        """
+        since = test_client.get('/changes', params={'since': 10 ** 9}).json()['seq']
+        start = latest_seq(test_engine)
+        save_days([DayRecord('kz', date(2025, 3, 21), False, 'Наурыз')], test_engine)
+
+        feed = test_client.get('/changes', params={'since': start}).json()
+        assert since == 10 ** 9
+        assert feed['seq'] == start + 1
+        assert [(c['region'], c['date'], c['is_working']) for c in feed['changes']] == [
+            ('kz', '2025-03-21', False)
+        ]
+
+    def test_changes_limit(self, test_client):
+        """
+        Параметр limit ограничивает размер порции.
+        """
+        save_days(expand_year('by', 2025, {}), test_engine)
+        feed = test_client.get('/changes', params={'since': 0, 'limit': 5}).json()
+        assert len(feed['changes']) == 5
+        assert feed['seq'] == feed['changes'][-1]['seq']
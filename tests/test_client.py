@@ -0,0 +1,121 @@
+"""
+Модуль tests.test_client — тесты встраиваемого клиента workcalendar_client.
+
+Проверяет:
+- загрузку снимка с сервера и совпадение ответов с сервером;
+- перепроверку неизменившегося снимка ответом 304;
+- старт без сети по локальному снимку;
+- арифметику рабочих дней ядра (count_working, add_working_days).
+"""
+
+from datetime import date, timedelta
+
+import httpx
+import pytest
+
+from app.engine import CalendarIndex
+from app.services import index_holder
+from app.sources.base import expand_year
+from workcalendar_client import CalendarClient, CalendarUnavailable
+
+OVERRIDES = {
+    date(2025, 1, 1): (False, 'Новый год'),
+    date(2025, 11, 1): (True, None),
+}
+
+
+def offline_http():
+    """
+    HTTP‑клиент, у которого любая попытка соединения завершается ошибкой.
+    """
+    def refuse(request):
+        raise httpx.ConnectError('нет сети', request=request)
+    return httpx.Client(base_url='http://calendar', transport=httpx.MockTransport(refuse))
+
+
+class TestCalendarClient:
+    """
+    Тесты CalendarClient против тестового приложения.
+    """
+
+    def setup_method(self):
+        """
+        Подставляет снимок за 2025 год с версией 7.
+        """
+        self.previous = index_holder.swap(
+            CalendarIndex(expand_year('ru', 2025, OVERRIDES), version=7)
+        )
+
+    def teardown_method(self):
+        """
+        Возвращает исходный снимок.
+        """
+        index_holder.swap(self.previous)
+
+    def test_answers_match_server(self, test_client, tmp_path):
+        """
+        Локальные ответы совпадают с ответами сервера.
+        """
+        calendar = CalendarClient(http=test_client, cache_dir=tmp_path)
+        calendar.load()
+        for day in (date(2025, 1, 1), date(2025, 11, 1), date(2025, 11, 2)):
+            served = test_client.get(f'/is-working-day/{day}').json()
+            assert calendar.is_working(day) is served['is_working']
+        assert calendar.get_day(date(2025, 1, 1)).holiday_name == 'Новый год'
+        assert calendar.index.version == 7
+
+    def test_unchanged_snapshot_is_304(self, test_client, tmp_path):
+        """
+        Повторная перепроверка неизменившегося снимка ничего не загружает.
+        """
+        calendar = CalendarClient(http=test_client, cache_dir=tmp_path)
+        calendar.load()
+        assert calendar.refresh() is False
+        index_holder.swap(CalendarIndex(expand_year('ru', 2025, {}), version=8))
+        assert calendar.refresh() is True
+        assert calendar.is_working(date(2025, 1, 1)) is True
+
+    def test_offline_start(self, test_client, tmp_path):
+        """
+        Без сети клиент стартует по сохранённому снимку, а без снимка — сообщает об ошибке.
+        """
+        CalendarClient(http=test_client, cache_dir=tmp_path).load()
+        calendar = CalendarClient(http=offline_http(), cache_dir=tmp_path)
+        calendar.load()
+        assert calendar.is_working(date(2025, 1, 1)) is False
+        assert calendar.refresh() is False
+        with pytest.raises(CalendarUnavailable):
+            CalendarClient(http=offline_http(), cache_dir=tmp_path / 'empty').load()
+
+
+class TestWorkingDayArithmetic:
+    """
+    Тесты count_working() и add_working_days() ядра.
+    """
+
+    def setup_class(self):
+        """
+        Снимок за 2025 год; остальные годы — по правилу пятидневки.
+        """
+        self.index = CalendarIndex(expand_year('ru', 2025, OVERRIDES))
+
+    def test_count_matches_day_by_day(self):
+        """
+        Счётчик через границы лет совпадает с подсчётом по дням.
+        """
+        start, end = date(2024, 12, 20), date(2026, 1, 10)
+        expected = sum(
+            self.index.is_working('ru', start + timedelta(days=offset))
+            for offset in range((end - start).days)
+        )
+        assert self.index.count_working('ru', start, end) == expected
+        assert self.index.count_working('ru', end, start) == -expected
+
+    def test_add_working_days(self):
+        """
+        Нерабочая дата переносится вперёд, затем сдвигается в обе стороны.
+        """
+        assert self.index.add_working_days('ru', date(2025, 1, 1), 0) == date(2025, 1, 2)
+        assert self.index.add_working_days('ru', date(2025, 10, 31), 1) == date(2025, 11, 1)
+        assert self.index.add_working_days('ru', date(2025, 1, 2), -1) == date(2024, 12, 31)
+        assert self.index.add_working_days('ru', date(2025, 12, 31), 1) == date(2026, 1, 1)
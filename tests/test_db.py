@@ -0,0 +1,123 @@
+"""
+Модуль tests.test_db — тесты профиля производительности SQLite.
+
+Проверяет на временной файловой БД:
+- установку PRAGMA (WAL, synchronous, busy_timeout) при подключении;
+- единственное соединение записи и пул чтения только для чтения;
+- чтение во время незавершённой транзакции записи без «database is locked»;
+- распределение чтения по репликам и исключение недоступных реплик.
+"""
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.core.db import create_engines, is_sqlite_file
+from app.core.replicas import ReadRouter
+
+
+@pytest.fixture
+def sqlite_engines(tmp_path):
+    """
+    Движки записи и чтения для временной файловой SQLite.
+
+    Yields:
+        tuple[Engine, Engine]: движок записи и движок чтения.
+    """
+    writer, reader = create_engines(f"sqlite:///{tmp_path / 'db.sqlite3'}")
+    with writer.begin() as connection:
+        connection.execute(text('CREATE TABLE day (id INTEGER PRIMARY KEY, value INTEGER)'))
+        connection.execute(text('INSERT INTO day (value) VALUES (1)'))
+    yield writer, reader
+    writer.dispose()
+    reader.dispose()
+
+
+class TestSqliteProfile:
+    """
+    Тесты create_engines() для SQLite.
+    """
+
+    def test_pragmas_applied(self, sqlite_engines):
+        """
+        Соединения открываются в режиме WAL с synchronous=NORMAL и busy_timeout.
+        """
+        _, reader = sqlite_engines
+        with reader.connect() as connection:
+            assert connection.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+            assert connection.execute(text('PRAGMA synchronous')).scalar() == 1
+            assert connection.execute(text('PRAGMA busy_timeout')).scalar() == 5000
+
+    def test_pools_are_split(self, sqlite_engines):
+        """
+        Запись — через одно соединение, чтение — через отдельный пул.
+        """
+        writer, reader = sqlite_engines
+        assert writer is not reader
+        assert writer.pool.size() == 1
+        with pytest.raises(exc.OperationalError):
+            with reader.begin() as connection:
+                connection.execute(text('INSERT INTO day (value) VALUES (2)'))
+
+    def test_reads_not_blocked_by_writer(self, sqlite_engines):
+        """
+        Пока транзакция записи не завершена, читатель видит последнее зафиксированное состояние.
+        """
+        writer, reader = sqlite_engines
+        with writer.begin() as write:
+            write.execute(text('UPDATE day SET value = 2'))
+            with reader.connect() as read:
+                assert read.execute(text('SELECT value FROM day')).scalar() == 1
+        with reader.connect() as read:
+            assert read.execute(text('SELECT value FROM day')).scalar() == 2
+
+    def test_memory_database_shares_engine(self):
+        """
+        Для SQLite в памяти движки чтения и записи совпадают.
+        """
+        writer, reader = create_engines('sqlite:///:memory:')
+        assert writer is reader
+        assert not is_sqlite_file('sqlite:///:memory:')
+        assert not is_sqlite_file('postgresql://user@host/db')
+
+
+class TestReadRouter:
+    """
+    Тесты маршрутизации чтения по репликам.
+    """
+
+    def test_round_robin(self, tmp_path):
+        """
+        Реплики выдаются по очереди.
+        """
+        primary = create_engine('sqlite://')
+        replicas = [create_engine(f"sqlite:///{tmp_path / f'r{n}.sqlite3'}") for n in range(2)]
+        router = ReadRouter(primary, replicas)
+        assert [router.get() for _ in range(4)] == replicas * 2
+
+    def test_unreachable_replica_excluded(self, tmp_path):
+        """
+        Недоступная реплика исключается проверкой и ошибкой соединения.
+        """
+        primary = create_engine('sqlite://')
+        good = create_engine(f"sqlite:///{tmp_path / 'good.sqlite3'}")
+        bad = create_engine(f"sqlite:///{tmp_path / 'missing' / 'bad.sqlite3'}")
+        router = ReadRouter(primary, [good, bad])
+        assert router.check() == [True, False]
+        assert {router.get() for _ in range(3)} == {good}
+
+        router = ReadRouter(primary, [bad])
+        with pytest.raises(exc.OperationalError):
+            with router.get().connect():
+                pass
+        assert router.get() is primary
+
+    def test_recovered_replica_returns(self, tmp_path):
+        """
+        После успешной проверки реплика возвращается в ротацию.
+        """
+        replica = create_engine(f"sqlite:///{tmp_path / 'replica.sqlite3'}")
+        router = ReadRouter(create_engine('sqlite://'), [replica])
+        router.mark_down(0)
+        assert router.get() is router.primary
+        router.check()
+        assert router.get() is replica
@@ -0,0 +1,73 @@
+"""
+Модуль tests.test_fixtures — тесты тестовых фикстур БД.
+
+Проверяет:
+- копию шаблона: актуальная схема без повторного прогона миграций;
+- изоляцию копий: запись одного теста не видна другим и шаблону;
+- синтетический набор данных `seeded_engine`.
+"""
+
+from datetime import date
+
+from sqlalchemy import inspect
+
+from app.engine import CalendarIndex, DayRecord
+from app.services.sync import latest_seq, load_index, save_days
+from .datasets import SEEDED_YEARS, seeded_records, synthetic_overrides
+
+
+class TestTemplateDatabase:
+    """
+    Тесты копий мигрированного шаблона.
+    """
+
+    def test_clone_has_schema(self, migrated_engine):
+        """
+        Копия шаблона содержит таблицы и версию миграций.
+        """
+        tables = inspect(migrated_engine).get_table_names()
+        assert {'alembic_version', 'calendarday', 'calendarchange', 'overlay'} <= set(tables)
+
+    def test_clones_are_isolated(self, migrated_engine, template_engine):
+        """
+        Запись в копию не попадает в шаблон и в другие копии.
+        """
+        save_days([DayRecord('ru', date(2025, 1, 1), False, 'Новый год')], migrated_engine)
+        assert latest_seq(migrated_engine) == 1
+        assert latest_seq(template_engine) == 0
+
+    def test_next_clone_is_empty(self, migrated_engine):
+        """
+        Следующий тест получает чистую копию.
+        """
+        assert latest_seq(migrated_engine) == 0
+
+
+class TestSeededDatabase:
+    """
+    Тесты синтетического набора данных.
+    """
+
+    def test_seeded_index(self, seeded_engine):
+        """
+        Снимок из заполненной БД совпадает с записями набора.
+        """
+        index = load_index(seeded_engine)
+        expected = CalendarIndex(seeded_records())
+        assert index.regions == set(SEEDED_YEARS)
+        for region, years in SEEDED_YEARS.items():
+            assert index.years(region) == list(years)
+            for year in years:
+                assert index.days(region, date(year, 1, 1), date(year, 12, 31)) == \
+                    expected.days(region, date(year, 1, 1), date(year, 12, 31))
+
+    def test_dataset_is_deterministic(self):
+        """
+        Набор воспроизводим и содержит праздники, переносы и сокращённые дни.
+        """
+        overrides = synthetic_overrides('ru', 2025)
+        assert overrides == synthetic_overrides('ru', 2025)
+        assert overrides != synthetic_overrides('ru', 2025, seed=1)
+        kinds = {len(value) for value in overrides.values()}
+        assert kinds == {2, 3}
+        assert any(is_working and day.weekday() == 5 for day, (is_working, *_) in overrides.items())
@@ -0,0 +1,100 @@
+"""
+Модуль tests.test_history — тесты календаря «на дату» (as_of).
+
+Проверяет:
+- состояние дня до и после переноса по журналу изменений;
+- правило по умолчанию для дней без истории;
+- приведение момента с часовым поясом к UTC;
+- параметр `as_of` у маршрутов `/calendar` и `/is-working-day`.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.engine import DayRecord
+from app.models import CalendarChange
+from app.services import days_as_of
+from app.services.sync import save_days
+
+DAY = date(2025, 11, 3)
+BEFORE = datetime(2025, 1, 10, 12, 0)
+AFTER = datetime(2025, 9, 1, 12, 0)
+
+
+def save_at(records, moment, bind):
+    """
+    Сохраняет дни и помечает их изменения в журнале моментом moment.
+    """
+    changed = save_days(records, bind)
+    with Session(bind) as session:
+        session.execute(
+            update(CalendarChange)
+            .where(CalendarChange.date.in_([record.date for record in changed]))
+            .where(CalendarChange.changed_at > moment)
+            .values(changed_at=moment)
+        )
+        session.commit()
+
+
+class TestDaysAsOf:
+    """
+    Тесты сервиса days_as_of.
+    """
+
+    def test_transfer_is_visible_only_after_change(self, migrated_engine):
+        """
+        До переноса день рабочий, после — выходной; соседние дни не меняются.
+        """
+        save_at([DayRecord('ru', DAY, True)], BEFORE, migrated_engine)
+        save_at([DayRecord('ru', DAY, False, 'Перенос')], AFTER, migrated_engine)
+        with Session(migrated_engine) as session:
+            early = days_as_of(session, 'ru', DAY, DAY + timedelta(days=1), AFTER - timedelta(days=1))
+            late = days_as_of(session, 'ru', DAY, DAY + timedelta(days=1), AFTER)
+        assert [record.is_working for record in early] == [True, True]
+        assert late[0] == DayRecord('ru', DAY, False, 'Перенос', 0)
+        assert late[1].is_working
+
+    def test_days_without_history_follow_default_rule(self, migrated_engine):
+        """
+        Дни без изменений до момента T отвечаются пятидневкой.
+        """
+        save_at([DayRecord('ru', DAY, False, 'Перенос')], AFTER, migrated_engine)
+        with Session(migrated_engine) as session:
+            records = days_as_of(session, 'ru', date(2025, 11, 1), DAY, BEFORE)
+        assert [record.is_working for record in records] == [False, False, True]
+        assert records[2].working_hours == 8
+
+    def test_aware_moment_is_converted_to_utc(self, migrated_engine):
+        """
+        Момент со смещением сравнивается с журналом в UTC.
+        """
+        save_at([DayRecord('ru', DAY, False, 'Перенос')], AFTER, migrated_engine)
+        plus_five = timezone(timedelta(hours=5))
+        with Session(migrated_engine) as session:
+            # 16:30 по +05:00 — это 11:30 UTC, до изменения.
+            [early] = days_as_of(session, 'ru', DAY, DAY, datetime(2025, 9, 1, 16, 30, tzinfo=plus_five))
+            [late] = days_as_of(session, 'ru', DAY, DAY, datetime(2025, 9, 1, 17, 30, tzinfo=plus_five))
+        assert early.is_working and not late.is_working
+
+
+class TestHistoryRoutes:
+    """
+    Тесты параметра as_of у маршрутов календаря.
+    """
+
+    def test_as_of_before_any_change(self, test_client):
+        """
+        До появления журнала календарь отвечает правилом по умолчанию.
+        """
+        response = test_client.get(
+            '/calendar',
+            params={'start_date': '2025-01-01', 'end_date': '2025-01-02', 'as_of': '2000-01-01T00:00:00Z'},
+        )
+        assert response.status_code == 200
+        assert [day['is_working'] for day in response.json()] == [True, True]
+
+        response = test_client.get('/is-working-day/2025-01-04', params={'as_of': '2000-01-01T00:00:00'})
+        assert response.status_code == 200
+        assert response.json()['is_working'] is False
@@ -0,0 +1,165 @@
+"""
+Модуль tests.test_hours — тесты рабочих часов и сокращённых дней.
+
+Проверяет:
+- разбор сокращённых дней источниками и их хранение в БД;
+- рабочие часы между моментами и срок через N рабочих часов
+  (сокращённый день, выходные, праздники, граница года);
+- маршруты `/working-hours` и `/working-hours/add` и ответы 400/422
+  на некорректные сроки, моменты с часовым поясом и 9999 год.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.engine import CalendarIndex, WorkSchedule, add_working_hours, working_hours_between
+from app.services import index_holder
+from app.services.sync import load_index, save_days
+from app.sources.base import expand_year
+from app.sources.isdayoff import IsDayOffSource
+
+OVERRIDES = {
+    date(2025, 1, 1): (False, 'Новый год'),
+    date(2025, 4, 30): (True, None, 7),
+    date(2025, 5, 1): (False, 'Праздник Весны и Труда'),
+    date(2025, 5, 2): (False, None),
+}
+
+
+@pytest.fixture(scope='module')
+def index():
+    """
+    Снимок за 2025 год с сокращённым днём 30 апреля и праздниками 1–2 мая.
+    """
+    return CalendarIndex(expand_year('ru', 2025, OVERRIDES))
+
+
+class TestWorkingHours:
+    """
+    Тесты арифметики рабочих часов ядра.
+    """
+
+    def test_short_day(self, index):
+        """
+        Сокращённый день длится 7 часов и заканчивается в 17:00.
+        """
+        assert index.get_day('ru', date(2025, 4, 30)).working_hours == 7
+        assert index.get_day('ru', date(2025, 5, 1)).working_hours == 0
+        assert working_hours_between(
+            index, 'ru', datetime(2025, 4, 30), datetime(2025, 5, 1)
+        ) == 7
+
+    def test_deadline_skips_holidays(self, index):
+        """
+        Срок переносится через сокращённый день, праздники и выходные.
+        """
+        deadline = add_working_hours(index, 'ru', datetime(2025, 4, 30, 16), 2)
+        assert deadline == datetime(2025, 5, 5, 10)
+        assert add_working_hours(index, 'ru', datetime(2025, 4, 29, 10), 8) == datetime(2025, 4, 30, 10)
+
+    def test_deadline_at_end_of_span(self, index):
+        """
+        Срок, истекающий в конце интервала, не переносится на следующий.
+        """
+        assert add_working_hours(index, 'ru', datetime(2025, 3, 3, 9), 4) == datetime(2025, 3, 3, 13)
+        assert add_working_hours(index, 'ru', datetime(2025, 3, 3, 9), 8) == datetime(2025, 3, 3, 18)
+
+    def test_inverse_operations(self, index):
+        """
+        Срок и подсчёт часов согласованы, в том числе через границу года и назад.
+        """
+        start = datetime(2024, 12, 28, 12)
+        for hours in (1, 7.5, 40, 300):
+            deadline = add_working_hours(index, 'ru', start, hours)
+            assert working_hours_between(index, 'ru', start, deadline) == hours
+            assert add_working_hours(index, 'ru', deadline, -hours) <= start + timedelta(days=3)
+
+    def test_schedule_parse(self):
+        """
+        Распорядок разбирается из строки, пересекающиеся интервалы отклоняются.
+        """
+        schedule = WorkSchedule.parse('08:00-12:00, 13:00-17:30')
+        assert schedule.day_spans(7) == [(8 * 3600, 12 * 3600), (13 * 3600, 16 * 3600)]
+        with pytest.raises(ValueError):
+            WorkSchedule.parse('09:00-13:00,12:00-18:00')
+
+
+class TestShortDaysStorage:
+    """
+    Тесты источников и хранения сокращённых дней.
+    """
+
+    def test_isdayoff_short_code(self):
+        """
+        Код '2' isdayoff — сокращённый рабочий день на 7 часов.
+        """
+        records = IsDayOffSource().parse(('2' + '0' * 364).encode('ascii'), 'ru', 2025)
+        assert (records[0].is_working, records[0].working_hours) == (True, 7)
+        assert records[1].working_hours is None
+
+    def test_hours_roundtrip(self, migrated_engine):
+        """
+        Часы сокращённого дня сохраняются и попадают в снимок; повторная запись ничего не меняет.
+        """
+        records = expand_year('ru', 2025, OVERRIDES)
+        assert save_days(records, migrated_engine)
+        assert save_days(records, migrated_engine) == []
+        index = load_index(migrated_engine)
+        assert index.get_day('ru', date(2025, 4, 30)).working_hours == 7
+        assert index.get_day('ru', date(2025, 4, 29)).working_hours == 8
+
+
+class TestHoursApi:
+    """
+    Тесты маршрутов рабочих часов.
+    """
+
+    def setup_method(self):
+        """
+        Подставляет снимок за 2025 год.
+        """
+        self.previous = index_holder.swap(CalendarIndex(expand_year('ru', 2025, OVERRIDES)))
+
+    def teardown_method(self):
+        """
+        Возвращает исходный снимок.
+        """
+        index_holder.swap(self.previous)
+
+    def test_between_and_deadline(self, test_client):
+        """
+        Маршруты возвращают часы и срок по распорядку WORKDAY_SCHEDULE.
+        """
+        response = test_client.get('/working-hours', params={
+            'start': '2025-04-30T00:00:00', 'end': '2025-05-06T00:00:00'
+        })
+        assert response.json()['hours'] == 7 + 8
+        response = test_client.get('/working-hours/add', params={
+            'start': '2025-04-30T16:00:00', 'hours': 2
+        })
+        assert response.json()['deadline'] == '2025-05-05T10:00:00'
+
+    def test_invalid_input_is_client_error(self, test_client):
+        """
+        Бесконечный, нулевой или слишком длинный срок — 422; момент
+        с часовым поясом и выход за 9999 год — 400, а не ошибка сервера.
+        """
+        for hours in ('nan', 'inf', '0', '1e9'):
+            response = test_client.get('/working-hours/add', params={
+                'start': '2025-04-30T16:00:00', 'hours': hours
+            })
+            assert response.status_code == 422
+        for params in (
+            {'start': '2025-04-30T00:00:00+03:00', 'end': '2025-05-06T00:00:00'},
+            {'start': '2025-04-30T00:00:00+03:00', 'end': '2025-05-06T00:00:00+03:00'},
+        ):
+            assert test_client.get('/working-hours', params=params).status_code == 400
+        response = test_client.get('/working-hours/add', params={
+            'start': '9999-12-31T10:00:00', 'hours': 100
+        })
+        assert response.status_code == 400
+        response = test_client.get('/working-hours', params={
+            'start': '9999-12-30T00:00:00', 'end': '9999-12-31T23:00:00'
+        })
+        assert response.json()['hours'] == 8 + 8
@@ -0,0 +1,157 @@
+"""
+Модуль tests.test_http — тесты слоя загрузки данных источников.
+
+Проверяет на локальном фейковом HTTP‑сервере:
+- сохранение ответа в файловый кэш и перепроверку через If-None-Match (304);
+- ограничение частоты запросов (token bucket) и проверку его параметров;
+- паузу ограничителя по ответу 429 с Retry-After.
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from app.core.settings import Settings
+from app.sources.http import ResponseCache, TokenBucket, fetch
+
+
+class FakeProvider(BaseHTTPRequestHandler):
+    """
+    Фейковый провайдер: /calendar отдаёт тело с ETag, /limited — 429.
+    """
+
+    full_responses = 0
+    not_modified = 0
+
+    def do_GET(self):
+        if self.path == '/limited':
+            self.send_response(429)
+            self.send_header('Retry-After', '120')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == '"v1"':
+            type(self).not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        type(self).full_responses += 1
+        body = b'0' * 365
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def provider_url():
+    """
+    Запускает фейковый провайдер на свободном локальном порту.
+
+    Yields:
+        str: базовый URL сервера.
+    """
+    FakeProvider.full_responses = FakeProvider.not_modified = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeProvider)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestFetch:
+    """
+    Тесты fetch() с кэшем и ограничителем.
+    """
+
+    def test_unchanged_resource_costs_304(self, provider_url, tmp_path):
+        """
+        Повторная загрузка неизменившихся данных отвечает 304 и берётся из кэша.
+        """
+        cache = ResponseCache(str(tmp_path / 'http_cache'))
+
+        async def scenario():
+            async with httpx.AsyncClient() as client:
+                first = await fetch(client, f'{provider_url}/calendar', cache=cache)
+                second = await fetch(client, f'{provider_url}/calendar', cache=cache)
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        assert first == second == b'0' * 365
+        assert FakeProvider.full_responses == 1
+        assert FakeProvider.not_modified == 1
+
+    def test_429_pauses_limiter(self, provider_url):
+        """
+        Ответ 429 приостанавливает ограничитель на Retry-After.
+        """
+        limiter = TokenBucket(rate=1, capacity=1)
+
+        async def scenario():
+            async with httpx.AsyncClient() as client:
+                with pytest.raises(httpx.HTTPStatusError):
+                    await fetch(client, f'{provider_url}/limited', limiter=limiter)
+
+        asyncio.run(scenario())
+        limiter._refill()
+        assert limiter._tokens < -100
+
+
+class TestTokenBucket:
+    """
+    Тесты ограничителя частоты запросов.
+    """
+
+    def test_rate_is_enforced(self):
+        """
+        После исчерпания «пачки» запросы идут не чаще rate в секунду.
+        """
+        limiter = TokenBucket(rate=20, capacity=2)
+
+        async def scenario():
+            started = time.monotonic()
+            for _ in range(6):
+                await limiter.acquire()
+            return time.monotonic() - started
+
+        assert asyncio.run(scenario()) >= 4 / 20 * 0.9
+
+    def test_refill_with_fake_clock(self):
+        """
+        Токены восстанавливаются пропорционально прошедшему времени.
+        """
+        now = [0.0]
+        limiter = TokenBucket(rate=2, capacity=4, clock=lambda: now[0])
+        limiter._tokens = 0
+        now[0] = 1.0
+        limiter._refill()
+        assert limiter._tokens == 2
+        now[0] = 10.0
+        limiter._refill()
+        assert limiter._tokens == 4
+
+    def test_invalid_parameters(self, monkeypatch):
+        """
+        Нулевая скорость и ёмкость меньше 1 отклоняются и в ведре,
+        и в настройках (вместо деления на ноль и вечного ожидания).
+        """
+        for rate, capacity in ((0, 1), (-1, 1), (1, 0.5)):
+            with pytest.raises(ValueError):
+                TokenBucket(rate=rate, capacity=capacity)
+        for name, value in (
+            ('SOURCE_RATE_LIMIT', '0'), ('SOURCE_BURST', '0'), ('SOURCE_RATE_LIMITS', '{"isdayoff": 0}'),
+        ):
+            monkeypatch.setenv(name, value)
+            with pytest.raises(ValidationError):
+                Settings()
+            monkeypatch.delenv(name)
@@ -0,0 +1,184 @@
+"""
+Модуль tests.test_loader — тесты загрузки календаря из файлов.
+
+Проверяет:
+- пакетную запись bulk_save_days() (та же семантика, что у save_days());
+- чтение CSV, JSON‑массива (потоково, малым буфером), JSON Lines и XML;
+- отбрасывание неверных строк и режим strict;
+- командную строку `python -m app.loader`.
+"""
+
+import json
+from datetime import date
+
+import pytest
+
+from app import loader
+from app.engine import CalendarIndex
+from app.services import bulk_load
+from app.services.bulk_load import LoadError, load_file
+from app.services.sync import bulk_save_days, latest_seq, load_index, save_days
+from .datasets import synthetic_year
+
+XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<calendar year="2025" lang="ru" country="ru">
+  <holidays><holiday id="1" title="Новогодние каникулы"/></holidays>
+  <days>
+    <day d="01.01" t="1" h="1"/>
+    <day d="04.30" t="2"/>
+    <day d="11.01" t="3"/>
+  </days>
+</calendar>
+'''
+
+
+def year_days(index, region, year):
+    return index.days(region, date(year, 1, 1), date(year, 12, 31))
+
+
+class TestBulkSave:
+    """
+    Тесты пакетной записи дней.
+    """
+
+    def test_matches_save_days(self, migrated_engine):
+        """
+        Пакетная запись даёт те же строки и журнал, что и save_days().
+        """
+        first, changed = synthetic_year('ru', 2025), synthetic_year('ru', 2025, seed=1)
+        assert bulk_save_days(first, migrated_engine) == 365
+        assert bulk_save_days(first, migrated_engine) == 0
+        expected = len(save_days(changed, migrated_engine))
+        assert expected > 0 and bulk_save_days(first, migrated_engine) == expected
+        assert latest_seq(migrated_engine) == 365 + 2 * expected
+        assert year_days(load_index(migrated_engine), 'ru', 2025) == \
+            year_days(CalendarIndex(first), 'ru', 2025)
+
+
+class TestLoadFile:
+    """
+    Тесты загрузки файлов разных форматов.
+    """
+
+    def test_csv_with_invalid_rows(self, migrated_engine, tmp_path):
+        """
+        Неверные строки отбрасываются с номером строки, остальные записываются.
+        """
+        path = tmp_path / 'days.csv'
+        path.write_text(
+            'date,is_working,holiday_name,working_hours\n'
+            '2025-01-01,0,Новый год,\n'
+            '2025-04-30,1,,7\n'
+            '2025-13-01,0,,\n'
+            '2025-05-01,может быть,,\n'
+            '2025-05-02,false,,\n',
+            encoding='utf-8'
+        )
+        progress = []
+        stats = load_file(path, bind=migrated_engine, chunk_size=2, progress=lambda s: progress.append(s.read))
+        assert (stats.read, stats.invalid, stats.changed) == (5, 2, 3)
+        assert stats.errors[0].endswith(':4: month must be in 1..12')
+        assert progress == [2, 4, 5]
+        index = load_index(migrated_engine)
+        assert index.get_day('ru', date(2025, 1, 1)).holiday_name == 'Новый год'
+        assert index.get_day('ru', date(2025, 4, 30)).working_hours == 7
+
+    def test_strict(self, migrated_engine, tmp_path):
+        """
+        В режиме strict неверная строка прерывает загрузку.
+        """
+        path = tmp_path / 'days.jsonl'
+        path.write_text('{"date": "2025-01-01", "is_working": false}\n{"date": "2025-01-02"}\n')
+        with pytest.raises(LoadError, match='нет поля is_working'):
+            load_file(path, bind=migrated_engine, strict=True)
+
+    def test_non_string_fields(self, migrated_engine, tmp_path):
+        """
+        Нестроковые region и holiday_name в JSONL — неверные строки,
+        а не прерванная загрузка.
+        """
+        path = tmp_path / 'days.jsonl'
+        path.write_text(
+            '{"date": "2025-01-01", "is_working": true, "region": 5}\n'
+            '{"date": "2025-01-02", "is_working": false, "holiday_name": ["Каникулы"]}\n'
+            '{"date": "2025-01-03", "is_working": false, "holiday_name": "Каникулы"}\n'
+        )
+        stats = load_file(path, bind=migrated_engine)
+        assert (stats.read, stats.invalid, stats.written) == (3, 2, 1)
+        assert stats.errors[0].endswith(":1: region: ожидается строка, получено 5")
+        with pytest.raises(LoadError, match='region: ожидается строка'):
+            load_file(path, bind=migrated_engine, strict=True, chunk_size=1)
+
+    def test_json_array_streamed(self, migrated_engine, tmp_path, monkeypatch):
+        """
+        JSON‑массив читается по объектам даже при буфере меньше объекта.
+        """
+        monkeypatch.setattr(bulk_load, 'READ_BUFFER_SIZE', 7)
+        rows = [
+            {'region': record.region, 'date': record.date.isoformat(),
+             'is_working': record.is_working, 'holiday_name': record.holiday_name,
+             'working_hours': record.working_hours}
+            for record in synthetic_year('kz', 2025)
+        ]
+        path = tmp_path / 'days.json'
+        path.write_text(json.dumps(rows, ensure_ascii=False, indent=1), encoding='utf-8')
+        stats = load_file(path, bind=migrated_engine, chunk_size=100)
+        assert (stats.read, stats.invalid, stats.changed) == (365, 0, 365)
+        assert year_days(load_index(migrated_engine), 'kz', 2025) == \
+            year_days(CalendarIndex(synthetic_year('kz', 2025)), 'kz', 2025)
+
+    def test_broken_json(self, migrated_engine, tmp_path):
+        """
+        Незакрытый JSON‑массив — ошибка загрузки.
+        """
+        path = tmp_path / 'days.json'
+        path.write_text('[{"date": "2025-01-01", "is_working": false}, {"date"')
+        with pytest.raises(LoadError):
+            load_file(path, bind=migrated_engine)
+
+    def test_xml(self, migrated_engine, tmp_path):
+        """
+        XML производственного календаря достраивается до полного года.
+        """
+        path = tmp_path / 'calendar.xml'
+        path.write_text(XML, encoding='utf-8')
+        stats = load_file(path, region='ru', bind=migrated_engine)
+        assert stats.changed == 365
+        index = load_index(migrated_engine)
+        assert index.get_day('ru', date(2025, 1, 1)).holiday_name == 'Новогодние каникулы'
+        assert index.get_day('ru', date(2025, 11, 1)).is_working
+        assert index.get_day('ru', date(2025, 4, 30)).working_hours == 7
+
+    def test_unknown_format(self, migrated_engine, tmp_path):
+        """
+        Неизвестное расширение отклоняется.
+        """
+        with pytest.raises(LoadError):
+            load_file(tmp_path / 'days.xlsx', bind=migrated_engine)
+
+
+class TestLoaderCli:
+    """
+    Тесты командной строки загрузчика.
+    """
+
+    def test_main(self, migrated_engine, tmp_path, capsys):
+        """
+        Загрузка нескольких файлов с итогом по каждому.
+        """
+        first, second = tmp_path / 'a.jsonl', tmp_path / 'b.csv'
+        first.write_text('{"date": "2025-01-01", "is_working": false, "region": "by"}\n')
+        second.write_text('date,is_working\n2025-01-02,0\n')
+        assert loader.main([str(first), str(second), '--region', 'by'], bind=migrated_engine) == 0
+        output = capsys.readouterr()
+        assert 'изменено 1' in output.out and 'a.jsonl' in output.err
+        assert not load_index(migrated_engine).is_working('by', date(2025, 1, 2))
+
+    def test_errors(self, migrated_engine, tmp_path):
+        """
+        Ошибка загрузки — код 1, неверные аргументы — код 2.
+        """
+        path = tmp_path / 'bad.csv'
+        path.write_text('date,is_working\nвчера,1\n')
+        assert loader.main([str(path), '--strict', '--quiet'], bind=migrated_engine) == 1
+        assert loader.main([str(path), '--chunk-size', '0'], bind=migrated_engine) == 2
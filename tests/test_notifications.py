@@ -0,0 +1,117 @@
+"""
+Модуль tests.test_notifications — тесты push‑уведомлений об изменениях.
+
+Проверяет:
+- fan‑out событий по подписчикам с фильтром регионов;
+- закрытие подписки при переполнении её очереди;
+- доставку событий через WebSocket `/ws/changes`;
+- формирование потока SSE с догрузкой пропущенных событий.
+"""
+
+import asyncio
+import time
+
+from app.routes.notifications import sse_stream
+from app.services import Broadcaster, broadcaster
+
+
+def make_event(seq, region='ru'):
+    """
+    Событие с одним изменением.
+    """
+    return {
+        'seq': seq, 'region': region,
+        'changes': [{'seq': seq, 'date': '2025-11-03', 'is_working': False, 'holiday_name': None}]
+    }
+
+
+class TestBroadcaster:
+    """
+    Тесты рассылки событий.
+    """
+
+    def test_fan_out_with_region_filter(self):
+        """
+        Событие получают все подписчики его региона и только они.
+        """
+        async def scenario():
+            hub = Broadcaster(queue_size=10)
+            all_regions = hub.subscribe()
+            ru_only = hub.subscribe(['ru'])
+            by_only = hub.subscribe(['by'])
+            assert hub.publish(make_event(1, 'ru')) == 2
+            return all_regions.queue.qsize(), ru_only.queue.qsize(), by_only.queue.qsize()
+
+        assert asyncio.run(scenario()) == (1, 1, 0)
+
+    def test_overflow_closes_subscription(self):
+        """
+        Переполненная подписка очищается и закрывается, остальные не страдают.
+        """
+        async def scenario():
+            hub = Broadcaster(queue_size=2)
+            slow = hub.subscribe()
+            fast = hub.subscribe()
+            for seq in range(1, 4):
+                hub.publish(make_event(seq))
+                if seq < 3:
+                    await fast.get()
+            return slow.overflowed, await slow.get(), await fast.get()
+
+        overflowed, marker, event = asyncio.run(scenario())
+        assert overflowed is True
+        assert marker is None
+        assert event['seq'] == 3
+
+
+class TestPushEndpoints:
+    """
+    Тесты WebSocket и SSE.
+    """
+
+    def test_websocket_receives_published_event(self, test_client):
+        """
+        Событие, опубликованное из другого потока, приходит по WebSocket.
+        """
+        with test_client.websocket_connect('/ws/changes?regions=ru') as websocket:
+            for _ in range(100):
+                if broadcaster.subscribers:
+                    break
+                time.sleep(0.01)
+            broadcaster.publish(make_event(7, 'by'))
+            broadcaster.publish(make_event(8, 'ru'))
+            assert websocket.receive_json()['seq'] == 8
+
+    def test_sse_stream_replays_then_skips_seen(self):
+        """
+        Поток SSE отдаёт догруженные события и не повторяет их из живой очереди.
+        """
+        async def scenario():
+            hub = Broadcaster()
+
+            async def replay():
+                # события, опубликованные во время догрузки, попадают в очередь
+                hub.publish(make_event(5))
+                hub.publish(make_event(6))
+                return [make_event(5)]
+
+            stream = sse_stream(None, replay, hub=hub)
+            chunks = [await anext(stream), await anext(stream)]
+            await stream.aclose()
+            return chunks, hub.subscribers
+
+        chunks, subscribers = asyncio.run(scenario())
+        assert [chunk.split('\n')[0] for chunk in chunks] == ['id: 5', 'id: 6']
+        assert subscribers == 0
+
+    def test_sse_subscribes_only_when_streaming(self):
+        """
+        Поток SSE, который так и не начали отправлять, не оставляет подписки.
+        """
+        async def replay():
+            return []
+
+        hub = Broadcaster()
+        stream = sse_stream(None, replay, hub=hub)
+        assert hub.subscribers == 0
+        del stream
@@ -0,0 +1,272 @@
+"""
+Модуль tests.test_overlays — тесты календарей сотрудников и команд.
+
+Проверяет:
+- набор интервалов IntervalMap (перекрытие, поиск, срез);
+- композицию слоёв LayeredCalendar поверх снимка в сравнении
+  с наивным применением слоёв по дням;
+- сменные графики ShiftPattern/ShiftLayer (цикл, праздники, кэш блоков);
+- маршруты `/overlays/...` (команда → сотрудник, удаление интервала).
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app.engine import (
+    CalendarIndex, IntervalLayer, IntervalMap, LayeredCalendar, ShiftLayer, ShiftPattern
+)
+from app.engine.shifts import _month_block
+from app.services import index_holder
+from app.sources.base import expand_year
+
+OVERRIDES = {
+    date(2025, 1, 1): (False, 'Новый год'),
+    date(2025, 5, 1): (False, 'Праздник Весны и Труда'),
+}
+
+
+@pytest.fixture(scope='module')
+def index():
+    """
+    Снимок за 2025 год с праздниками 1 января и 1 мая.
+    """
+    return CalendarIndex(expand_year('ru', 2025, OVERRIDES))
+
+
+class TestIntervalMap:
+    """
+    Тесты набора интервалов дат.
+    """
+
+    def test_later_interval_wins(self):
+        """
+        Новый интервал перекрывает пересечение со старым и делит его.
+        """
+        intervals = IntervalMap([
+            (date(2025, 7, 1), date(2025, 7, 14), 'отпуск'),
+            (date(2025, 7, 5), date(2025, 7, 6), 'дежурство'),
+        ])
+        assert len(intervals) == 3
+        assert intervals.get(date(2025, 7, 4)) == 'отпуск'
+        assert intervals.get(date(2025, 7, 5)) == 'дежурство'
+        assert intervals.get(date(2025, 7, 7)) == 'отпуск'
+        assert intervals.get(date(2025, 7, 15)) is None
+        assert intervals.overlapping(date(2025, 7, 6), date(2025, 7, 8)) == [
+            (date(2025, 7, 6), date(2025, 7, 6), 'дежурство'),
+            (date(2025, 7, 7), date(2025, 7, 8), 'отпуск'),
+        ]
+
+    def test_reversed_interval(self):
+        """
+        Интервал с концом раньше начала отклоняется.
+        """
+        with pytest.raises(ValueError):
+            IntervalMap([(date(2025, 7, 2), date(2025, 7, 1), None)])
+
+
+class TestLayeredCalendar:
+    """
+    Тесты композиции слоёв поверх базового календаря.
+    """
+
+    def test_layers_override_base(self, index):
+        """
+        Отпуск сотрудника перекрывает рабочий день команды, а дни без
+        интервалов берутся из базового календаря.
+        """
+        team = IntervalLayer('team', [(date(2025, 5, 3), date(2025, 5, 4), True, 'Релиз')])
+        person = IntervalLayer('ivanov', [(date(2025, 5, 4), date(2025, 5, 7), False, 'Отпуск')])
+        calendar = LayeredCalendar(index, 'ru', [team, person])
+        saturday = calendar.get_day(date(2025, 5, 3))
+        assert saturday.is_working and saturday.holiday_name == 'Релиз'
+        assert saturday.working_hours == 8
+        assert calendar.get_day(date(2025, 5, 5)).working_hours == 0
+        assert calendar.get_day(date(2025, 5, 5)).holiday_name == 'Отпуск'
+        assert calendar.get_day(date(2025, 5, 1)).holiday_name == 'Праздник Весны и Труда'
+        assert calendar.count_working(date(2025, 5, 1), date(2025, 5, 12)) == 4
+
+    def test_matches_naive(self, index):
+        """
+        Срез и подсчёт совпадают с наивным применением слоёв по дням.
+        """
+        rng = random.Random(38)
+        layers = []
+        for number in range(3):
+            intervals = []
+            for _ in range(20):
+                start = date(2025, 1, 1) + timedelta(days=rng.randrange(360))
+                end = start + timedelta(days=rng.randrange(10))
+                intervals.append((start, end, rng.random() < 0.5, f'слой {number}'))
+            layers.append((intervals, IntervalLayer(f'layer-{number}', intervals)))
+        calendar = LayeredCalendar(index, 'ru', [layer for _, layer in layers])
+
+        def naive(day):
+            is_working = index.is_working('ru', day)
+            for intervals, _ in layers:
+                for start, end, working, _ in intervals:
+                    if start <= day <= end:
+                        is_working = working
+            return is_working
+
+        start, end = date(2025, 1, 1), date(2025, 12, 31)
+        days = calendar.days(start, end)
+        assert [record.is_working for record in days] == [
+            naive(start + timedelta(days=offset)) for offset in range(365)
+        ]
+        assert all(calendar.get_day(record.date) == record for record in days)
+        assert calendar.count_working(date(2025, 3, 1), date(2025, 9, 1)) == sum(
+            naive(date(2025, 3, 1) + timedelta(days=offset)) for offset in range(184)
+        )
+
+
+class TestShifts:
+    """
+    Тесты сменных графиков.
+    """
+
+    def test_parse(self):
+        """
+        График разбирается в цикл рабочих и нерабочих дней.
+        """
+        assert ShiftPattern.parse('2/2').cycle == (True, True, False, False)
+        assert ShiftPattern.parse('1/3').cycle == (True, False, False, False)
+        for text in ('2', '0/0', 'a/b', '2/-1', '300/67', '9' * 40 + '/1'):
+            with pytest.raises(ValueError):
+                ShiftPattern.parse(text)
+
+    def test_matches_naive(self, index):
+        """
+        Слой графика совпадает с наивным расчётом по дням: до якоря действует
+        базовый календарь, праздники — выходные, отпуск перекрывает график.
+        """
+        pattern = ShiftPattern.parse('5/2/5/3')
+        anchor = date(2025, 2, 11)
+        vacation = IntervalLayer('vacation', [(date(2025, 8, 4), date(2025, 8, 17), False, 'Отпуск')])
+        calendar = LayeredCalendar(index, 'ru', [
+            ShiftLayer('shift', pattern, anchor, index, 'ru'), vacation
+        ])
+
+        def naive(day):
+            if date(2025, 8, 4) <= day <= date(2025, 8, 17):
+                return False
+            if day < anchor or day == date(2025, 5, 1):
+                return index.is_working('ru', day)
+            return pattern.cycle[(day - anchor).days % 15]
+
+        start = date(2025, 1, 1)
+        days = calendar.days(start, date(2025, 12, 31))
+        assert [record.is_working for record in days] == [
+            naive(start + timedelta(days=offset)) for offset in range(365)
+        ]
+        assert all(calendar.get_day(record.date) == record for record in days)
+        assert calendar.get_day(date(2025, 5, 1)).holiday_name == 'Праздник Весны и Труда'
+
+    def test_month_blocks_shared(self, index):
+        """
+        Блоки месяцев общие для сотрудников с одинаковой фазой графика.
+        """
+        pattern = ShiftPattern.parse('2/2')
+        first = ShiftLayer('a', pattern, date(2025, 1, 1), index, 'ru')
+        second = ShiftLayer('b', pattern, date(2024, 12, 28), index, 'ru')
+        first.overrides(date(2030, 1, 1), date(2030, 1, 31))
+        hits = _month_block.cache_info().hits
+        second.overrides(date(2030, 1, 1), date(2030, 1, 31))
+        assert _month_block.cache_info().hits == hits + 1
+
+
+class TestOverlayApi:
+    """
+    Тесты маршрутов календарей сотрудников и команд.
+    """
+
+    def setup_method(self):
+        """
+        Подставляет снимок за 2025 год.
+        """
+        self.previous = index_holder.swap(CalendarIndex(expand_year('ru', 2025, OVERRIDES)))
+
+    def teardown_method(self):
+        """
+        Возвращает исходный снимок.
+        """
+        index_holder.swap(self.previous)
+
+    def test_team_and_employee(self, test_client):
+        """
+        Календарь сотрудника учитывает интервалы команды и свои.
+        """
+        assert test_client.put('/overlays/team-ops', json={'region': 'ru'}).status_code == 200
+        assert test_client.put(
+            '/overlays/petrov', json={'region': 'ru', 'parent': 'team-ops'}
+        ).status_code == 200
+        test_client.post('/overlays/team-ops/intervals', json={
+            'start_date': '2025-06-07', 'end_date': '2025-06-07',
+            'is_working': True, 'note': 'Рабочая суббота команды',
+        })
+        response = test_client.post('/overlays/petrov/intervals', json={
+            'start_date': '2025-06-09', 'end_date': '2025-06-11', 'note': 'Отпуск',
+        })
+        assert response.status_code == 201
+        interval_id = response.json()['id']
+
+        response = test_client.get(
+            '/overlays/petrov/calendar',
+            params={'start_date': '2025-06-07', 'end_date': '2025-06-12'},
+        )
+        assert response.status_code == 200
+        assert [day['is_working'] for day in response.json()] == [
+            True, False, False, False, False, True
+        ]
+        assert response.json()[2]['holiday_name'] == 'Отпуск'
+
+        assert test_client.delete(
+            f'/overlays/petrov/intervals/{interval_id}'
+        ).status_code == 204
+        response = test_client.get('/overlays/petrov/is-working-day/2025-06-10')
+        assert response.json()['is_working'] is True
+        assert test_client.get('/overlays/petrov/intervals').json() == []
+
+    def test_shift_pattern(self, test_client):
+        """
+        Сменный график наложения учитывается в календаре сотрудника;
+        неверный или слишком длинный график и слишком длинные строки — 422.
+        """
+        response = test_client.put('/overlays/sidorov', json={
+            'shift_pattern': '1/3', 'shift_anchor': '2025-06-01',
+        })
+        assert response.status_code == 200
+        assert response.json()['shift_pattern'] == '1/3'
+        response = test_client.get(
+            '/overlays/sidorov/calendar',
+            params={'start_date': '2025-06-01', 'end_date': '2025-06-08'},
+        )
+        assert [day['is_working'] for day in response.json()] == [
+            True, False, False, False, True, False, False, False
+        ]
+        assert test_client.put(
+            '/overlays/sidorov', json={'shift_pattern': '1/3'}
+        ).status_code == 400
+        for pattern in ('сутки', '1000000000/1', '1/' * 30 + '1'):
+            assert test_client.put('/overlays/sidorov', json={
+                'shift_pattern': pattern, 'shift_anchor': '2025-06-01',
+            }).status_code == 422
+        assert test_client.put('/overlays/sidorov', json={'region': 'r' * 9}).status_code == 422
+        assert test_client.post('/overlays/sidorov/intervals', json={
+            'start_date': '2025-06-10', 'end_date': '2025-06-11', 'note': 'x' * 201,
+        }).status_code == 422
+
+    def test_errors(self, test_client):
+        """
+        Неизвестное наложение — 404, цикл родителей и обратный интервал — 400.
+        """
+        assert test_client.get('/overlays/nobody/is-working-day/2025-06-10').status_code == 404
+        test_client.put('/overlays/cycle-a', json={})
+        test_client.put('/overlays/cycle-b', json={'parent': 'cycle-a'})
+        assert test_client.put(
+            '/overlays/cycle-a', json={'parent': 'cycle-b'}
+        ).status_code == 400
+        assert test_client.post('/overlays/cycle-a/intervals', json={
+            'start_date': '2025-06-10', 'end_date': '2025-06-09',
+        }).status_code == 400
@@ -0,0 +1,131 @@
+"""
+Модуль tests.test_query — тесты составного запроса `/query`.
+
+Проверяет:
+- результаты разнородных операций по одному снимку и его версию;
+- ошибку одной операции без влияния на остальные;
+- однократное вычисление одинаковых операций.
+"""
+
+from datetime import date
+
+from app.engine import CalendarIndex
+from app.schemas.query import DayOperation
+from app.services import QueryContext, index_holder
+from app.sources.base import expand_year
+
+OVERRIDES = {
+    date(2025, 5, 1): (False, 'Праздник Весны и Труда'),
+    date(2025, 5, 2): (False, None),
+    date(2025, 5, 8): (False, None),
+    date(2025, 5, 9): (False, 'День Победы'),
+}
+
+
+class TestQueryApi:
+    """
+    Тесты маршрута составного запроса.
+    """
+
+    def setup_method(self):
+        """
+        Подставляет снимок за 2025 год с майскими праздниками.
+        """
+        self.previous = index_holder.swap(
+            CalendarIndex(expand_year('ru', 2025, OVERRIDES), version=7)
+        )
+
+    def teardown_method(self):
+        """
+        Возвращает исходный снимок.
+        """
+        index_holder.swap(self.previous)
+
+    def test_operations(self, test_client):
+        """
+        Все операции вычисляются по одному снимку и возвращаются по порядку.
+        """
+        response = test_client.post('/query', json={'operations': [
+            {'id': 'month', 'op': 'calendar', 'start_date': '2025-05-01', 'end_date': '2025-05-31'},
+            {'op': 'holidays', 'start_date': '2025-05-01', 'end_date': '2025-05-31'},
+            {'op': 'count_working', 'start_date': '2025-05-01', 'end_date': '2025-06-01'},
+            {'op': 'is_working', 'day': '2025-05-09'},
+            {'op': 'next_working', 'day': '2025-04-30'},
+            {'op': 'previous_working', 'day': '2025-05-12'},
+            {'op': 'add_working_days', 'day': '2025-04-30', 'days': 2},
+            {'op': 'working_hours', 'start': '2025-05-05T09:00:00', 'end': '2025-05-06T09:00:00'},
+            {'op': 'deadline', 'start': '2025-05-07T17:00:00', 'hours': 2},
+        ]})
+        assert response.status_code == 200
+        body = response.json()
+        assert body['version'] == 7
+        results = [result['result'] for result in body['results']]
+        assert body['results'][0]['id'] == 'month' and len(results[0]) == 31
+        assert [day['date'] for day in results[1]] == ['2025-05-01', '2025-05-09']
+        assert results[2] == 18
+        assert results[3] is False
+        assert results[4] == '2025-05-05'
+        assert results[5] == '2025-05-07'
+        assert results[6] == '2025-05-06'
+        assert results[7] == 8
+        assert results[8] == '2025-05-12T10:00:00'
+
+    def test_operation_error(self, test_client):
+        """
+        Ошибка одной операции возвращается в её результате.
+        """
+        response = test_client.post('/query', json={'operations': [
+            {'op': 'calendar', 'start_date': '2025-05-31', 'end_date': '2025-05-01'},
+            {'op': 'is_working', 'day': '2025-05-05'},
+        ]})
+        assert response.status_code == 200
+        first, second = response.json()['results']
+        assert first['error'] and first['result'] is None
+        assert second['result'] is True
+
+    def test_out_of_range_operations(self, test_client):
+        """
+        Выход за пределы дат, слишком длинный период и смешение моментов
+        с часовым поясом и без — ошибки своих операций, а не всего запроса.
+        """
+        response = test_client.post('/query', json={'operations': [
+            {'op': 'count_working', 'start_date': '0001-01-01', 'end_date': '9998-01-01'},
+            {'op': 'count_working', 'start_date': '2025-06-01', 'end_date': '2025-05-01'},
+            {'op': 'next_working', 'day': '9999-12-31'},
+            {'op': 'working_hours', 'start': '2025-05-05T09:00:00+03:00', 'end': '2025-05-06T09:00:00'},
+            {'op': 'is_working', 'day': '2025-05-05'},
+        ]})
+        assert response.status_code == 200
+        results = response.json()['results']
+        assert [bool(result['error']) for result in results] == [True, False, True, True, False]
+        assert results[1]['result'] == -18
+        assert results[4]['result'] is True
+
+    def test_unknown_operation(self, test_client):
+        """
+        Неизвестный вид операции отклоняется при разборе запроса.
+        """
+        response = test_client.post('/query', json={'operations': [{'op': 'weather', 'day': '2025-05-05'}]})
+        assert response.status_code == 422
+
+
+class TestQueryContext:
+    """
+    Тесты контекста вычисления.
+    """
+
+    def test_duplicates_evaluated_once(self):
+        """
+        Одинаковые операции (с разными метками) вычисляются один раз.
+        """
+        context = QueryContext(CalendarIndex(expand_year('ru', 2025, OVERRIDES)), 'ru')
+        calls = []
+        evaluate = context.evaluate
+        context.evaluate = lambda operation: calls.append(operation) or evaluate(operation)
+        results = context.run([
+            DayOperation(id='a', op='is_working', day=date(2025, 5, 9)),
+            DayOperation(id='b', op='is_working', day=date(2025, 5, 9)),
+        ])
+        assert [result.id for result in results] == ['a', 'b']
+        assert [result.result for result in results] == [False, False]
+        assert len(calls) == 1
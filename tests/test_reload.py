@@ -0,0 +1,157 @@
+"""
+Модуль tests.test_reload — тесты горячей перезагрузки настроек и мастера запуска.
+
+Проверяет:
+- подмену только перезагружаемых параметров и отчёт о требующих перезапуска;
+- сохранение прежних настроек при некорректных значениях;
+- уведомление подписчиков: планировщик, ограничители запросов, уведомления;
+- перезагрузку при изменении .env‑файла;
+- загрузку снимка мастером `python -m app.server` до fork, сигналы
+  воркера и пропуск миграций в воркерах.
+"""
+
+import asyncio
+import signal
+
+from app.core import MIGRATIONS_APPLIED_ENV, migrations_applied, reload_settings
+from app.core.settings import Settings
+from app.engine import IndexHolder
+from app.server import build_parser, preload, reset_worker_signals
+from app.services import SettingsReloader, index_holder, latest_seq
+from app.services.reload import apply_service_settings
+from app.services.scheduler import SyncScheduler
+from app.services.state import broadcaster
+from app.sources import http
+
+
+class TestReloadSettings:
+    """
+    Тесты reload_settings и SettingsReloader.
+    """
+
+    def test_only_reloadable_settings_change(self, monkeypatch):
+        """
+        Интервал обновления подменяется, подключение к БД — только после перезапуска.
+        """
+        target = Settings()
+        url = target.DATABASE_URL
+        monkeypatch.setenv('SYNC_INTERVAL', '123')
+        monkeypatch.setenv('DATABASE_URL', 'sqlite:///other.sqlite3')
+        changes, restart = reload_settings(target)
+        assert changes == {'SYNC_INTERVAL': 123}
+        assert restart == ['DATABASE_URL']
+        assert target.SYNC_INTERVAL == 123 and target.DATABASE_URL == url
+
+    def test_invalid_values_keep_settings(self, monkeypatch):
+        """
+        Некорректное значение не применяется ни к одному параметру.
+        """
+        target = Settings()
+        interval = target.SYNC_INTERVAL
+        monkeypatch.setenv('SYNC_INTERVAL', str(interval + 5))
+        monkeypatch.setenv('SYNC_JITTER', 'много')
+        reloader = SettingsReloader(target)
+        assert reloader.reload() == {}
+        assert target.SYNC_INTERVAL == interval
+
+    def test_listeners_receive_changes(self, monkeypatch):
+        """
+        Планировщик получает новые регионы и интервалы.
+        """
+        scheduler = SyncScheduler(['ru'], IndexHolder(), interval=60, jitter=0, poll_interval=1)
+        reloader = SettingsReloader(Settings())
+        reloader.subscribe(scheduler.apply_settings)
+        monkeypatch.setenv('CALENDAR_REGIONS', '["ru", "by"]')
+        monkeypatch.setenv('SYNC_POLL_INTERVAL', '7')
+        reloader.reload()
+        assert scheduler.regions == ['ru', 'by']
+        assert (scheduler.interval, scheduler.poll_interval) == (60, 7)
+        reloader.unsubscribe(scheduler.apply_settings)
+        assert reloader.listeners == []
+
+    def test_service_settings_applied(self, monkeypatch):
+        """
+        Ограничители запросов пересоздаются, очередь уведомлений берёт новый размер.
+        """
+        limiter = http.get_limiter('xmlcalendar')
+        queue_size = broadcaster.queue_size
+        try:
+            apply_service_settings({'SOURCE_BURST': 5, 'NOTIFY_QUEUE_SIZE': 7})
+            assert http.get_limiter('xmlcalendar') is not limiter
+            assert broadcaster.queue_size == 7
+        finally:
+            broadcaster.queue_size = queue_size
+            http.reset_limiters()
+
+    def test_watch_reloads_on_file_change(self, tmp_path):
+        """
+        Изменение .env‑файла перезагружает настройки значениями из этого файла.
+        """
+        env_file = tmp_path / '.env.testing'
+        env_file.write_text('SYNC_INTERVAL=1\n')
+        target = Settings()
+        reloader = SettingsReloader(target, env_file)
+
+        async def scenario():
+            watcher = asyncio.create_task(reloader.watch(0.01))
+            await asyncio.sleep(0.03)
+            env_file.write_text('SYNC_INTERVAL=77\n')
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if target.SYNC_INTERVAL == 77:
+                    break
+            watcher.cancel()
+
+        asyncio.run(scenario())
+        assert target.SYNC_INTERVAL == 77
+
+
+class TestServer:
+    """
+    Тесты мастера многопроцессного запуска.
+    """
+
+    def test_preload_loads_current_snapshot(self, seeded_engine):
+        """
+        Мастер загружает актуальный снимок в index_holder до fork.
+        """
+        previous = index_holder.current
+        try:
+            index = preload(seeded_engine)
+            assert index_holder.current is index
+            assert index.version == latest_seq(seeded_engine)
+        finally:
+            index_holder.swap(previous)
+
+    def test_parser_defaults_from_settings(self):
+        """
+        Адрес и число воркеров по умолчанию берутся из настроек.
+        """
+        args = build_parser().parse_args(['--workers', '3'])
+        assert (args.port, args.workers) == (Settings().SERVER_PORT, 3)
+
+    def test_worker_ignores_early_sighup(self):
+        """
+        Воркер до установки обработчика перезагрузки игнорирует SIGHUP,
+        а SIGTERM/SIGINT обрабатывает по умолчанию.
+        """
+        previous = {
+            signum: signal.getsignal(signum)
+            for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP)
+        }
+        try:
+            reset_worker_signals()
+            assert signal.getsignal(signal.SIGHUP) is signal.SIG_IGN
+            assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+    def test_workers_skip_migrations(self, monkeypatch):
+        """
+        Миграции пропускаются, только если их применил мастер.
+        """
+        monkeypatch.delenv(MIGRATIONS_APPLIED_ENV, raising=False)
+        assert not migrations_applied()
+        monkeypatch.setenv(MIGRATIONS_APPLIED_ENV, '1')
+        assert migrations_applied()
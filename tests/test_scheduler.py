@@ -0,0 +1,119 @@
+"""
+Модуль tests.test_scheduler — тесты фонового обновления календаря.
+
+Проверяет:
+- переход к резервному источнику при ошибке основного;
+- сохранение данных лидером и подмену снимка у всех воркеров;
+- то, что только один воркер может удерживать блокировку лидера.
+
+Вместо сетевых источников используются фейковые адаптеры.
+"""
+
+import asyncio
+from datetime import date
+
+from app.engine import IndexHolder
+from app.services import Broadcaster, LeaderLock, SyncScheduler, latest_seq
+from app.services.sync import save_days
+from app.sources import BaseSource, SourceError
+from app.sources.base import expand_year
+
+
+class FakeSource(BaseSource):
+    """
+    Источник без сети: 1 января каждого года — праздник.
+    """
+
+    name = 'fake'
+
+    def __init__(self):
+        self.calls = 0
+
+    async def fetch_year(self, client, region, year):
+        self.calls += 1
+        return expand_year(region, year, {date(year, 1, 1): (False, 'Новый год')})
+
+
+class BrokenSource(BaseSource):
+    """
+    Источник, который всегда недоступен.
+    """
+
+    name = 'broken'
+
+    async def fetch_year(self, client, region, year):
+        raise SourceError('недоступен')
+
+
+class TestScheduler:
+    """
+    Тесты SyncScheduler и LeaderLock.
+    """
+
+    def test_leader_refreshes_and_swaps_index(self, migrated_engine, tmp_path):
+        """
+        Лидер загружает годы через резервный источник и подменяет снимок.
+        """
+        source = FakeSource()
+        holder = IndexHolder()
+        scheduler = SyncScheduler(
+            ['ru'], holder,
+            lock=LeaderLock(str(tmp_path / 'sync.lock')),
+            sources=[BrokenSource(), source],
+            bind=migrated_engine
+        )
+        index = asyncio.run(scheduler.run_once())
+        scheduler.lock.release()
+
+        year = date.today().year
+        assert source.calls == 2
+        assert holder.current is index
+        assert index.version == latest_seq(migrated_engine) > 0
+        assert index.years('ru') == [year, year + 1]
+        assert index.get_day('ru', date(year, 1, 1)).holiday_name == 'Новый год'
+
+    def test_follower_only_reloads(self, migrated_engine, tmp_path):
+        """
+        Воркер без блокировки лидера не ходит в источники, а только перечитывает БД.
+        """
+        path = str(tmp_path / 'sync.lock')
+        leader = LeaderLock(path)
+        assert leader.acquire()
+
+        source = FakeSource()
+        scheduler = SyncScheduler(
+            ['ru'], IndexHolder(), lock=LeaderLock(path),
+            sources=[source], bind=migrated_engine
+        )
+        asyncio.run(scheduler.run_once())
+        leader.release()
+
+        assert source.calls == 0
+        assert scheduler.lock.held is False
+
+    def test_reload_publishes_change_events(self, migrated_engine, tmp_path):
+        """
+        После появления изменений в БД воркер рассылает их подписчикам.
+        """
+        async def scenario():
+            hub = Broadcaster()
+            subscription = hub.subscribe(['ru'])
+            scheduler = SyncScheduler(
+                ['ru'], IndexHolder(), lock=LeaderLock(str(tmp_path / 'sync.lock')),
+                bind=migrated_engine, broadcaster=hub
+            )
+            save_days(expand_year('ru', 2025, {}), migrated_engine)
+            await scheduler.reload()
+            return await subscription.get()
+
+        event = asyncio.run(scenario())
+        assert event['region'] == 'ru'
+        assert len(event['changes']) == 365
+        assert event['seq'] == latest_seq(migrated_engine)
+
+    def test_next_delay_within_jitter(self):
+        """
+        Задержка лежит в пределах [interval, interval + jitter].
+        """
+        scheduler = SyncScheduler(['ru'], IndexHolder(), interval=100, jitter=10)
+        assert all(100 <= scheduler.next_delay() <= 110 for _ in range(50))
@@ -0,0 +1,192 @@
+"""
+Модуль tests.test_shedding — тесты ограничения нагрузки (LoadShedder).
+
+Проверяет на тестовом приложении (ASGI‑транспорт httpx):
+- 503 с Retry-After сверх лимита одновременных запросов;
+- приоритет дешёвых запросов над дорогими;
+- срок ответа: быстрый 503 вместо ожидания медленного обработчика
+  и отсутствие срока у записей;
+- пул потоков не меньше лимита одновременных запросов;
+- классификацию путей.
+"""
+
+import asyncio
+import time
+
+import httpx
+from anyio.to_thread import current_default_thread_limiter
+from fastapi import FastAPI
+
+from app.core import LoadShedder
+from app.core.shedding import has_deadline, is_expensive
+
+
+def build_app(gate: asyncio.Event, **options):
+    """
+    Тестовое приложение: обработчики ждут gate; возвращает (app, shedder).
+    """
+    test_app = FastAPI()
+
+    @test_app.get('/is-working-day/{day}')
+    async def cheap(day: str):
+        await gate.wait()
+        return {'day': day}
+
+    @test_app.get('/calendar')
+    async def expensive():
+        await gate.wait()
+        return []
+
+    @test_app.get('/health')
+    async def health():
+        return {'status': 'ok'}
+
+    @test_app.get('/slow')
+    def slow():
+        time.sleep(0.2)
+        return {'status': 'late'}
+
+    @test_app.post('/overlays/{name}/intervals', status_code=201)
+    def slow_write(name: str):
+        time.sleep(0.2)
+        return {'name': name}
+
+    test_app.add_middleware(LoadShedder, **options)
+    test_app.middleware_stack = shedder = test_app.build_middleware_stack()
+    while not isinstance(shedder, LoadShedder):
+        shedder = shedder.app
+    return test_app, shedder
+
+
+def http(test_app):
+    """
+    Асинхронный HTTP‑клиент к тестовому приложению.
+    """
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=test_app), base_url='http://calendar')
+
+
+async def settle():
+    """
+    Даёт запущенным запросам дойти до обработчиков.
+    """
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class TestLoadShedder:
+    """
+    Тесты middleware LoadShedder.
+    """
+
+    def test_excess_requests_are_shed(self):
+        """
+        Сверх лимита запрос сразу получает 503 с Retry-After; проверки состояния не ограничены.
+        """
+        async def scenario():
+            gate = asyncio.Event()
+            test_app, shedder = build_app(gate, limit=2, expensive_limit=2)
+            async with http(test_app) as client:
+                running = [asyncio.create_task(client.get(f'/is-working-day/2025-01-0{n}')) for n in (1, 2)]
+                await settle()
+                rejected = await client.get('/is-working-day/2025-01-03')
+                health = await client.get('/health')
+                gate.set()
+                finished = await asyncio.gather(*running)
+            return rejected, health, finished, shedder
+
+        rejected, health, finished, shedder = asyncio.run(scenario())
+        assert rejected.status_code == 503
+        assert rejected.headers['Retry-After'] == '1'
+        assert 'detail' in rejected.json()
+        assert health.status_code == 200
+        assert [response.status_code for response in finished] == [200, 200]
+        assert (shedder.shed, shedder.in_flight) == (1, 0)
+
+    def test_cheap_requests_keep_reserved_slots(self):
+        """
+        Дорогие запросы не занимают места, оставленные дешёвым.
+        """
+        async def scenario():
+            gate = asyncio.Event()
+            test_app, _ = build_app(gate, limit=3, expensive_limit=1)
+            async with http(test_app) as client:
+                first = asyncio.create_task(client.get('/calendar'))
+                await settle()
+                second = await client.get('/calendar')
+                cheap = asyncio.create_task(client.get('/is-working-day/2025-01-01'))
+                await settle()
+                gate.set()
+                return second, await first, await cheap
+
+        second, first, cheap = asyncio.run(scenario())
+        assert second.status_code == 503
+        assert first.status_code == 200 and cheap.status_code == 200
+
+    def test_deadline_returns_503_and_holds_slot(self):
+        """
+        Не начатый к сроку ответ — 503 без ожидания обработчика; место освобождается.
+        """
+        async def scenario():
+            test_app, shedder = build_app(asyncio.Event(), limit=1, cheap_deadline=0.05)
+            async with http(test_app) as client:
+                started = time.perf_counter()
+                response = await client.get('/slow')
+                elapsed = time.perf_counter() - started
+            return response, elapsed, shedder
+
+        response, elapsed, shedder = asyncio.run(scenario())
+        assert response.status_code == 503
+        assert elapsed < 0.2
+        assert (shedder.timed_out, shedder.in_flight) == (1, 0)
+
+    def test_writes_get_real_result(self):
+        """
+        Запись дольше срока не получает 503 (клиент не повторит её),
+        а дожидается своего ответа; медленное чтение — 503.
+        """
+        async def scenario():
+            test_app, shedder = build_app(
+                asyncio.Event(), limit=4, deadline=0.05, cheap_deadline=0.05
+            )
+            async with http(test_app) as client:
+                write = await client.post('/overlays/ivanov/intervals')
+                read = await client.get('/slow')
+            return write, read, shedder
+
+        write, read, shedder = asyncio.run(scenario())
+        assert write.status_code == 201 and write.json() == {'name': 'ivanov'}
+        assert read.status_code == 503
+        assert shedder.timed_out == 1
+
+    def test_thread_pool_fits_limit(self):
+        """
+        Пул потоков синхронных обработчиков расширяется до лимита мест.
+        """
+        async def scenario():
+            test_app, _ = build_app(asyncio.Event(), limit=64)
+            async with http(test_app) as client:
+                await client.get('/health')
+                response = await client.get('/slow')
+            return response, current_default_thread_limiter().total_tokens
+
+        response, tokens = asyncio.run(scenario())
+        assert response.status_code == 200
+        assert tokens == 64
+
+    def test_expensive_paths(self):
+        """
+        Периоды, пакеты, составные запросы, снимки и журнал — дорогие; точечные — нет.
+        """
+        assert is_expensive('/calendar')
+        assert is_expensive('/bulk/count')
+        assert is_expensive('/days')
+        assert is_expensive('/snapshot/ru')
+        assert is_expensive('/changes')
+        assert is_expensive('/aggregates/2025/months')
+        assert not is_expensive('/is-working-day/2025-01-01')
+        assert is_expensive('/overlays/ivanov/calendar')
+        assert not is_expensive('/is-working-day/2025-01-01')
+        assert not is_expensive('/calendar-export-like')
+        assert has_deadline('GET', '/versions/ru') and has_deadline('POST', '/bulk/count')
+        assert not has_deadline('POST', '/versions/ru/publish')
+        assert not has_deadline('DELETE', '/overlays/ivanov/intervals/1')
@@ -0,0 +1,146 @@
+"""
+Модуль tests.test_sources — тесты разбора данных внешних источников.
+
+Проверяет нормализацию ответов xmlcalendar.ru, isdayoff.ru и HTML‑страниц
+consultant.ru к полному списку дней года без обращения к сети.
+"""
+
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from app.sources import SourceError, get_sources
+from app.sources.consultant import ConsultantSource, parse_consultant_html
+from app.sources.isdayoff import IsDayOffSource
+from app.sources.pool import shutdown_parse_pool
+from app.sources.xmlcalendar import XmlCalendarSource
+
+CALENDAR_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<calendar year="2025" lang="ru" country="ru">
+  <holidays>
+    <holiday id="1" title="Новогодние каникулы (в ред. закона)"/>
+  </holidays>
+  <days>
+    <day d="01.01" t="1" h="1"/>
+    <day d="04.30" t="2"/>
+    <day d="11.01" t="3" f="01.05"/>
+  </days>
+</calendar>'''.encode('utf-8')
+
+
+class TestSources:
+    """
+    Тесты адаптеров источников.
+    """
+
+    def test_xmlcalendar_parse(self):
+        """
+        XML разбирается в полный год с праздниками и переносами.
+        """
+        records = XmlCalendarSource().parse(CALENDAR_XML, 'ru', 2025)
+        by_date = {record.date: record for record in records}
+        assert len(records) == 365
+        assert by_date[date(2025, 1, 1)].is_working is False
+        assert by_date[date(2025, 1, 1)].holiday_name == 'Новогодние каникулы'
+        assert by_date[date(2025, 4, 30)].is_working is True
+        assert by_date[date(2025, 11, 1)].is_working is True
+        assert by_date[date(2025, 1, 4)].is_working is False
+
+    def test_xmlcalendar_invalid(self):
+        """
+        Некорректный XML приводит к SourceError.
+        """
+        with pytest.raises(SourceError):
+            XmlCalendarSource().parse(b'<calendar>', 'ru', 2025)
+
+    def test_isdayoff_parse(self):
+        """
+        Строка кодов разбирается по дню на символ.
+        """
+        codes = ('1' + '0' * 364).encode('ascii')
+        records = IsDayOffSource().parse(codes, 'ru', 2025)
+        assert records[0].is_working is False
+        assert all(record.is_working for record in records[1:])
+
+    def test_isdayoff_wrong_length(self):
+        """
+        Ответ неверной длины отклоняется.
+        """
+        with pytest.raises(SourceError):
+            IsDayOffSource().parse(b'0101', 'ru', 2025)
+
+    def test_get_sources_keeps_order(self):
+        """
+        Источники создаются в порядке из настроек.
+        """
+        names = [source.name for source in get_sources(['isdayoff', 'xmlcalendar'])]
+        assert names == ['isdayoff', 'xmlcalendar']
+
+
+def consultant_page(year):
+    """
+    Упрощённая страница consultant.ru: 12 месяцев, 1 января — праздник,
+    1 февраля — сокращённый день, остальное — пустые рабочие ячейки.
+    """
+    months = []
+    for month in range(1, 13):
+        cells = '<td class="inactively">31</td>'
+        if month == 1:
+            cells += '<td class="holiday weekend">1</td><td>9</td>'
+        elif month == 2:
+            cells += '<td class="preholiday">1*</td>'
+        months.append(f'<table class="cal"><tr><th class="month">{month}</th></tr><tr>{cells}</tr></table>')
+    return f'<html><body><p>шапка</p>{"".join(months)}</body></html>'.encode('utf-8')
+
+
+class TestConsultantSource:
+    """
+    Тесты HTML‑источника с разбором в пуле процессов.
+    """
+
+    def test_parse_html(self):
+        """
+        Классы ячеек определяют статус дня, соседние месяцы пропускаются.
+        """
+        records = parse_consultant_html(consultant_page(2025), 'ru', 2025)
+        by_date = {record.date: record for record in records}
+        assert len(records) == 365
+        assert by_date[date(2025, 1, 1)].is_working is False
+        assert by_date[date(2025, 1, 9)].is_working is True
+        assert by_date[date(2025, 2, 1)].is_working is True
+        assert by_date[date(2025, 1, 31)].is_working is True
+
+    def test_parse_html_without_calendar(self):
+        """
+        Страница без таблиц‑месяцев отклоняется.
+        """
+        with pytest.raises(SourceError):
+            parse_consultant_html(b'<html></html>', 'ru', 2025)
+
+    def test_fetch_year_parses_in_process_pool(self):
+        """
+        Загрузка идёт через HTTP‑клиент, разбор — в пуле процессов.
+        """
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=consultant_page(2024))
+        )
+
+        async def scenario():
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await ConsultantSource().fetch_year(client, 'ru', 2024)
+
+        try:
+            records = asyncio.run(scenario())
+        finally:
+            shutdown_parse_pool()
+        assert len(records) == 366
+        assert records[0].is_working is False
+
+    def test_other_regions_not_supported(self):
+        """
+        Для регионов кроме 'ru' источник сообщает об ошибке (сработает резервный).
+        """
+        with pytest.raises(SourceError):
+            ConsultantSource().url('by', 2025)
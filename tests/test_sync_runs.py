@@ -0,0 +1,126 @@
+"""
+Модуль tests.test_sync_runs — тесты истории синхронизаций.
+
+Проверяет:
+- запись загрузок лет запуска в `syncrun` с источником и числом изменений;
+- фиксацию ошибок источников при переходе к резервному и изоляцию
+  непредусмотренных ошибок одного года;
+- раздельный замер загрузки и разбора у источников с fetch_raw/parse;
+- маршрут `/sync/runs`.
+"""
+
+import asyncio
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.services import list_sync_runs, refresh
+from app.sources import BaseSource
+from app.sources.base import expand_year
+from tests.test_scheduler import BrokenSource, FakeSource
+
+
+class RawSource(BaseSource):
+    """
+    Источник без сети с отдельными этапами загрузки и разбора.
+    """
+
+    name = 'raw'
+
+    async def fetch_raw(self, client, region, year):
+        return b'{}'
+
+    def parse(self, raw, region, year):
+        return expand_year(region, year, {date(year, 5, 1): (False, 'Праздник весны и труда')})
+
+
+class CrashingSource(RawSource):
+    """
+    Источник, разбор которого падает на 2026 годе непредусмотренной ошибкой.
+    """
+
+    name = 'crashing'
+
+    def parse(self, raw, region, year):
+        if year == 2026:
+            raise KeyError('holidays')
+        return super().parse(raw, region, year)
+
+
+class TestSyncRuns:
+    """
+    Тесты истории синхронизаций.
+    """
+
+    def test_refresh_records_runs(self, migrated_engine):
+        """
+        Каждая загрузка года запуска сохраняется с общим run_id.
+        """
+        asyncio.run(refresh(['ru'], [2025, 2026], sources=[FakeSource()], bind=migrated_engine))
+
+        with Session(migrated_engine) as session:
+            runs = list_sync_runs(session)
+        assert sorted(run.year for run in runs) == [2025, 2026]
+        assert len({run.run_id for run in runs}) == 1
+        for run in runs:
+            assert run.source == 'fake'
+            assert run.changed == 365
+            assert run.error is None
+            assert run.fetch_seconds >= 0 and run.write_seconds > 0
+
+    def test_failed_source_is_recorded(self, migrated_engine):
+        """
+        Ошибка основного источника попадает в историю, данные — из резервного.
+        """
+        asyncio.run(refresh(['ru'], [2025], sources=[BrokenSource(), FakeSource()], bind=migrated_engine))
+        asyncio.run(refresh(['kz'], [2025], sources=[BrokenSource()], bind=migrated_engine))
+
+        with Session(migrated_engine) as session:
+            ru, = list_sync_runs(session, region='ru')
+            kz, = list_sync_runs(session, region='kz')
+        assert ru.source == 'fake'
+        assert ru.error == 'broken: недоступен'
+        assert kz.source is None
+        assert kz.changed == 0
+        assert kz.write_seconds == 0
+
+    def test_unexpected_error_is_isolated(self, migrated_engine):
+        """
+        Непредусмотренная ошибка одного года записывается в его историю
+        и не мешает остальным годам запуска.
+        """
+        changed = asyncio.run(
+            refresh(['ru'], [2025, 2026], sources=[CrashingSource()], bind=migrated_engine)
+        )
+        assert changed == 365
+
+        with Session(migrated_engine) as session:
+            runs = {run.year: run for run in list_sync_runs(session)}
+        assert runs[2025].error is None and runs[2025].changed == 365
+        assert runs[2026].error == "KeyError: 'holidays'"
+        assert runs[2026].changed == 0
+
+    def test_parse_is_timed_separately(self, migrated_engine):
+        """
+        Для источника с fetch_raw/parse разбор замеряется отдельно.
+        """
+        asyncio.run(refresh(['ru'], [2025], sources=[RawSource()], bind=migrated_engine))
+
+        with Session(migrated_engine) as session:
+            run, = list_sync_runs(session)
+        assert run.source == 'raw'
+        assert run.parse_seconds > 0
+        assert run.changed == 365
+
+    def test_runs_route(self, test_client, test_db_engine):
+        """
+        `/sync/runs` отдаёт историю с фильтром по запуску.
+        """
+        asyncio.run(refresh(['ru'], [2025], sources=[FakeSource()], bind=test_db_engine))
+        asyncio.run(refresh(['ru'], [2026], sources=[FakeSource()], bind=test_db_engine))
+
+        runs = test_client.get('/sync/runs', params={'region': 'ru'}).json()
+        assert [run['year'] for run in runs[:2]] == [2026, 2025]
+        latest = test_client.get('/sync/runs', params={'run_id': runs[0]['run_id']}).json()
+        assert [run['year'] for run in latest] == [2026]
+        assert test_client.get('/sync/runs', params={'limit': 0}).status_code == 422
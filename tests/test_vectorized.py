@@ -0,0 +1,137 @@
+"""
+Модуль tests.test_vectorized — тесты векторных вычислений по календарю.
+
+Проверяет, что VectorCalendar совпадает с поэлементными ответами
+CalendarIndex (включая переносы и даты вне загруженных лет),
+и пакетные маршруты `/bulk/*`.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.engine import CalendarIndex
+from app.engine.vectorized import VectorCalendar
+from app.services import index_holder
+from app.sources.base import expand_year
+
+OVERRIDES = {
+    date(2025, 1, 1): (False, 'Новый год'),
+    date(2025, 1, 2): (False, None),
+    date(2025, 11, 1): (True, None),
+}
+
+
+@pytest.fixture(scope='module')
+def index():
+    """
+    Снимок за 2025 год с праздниками и рабочей субботой.
+    """
+    return CalendarIndex(expand_year('ru', 2025, OVERRIDES), version=1)
+
+
+class TestVectorCalendar:
+    """
+    Тесты VectorCalendar.
+    """
+
+    def test_matches_scalar_lookups(self, index):
+        """
+        Признаки и счётчики совпадают с поэлементным расчётом, в том числе вне года.
+        """
+        calendar = VectorCalendar.from_index(index, 'ru')
+        days = [date(2024, 12, 20) + timedelta(days=offset) for offset in range(400)]
+        dates = np.array(days, dtype='datetime64[D]')
+        assert calendar.is_working(dates).tolist() == [index.is_working('ru', day) for day in days]
+
+        counts = calendar.count(dates, dates + 10)
+        expected = [
+            sum(index.is_working('ru', day + timedelta(days=step)) for step in range(10))
+            for day in days
+        ]
+        assert counts.tolist() == expected
+        assert (calendar.count(dates + 10, dates) == -counts).all()
+
+    def test_offset(self, index):
+        """
+        Нерабочая дата переносится по правилу roll, затем сдвигается.
+        """
+        calendar = VectorCalendar.from_index(index, 'ru')
+        dates = np.array(['2025-01-04', '2025-01-03', '2025-10-31'], dtype='datetime64[D]')
+        assert calendar.offset(dates, 1).tolist() == [
+            date(2025, 1, 7), date(2025, 1, 6), date(2025, 11, 1)
+        ]
+        assert calendar.offset(dates, 0, roll='backward')[0] == np.datetime64('2025-01-03')
+        with pytest.raises(ValueError):
+            calendar.offset(dates, 400)
+
+    def test_vector_is_cached_per_snapshot(self, index):
+        """
+        Массивы строятся один раз на снимок; регионы вне снимка не кэшируются.
+        """
+        assert index.vector('ru') is index.vector('ru')
+        assert index.vector('zz') is not index.vector('zz')
+
+
+class TestBulkApi:
+    """
+    Тесты маршрутов `/bulk/*`.
+    """
+
+    def setup_method(self):
+        """
+        Подставляет снимок за 2025 год.
+        """
+        self.previous = index_holder.swap(CalendarIndex(expand_year('ru', 2025, OVERRIDES)))
+
+    def teardown_method(self):
+        """
+        Возвращает исходный снимок.
+        """
+        index_holder.swap(self.previous)
+
+    def test_is_working(self, test_client):
+        """
+        Признаки возвращаются в порядке входных дат.
+        """
+        response = test_client.post(
+            '/bulk/is-working', json={'dates': ['2025-01-01', '2025-11-01', '2025-11-03']}
+        )
+        assert response.json() == {'is_working': [False, True, True]}
+
+    def test_count_and_offset(self, test_client):
+        """
+        Счётчики по парам и сдвиг на разное число рабочих дней.
+        """
+        response = test_client.post('/bulk/count', json={
+            'start_dates': ['2025-01-01', '2025-02-01'],
+            'end_dates': ['2025-01-10', '2025-01-01'],
+        })
+        assert response.json() == {'counts': [5, -21]}
+        response = test_client.post('/bulk/offset', json={
+            'dates': ['2025-01-01', '2025-01-09'], 'days': [0, 2],
+        })
+        assert response.json() == {'dates': ['2025-01-03', '2025-01-13']}
+
+    def test_offset_bounds(self, test_client):
+        """
+        Сдвиг больше MAX_OFFSET_DAYS отклоняется при разборе запроса (422),
+        а результат раньше 1 года — ошибка запроса (400).
+        """
+        for days in (10 ** 18, [10 ** 6 + 1], -10 ** 18):
+            response = test_client.post('/bulk/offset', json={'dates': ['2025-01-01'], 'days': days})
+            assert response.status_code == 422
+        response = test_client.post('/bulk/offset', json={
+            'region': 'zz', 'dates': ['2025-01-01'], 'days': -10 ** 6,
+        })
+        assert response.status_code == 400
+
+    def test_mismatched_lengths(self, test_client):
+        """
+        Массивы разной длины отклоняются.
+        """
+        response = test_client.post(
+            '/bulk/count', json={'start_dates': ['2025-01-01'], 'end_dates': []}
+        )
+        assert response.status_code == 400
@@ -0,0 +1,178 @@
+"""
+Модуль tests.test_versions — тесты версий календаря и отката.
+
+Проверяет:
+- публикацию версии и снимок из активной версии;
+- откат: переключение указателя без перезаписи `calendarday`,
+  журнал изменившихся дней и возврат вперёд;
+- журнал дней, которые публикация после отката возвращает в обслуживание;
+- кэш разобранных версий;
+- маршруты `/versions/...`.
+"""
+
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.engine import DayRecord
+from app.models import CalendarDay
+from app.services import (
+    activate_version, changes_since, days_as_of, index_holder, latest_seq, load_index,
+    publish_version
+)
+from app.services.sync import save_days
+from app.services.versions import VersionCache, version_cache
+from .datasets import synthetic_year
+
+BAD = date(2025, 3, 3)
+
+
+class TestVersions:
+    """
+    Тесты публикации и переключения версий.
+    """
+
+    def test_rollback_and_forward(self, migrated_engine):
+        """
+        Откат возвращает прежние дни, пишет их в журнал и не трогает calendarday.
+        """
+        good = synthetic_year('ru', 2025)
+        save_days(good, migrated_engine)
+        first = publish_version('ru', 'исходная', migrated_engine)
+        assert publish_version('ru', bind=migrated_engine) == first
+
+        save_days([DayRecord('ru', BAD, False, 'Ошибка')], migrated_engine)
+        second = publish_version('ru', 'ошибка источника', migrated_engine)
+        assert second > first
+        assert not load_index(migrated_engine).is_working('ru', BAD)
+
+        seq = latest_seq(migrated_engine)
+        assert activate_version('ru', first, migrated_engine) == 1
+        index = load_index(migrated_engine)
+        assert index.is_working('ru', BAD) and index.version == seq + 1
+        with Session(migrated_engine) as session:
+            [change] = changes_since(session, seq, 10)
+            assert (change.date, change.is_working) == (BAD, True)
+            stored = session.scalar(select(CalendarDay.is_working).where(CalendarDay.date == BAD))
+            assert stored is False
+            assert session.scalar(select(func.count()).select_from(CalendarDay)) == 365
+
+        assert activate_version('ru', second, migrated_engine) == 1
+        assert not load_index(migrated_engine).is_working('ru', BAD)
+
+    def test_publish_after_rollback_is_journaled(self, migrated_engine):
+        """
+        Публикация после отката возвращает откатанный день в обслуживание
+        и пишет его в журнал; день, уже записанный при сохранении,
+        не дублируется.
+        """
+        save_days(synthetic_year('ru', 2025), migrated_engine)
+        first = publish_version('ru', bind=migrated_engine)
+        save_days([DayRecord('ru', BAD, False, 'Ошибка')], migrated_engine)
+        publish_version('ru', bind=migrated_engine)
+        activate_version('ru', first, migrated_engine)
+
+        seq = latest_seq(migrated_engine)
+        unrelated = date(2025, 4, 7)
+        save_days([DayRecord('ru', unrelated, False, 'Перенос')], migrated_engine)
+        publish_version('ru', 'синхронизация', migrated_engine)
+
+        index = load_index(migrated_engine)
+        with Session(migrated_engine) as session:
+            changes = changes_since(session, seq, 10)
+            history = days_as_of(session, 'ru', BAD, unrelated, datetime.now(timezone.utc))
+        assert sorted(change.date for change in changes) == [BAD, unrelated]
+        assert index.version == latest_seq(migrated_engine)
+        for record in history:
+            assert record == index.get_day('ru', record.date)
+        assert not index.is_working('ru', BAD)
+
+    def test_unknown_version(self, migrated_engine):
+        """
+        Переключение на чужую или несуществующую версию отклоняется.
+        """
+        save_days(synthetic_year('kz', 2025), migrated_engine)
+        version_id = publish_version('kz', bind=migrated_engine)
+        with pytest.raises(LookupError):
+            activate_version('ru', version_id, migrated_engine)
+        with pytest.raises(LookupError):
+            activate_version('kz', version_id + 100, migrated_engine)
+
+    def test_unpublished_regions_from_calendarday(self, migrated_engine):
+        """
+        Регион без версий по-прежнему читается из calendarday.
+        """
+        save_days(synthetic_year('ru', 2025), migrated_engine)
+        publish_version('ru', bind=migrated_engine)
+        save_days(synthetic_year('by', 2025), migrated_engine)
+        index = load_index(migrated_engine)
+        assert index.years('ru') == [2025] and index.years('by') == [2025]
+
+
+class TestVersionCache:
+    """
+    Тесты кэша разобранных версий.
+    """
+
+    def test_reuse_and_eviction(self):
+        """
+        Повторное обращение к версии не разбирает её заново; старые вытесняются.
+        """
+        cache = VersionCache(size=2)
+        loads = []
+        for version_id in (1, 2, 1, 3):
+            cache.get(version_id, lambda: loads.append(version_id) or [])
+        assert loads == [1, 2, 3]
+        assert 1 in cache and 2 not in cache
+
+    def test_rollback_reuses_parsed_years(self, migrated_engine):
+        """
+        После отката воркер берёт годы версии из кэша (те же объекты).
+        """
+        save_days(synthetic_year('ru', 2025), migrated_engine)
+        first = publish_version('ru', bind=migrated_engine)
+        before = load_index(migrated_engine).year('ru', 2025)
+        save_days(synthetic_year('ru', 2025, seed=2), migrated_engine)
+        publish_version('ru', bind=migrated_engine)
+        activate_version('ru', first, migrated_engine)
+        assert first in version_cache
+        assert load_index(migrated_engine).year('ru', 2025) is before
+
+
+class TestVersionsApi:
+    """
+    Тесты маршрутов версий.
+    """
+
+    def setup_method(self):
+        """
+        Запоминает исходный снимок (маршруты подменяют его).
+        """
+        self.previous = index_holder.current
+
+    def teardown_method(self):
+        """
+        Возвращает исходный снимок.
+        """
+        index_holder.swap(self.previous)
+
+    def test_publish_and_rollback(self, test_client, test_db_engine):
+        """
+        Откат через API сразу меняет ответы этого воркера.
+        """
+        save_days(synthetic_year('xx', 2025), test_db_engine)
+        first = test_client.post('/versions/xx/publish', json={'note': 'исходная'}).json()
+        assert first['active'] and first['note'] == 'исходная'
+        save_days([DayRecord('xx', BAD, False, 'Ошибка')], test_db_engine)
+        second = test_client.post('/versions/xx/publish', json={}).json()
+        assert test_client.get('/is-working-day/2025-03-03', params={'region': 'xx'}).json()['is_working'] is False
+
+        response = test_client.post('/versions/xx/rollback', json={'version_id': first['id']})
+        assert response.status_code == 200
+        assert response.json() == {'region': 'xx', 'version_id': first['id'], 'changed': 1}
+        assert test_client.get('/is-working-day/2025-03-03', params={'region': 'xx'}).json()['is_working'] is True
+        versions = test_client.get('/versions/xx').json()
+        assert [(v['id'], v['active']) for v in versions] == [(second['id'], False), (first['id'], True)]
+        assert test_client.post('/versions/xx/rollback', json={'version_id': 10**6}).status_code == 404
@@ -0,0 +1,94 @@
+"""
+Модуль tests.test_warmup — тесты прогрева воркера и проверок состояния.
+
+Проверяет:
+- загрузку снимка из БД и отметку готовности после прогрева;
+- сохранение уже актуального снимка (загруженного мастером до fork);
+- проверку реплик переданного маршрутизатора (рабочая БД не открывается);
+- ответы `/health` и `/ready` до и после прогрева.
+"""
+
+import asyncio
+from datetime import date
+
+from app.core.replicas import ReadRouter
+from app.engine import IndexHolder
+from app.services import Readiness, readiness, warmup, warmup_years
+from app.services.sync import save_days
+from app.sources.base import expand_year
+
+
+class TestWarmup:
+    """
+    Тесты прогрева.
+    """
+
+    def test_warmup_loads_index_and_marks_ready(self, migrated_engine):
+        """
+        После прогрева снимок загружен из БД, а воркер готов.
+        """
+        save_days(expand_year('ru', 2025, {date(2025, 1, 1): (False, 'Новый год')}), migrated_engine)
+        holder = IndexHolder()
+        state = Readiness()
+        asyncio.run(warmup(holder, ['ru'], [2025], migrated_engine, state, router=None))
+        assert state.ready
+        assert holder.current.version > 0
+        assert holder.current.is_working('ru', date(2025, 1, 1)) is False
+
+    def test_warmup_keeps_current_snapshot(self, seeded_engine):
+        """
+        Актуальный снимок (версия равна seq журнала) не перечитывается.
+        """
+        from app.services import load_index
+        holder = IndexHolder()
+        index = load_index(seeded_engine)
+        holder.swap(index)
+        asyncio.run(warmup(holder, ['ru'], [2025], seeded_engine, Readiness(), router=None))
+        assert holder.current is index
+
+    def test_warmup_checks_given_router(self, migrated_engine):
+        """
+        Проверяются реплики переданного маршрутизатора, а не рабочей БД.
+        """
+        router = ReadRouter(migrated_engine, [migrated_engine])
+        router.mark_down(0)
+        asyncio.run(warmup(IndexHolder(), ['ru'], [2025], migrated_engine, Readiness(), router))
+        assert router.healthy == [migrated_engine]
+
+    def test_warmup_years(self):
+        """
+        Прогреваются текущий год и span лет до и после него.
+        """
+        assert warmup_years(date(2026, 5, 1), span=2) == [2024, 2025, 2026, 2027, 2028]
+
+
+class TestHealthApi:
+    """
+    Тесты `/health` и `/ready`.
+    """
+
+    def teardown_method(self):
+        """
+        Снимает готовность, выставленную тестом.
+        """
+        readiness.reset()
+
+    def test_health_always_ok(self, test_client):
+        """
+        `/health` отвечает 200 и во время прогрева.
+        """
+        readiness.reset()
+        assert test_client.get('/health').status_code == 200
+
+    def test_ready_after_warmup(self, test_client):
+        """
+        `/ready` отвечает 503 до прогрева и 200 после него.
+        """
+        readiness.reset()
+        response = test_client.get('/ready')
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+        readiness.mark_ready()
+        response = test_client.get('/ready')
+        assert response.status_code == 200
+        assert response.json()['status'] == 'ready'
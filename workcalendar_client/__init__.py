@@ -0,0 +1,39 @@
+"""
+Пакет workcalendar_client — встраиваемая клиентская библиотека WorkCalendarClient.
+
+Загружает снимок календаря региона с сервиса один раз и отвечает на вопросы
+(рабочий ли день, сколько рабочих дней в периоде, дата через N рабочих дней)
+в процессе вызывающего сервиса, без сетевых запросов на каждый вопрос.
+Вычисления выполняет то же ядро (app.engine), что и сервер.
+
+Экспортируемые объекты:
+- CalendarClient — клиент с локальным снимком, фоновой перепроверкой
+  через ETag и offline‑стартом из локального файла;
+- CalendarUnavailable — снимок недоступен ни с сервера, ни локально;
+- SnapshotStore — файловое хранилище снимков;
+- AsyncCalendarClient — асинхронный клиент REST API с пулом соединений,
+  объединяющий одновременные одиночные вопросы в пакетные запросы;
+- MicroBatcher — сборщик вопросов в пакеты.
+
+Пример использования:
+    from workcalendar_client import CalendarClient
+
+    with CalendarClient('http://calendar:8000', cache_dir='data/calendar') as calendar:
+        calendar.is_working(date(2025, 1, 1))
+
+Асинхронный клиент:
+    async with AsyncCalendarClient('http://calendar:8000') as calendar:
+        await calendar.is_working(date(2025, 1, 1))
+
+Зависимости: httpx и пакет app.engine (без БД и веб‑фреймворка).
+"""
+
+from .async_client import AsyncCalendarClient
+from .batching import MicroBatcher
+from .client import CalendarClient, CalendarUnavailable
+from .store import SnapshotStore
+
+__all__ = [
+    'AsyncCalendarClient', 'CalendarClient', 'CalendarUnavailable',
+    'MicroBatcher', 'SnapshotStore'
+]
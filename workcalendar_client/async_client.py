@@ -0,0 +1,132 @@
+"""
+Модуль workcalendar_client.async_client — асинхронный клиент REST API календаря.
+
+Для асинхронных воркеров, которым нужны ответы сервера (а не локальный
+снимок, см. CalendarClient):
+- один общий httpx.AsyncClient с пулом соединений и keep-alive —
+  без нового TCP‑соединения на каждый вопрос;
+- одиночные вопросы `get_day()`/`is_working()`, заданные почти одновременно
+  (в пределах batch_window), объединяются в один запрос POST /days.
+
+Пример использования:
+    async with AsyncCalendarClient('http://calendar:8000') as calendar:
+        flags = await asyncio.gather(*(calendar.is_working(day) for day in days))
+        # ушёл один запрос POST /days вместо len(days) запросов
+"""
+
+from datetime import date
+from typing import Iterable, Optional
+
+import httpx
+
+from app.engine import DayRecord
+from .batching import MicroBatcher
+
+MAX_BATCH = 100_000
+"""Предел размера пакета (совпадает с ограничением сервера на POST /days)."""
+
+
+def day_record(data: dict) -> DayRecord:
+    """
+    Преобразует день из ответа API в DayRecord.
+    """
+    return DayRecord(
+        data['region'], date.fromisoformat(data['date']),
+        data['is_working'], data.get('holiday_name'), data.get('working_hours')
+    )
+
+
+class AsyncCalendarClient:
+    """
+    Асинхронный клиент календаря с пулом соединений и микропакетами.
+
+    Attributes:
+        region (str): регион по умолчанию;
+        batcher (MicroBatcher): сборщик одиночных вопросов в пакеты.
+    """
+
+    def __init__(
+        self,
+        base_url: str = '',
+        region: str = 'ru',
+        batch_window: float = 0.002,
+        max_batch: int = 500,
+        max_connections: int = 100,
+        timeout: float = 10.0,
+        http: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """
+        Args:
+            base_url (str): адрес сервиса календаря;
+            region (str): регион по умолчанию;
+            batch_window (float): окно объединения вопросов, секунды;
+            max_batch (int): максимальный размер пакета;
+            max_connections (int): размер пула соединений;
+            timeout (float): таймаут HTTP‑запросов, секунды;
+            http (httpx.AsyncClient | None): готовый клиент (не закрывается клиентом).
+        """
+        self.region = region
+        self._own_http = http is None
+        self._http = http if http is not None else httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+        )
+        self.batcher = MicroBatcher(self._send, batch_window, min(max_batch, MAX_BATCH))
+
+    async def _send(self, region: str, dates: list[date]) -> list[DayRecord]:
+        """
+        Отправляет пакет дат одним запросом POST /days.
+        """
+        response = await self._http.post('/days', json={
+            'region': region, 'dates': [day.isoformat() for day in dates]
+        })
+        response.raise_for_status()
+        return [day_record(data) for data in response.json()]
+
+    async def get_day(self, day: date, region: Optional[str] = None) -> DayRecord:
+        """
+        Возвращает статус дня (вопрос попадает в ближайший пакет).
+        """
+        return await self.batcher.submit(region or self.region, day)
+
+    async def is_working(self, day: date, region: Optional[str] = None) -> bool:
+        """
+        Проверяет, является ли дата рабочим днём.
+        """
+        return (await self.get_day(day, region)).is_working
+
+    async def get_days(self, dates: Iterable[date], region: Optional[str] = None) -> list[DayRecord]:
+        """
+        Возвращает статусы набора дат одним запросом (без окна ожидания).
+        """
+        return await self._send(region or self.region, list(dates))
+
+    async def calendar(self, start: date, end: date, region: Optional[str] = None) -> list[DayRecord]:
+        """
+        Возвращает статусы дней за период [start, end] (GET /calendar).
+        """
+        response = await self._http.get('/calendar', params={
+            'start_date': start.isoformat(),
+            'end_date': end.isoformat(),
+            'region': region or self.region,
+        })
+        response.raise_for_status()
+        return [day_record(data) for data in response.json()]
+
+    async def aclose(self) -> None:
+        """
+        Отправляет накопленные пакеты и закрывает собственный HTTP‑клиент.
+        """
+        await self.batcher.flush()
+        if self._own_http:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> 'AsyncCalendarClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,114 @@
+"""
+Модуль workcalendar_client.batching — объединение одиночных запросов в пакеты.
+
+Асинхронные воркеры часто задают по одному вопросу на задачу, но почти
+одновременно. MicroBatcher собирает вопросы, пришедшие в течение короткого
+окна (window), и отправляет их одним пакетным запросом; каждый вызывающий
+получает свой результат. Одинаковые вопросы в пакете отправляются один раз.
+
+Правила отправки пакета:
+- через `window` секунд после первого вопроса пакета;
+- сразу, если в пакете набралось `max_size` разных вопросов.
+
+Пример использования:
+    async def send(region, dates):
+        return await fetch_days(region, dates)   # один HTTP‑запрос
+
+    batcher = MicroBatcher(send, window=0.002, max_size=500)
+    day = await batcher.submit('ru', date(2025, 1, 1))
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class MicroBatcher:
+    """
+    Сборщик вопросов в пакеты по ключу (например, по региону).
+
+    Attributes:
+        window (float): окно накопления пакета, секунды;
+        max_size (int): максимальный размер пакета.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Hashable, list], Awaitable[list]],
+        window: float = 0.002,
+        max_size: int = 500
+    ) -> None:
+        """
+        Args:
+            send: корутина (ключ, вопросы) → результаты в том же порядке;
+            window (float): окно накопления пакета, секунды;
+            max_size (int): максимальный размер пакета.
+        """
+        self.send = send
+        self.window = window
+        self.max_size = max_size
+        self._pending: dict[Hashable, dict[Hashable, asyncio.Future]] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self._flushing: set[asyncio.Task] = set()
+
+    async def submit(self, key: Hashable, item: Hashable) -> Any:
+        """
+        Добавляет вопрос в текущий пакет ключа и ждёт ответа.
+
+        Raises:
+            Exception: ошибка отправки пакета передаётся всем его участникам.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = {}
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+        future = batch.get(item)
+        if future is None:
+            future = batch[item] = loop.create_future()
+            if len(batch) >= self.max_size:
+                self._timers[key].cancel()
+                self._flush(key)
+        # shield: отмена одного участника не отменяет общий результат
+        return await asyncio.shield(future)
+
+    def _flush(self, key: Hashable) -> None:
+        """
+        Закрывает пакет ключа и отправляет его в фоновой задаче.
+        """
+        batch = self._pending.pop(key, None)
+        self._timers.pop(key, None)
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._send(key, batch))
+            self._flushing.add(task)
+            task.add_done_callback(self._flushing.discard)
+
+    async def _send(self, key: Hashable, batch: dict[Hashable, asyncio.Future]) -> None:
+        """
+        Отправляет пакет и раздаёт результаты; если результатов меньше
+        или больше, чем вопросов, ошибку получают все участники пакета.
+        """
+        items = list(batch)
+        try:
+            results = list(await self.send(key, items))
+            if len(results) != len(items):
+                raise ValueError(
+                    f'Пакет {key!r}: получено результатов {len(results)}, ожидалось {len(items)}'
+                )
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for item, result in zip(items, results):
+            if not batch[item].done():
+                batch[item].set_result(result)
+
+    async def flush(self) -> None:
+        """
+        Отправляет все накопленные пакеты и дожидается ответов.
+        """
+        for key in list(self._pending):
+            self._timers[key].cancel()
+            self._flush(key)
+        if self._flushing:
+            await asyncio.gather(*self._flushing, return_exceptions=True)
@@ -0,0 +1,237 @@
+"""
+Модуль workcalendar_client.client — встраиваемый клиент календаря.
+
+Вместо HTTP‑запроса на каждый вопрос клиент один раз загружает снимок
+календаря региона (GET /snapshot/{region}) и отвечает на вопросы локально,
+тем же кодом ядра (app.engine), что и сервер, — результаты совпадают.
+
+Особенности:
+- фоновая перепроверка снимка с If-None-Match: неизменившийся снимок
+  стоит ответа 304 без тела;
+- снимок сохраняется в локальный файл (cache_dir), поэтому клиент
+  стартует и без сети (offline) по последнему сохранённому снимку;
+- замена снимка атомарна: вызывающий код всегда видит согласованные данные.
+
+Пример использования:
+    with CalendarClient('http://calendar:8000', cache_dir='/var/cache/calendar') as calendar:
+        calendar.is_working(date(2025, 1, 1))                 # False
+        calendar.add_working_days(date(2025, 1, 1), 5)        # дата через 5 рабочих дней
+        calendar.count_working(date(2025, 1, 1), date(2025, 2, 1))
+"""
+
+import logging
+import threading
+from datetime import date
+from typing import Iterable, Optional
+
+import httpx
+
+from app.engine import CalendarIndex, DayRecord, IndexHolder, YearCalendar, load_years
+from .store import SnapshotStore
+
+logger = logging.getLogger('workcalendar_client')
+
+
+class CalendarUnavailable(Exception):
+    """
+    Снимок календаря недоступен: сервер не ответил, а локальной копии нет.
+    """
+
+
+class CalendarClient:
+    """
+    Клиент календаря с локальными вычислениями.
+
+    Attributes:
+        regions (list[str]): загружаемые регионы (первый — регион по умолчанию);
+        refresh_interval (float): период фоновой перепроверки, секунды;
+        store (SnapshotStore | None): локальное хранилище снимков.
+    """
+
+    def __init__(
+        self,
+        base_url: str = '',
+        regions: Iterable[str] = ('ru',),
+        cache_dir=None,
+        refresh_interval: float = 300,
+        timeout: float = 10.0,
+        http: Optional[httpx.Client] = None
+    ) -> None:
+        """
+        Args:
+            base_url (str): адрес сервиса календаря;
+            regions (Iterable[str]): регионы для загрузки;
+            cache_dir: каталог локальных снимков (None — без offline‑режима);
+            refresh_interval (float): период фоновой перепроверки, секунды;
+            timeout (float): таймаут HTTP‑запросов, секунды;
+            http (httpx.Client | None): готовый HTTP‑клиент (не закрывается клиентом).
+        """
+        self.regions = list(regions)
+        self.refresh_interval = refresh_interval
+        self.store = SnapshotStore(cache_dir) if cache_dir is not None else None
+        self._own_http = http is None
+        self._http = http if http is not None else httpx.Client(base_url=base_url, timeout=timeout)
+        self._holder = IndexHolder()
+        self._etags: dict[str, Optional[str]] = {}
+        self._years: dict[str, list[YearCalendar]] = {}
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def index(self) -> CalendarIndex:
+        """
+        Текущий локальный снимок календаря.
+        """
+        return self._holder.current
+
+    def _apply(self, region: str, etag: Optional[str], snapshot: dict) -> None:
+        """
+        Запоминает снимок региона (годы разбираются и проверяются сразу).
+        """
+        self._years[region] = load_years(snapshot)
+        self._versions[region] = snapshot['version']
+        self._etags[region] = etag
+
+    def _rebuild(self) -> None:
+        """
+        Собирает и атомарно подменяет общий снимок по всем регионам.
+        """
+        self._holder.swap(CalendarIndex.from_years(
+            (calendar for years in self._years.values() for calendar in years),
+            version=max(self._versions.values(), default=0),
+        ))
+
+    def _revalidate(self, region: str) -> bool:
+        """
+        Перепроверяет снимок региона на сервере.
+
+        Returns:
+            bool: True, если получен новый снимок.
+
+        Raises:
+            httpx.HTTPError: при сетевой ошибке или неуспешном ответе.
+        """
+        headers = {}
+        if self._etags.get(region):
+            headers['If-None-Match'] = self._etags[region]
+        response = self._http.get(f'/snapshot/{region}', headers=headers)
+        if response.status_code == 304:
+            return False
+        response.raise_for_status()
+        snapshot = response.json()
+        etag = response.headers.get('ETag')
+        self._apply(region, etag, snapshot)
+        if self.store is not None:
+            self.store.put(region, etag, snapshot)
+        return True
+
+    def load(self) -> None:
+        """
+        Загружает снимки регионов: с сервера, а при его недоступности —
+        из локального хранилища.
+
+        Сохранённый снимок используется и как отправная точка перепроверки:
+        если он актуален, сервер ответит 304.
+
+        Raises:
+            CalendarUnavailable: если для региона нет ни ответа сервера,
+                ни локальной копии.
+        """
+        with self._lock:
+            for region in self.regions:
+                stored = self.store.get(region) if self.store is not None else None
+                if stored is not None:
+                    self._apply(region, *stored)
+                try:
+                    self._revalidate(region)
+                except httpx.HTTPError as error:
+                    if stored is None:
+                        raise CalendarUnavailable(
+                            f'Календарь региона {region} недоступен: {error!r}'
+                        ) from error
+                    logger.warning(f'Сервер недоступен, {region}: локальный снимок ({error!r})')
+            self._rebuild()
+
+    def refresh(self) -> bool:
+        """
+        Перепроверяет снимки всех регионов; ошибки сети не прерывают работу.
+
+        Returns:
+            bool: True, если хотя бы один снимок обновился.
+        """
+        with self._lock:
+            changed = False
+            for region in self.regions:
+                try:
+                    changed = self._revalidate(region) or changed
+                except (httpx.HTTPError, ValueError) as error:
+                    logger.warning(f'Не удалось перепроверить снимок {region}: {error!r}')
+            if changed:
+                self._rebuild()
+            return changed
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.refresh_interval):
+            self.refresh()
+
+    def start(self) -> None:
+        """
+        Запускает фоновую перепроверку снимков (поток‑демон).
+        """
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='workcalendar-refresh', daemon=True
+            )
+            self._thread.start()
+
+    def close(self) -> None:
+        """
+        Останавливает фоновую перепроверку и закрывает собственный HTTP‑клиент.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._own_http:
+            self._http.close()
+
+    def __enter__(self) -> 'CalendarClient':
+        self.load()
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def is_working(self, day: date, region: Optional[str] = None) -> bool:
+        """
+        Проверяет, является ли дата рабочим днём.
+        """
+        return self.index.is_working(region or self.regions[0], day)
+
+    def get_day(self, day: date, region: Optional[str] = None) -> DayRecord:
+        """
+        Возвращает запись о дне (статус и название праздника).
+        """
+        return self.index.get_day(region or self.regions[0], day)
+
+    def days(self, start: date, end: date, region: Optional[str] = None) -> list[DayRecord]:
+        """
+        Возвращает записи о днях в диапазоне [start, end] включительно.
+        """
+        return self.index.days(region or self.regions[0], start, end)
+
+    def count_working(self, start: date, end: date, region: Optional[str] = None) -> int:
+        """
+        Число рабочих дней в полуинтервале [start, end).
+        """
+        return self.index.count_working(region or self.regions[0], start, end)
+
+    def add_working_days(self, day: date, days: int, region: Optional[str] = None) -> date:
+        """
+        Сдвигает дату на `days` рабочих дней.
+        """
+        return self.index.add_working_days(region or self.regions[0], day, days)
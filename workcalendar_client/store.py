@@ -0,0 +1,54 @@
+"""
+Модуль workcalendar_client.store — локальное хранилище снимков календаря.
+
+Снимок каждого региона хранится в отдельном файле `<region>.json`
+вместе с ETag, с которым его отдал сервер. Это позволяет:
+- стартовать без сети (offline) по последнему сохранённому снимку;
+- после рестарта перепроверить снимок запросом с If-None-Match
+  вместо полной загрузки.
+
+Файлы записываются атомарно через временный файл и os.replace.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+
+class SnapshotStore:
+    """
+    Файловое хранилище снимков регионов.
+
+    Attributes:
+        directory (Path): каталог с файлами снимков.
+    """
+
+    def __init__(self, directory) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, region: str) -> Path:
+        return self.directory / f'{region}.json'
+
+    def get(self, region: str) -> Optional[tuple[Optional[str], dict]]:
+        """
+        Возвращает (ETag, снимок) региона или None, если файла нет или он повреждён.
+        """
+        try:
+            data = json.loads(self._path(region).read_text(encoding='utf-8'))
+            return data.get('etag'), data['snapshot']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, region: str, etag: Optional[str], snapshot: dict) -> None:
+        """
+        Сохраняет снимок региона и его ETag.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(region)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(
+            json.dumps({'etag': etag, 'snapshot': snapshot}, ensure_ascii=False),
+            encoding='utf-8'
+        )
+        os.replace(tmp_path, path)